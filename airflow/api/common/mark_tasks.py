@@ -158,6 +158,7 @@ def set_state(
             if task_instance.state in (TaskInstanceState.DEFERRED, TaskInstanceState.UP_FOR_RESCHEDULE):
                 task_instance._try_number += 1
             task_instance.set_state(state, session=session)
+        DagRun.touch_finished({(ti.dag_id, ti.run_id) for ti in tis_altered}, session=session)
         session.flush()
     else:
         tis_altered = session.scalars(qry_dag).all()
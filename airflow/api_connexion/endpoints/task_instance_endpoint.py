@@ -702,5 +702,6 @@ def set_task_instance_note(
     else:
         ti.task_instance_note.content = new_note
         ti.task_instance_note.user_id = current_user_id
+    DR.touch_finished([(ti.dag_id, ti.run_id)], session=session)
     session.commit()
     return task_instance_schema.dump((ti, sla_miss))
@@ -45,6 +45,7 @@ def _initialize_map() -> dict[str, Callable]:
         DagModel.deactivate_deleted_dags,
         DagModel.get_paused_dag_ids,
         DagFileProcessorManager.clear_nonexistent_import_errors,
+        DagFileProcessorManager.update_dags_last_parsed_time,
         DagWarning.purge_inactive_dag_warnings,
         XCom.get_value,
         XCom.get_one,
@@ -57,9 +58,12 @@ def _initialize_map() -> dict[str, Callable]:
         Trigger.bulk_fetch,
         Trigger.clean_unused,
         Trigger.submit_event,
+        Trigger.submit_events,
         Trigger.submit_failure,
+        Trigger.submit_failures,
         Trigger.ids_for_triggerer,
         Trigger.assign_unassigned,
+        Trigger.release_excess_triggers,
     ]
     return {f"{func.__module__}.{func.__qualname__}": func for func in functions}
 
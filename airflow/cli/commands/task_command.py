@@ -194,6 +194,28 @@ def _get_ti(
     return ti, dr_created
 
 
+def _get_serialized_dag(dag_id: str, task_id: str) -> DAG | None:
+    """
+    Return the serialized DAG of a task to supervise it, or None if the DAG file must be parsed.
+
+    The supervisor of a task (``--local``) does not run user code, the task runs in another process
+    which parses the DAG file. Reading the serialized DAG, as the scheduler does, saves the supervisor
+    from parsing the DAG file as well when the task is started in a new interpreter. A forked task
+    would otherwise reuse the DAG of the supervisor, so it parses the DAG file as often either way.
+    """
+    from airflow.models.dagbag import DagBag
+
+    try:
+        dag = DagBag(read_dags_from_db=True, load_op_links=False).get_dag(dag_id)
+    except Exception:
+        log.warning("Could not read the serialized DAG %s, parsing its DAG file", dag_id, exc_info=True)
+        return None
+    if dag is None or dag.is_subdag or not dag.has_task(task_id):
+        log.info("The serialized DAG %s cannot run task %s, parsing its DAG file", dag_id, task_id)
+        return None
+    return dag
+
+
 def _run_task_by_selected_method(args, dag: DAG, ti: TaskInstance) -> None | TaskReturnCode:
     """
     Run the task based on a mode.
@@ -402,10 +424,14 @@ def task_run(args, dag: DAG | None = None) -> TaskReturnCode | None:
     if args.pickle:
         print(f"Loading pickle id: {args.pickle}")
         _dag = get_dag_by_pickle(args.pickle)
-    elif not dag:
-        _dag = get_dag(args.subdir, args.dag_id, args.read_from_db)
-    else:
+    elif dag:
         _dag = dag
+    elif args.local and conf.getboolean("core", "task_supervisor_uses_serialized_dag", fallback=False):
+        _dag = _get_serialized_dag(args.dag_id, args.task_id) or get_dag(
+            args.subdir, args.dag_id, args.read_from_db
+        )
+    else:
+        _dag = get_dag(args.subdir, args.dag_id, args.read_from_db)
     task = _dag.get_task(task_id=args.task_id)
     ti, _ = _get_ti(task, args.map_index, exec_date_or_run_id=args.execution_date_or_run_id, pool=args.pool)
     ti.init_run_context(raw=args.raw)
@@ -458,6 +458,8 @@ class AirflowConfigParser(ConfigParser):
         ("core", "dag_ignore_file_syntax"): ["regexp", "glob"],
         ("core", "mp_start_method"): multiprocessing.get_all_start_methods(),
         ("scheduler", "file_parsing_sort_mode"): ["modified_time", "random_seeded_by_host", "alphabetical"],
+        # parsing_start_method can be empty, which uses mp_start_method as fallback
+        ("scheduler", "parsing_start_method"): multiprocessing.get_all_start_methods() + [""],
         ("logging", "logging_level"): _available_logging_levels,
         ("logging", "fab_logging_level"): _available_logging_levels,
         # celery_logging_level can be empty, which uses logging_level as fallback
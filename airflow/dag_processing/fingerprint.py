@@ -0,0 +1,145 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Fingerprints of DAG files, used to skip parsing files which did not change since they were last parsed."""
+from __future__ import annotations
+
+import ast
+import os
+from typing import NamedTuple
+
+from airflow.utils.hashlib_wrapper import md5
+
+# DAG files containing this string are parsed every time, e.g. because they generate DAGs from external state.
+ALWAYS_REPARSE_MARKER = b"airflow: always-reparse"
+
+
+class _FileInfo(NamedTuple):
+    signature: tuple[int, int]
+    content_hash: bytes
+    always_reparse: bool
+    local_imports: list[str]
+
+
+class DagFileFingerprinter:
+    """
+    Compute fingerprints of DAG files.
+
+    The fingerprint of a file is a hash of its content and of the content of the local modules it imports,
+    recursively. Files are only read again when their modification time or size changes.
+
+    :param search_paths: Directories local modules are imported from, e.g. the DAGs and plugins folders.
+    """
+
+    def __init__(self, search_paths: list[str]):
+        self.search_paths = [path for path in search_paths if path and os.path.isdir(path)]
+        self._files: dict[str, _FileInfo] = {}
+
+    def fingerprint(self, file_path: str) -> str | None:
+        """
+        Return the fingerprint of a DAG file.
+
+        :return: The fingerprint, or None if the file must always be parsed: it contains
+            ``ALWAYS_REPARSE_MARKER``, or it or one of its local modules cannot be read.
+        """
+        digest = md5()
+        seen: set[str] = set()
+        to_visit = [file_path]
+        while to_visit:
+            path = to_visit.pop()
+            if path in seen:
+                continue
+            seen.add(path)
+            info = self._get_file_info(path)
+            if info is None or info.always_reparse:
+                return None
+            digest.update(os.fsencode(path))
+            digest.update(info.content_hash)
+            to_visit.extend(info.local_imports)
+        return digest.hexdigest()
+
+    def forget(self, file_path: str) -> None:
+        """Drop what is cached about a file."""
+        self._files.pop(file_path, None)
+
+    def _get_file_info(self, path: str) -> _FileInfo | None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        info = self._files.get(path)
+        if info is not None and info.signature == signature:
+            return info
+        try:
+            with open(path, "rb") as f:
+                content = f.read()
+        except OSError:
+            return None
+        local_imports = self._find_local_imports(path, content) if path.endswith(".py") else []
+        info = _FileInfo(signature, md5(content).digest(), ALWAYS_REPARSE_MARKER in content, local_imports)
+        self._files[path] = info
+        return info
+
+    def _find_local_imports(self, path: str, content: bytes) -> list[str]:
+        try:
+            tree = ast.parse(content)
+        except (SyntaxError, ValueError):
+            return []
+        files: set[str] = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    files.update(self._resolve(self.search_paths, alias.name))
+            elif isinstance(node, ast.ImportFrom):
+                module = node.module or ""
+                if node.level:
+                    package_dir = os.path.dirname(path)
+                    for _ in range(node.level - 1):
+                        package_dir = os.path.dirname(package_dir)
+                    roots = [package_dir]
+                else:
+                    roots = self.search_paths
+                # ``from package import name`` may import the ``package.name`` submodule.
+                for name in [
+                    module,
+                    *(f"{module}.{alias.name}" if module else alias.name for alias in node.names),
+                ]:
+                    if name:
+                        files.update(self._resolve(roots, name))
+        files.discard(path)
+        return sorted(files)
+
+    @staticmethod
+    def _resolve(roots: list[str], module: str) -> list[str]:
+        """Return the files executed when importing ``module`` from the first root containing it."""
+        parts = module.split(".")
+        for root in roots:
+            files = []
+            for i in range(1, len(parts) + 1):
+                base = os.path.join(root, *parts[:i])
+                if os.path.isfile(f"{base}.py"):
+                    files.append(f"{base}.py")
+                    break
+                init_file = os.path.join(base, "__init__.py")
+                if os.path.isfile(init_file):
+                    files.append(init_file)
+                elif not os.path.isdir(base):
+                    break
+            if files:
+                return files
+        return []
@@ -45,7 +45,10 @@ import airflow.models
 from airflow.api_internal.internal_api_call import internal_api_call
 from airflow.callbacks.callback_requests import CallbackRequest, SlaCallbackRequest
 from airflow.configuration import conf
+from airflow.dag_processing.fingerprint import DagFileFingerprinter
 from airflow.dag_processing.processor import DagFileProcessorProcess
+from airflow.dag_processing.watcher import BaseDagDirectoryWatcher, start_dag_directory_watcher
+from airflow.dag_processing.worker_pool import DagFileProcessorWorkerPool, PooledDagFileProcessorProcess
 from airflow.models import errors
 from airflow.models.dag import DagModel
 from airflow.models.dagwarning import DagWarning
@@ -54,7 +57,7 @@ from airflow.models.serialized_dag import SerializedDagModel
 from airflow.secrets.cache import SecretCache
 from airflow.stats import Stats
 from airflow.utils import timezone
-from airflow.utils.file import list_py_file_paths, might_contain_dag
+from airflow.utils.file import is_dag_file_path, list_py_file_paths, might_contain_dag
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.mixins import MultiprocessingStartMethodMixin
 from airflow.utils.net import get_hostname
@@ -422,6 +425,13 @@ class DagFileProcessorManager(LoggingMixin):
 
         # Map from file path to the processor
         self._processors: dict[str, DagFileProcessorProcess] = {}
+        # Long-lived processes parsing files one after the other, instead of one process per file
+        self._worker_pool: DagFileProcessorWorkerPool | None = None
+        if conf.getboolean("scheduler", "parsing_worker_pool"):
+            self._worker_pool = DagFileProcessorWorkerPool(
+                max_files=conf.getint("scheduler", "parsing_worker_max_files"),
+                max_memory_mb=conf.getint("scheduler", "parsing_worker_max_memory_mb"),
+            )
 
         self._num_run = 0
 
@@ -442,6 +452,23 @@ class DagFileProcessorManager(LoggingMixin):
         self._processor_timeout = processor_timeout
         # How often to scan the DAGs directory for new files. Default to 5 minutes.
         self.dag_dir_list_interval = conf.getint("scheduler", "dag_dir_list_interval")
+        # When watching the DAGs directory for changes, how often to list it entirely anyway.
+        self.dag_dir_full_rescan_interval = conf.getint("scheduler", "dag_dir_full_rescan_interval")
+        self._dag_dir_watch_mode = conf.get("scheduler", "dag_dir_watch_mode")
+        self._dag_dir_watcher: BaseDagDirectoryWatcher | None = None
+        # Modification time of DAG files, only cached while the DAGs directory is watched
+        self._file_mtimes: dict[str, float] = {}
+
+        # Skip parsing files when neither they nor the local modules they import changed
+        self._fingerprinter: DagFileFingerprinter | None = None
+        if conf.getboolean("scheduler", "skip_unchanged_dag_files"):
+            self._fingerprinter = DagFileFingerprinter(
+                [str(dag_directory), conf.get("core", "plugins_folder", fallback="")]
+            )
+        # Fingerprint of files when they were last parsed without import errors
+        self._file_fingerprints: dict[str, str] = {}
+        # Fingerprint of files being parsed
+        self._processor_fingerprints: dict[str, str] = {}
 
         # Mapping file name and callbacks requests
         self._callback_to_execute: dict[str, list[CallbackRequest]] = defaultdict(list)
@@ -750,59 +777,129 @@ class DagFileProcessorManager(LoggingMixin):
             self._add_paths_to_queue([request.full_filepath], True)
             Stats.incr("dag_processing.other_callback_count")
 
+    def _get_dag_dir_watcher(self) -> BaseDagDirectoryWatcher | None:
+        """Start watching the DAGs directory on first use, if configured to."""
+        if self._dag_dir_watcher is None and self._dag_dir_watch_mode.lower() != "none":
+            if os.path.isdir(self._dag_directory):
+                try:
+                    self._dag_dir_watcher = start_dag_directory_watcher(
+                        self._dag_dir_watch_mode, str(self._dag_directory), self.dag_dir_list_interval
+                    )
+                except OSError:
+                    self.log.warning(
+                        "Cannot watch %s, listing it every %s seconds instead",
+                        self._dag_directory,
+                        self.dag_dir_list_interval,
+                        exc_info=True,
+                    )
+            if self._dag_dir_watcher is None:
+                self._dag_dir_watch_mode = "none"
+        return self._dag_dir_watcher
+
     def _refresh_dag_dir(self) -> bool:
         """Refresh file paths from dag dir if we haven't done it for too long."""
         now = timezone.utcnow()
         elapsed_time_since_refresh = (now - self.last_dag_dir_refresh_time).total_seconds()
-        if elapsed_time_since_refresh > self.dag_dir_list_interval:
-            # Build up a list of Python files that could contain DAGs
-            self.log.info("Searching for files in %s", self._dag_directory)
-            self._file_paths = list_py_file_paths(self._dag_directory)
-            self.last_dag_dir_refresh_time = now
-            self.log.info("There are %s files in %s", len(self._file_paths), self._dag_directory)
-            self.set_file_paths(self._file_paths)
+        watcher = self._get_dag_dir_watcher()
+        if watcher is not None:
+            # Only the changed files are looked at, the full listing is just a safety net.
+            changes = watcher.poll()
+            if not changes.rescan and elapsed_time_since_refresh <= self.dag_dir_full_rescan_interval:
+                return self._apply_dag_dir_changes(changes.paths)
+            self._file_mtimes.clear()
+        elif elapsed_time_since_refresh <= self.dag_dir_list_interval:
+            return False
 
-            try:
-                self.log.debug("Removing old import errors")
-                DagFileProcessorManager.clear_nonexistent_import_errors(file_paths=self._file_paths)
-            except Exception:
-                self.log.exception("Error removing old import errors")
-
-            def _iter_dag_filelocs(fileloc: str) -> Iterator[str]:
-                """Get "full" paths to DAGs if inside ZIP files.
-
-                This is the format used by the remove/delete functions.
-                """
-                if fileloc.endswith(".py") or not zipfile.is_zipfile(fileloc):
-                    yield fileloc
-                    return
-                try:
-                    with zipfile.ZipFile(fileloc) as z:
-                        for info in z.infolist():
-                            if might_contain_dag(info.filename, True, z):
-                                yield os.path.join(fileloc, info.filename)
-                except zipfile.BadZipFile:
-                    self.log.exception("There was an error accessing ZIP file %s %s", fileloc)
+        # Build up a list of Python files that could contain DAGs
+        self.log.info("Searching for files in %s", self._dag_directory)
+        self._file_paths = list_py_file_paths(self._dag_directory)
+        self.last_dag_dir_refresh_time = now
+        self.log.info("There are %s files in %s", len(self._file_paths), self._dag_directory)
+        self.set_file_paths(self._file_paths)
+        self._remove_deleted_dag_files()
+        return True
 
-            dag_filelocs = {full_loc for path in self._file_paths for full_loc in _iter_dag_filelocs(path)}
+    def _apply_dag_dir_changes(self, changed_paths: set[str]) -> bool:
+        """
+        Update the known file paths from the files the DAGs directory watcher saw changing.
 
-            from airflow.models.dagcode import DagCode
+        Changed and new DAG files are queued for parsing straight away.
 
-            SerializedDagModel.remove_deleted_dags(
-                alive_dag_filelocs=dag_filelocs,
-                processor_subdir=self.get_dag_directory(),
-            )
-            DagModel.deactivate_deleted_dags(
-                dag_filelocs,
-                processor_subdir=self.get_dag_directory(),
+        :return: whether DAG files were added or removed.
+        """
+        if not changed_paths:
+            return False
+        Stats.incr("dag_processing.dag_dir_watch_changes", len(changed_paths))
+        safe_mode = conf.getboolean("core", "dag_discovery_safe_mode", fallback=True)
+        known_file_paths = set(self._file_paths)
+        modified, added, removed = [], [], set()
+        for file_path in sorted(changed_paths):
+            self._file_mtimes.pop(file_path, None)
+            if is_dag_file_path(self._dag_directory, file_path, safe_mode):
+                (modified if file_path in known_file_paths else added).append(file_path)
+            elif file_path in known_file_paths:
+                removed.add(file_path)
+
+        if added or removed:
+            self.log.info(
+                "Found %s new and %s deleted files in %s", len(added), len(removed), self._dag_directory
             )
-            DagCode.remove_deleted_code(
-                dag_filelocs,
-                processor_subdir=self.get_dag_directory(),
+            self.set_file_paths([path for path in self._file_paths if path not in removed] + added)
+        if removed:
+            self._remove_deleted_dag_files()
+
+        file_paths_to_queue = modified + added
+        if file_paths_to_queue:
+            self.log.debug("Queuing changed files for processing:\n\t%s", "\n\t".join(file_paths_to_queue))
+            for file_path in added:
+                self._file_stats.setdefault(file_path, DagFileProcessorManager.DEFAULT_FILE_STAT)
+            self._file_path_queue = collections.deque(
+                path for path in self._file_path_queue if path not in file_paths_to_queue
             )
+            # extendleft reverses the order of the paths
+            self._add_paths_to_queue(file_paths_to_queue[::-1], True)
+        return bool(added or removed)
 
-            return True
-        return False
+    def _remove_deleted_dag_files(self) -> None:
+        """Remove import errors and deactivate DAGs of files which are no longer in the DAGs directory."""
+        try:
+            self.log.debug("Removing old import errors")
+            DagFileProcessorManager.clear_nonexistent_import_errors(file_paths=self._file_paths)
+        except Exception:
+            self.log.exception("Error removing old import errors")
+
+        def _iter_dag_filelocs(fileloc: str) -> Iterator[str]:
+            """Get "full" paths to DAGs if inside ZIP files.
+
+            This is the format used by the remove/delete functions.
+            """
+            if fileloc.endswith(".py") or not zipfile.is_zipfile(fileloc):
+                yield fileloc
+                return
+            try:
+                with zipfile.ZipFile(fileloc) as z:
+                    for info in z.infolist():
+                        if might_contain_dag(info.filename, True, z):
+                            yield os.path.join(fileloc, info.filename)
+            except zipfile.BadZipFile:
+                self.log.exception("There was an error accessing ZIP file %s %s", fileloc)
+
+        dag_filelocs = {full_loc for path in self._file_paths for full_loc in _iter_dag_filelocs(path)}
+
+        from airflow.models.dagcode import DagCode
+
+        SerializedDagModel.remove_deleted_dags(
+            alive_dag_filelocs=dag_filelocs,
+            processor_subdir=self.get_dag_directory(),
+        )
+        DagModel.deactivate_deleted_dags(
+            dag_filelocs,
+            processor_subdir=self.get_dag_directory(),
+        )
+        DagCode.remove_deleted_code(
+            dag_filelocs,
+            processor_subdir=self.get_dag_directory(),
+        )
 
     def _print_stat(self):
         """Occasionally print out stats about how fast the files are getting processed."""
@@ -1006,12 +1103,18 @@ class DagFileProcessorManager(LoggingMixin):
                 Stats.decr("dag_processing.processes", tags={"file_path": file_path, "action": "stop"})
                 processor.terminate()
                 self._file_stats.pop(file_path)
+                self._processor_fingerprints.pop(file_path, None)
 
         to_remove = set(self._file_stats).difference(self._file_paths)
         for key in to_remove:
             # Remove the stats for any dag files that don't exist anymore
             del self._file_stats[key]
 
+        for file_path in set(self._file_fingerprints).difference(new_file_paths):
+            del self._file_fingerprints[file_path]
+            if self._fingerprinter is not None:
+                self._fingerprinter.forget(file_path)
+
         self._processors = filtered_processors
 
     def wait_until_finished(self):
@@ -1034,6 +1137,12 @@ class DagFileProcessorManager(LoggingMixin):
             count_import_errors = -1
             num_dags = 0
 
+        fingerprint = self._processor_fingerprints.pop(processor.file_path, None)
+        if fingerprint is not None and count_import_errors == 0:
+            self._file_fingerprints[processor.file_path] = fingerprint
+        else:
+            self._file_fingerprints.pop(processor.file_path, None)
+
         last_duration = last_finish_time - processor.start_time
         stat = DagFileStat(
             num_dags=num_dags,
@@ -1090,13 +1199,32 @@ class DagFileProcessorManager(LoggingMixin):
                 continue
 
             callback_to_execute_for_file = self._callback_to_execute[file_path]
-            processor = self._create_process(
-                file_path,
-                self._pickle_dags,
-                self._dag_ids,
-                self.get_dag_directory(),
-                callback_to_execute_for_file,
-            )
+            if self._fingerprinter is not None and file_path.endswith(".py"):
+                fingerprint = self._fingerprinter.fingerprint(file_path)
+                if not callback_to_execute_for_file and self._skip_unchanged_file(file_path, fingerprint):
+                    del self._callback_to_execute[file_path]
+                    continue
+                if fingerprint is not None:
+                    self._processor_fingerprints[file_path] = fingerprint
+
+            processor: DagFileProcessorProcess
+            if self._worker_pool is not None:
+                processor = PooledDagFileProcessorProcess(
+                    self._worker_pool,
+                    file_path,
+                    self._pickle_dags,
+                    self._dag_ids,
+                    self.get_dag_directory(),
+                    callback_to_execute_for_file,
+                )
+            else:
+                processor = self._create_process(
+                    file_path,
+                    self._pickle_dags,
+                    self._dag_ids,
+                    self.get_dag_directory(),
+                    callback_to_execute_for_file,
+                )
 
             del self._callback_to_execute[file_path]
             Stats.incr("dag_processing.processes", tags={"file_path": file_path, "action": "start"})
@@ -1108,6 +1236,54 @@ class DagFileProcessorManager(LoggingMixin):
 
             Stats.gauge("dag_processing.file_path_queue_size", len(self._file_path_queue))
 
+    def _skip_unchanged_file(self, file_path: str, fingerprint: str | None) -> bool:
+        """
+        Record a file as parsed without parsing it, if it did not change since it was last parsed.
+
+        :return: whether the file was skipped.
+        """
+        if fingerprint is None or self._file_fingerprints.get(file_path) != fingerprint:
+            return False
+        stat = self._file_stats.get(file_path, DagFileProcessorManager.DEFAULT_FILE_STAT)
+        now = timezone.utcnow()
+        # The DAGs must not be deactivated as stale because their file was not parsed.
+        if self.update_dags_last_parsed_time(fileloc=file_path, last_parsed_time=now) != stat.num_dags:
+            # Some DAGs were deleted or deactivated since the file was last parsed, parse it again.
+            self._file_fingerprints.pop(file_path)
+            return False
+        self.log.debug("Skipping unchanged file %s", file_path)
+        self._file_stats[file_path] = DagFileStat(
+            num_dags=stat.num_dags,
+            import_errors=0,
+            last_finish_time=now,
+            last_duration=timezone.utcnow() - now,
+            run_count=stat.run_count + 1,
+        )
+        Stats.incr("dag_processing.unchanged_files_skipped")
+        return True
+
+    @staticmethod
+    @internal_api_call
+    @provide_session
+    def update_dags_last_parsed_time(
+        fileloc: str, last_parsed_time: datetime, session: Session = NEW_SESSION
+    ) -> int:
+        """
+        Mark the active DAGs of a file as parsed, when the file did not change since it was last parsed.
+
+        :param fileloc: path to the DAG definition file
+        :param last_parsed_time: time the file was found unchanged
+        :param session: session for ORM operations
+        :return: number of DAGs updated
+        """
+        updated = (
+            session.query(DagModel)
+            .filter(DagModel.fileloc == fileloc, DagModel.is_active)
+            .update({DagModel.last_parsed_time: last_parsed_time}, synchronize_session=False)
+        )
+        session.commit()
+        return updated
+
     def add_new_file_path_to_queue(self):
         for file_path in self.file_paths:
             if file_path not in self._file_stats:
@@ -1140,7 +1316,7 @@ class DagFileProcessorManager(LoggingMixin):
         for file_path in self._file_paths:
             if is_mtime_mode:
                 try:
-                    files_with_mtime[file_path] = os.path.getmtime(file_path)
+                    files_with_mtime[file_path] = self._get_file_mtime(file_path)
                 except FileNotFoundError:
                     self.log.warning("Skipping processing of missing file: %s", file_path)
                     self._file_stats.pop(file_path, None)
@@ -1207,6 +1383,15 @@ class DagFileProcessorManager(LoggingMixin):
         self._add_paths_to_queue(files_paths_to_queue, False)
         Stats.incr("dag_processing.file_path_queue_update_count")
 
+    def _get_file_mtime(self, file_path: str) -> float:
+        """Get the modification time of a file, cached while the DAGs directory watcher tracks changes."""
+        if self._dag_dir_watcher is None:
+            return os.path.getmtime(file_path)
+        mtime = self._file_mtimes.get(file_path)
+        if mtime is None:
+            mtime = self._file_mtimes[file_path] = os.path.getmtime(file_path)
+        return mtime
+
     def _kill_timed_out_processors(self):
         """Kill any file processors that timeout to defend against process hangs."""
         now = timezone.utcnow()
@@ -1229,6 +1414,8 @@ class DagFileProcessorManager(LoggingMixin):
                 # Clean up processor references
                 self.waitables.pop(processor.waitable_handle)
                 processors_to_remove.append(file_path)
+                self._processor_fingerprints.pop(file_path, None)
+                self._file_fingerprints.pop(file_path, None)
 
                 stat = DagFileStat(
                     num_dags=0,
@@ -1270,12 +1457,19 @@ class DagFileProcessorManager(LoggingMixin):
                 "dag_processing.processes", tags={"file_path": processor.file_path, "action": "terminate"}
             )
             processor.terminate()
+        if self._worker_pool is not None:
+            self._worker_pool.stop()
 
     def end(self):
         """Kill all child processes on exit since we don't want to leave them as orphaned."""
         pids_to_kill = self.get_all_pids()
         if pids_to_kill:
             kill_child_processes_by_pids(pids_to_kill)
+        if self._worker_pool is not None:
+            self._worker_pool.stop()
+        if self._dag_dir_watcher is not None:
+            self._dag_dir_watcher.stop()
+            self._dag_dir_watcher = None
 
     def emit_metrics(self):
         """
@@ -27,7 +27,7 @@ import zipfile
 from contextlib import redirect_stderr, redirect_stdout, suppress
 from datetime import datetime, timedelta
 from multiprocessing.connection import Connection as MultiprocessingConnection
-from typing import TYPE_CHECKING, Iterable, Iterator
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
 
 from setproctitle import setproctitle
 from sqlalchemy import delete, exc, func, or_
@@ -119,6 +119,8 @@ class DagFileProcessorProcess(LoggingMixin, MultiprocessingStartMethodMixin):
         thread_name: str,
         dag_directory: str,
         callback_requests: list[CallbackRequest],
+        launch_time: float | None = None,
+        start_method: str | None = None,
     ) -> None:
         """
         Process the given file.
@@ -132,9 +134,20 @@ class DagFileProcessorProcess(LoggingMixin, MultiprocessingStartMethodMixin):
             in this list
         :param thread_name: the name to use for the process that is launched
         :param callback_requests: failure callback to execute
+        :param launch_time: when the parent started launching this process, to measure the startup cost
+        :param start_method: the multiprocessing start method used to launch this process
         :return: the process that was launched
         """
         # This helper runs in the newly created process
+        if launch_time is not None:
+            startup_time = timedelta(seconds=time.time() - launch_time)
+            file_name = os.path.splitext(os.path.basename(file_path))[0].replace(os.sep, ".")
+            Stats.timing(f"dag_processing.processor_startup_time.{start_method}", startup_time)
+            Stats.timing(
+                "dag_processing.processor_startup_time",
+                startup_time,
+                tags={"start_method": start_method, "file_name": file_name},
+            )
         log: logging.Logger = logging.getLogger("airflow.processor")
 
         # Since we share all open FDs from the parent, we need to close the parent side of the pipe here in
@@ -164,19 +177,7 @@ class DagFileProcessorProcess(LoggingMixin, MultiprocessingStartMethodMixin):
             result_channel.send(result)
 
         try:
-            DAG_PROCESSOR_LOG_TARGET = conf.get_mandatory_value("logging", "DAG_PROCESSOR_LOG_TARGET")
-            if DAG_PROCESSOR_LOG_TARGET == "stdout":
-                with Stats.timer() as timer:
-                    _handle_dag_file_processing()
-            else:
-                # The following line ensures that stdout goes to the same destination as the logs. If stdout
-                # gets sent to logs and logs are sent to stdout, this leads to an infinite loop. This
-                # necessitates this conditional based on the value of DAG_PROCESSOR_LOG_TARGET.
-                with redirect_stdout(StreamLogWriter(log, logging.INFO)), redirect_stderr(
-                    StreamLogWriter(log, logging.WARN)
-                ), Stats.timer() as timer:
-                    _handle_dag_file_processing()
-            log.info("Processing %s took %.3f seconds", file_path, timer.duration)
+            DagFileProcessorProcess._run_with_log_redirect(log, file_path, _handle_dag_file_processing)
         except Exception:
             # Log exceptions through the logging framework.
             log.exception("Got an exception! Propagating...")
@@ -188,9 +189,53 @@ class DagFileProcessorProcess(LoggingMixin, MultiprocessingStartMethodMixin):
 
             result_channel.close()
 
+    @staticmethod
+    def _run_with_log_redirect(
+        log: logging.Logger, file_path: str, handle_dag_file_processing: Callable[[], None]
+    ) -> None:
+        """Process a file, with its standard output and error sent to the DAG processor logs if needed."""
+        DAG_PROCESSOR_LOG_TARGET = conf.get_mandatory_value("logging", "DAG_PROCESSOR_LOG_TARGET")
+        if DAG_PROCESSOR_LOG_TARGET == "stdout":
+            with Stats.timer() as timer:
+                handle_dag_file_processing()
+        else:
+            # The following line ensures that stdout goes to the same destination as the logs. If stdout
+            # gets sent to logs and logs are sent to stdout, this leads to an infinite loop. This
+            # necessitates this conditional based on the value of DAG_PROCESSOR_LOG_TARGET.
+            with redirect_stdout(StreamLogWriter(log, logging.INFO)), redirect_stderr(
+                StreamLogWriter(log, logging.WARN)
+            ), Stats.timer() as timer:
+                handle_dag_file_processing()
+        log.info("Processing %s took %.3f seconds", file_path, timer.duration)
+
+    def _get_multiprocessing_start_method(self) -> str:
+        return (
+            conf.get("scheduler", "parsing_start_method", fallback="")
+            or super()._get_multiprocessing_start_method()
+        )
+
+    def _get_multiprocessing_context(self) -> multiprocessing.context.DefaultContext:
+        context = super()._get_multiprocessing_context()
+        if self._get_multiprocessing_start_method() == "forkserver":
+            # Only effective before the fork server is started, i.e. before the first file is processed.
+            context.set_forkserver_preload(
+                [
+                    module.strip()
+                    for module in conf.get("scheduler", "parsing_preload_modules", fallback="").split(",")
+                    if module.strip()
+                ]
+            )
+        return context
+
     def start(self) -> None:
         """Launch the process and start processing the DAG."""
-        if conf.getboolean("scheduler", "parsing_pre_import_modules", fallback=True):
+        start_method = self._get_multiprocessing_start_method()
+        context = self._get_multiprocessing_context()
+
+        # Pre-imported modules are only inherited by forked processes.
+        if start_method == "fork" and conf.getboolean(
+            "scheduler", "parsing_pre_import_modules", fallback=True
+        ):
             # Read the file to pre-import airflow modules used.
             # This prevents them from being re-imported from zero in each "processing" process
             # and saves CPU time and memory.
@@ -212,8 +257,6 @@ class DagFileProcessorProcess(LoggingMixin, MultiprocessingStartMethodMixin):
             else:
                 self.import_modules(self.file_path)
 
-        context = self._get_multiprocessing_context()
-
         _parent_channel, _child_channel = context.Pipe(duplex=False)
         process = context.Process(
             target=type(self)._run_file_processor,
@@ -226,6 +269,8 @@ class DagFileProcessorProcess(LoggingMixin, MultiprocessingStartMethodMixin):
                 f"DagFileProcessor{self._instance_id}",
                 self._dag_directory,
                 self._callback_requests,
+                time.time(),
+                start_method,
             ),
             name=f"DagFileProcessor{self._instance_id}-Process",
         )
@@ -0,0 +1,283 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Watchers reporting changed files in the DAGs folder, so it does not have to be listed over and over."""
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import struct
+import sys
+import time
+from typing import NamedTuple
+
+from airflow.exceptions import AirflowConfigException
+from airflow.utils.log.logging_mixin import LoggingMixin
+
+log = logging.getLogger(__name__)
+
+IGNORE_FILE_NAME = ".airflowignore"
+
+
+class DagDirectoryChanges(NamedTuple):
+    """
+    Changes found in the DAGs folder since the last poll.
+
+    :param paths: Files that were created, modified, moved or deleted.
+    :param rescan: Whether the watcher could not tell precisely what changed (e.g. a directory was
+        moved or an ignore file changed), in which case the whole folder has to be listed again.
+    """
+
+    paths: set[str]
+    rescan: bool
+
+
+class BaseDagDirectoryWatcher(LoggingMixin):
+    """
+    Base class for DAGs folder watchers.
+
+    :param directory: The DAGs folder to watch, recursively.
+    """
+
+    def __init__(self, directory: str):
+        super().__init__()
+        self.directory = directory
+
+    def start(self) -> None:
+        """Start watching the folder."""
+        raise NotImplementedError()
+
+    def poll(self) -> DagDirectoryChanges:
+        """Return, without blocking, the changes since the previous call."""
+        raise NotImplementedError()
+
+    def stop(self) -> None:
+        """Stop watching the folder."""
+
+
+class PollingDagDirectoryWatcher(BaseDagDirectoryWatcher):
+    """
+    Watcher comparing the modification times of all files in the folder, for platforms without inotify.
+
+    This still walks the folder, but it only stats files: ignore files and DAG file contents are only read
+    for the files that changed, and nothing is done in the database.
+
+    :param directory: The DAGs folder to watch, recursively.
+    :param poll_interval: Minimum number of seconds between two walks of the folder.
+    """
+
+    def __init__(self, directory: str, poll_interval: float):
+        super().__init__(directory)
+        self.poll_interval = poll_interval
+        self._mtimes: dict[str, float] = {}
+        self._last_poll = 0.0
+
+    def _walk(self) -> dict[str, float]:
+        mtimes = {}
+        for root, _, files in os.walk(self.directory, followlinks=True):
+            for file in files:
+                path = os.path.join(root, file)
+                try:
+                    mtimes[path] = os.stat(path).st_mtime
+                except FileNotFoundError:
+                    continue
+        return mtimes
+
+    def start(self) -> None:
+        self._mtimes = self._walk()
+        self._last_poll = time.monotonic()
+
+    def poll(self) -> DagDirectoryChanges:
+        if time.monotonic() - self._last_poll < self.poll_interval:
+            return DagDirectoryChanges(set(), False)
+        mtimes = self._walk()
+        self._last_poll = time.monotonic()
+        changed = {path for path, mtime in mtimes.items() if self._mtimes.get(path) != mtime}
+        changed.update(path for path in self._mtimes if path not in mtimes)
+        self._mtimes = mtimes
+        rescan = any(os.path.basename(path) == IGNORE_FILE_NAME for path in changed)
+        return DagDirectoryChanges(changed, rescan)
+
+
+# Constants from <sys/inotify.h>
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = (
+    IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _load_libc():
+    if not sys.platform.startswith("linux"):
+        return None
+    libc_name = ctypes.util.find_library("c")
+    if not libc_name:
+        return None
+    try:
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+    except OSError:
+        return None
+    return libc if hasattr(libc, "inotify_init1") else None
+
+
+class InotifyDagDirectoryWatcher(BaseDagDirectoryWatcher):
+    """
+    Watcher using Linux inotify, which costs nothing as long as nothing changes.
+
+    Note that inotify does not see changes made on other hosts to network file systems.
+
+    :param directory: The DAGs folder to watch, recursively.
+    """
+
+    def __init__(self, directory: str):
+        super().__init__(directory)
+        self._libc = _load_libc()
+        self._fd: int | None = None
+        self._watches: dict[int, str] = {}
+
+    def start(self) -> None:
+        if self._libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not available on this platform")
+        fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._fd = fd
+        try:
+            self._add_watches(self.directory)
+        except OSError:
+            self.stop()
+            raise
+
+    def _add_watches(self, directory: str) -> None:
+        assert self._libc is not None
+        for root, _, _ in os.walk(directory, followlinks=True):
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(root), _WATCH_MASK)
+            if wd < 0:
+                err = ctypes.get_errno()
+                if err == errno.ENOENT:
+                    continue
+                # Typically ENOSPC, when fs.inotify.max_user_watches is too low for the folder.
+                raise OSError(err, f"Cannot watch {root}: {os.strerror(err)}")
+            self._watches[wd] = root
+
+    def poll(self) -> DagDirectoryChanges:
+        changed: set[str] = set()
+        rescan = False
+        while True:
+            try:
+                buffer = os.read(self._fd, 64 * 1024)  # type: ignore[arg-type]
+            except BlockingIOError:
+                break
+            if not buffer:
+                break
+            offset = 0
+            while offset < len(buffer):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(buffer, offset)
+                offset += _EVENT_HEADER.size
+                name = os.fsdecode(buffer[offset : offset + length].rstrip(b"\0"))
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    rescan = True
+                    continue
+                if mask & IN_IGNORED:
+                    self._watches.pop(wd, None)
+                    continue
+                directory = self._watches.get(wd)
+                if directory is None:
+                    continue
+                if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                    rescan = True
+                    continue
+                path = os.path.join(directory, name)
+                if mask & IN_ISDIR:
+                    # Directories appearing or disappearing may carry many files with them.
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        try:
+                            self._add_watches(path)
+                        except OSError:
+                            self.log.warning("Could not watch new directory %s", path, exc_info=True)
+                    rescan = True
+                    continue
+                if name == IGNORE_FILE_NAME:
+                    rescan = True
+                changed.add(path)
+        return DagDirectoryChanges(changed, rescan)
+
+    def stop(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            self._watches.clear()
+
+
+def start_dag_directory_watcher(
+    mode: str, directory: str, poll_interval: float
+) -> BaseDagDirectoryWatcher | None:
+    """
+    Start the DAGs folder watcher for ``[scheduler] dag_dir_watch_mode``; return None if disabled.
+
+    :param mode: One of ``none``, ``auto`` (inotify, falling back to polling if inotify cannot be
+        used), ``inotify`` or ``polling``.
+    :param directory: The DAGs folder to watch.
+    :param poll_interval: Minimum number of seconds between two walks of the folder, in polling mode.
+    """
+    mode = mode.lower()
+    if mode == "none":
+        return None
+    watcher: BaseDagDirectoryWatcher
+    if mode in ("auto", "inotify"):
+        watcher = InotifyDagDirectoryWatcher(directory)
+        try:
+            watcher.start()
+            return watcher
+        except OSError:
+            if mode == "inotify":
+                raise
+            log.warning("Cannot use inotify to watch %s, falling back to polling", directory, exc_info=True)
+        mode = "polling"
+    if mode == "polling":
+        watcher = PollingDagDirectoryWatcher(directory, poll_interval)
+        watcher.start()
+        return watcher
+    raise AirflowConfigException(
+        f"Unknown [scheduler] dag_dir_watch_mode {mode!r}, expected one of none, auto, inotify, polling"
+    )
@@ -0,0 +1,295 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Long-lived worker processes parsing DAG files one after the other, instead of one process per file."""
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+from multiprocessing.connection import Connection as MultiprocessingConnection
+from typing import TYPE_CHECKING
+
+import psutil
+from setproctitle import setproctitle
+
+from airflow import settings
+from airflow.dag_processing.processor import DagFileProcessor, DagFileProcessorProcess
+from airflow.exceptions import AirflowException
+from airflow.stats import Stats
+from airflow.utils import timezone
+from airflow.utils.log.logging_mixin import LoggingMixin, set_context
+
+if TYPE_CHECKING:
+    import multiprocessing.context
+
+    from airflow.callbacks.callback_requests import CallbackRequest
+
+# How often an idle worker checks whether the DAG file processor manager is still alive.
+PARENT_CHECK_INTERVAL = 5.0
+
+
+def _unload_modules(module_names: set[str], directory: str) -> None:
+    """Forget the modules loaded from files in ``directory``, so they are imported again when changed."""
+    directory = os.path.join(os.path.realpath(directory), "")
+    for name in module_names:
+        module_file = getattr(sys.modules.get(name), "__file__", None)
+        if module_file and os.path.realpath(module_file).startswith(directory):
+            del sys.modules[name]
+
+
+def _run_worker(
+    connection: MultiprocessingConnection,
+    parent_connection: MultiprocessingConnection,
+    max_files: int,
+    max_memory_mb: int,
+) -> None:
+    """
+    Parse the DAG files received on the connection, one at a time, until asked to stop or recycled.
+
+    :param connection: the connection to receive files to parse on, and to send results back with
+    :param parent_connection: the parent end of the connection to close in the worker
+    :param max_files: number of files to parse before exiting, so a new worker is started
+    :param max_memory_mb: memory usage in MiB above which to exit after a file, 0 for no limit
+    """
+    # This helper runs in the newly created process
+    log: logging.Logger = logging.getLogger("airflow.processor")
+
+    parent_connection.close()
+    del parent_connection
+
+    parent_pid = os.getppid()
+    setproctitle("airflow scheduler - DagFileProcessor worker")
+    # Re-configure the ORM engine as there are issues with multiple processes
+    settings.configure_orm()
+    try:
+        num_files = 0
+        while True:
+            if not connection.poll(PARENT_CHECK_INTERVAL):
+                if os.getppid() != parent_pid:
+                    break
+                continue
+            try:
+                (
+                    file_path,
+                    pickle_dags,
+                    dag_ids,
+                    dag_directory,
+                    callback_requests,
+                    thread_name,
+                ) = connection.recv()
+            except EOFError:
+                break
+            num_files += 1
+
+            set_context(log, file_path)
+            setproctitle(f"airflow scheduler - DagFileProcessor {file_path}")
+            # Change the thread name to differentiate log lines, as for one-off processes.
+            threading.current_thread().name = thread_name
+            result: tuple[int, int] | None = None
+
+            def _handle_dag_file_processing():
+                nonlocal result
+                log.info("Started worker (PID=%s) to work on %s", os.getpid(), file_path)
+                dag_file_processor = DagFileProcessor(dag_ids=dag_ids, dag_directory=dag_directory, log=log)
+                result = dag_file_processor.process_file(
+                    file_path=file_path,
+                    pickle_dags=pickle_dags,
+                    callback_requests=callback_requests,
+                )
+
+            modules_before = set(sys.modules)
+            try:
+                DagFileProcessorProcess._run_with_log_redirect(log, file_path, _handle_dag_file_processing)
+                recycle = num_files >= max_files
+                if max_memory_mb and not recycle:
+                    recycle = psutil.Process().memory_info().rss > max_memory_mb * 1024 * 1024
+            except Exception:
+                log.exception("Got an exception! Recycling the worker...")
+                recycle = True
+            _unload_modules(set(sys.modules) - modules_before, dag_directory)
+
+            connection.send((result, recycle))
+            if recycle:
+                break
+            setproctitle("airflow scheduler - DagFileProcessor worker")
+    finally:
+        # We re-initialized the ORM within this Process above so we need to
+        # tear it down manually here
+        settings.dispose_orm()
+
+        connection.close()
+
+
+class DagFileProcessorWorker(LoggingMixin):
+    """
+    A long-lived process parsing DAG files, see :func:`_run_worker`.
+
+    :param context: the multiprocessing context to start the process with
+    :param max_files: number of files to parse before the worker exits
+    :param max_memory_mb: memory usage in MiB above which the worker exits after a file, 0 for no limit
+    """
+
+    def __init__(self, context: multiprocessing.context.DefaultContext, max_files: int, max_memory_mb: int):
+        super().__init__()
+        self.connection, child_connection = context.Pipe()
+        self.process = context.Process(
+            target=_run_worker,
+            args=(child_connection, self.connection, max_files, max_memory_mb),
+            name="DagFileProcessorWorker-Process",
+        )
+        self.process.start()
+        # Close the child side of the pipe now the subprocess has started
+        child_connection.close()
+        Stats.incr("dag_processing.worker_starts")
+
+    def stop(self) -> None:
+        """Stop the worker, waiting a bit for it to exit by itself first."""
+        self.connection.close()
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.log.warning("Killing DagFileProcessorWorker (PID=%d)", self.process.pid)
+            self.process.kill()
+            self.process.join()
+
+
+class DagFileProcessorWorkerPool(LoggingMixin):
+    """
+    Pool of long-lived processes parsing DAG files.
+
+    Workers are started on demand and reused as long as they are healthy: a worker exits after
+    ``max_files`` files, when it uses more than ``max_memory_mb`` MiB, or after a failure, and a new one
+    is started the next time one is needed.
+
+    :param max_files: number of files a worker parses before being replaced
+    :param max_memory_mb: memory usage in MiB above which a worker is replaced, 0 for no limit
+    """
+
+    def __init__(self, max_files: int, max_memory_mb: int):
+        super().__init__()
+        self.max_files = max_files
+        self.max_memory_mb = max_memory_mb
+        self._idle_workers: list[DagFileProcessorWorker] = []
+
+    def acquire(self, context: multiprocessing.context.DefaultContext) -> DagFileProcessorWorker:
+        """Return an idle worker, starting a new one if needed."""
+        while self._idle_workers:
+            worker = self._idle_workers.pop()
+            if worker.process.is_alive():
+                return worker
+            worker.stop()
+        return DagFileProcessorWorker(context, self.max_files, self.max_memory_mb)
+
+    def release(self, worker: DagFileProcessorWorker) -> None:
+        """Make a worker which finished processing a file available again."""
+        self._idle_workers.append(worker)
+
+    def stop(self) -> None:
+        """Stop all idle workers, busy workers are stopped through their processor."""
+        for worker in self._idle_workers:
+            worker.stop()
+        self._idle_workers.clear()
+
+
+class PooledDagFileProcessorProcess(DagFileProcessorProcess):
+    """
+    Processes a DAG file in a worker from a :class:`DagFileProcessorWorkerPool`.
+
+    :param pool: the pool to get a worker from
+    :param file_path: a Python file containing Airflow DAG definitions
+    :param pickle_dags: whether to serialize the DAG objects to the DB
+    :param dag_ids: If specified, only look at these DAG ID's
+    :param callback_requests: failure callback to execute
+    """
+
+    def __init__(
+        self,
+        pool: DagFileProcessorWorkerPool,
+        file_path: str,
+        pickle_dags: bool,
+        dag_ids: list[str] | None,
+        dag_directory: str,
+        callback_requests: list[CallbackRequest],
+    ):
+        super().__init__(file_path, pickle_dags, dag_ids, dag_directory, callback_requests)
+        self._pool = pool
+        self._worker: DagFileProcessorWorker | None = None
+        self._result_received = False
+
+    def start(self) -> None:
+        """Send the file to an idle worker."""
+        worker = self._pool.acquire(self._get_multiprocessing_context())
+        self._worker = worker
+        # Killing, terminating and getting the PID or exit code of this processor apply to the worker.
+        self._process = worker.process
+        self._parent_channel = worker.connection
+        self._start_time = timezone.utcnow()
+        worker.connection.send(
+            (
+                self.file_path,
+                self._pickle_dags,
+                self._dag_ids,
+                self._dag_directory,
+                self._callback_requests,
+                f"DagFileProcessor{self._instance_id}",
+            )
+        )
+
+    @property
+    def done(self) -> bool:
+        """
+        Check if the worker is done processing this file.
+
+        The result is only read from the worker by :attr:`result`, so the waitable handle stays ready
+        until the result is collected.
+
+        :return: whether the file is processed
+        """
+        if self._worker is None:
+            raise AirflowException("Tried to see if it's done before starting!")
+
+        if not self._done:
+            self._done = self._worker.connection.poll() or not self._worker.process.is_alive()
+        return self._done
+
+    @property
+    def result(self) -> tuple[int, int] | None:
+        """Result of running ``DagFileProcessor.process_file()``."""
+        if not self.done:
+            raise AirflowException("Tried to get the result before it's done!")
+        if not self._result_received:
+            self._result_received = True
+            worker = self._worker
+            recycle = True
+            try:
+                if worker.connection.poll():
+                    self._result, recycle = worker.connection.recv()
+            except (EOFError, OSError):
+                # The worker died
+                pass
+            if recycle:
+                worker.stop()
+            else:
+                self._pool.release(worker)
+        return self._result
+
+    @property
+    def waitable_handle(self):
+        if self._worker is None:
+            raise AirflowException("Tried to get the waitable handle before starting!")
+        return self._worker.connection
@@ -27,7 +27,9 @@ from __future__ import annotations
 import logging
 import os
 import subprocess
+import sys
 from abc import abstractmethod
+from collections import OrderedDict
 from multiprocessing import Manager, Process
 from multiprocessing.managers import SyncManager
 from queue import Empty, Queue
@@ -36,13 +38,18 @@ from typing import TYPE_CHECKING, Any, Optional, Tuple
 from setproctitle import getproctitle, setproctitle
 
 from airflow import settings
+from airflow.configuration import conf
 from airflow.exceptions import AirflowException
 from airflow.executors.base_executor import PARALLELISM, BaseExecutor
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.state import TaskInstanceState
 
 if TYPE_CHECKING:
+    from argparse import Namespace
+
     from airflow.executors.base_executor import CommandType
+    from airflow.models.dag import DAG
+    from airflow.models.dagbag import DagBag
     from airflow.models.taskinstance import TaskInstanceStateType
     from airflow.models.taskinstancekey import TaskInstanceKey
 
@@ -115,20 +122,11 @@ class LocalWorkerBase(Process, LoggingMixin):
         try:
             import signal
 
-            from airflow.cli.cli_parser import get_parser
-
             signal.signal(signal.SIGINT, signal.SIG_DFL)
             signal.signal(signal.SIGTERM, signal.SIG_DFL)
             signal.signal(signal.SIGUSR2, signal.SIG_DFL)
 
-            parser = get_parser()
-            # [1:] - remove "airflow" from the start of the command
-            args = parser.parse_args(command[1:])
-            args.shut_down_logging = False
-
-            setproctitle(f"airflow task supervisor: {command}")
-
-            args.func(args)
+            self._run_command(command)
             ret = 0
             return TaskInstanceState.SUCCESS
         except Exception as e:
@@ -139,6 +137,19 @@ class LocalWorkerBase(Process, LoggingMixin):
             logging.shutdown()
             os._exit(ret)
 
+    def _run_command(self, command: CommandType) -> None:
+        """Run the command in the fork of the worker."""
+        from airflow.cli.cli_parser import get_parser
+
+        parser = get_parser()
+        # [1:] - remove "airflow" from the start of the command
+        args = parser.parse_args(command[1:])
+        args.shut_down_logging = False
+
+        setproctitle(f"airflow task supervisor: {command}")
+
+        args.func(args)
+
     @abstractmethod
     def do_work(self):
         """Execute tasks; called in the subprocess."""
@@ -200,6 +211,144 @@ class QueuedLocalWorker(LocalWorkerBase):
                 self.task_queue.task_done()
 
 
+class WarmQueuedLocalWorker(QueuedLocalWorker):
+    """
+    QueuedLocalWorker keeping the CLI parser and recently used DAG files parsed between tasks.
+
+    The worker parses the DAG file of each task before forking to run it, unless it holds it already,
+    so the fork inherits the parsed DAG and the task starts without importing its DAG file again. The
+    DAG files are kept in a least recently used cache keyed by their path and modification time.
+
+    The modules of the DAGs folder imported while parsing, e.g. helpers shared by DAG files, are
+    tracked as well: once one of them changes, they are all removed from ``sys.modules`` and all the
+    DAG files are parsed again. Other modules, e.g. installed packages or plugins, are never reloaded:
+    restart the executor to pick up their changes.
+
+    :param task_queue: queue from which worker reads tasks
+    :param result_queue: queue where worker puts results after finishing tasks
+    :param dag_cache_size: number of DAG files to keep parsed
+    """
+
+    def __init__(
+        self,
+        task_queue: Queue[ExecutorWorkType],
+        result_queue: Queue[TaskInstanceStateType],
+        dag_cache_size: int,
+    ):
+        super().__init__(task_queue=task_queue, result_queue=result_queue)
+        self.dag_cache_size = dag_cache_size
+        self.dagbags: OrderedDict[tuple[str, float], DagBag] = OrderedDict()
+        self._task_args: Namespace | None = None
+        self._task_dag: DAG | None = None
+        # Modules of the DAGs folder imported while parsing: module name -> (file, modification time)
+        self.dag_folder_modules: dict[str, tuple[str, float]] = {}
+
+    def do_work(self) -> None:
+        # Imported once in the worker, instead of in each fork
+        import airflow.cli.commands.task_command  # noqa: F401
+        from airflow.cli.cli_parser import get_parser
+
+        get_parser()
+        super().do_work()
+
+    def _execute_work_in_fork(self, command: CommandType) -> TaskInstanceState:
+        from airflow.cli.cli_parser import get_parser
+
+        # [1:] - remove "airflow" from the start of the command
+        self._task_args = get_parser().parse_args(command[1:])
+        self._task_dag = self._get_dag(self._task_args)
+        try:
+            return super()._execute_work_in_fork(command)
+        finally:
+            self._task_args = self._task_dag = None
+
+    def _run_command(self, command: CommandType) -> None:
+        if TYPE_CHECKING:
+            assert self._task_args
+        self._task_args.shut_down_logging = False
+
+        setproctitle(f"airflow task supervisor: {command}")
+
+        if self._task_dag:
+            self._task_args.func(self._task_args, dag=self._task_dag)
+        else:
+            self._task_args.func(self._task_args)
+
+    def _get_dag(self, args: Namespace) -> DAG | None:
+        """Return the DAG of the task, parsing its DAG file if not cached, or None to let the task parse."""
+        from airflow.models.dagbag import DagBag
+        from airflow.utils.cli import process_subdir
+
+        if getattr(args, "pickle", None) or getattr(args, "read_from_db", False) or not args.subdir:
+            return None
+        try:
+            path = process_subdir(args.subdir)
+            if not os.path.isfile(path):
+                return None
+            key = (path, os.path.getmtime(path))
+        except OSError:
+            return None
+
+        self._invalidate_changed_modules()
+        dagbag = self.dagbags.get(key)
+        if dagbag is None:
+            self.log.info("Parsing %s to run its tasks", path)
+            imported_modules = set(sys.modules)
+            try:
+                dagbag = DagBag(path, include_examples=False)
+            except Exception:
+                self.log.exception("Failed to parse %s, the task will parse it", path)
+                return None
+            finally:
+                # The forks must not share the connections opened while parsing
+                settings.engine.dispose()
+                self._track_dag_folder_modules(set(sys.modules) - imported_modules, path)
+            for cached_key in [cached_key for cached_key in self.dagbags if cached_key[0] == path]:
+                del self.dagbags[cached_key]
+            self.dagbags[key] = dagbag
+            while len(self.dagbags) > self.dag_cache_size:
+                self.dagbags.popitem(last=False)
+        else:
+            self.dagbags.move_to_end(key)
+        # Not DagBag.get_dag, which checks in the database whether the DAG expired
+        return dagbag.dags.get(args.dag_id)
+
+    def _track_dag_folder_modules(self, module_names: set[str], dag_file: str) -> None:
+        folders = tuple(
+            os.path.join(os.path.realpath(folder), "")
+            for folder in (settings.DAGS_FOLDER, os.path.dirname(dag_file))
+        )
+        for name in module_names:
+            if name.startswith("unusual_prefix_"):
+                # The DAG files themselves, imported again by each parse
+                continue
+            module_file = getattr(sys.modules.get(name), "__file__", None)
+            if not module_file or not os.path.realpath(module_file).startswith(folders):
+                continue
+            try:
+                self.dag_folder_modules[name] = (module_file, os.path.getmtime(module_file))
+            except OSError:
+                pass
+
+    def _invalidate_changed_modules(self) -> None:
+        """Forget the parsed DAG files and the modules of the DAGs folder once one of these changed."""
+        for name, (module_file, mtime) in self.dag_folder_modules.items():
+            try:
+                if os.path.getmtime(module_file) == mtime:
+                    continue
+            except OSError:
+                pass
+            self.log.info("Module %s changed, parsing the DAG files again", name)
+            break
+        else:
+            return
+        # The modules can import each other, they are all imported again
+        for name in self.dag_folder_modules:
+            sys.modules.pop(name, None)
+        self.dag_folder_modules.clear()
+        self.dagbags.clear()
+
+
 class LocalExecutor(BaseExecutor):
     """
     LocalExecutor executes tasks locally in parallel.
@@ -218,6 +367,11 @@ class LocalExecutor(BaseExecutor):
         super().__init__(parallelism=parallelism)
         if self.parallelism < 0:
             raise AirflowException("parallelism must be bigger than or equal to 0")
+        self.dag_cache_size = conf.getint("core", "local_executor_dag_cache_size", fallback=0)
+        if self.dag_cache_size and not self.parallelism:
+            raise AirflowException(
+                "[core] local_executor_dag_cache_size requires parallelism to be bigger than 0"
+            )
         self.manager: SyncManager | None = None
         self.result_queue: Queue[TaskInstanceStateType] | None = None
         self.workers: list[QueuedLocalWorker] = []
@@ -297,10 +451,18 @@ class LocalExecutor(BaseExecutor):
                 assert self.executor.result_queue
 
             self.queue = self.executor.manager.Queue()
-            self.executor.workers = [
-                QueuedLocalWorker(self.queue, self.executor.result_queue)
-                for _ in range(self.executor.parallelism)
-            ]
+            if self.executor.dag_cache_size:
+                self.executor.workers = [
+                    WarmQueuedLocalWorker(
+                        self.queue, self.executor.result_queue, self.executor.dag_cache_size
+                    )
+                    for _ in range(self.executor.parallelism)
+                ]
+            else:
+                self.executor.workers = [
+                    QueuedLocalWorker(self.queue, self.executor.result_queue)
+                    for _ in range(self.executor.parallelism)
+                ]
 
             self.executor.workers_used = len(self.executor.workers)
 
@@ -21,7 +21,7 @@ from functools import cached_property
 from time import sleep
 from typing import Callable, NoReturn
 
-from sqlalchemy import Column, Index, Integer, String, case, select
+from sqlalchemy import Column, Float, Index, Integer, String, case, select
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import backref, foreign, relationship
 from sqlalchemy.orm.session import Session, make_transient
@@ -72,6 +72,8 @@ class Job(Base, LoggingMixin):
     executor_class = Column(String(500))
     hostname = Column(String(500))
     unixname = Column(String(1000))
+    # Share of its capacity the job is using, reported by triggerers with their heartbeat
+    load = Column(Float)
 
     __table_args__ = (
         Index("job_type_heart", job_type, latest_heartbeat),
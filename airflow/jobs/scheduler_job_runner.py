@@ -34,7 +34,7 @@ from typing import TYPE_CHECKING, Any, Callable, Collection, Iterable, Iterator
 
 from sqlalchemy import and_, delete, func, not_, or_, select, text, update
 from sqlalchemy.engine import Result
-from sqlalchemy.exc import OperationalError
+from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.orm import Query, Session, joinedload, load_only, make_transient, selectinload
 from sqlalchemy.sql import expression
 
@@ -56,6 +56,7 @@ from airflow.models.dataset import (
     DatasetModel,
     TaskOutletDatasetReference,
 )
+from airflow.models.scheduler_partition import SchedulerPartition
 from airflow.models.serialized_dag import SerializedDagModel
 from airflow.models.taskinstance import SimpleTaskInstance, TaskInstance, TaskInstanceKey
 from airflow.stats import Stats
@@ -65,6 +66,7 @@ from airflow.utils import timezone
 from airflow.utils.event_scheduler import EventScheduler
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.retries import MAX_DB_RETRIES, retry_db_transaction, run_with_db_retries
+from airflow.utils.scheduler_wakeup import BaseWakeupChannel, get_wakeup_channel
 from airflow.utils.session import NEW_SESSION, create_session, provide_session
 from airflow.utils.sqlalchemy import (
     CommitProhibitorGuard,
@@ -110,6 +112,105 @@ class ConcurrencyMap:
         return instance
 
 
+class ConcurrencyLedger(LoggingMixin):
+    """
+    In-memory ledger of the task instances occupying pool slots and concurrency limits.
+
+    The ledger is updated incrementally by the scheduler when it queues task instances and when it
+    receives executor events, so the critical section does not need to aggregate the task instance
+    table on every loop. Changes made outside of this scheduler (e.g. by another scheduler or by tasks
+    killed externally) are picked up when the ledger is reconciled against the database, which happens
+    every ``reconcile_interval`` seconds or whenever the ledger has been invalidated.
+
+    :param reconcile_interval: Number of seconds after which the ledger is rebuilt from the database.
+    """
+
+    def __init__(self, reconcile_interval: float):
+        super().__init__()
+        self.reconcile_interval = reconcile_interval
+        # (dag_id, task_id, run_id, map_index) -> (pool, pool_slots, state)
+        self._entries: dict[tuple[str, str, str, int], tuple[str, int, TaskInstanceState]] = {}
+        self._pool_slots: dict[tuple[str, TaskInstanceState], int] = Counter()
+        self._running_tasks: dict[tuple[str, str, str], int] = Counter()
+        self._last_reconciled: float | None = None
+
+    @property
+    def needs_reconcile(self) -> bool:
+        """Whether the ledger is stale and has to be rebuilt from the database."""
+        if self._last_reconciled is None:
+            return True
+        return time.monotonic() - self._last_reconciled >= self.reconcile_interval
+
+    def invalidate(self) -> None:
+        """Force a reconciliation against the database before the ledger is used again."""
+        self._last_reconciled = None
+
+    def reconcile(self, session: Session) -> None:
+        """Rebuild the ledger from the task instances currently occupying slots in the database."""
+        rows = session.execute(
+            select(TI.dag_id, TI.task_id, TI.run_id, TI.map_index, TI.pool, TI.pool_slots, TI.state).where(
+                TI.state.in_(EXECUTION_STATES | {TaskInstanceState.DEFERRED})
+            )
+        )
+        previous_size = len(self._entries)
+        self._entries.clear()
+        self._pool_slots.clear()
+        self._running_tasks.clear()
+        for dag_id, task_id, run_id, map_index, pool, pool_slots, state in rows:
+            self._add((dag_id, task_id, run_id, map_index), (pool, pool_slots, state))
+        self._last_reconciled = time.monotonic()
+        self.log.debug(
+            "Reconciled concurrency ledger: %s entries (was %s)", len(self._entries), previous_size
+        )
+        Stats.gauge("scheduler.concurrency_ledger.size", len(self._entries))
+
+    def _add(self, primary: tuple[str, str, str, int], entry: tuple[str, int, TaskInstanceState]) -> None:
+        self._remove(primary)
+        dag_id, task_id, run_id, _ = primary
+        pool, pool_slots, state = entry
+        self._entries[primary] = entry
+        self._pool_slots[(pool, state)] += pool_slots
+        if state in EXECUTION_STATES:
+            self._running_tasks[(dag_id, run_id, task_id)] += 1
+
+    def _remove(self, primary: tuple[str, str, str, int]) -> tuple[str, int, TaskInstanceState] | None:
+        entry = self._entries.pop(primary, None)
+        if entry is None:
+            return None
+        dag_id, task_id, run_id, _ = primary
+        pool, pool_slots, state = entry
+        self._pool_slots[(pool, state)] -= pool_slots
+        if not self._pool_slots[(pool, state)]:
+            del self._pool_slots[(pool, state)]
+        if state in EXECUTION_STATES:
+            self._running_tasks[(dag_id, run_id, task_id)] -= 1
+            if not self._running_tasks[(dag_id, run_id, task_id)]:
+                del self._running_tasks[(dag_id, run_id, task_id)]
+        return entry
+
+    def track(self, ti: TI, state: TaskInstanceState) -> None:
+        """Record that a task instance is occupying its pool slots in the given state."""
+        self._add(ti.key.primary, (ti.pool, ti.pool_slots, state))
+
+    def update_state(self, key: TaskInstanceKey, state: TaskInstanceState) -> None:
+        """Update the state of a tracked task instance; untracked task instances are ignored."""
+        entry = self._remove(key.primary)
+        if entry is not None:
+            self._add(key.primary, (entry[0], entry[1], state))
+
+    def discard(self, key: TaskInstanceKey) -> None:
+        """Release the slots held by a task instance, if it is tracked."""
+        self._remove(key.primary)
+
+    def slots_by_pool_state(self) -> list[tuple[str, TaskInstanceState, int]]:
+        """Return the occupied slots as ``(pool, state, slots)``, see :meth:`Pool.slots_stats`."""
+        return [(pool, state, slots) for (pool, state), slots in self._pool_slots.items()]
+
+    def concurrency_map(self) -> ConcurrencyMap:
+        """Return a copy of the concurrency map of the tracked task instances in execution states."""
+        return ConcurrencyMap.from_concurrency_map(self._running_tasks)
+
+
 def _is_parent_process() -> bool:
     """
     Whether this is a parent process.
@@ -174,6 +275,7 @@ class SchedulerJobRunner(BaseJobRunner[Job], LoggingMixin):
             )
             scheduler_idle_sleep_time = processor_poll_interval
         self._scheduler_idle_sleep_time = scheduler_idle_sleep_time
+        self._wakeup_channel: BaseWakeupChannel | None = None
         # How many seconds do we wait for tasks to heartbeat before mark them as zombies.
         self._zombie_threshold_secs = conf.getint("scheduler", "scheduler_zombie_task_threshold")
         self._standalone_dag_processor = conf.getboolean("scheduler", "standalone_dag_processor")
@@ -229,6 +331,16 @@ class SchedulerJobRunner(BaseJobRunner[Job], LoggingMixin):
         self.dagbag = DagBag(dag_folder=self.subdir, read_dags_from_db=True, load_op_links=False)
         self._paused_dag_without_running_dagruns: set = set()
 
+        # When DAG partitioning is enabled, the partitions of the DAGs leased by this scheduler.
+        self._num_dag_partitions = conf.getint("scheduler", "num_dag_partitions")
+        self._dag_partitions: set[int] | None = None
+
+        self._concurrency_ledger: ConcurrencyLedger | None = None
+        if conf.getboolean("scheduler", "use_concurrency_ledger"):
+            self._concurrency_ledger = ConcurrencyLedger(
+                reconcile_interval=conf.getfloat("scheduler", "concurrency_ledger_reconcile_interval")
+            )
+
     @provide_session
     def heartbeat_callback(self, session: Session = NEW_SESSION) -> None:
         Stats.incr("scheduler_heartbeat", 1, 1)
@@ -316,9 +428,17 @@ class SchedulerJobRunner(BaseJobRunner[Job], LoggingMixin):
                     "Failed to acquire advisory lock", params=None, orig=RuntimeError("55P03")
                 )
 
+        ledger = self._concurrency_ledger
+        if ledger and ledger.needs_reconcile:
+            ledger.reconcile(session=session)
+
         # Get the pool settings. We get a lock on the pool rows, treating this as a "critical section"
         # Throws an exception if lock cannot be obtained, rather than blocking
-        pools = Pool.slots_stats(lock_rows=True, session=session)
+        pools = Pool.slots_stats(
+            lock_rows=True,
+            slots_by_pool_state=ledger.slots_by_pool_state() if ledger else None,
+            session=session,
+        )
 
         # If the pools are full, there is no point doing anything!
         # If _somehow_ the pool is overfull, don't let the limit go negative - it breaks SQL
@@ -333,7 +453,10 @@ class SchedulerJobRunner(BaseJobRunner[Job], LoggingMixin):
         starved_pools = {pool_name for pool_name, stats in pools.items() if stats["open"] <= 0}
 
         # dag_id to # of running tasks and (dag_id, task_id) to # of running tasks.
-        concurrency_map = self.__get_concurrency_maps(states=EXECUTION_STATES, session=session)
+        if ledger:
+            concurrency_map = ledger.concurrency_map()
+        else:
+            concurrency_map = self.__get_concurrency_maps(states=EXECUTION_STATES, session=session)
 
         # Number of tasks that cannot be scheduled because of no open slot in pool
         num_starving_tasks_total = 0
@@ -611,6 +734,8 @@ class SchedulerJobRunner(BaseJobRunner[Job], LoggingMixin):
 
             for ti in executable_tis:
                 ti.emit_state_change_metric(TaskInstanceState.QUEUED)
+                if ledger:
+                    ledger.track(ti, TaskInstanceState.QUEUED)
 
         for ti in executable_tis:
             make_transient(ti)
@@ -627,6 +752,8 @@ class SchedulerJobRunner(BaseJobRunner[Job], LoggingMixin):
         for ti in task_instances:
             if ti.dag_run.state in State.finished_dr_states:
                 ti.set_state(None, session=session)
+                if self._concurrency_ledger:
+                    self._concurrency_ledger.discard(ti.key)
                 continue
             command = ti.command_as_list(
                 local=True,
@@ -679,6 +806,8 @@ class SchedulerJobRunner(BaseJobRunner[Job], LoggingMixin):
         ti_primary_key_to_try_number_map: dict[tuple[str, str, str, int], int] = {}
         event_buffer = self.job.executor.get_event_buffer()
         tis_with_right_state: list[TaskInstanceKey] = []
+        # Finished according to the executor, the ledger is updated with their state in the database
+        finished_ti_keys: list[TaskInstanceKey] = []
 
         # Report execution
         for ti_key, (state, _) in event_buffer.items():
@@ -689,6 +818,12 @@ class SchedulerJobRunner(BaseJobRunner[Job], LoggingMixin):
             if state in (TaskInstanceState.FAILED, TaskInstanceState.SUCCESS, TaskInstanceState.QUEUED):
                 tis_with_right_state.append(ti_key)
 
+            if self._concurrency_ledger:
+                if state in (TaskInstanceState.FAILED, TaskInstanceState.SUCCESS):
+                    finished_ti_keys.append(ti_key)
+                elif state == TaskInstanceState.RUNNING:
+                    self._concurrency_ledger.update_state(ti_key, TaskInstanceState.RUNNING)
+
         # Return if no finished tasks
         if not tis_with_right_state:
             return len(event_buffer)
@@ -705,7 +840,9 @@ class SchedulerJobRunner(BaseJobRunner[Job], LoggingMixin):
             **skip_locked(session=session),
         )
         tis = session.scalars(tis)
+        loaded_tis: list[TI] = []
         for ti in tis:
+            loaded_tis.append(ti)
             try_number = ti_primary_key_to_try_number_map[ti.key.primary]
             buffer_key = ti.key.with_try_number(try_number)
             state, info = event_buffer.pop(buffer_key)
@@ -792,8 +929,29 @@ class SchedulerJobRunner(BaseJobRunner[Job], LoggingMixin):
                 else:
                     ti.handle_failure(error=msg % (ti, state, ti.state, info), session=session)
 
+        if self._concurrency_ledger:
+            self._update_ledger_with_finished_tis(finished_ti_keys, loaded_tis)
         return len(event_buffer)
 
+    def _update_ledger_with_finished_tis(self, ti_keys: list[TaskInstanceKey], tis: list[TI]) -> None:
+        """
+        Update the concurrency ledger with the state of the task instances the executor reports finished.
+
+        A task instance whose process finished may still hold its slots, e.g. when it deferred (which
+        counts against pools with ``include_deferred``) or was queued again, so its state in the database
+        is used rather than the one of the executor.
+        """
+        if TYPE_CHECKING:
+            assert self._concurrency_ledger
+        tis_by_key = {ti.key.primary: ti for ti in tis}
+        for key in ti_keys:
+            ti = tis_by_key.get(key.primary)
+            if ti is not None and ti.state in EXECUTION_STATES | {TaskInstanceState.DEFERRED}:
+                self._concurrency_ledger.track(ti, ti.state)
+            else:
+                # Task instances locked by another scheduler are reconciled later if they still hold slots
+                self._concurrency_ledger.discard(key)
+
     def _execute(self) -> int | None:
         from airflow.dag_processing.manager import DagFileProcessorAgent
 
@@ -873,6 +1031,13 @@ class SchedulerJobRunner(BaseJobRunner[Job], LoggingMixin):
                     self.processor_agent.end()
                 except Exception:
                     self.log.exception("Exception when executing DagFileProcessorAgent.end")
+            if self._wakeup_channel:
+                self._wakeup_channel.close()
+            if self._num_dag_partitions:
+                try:
+                    SchedulerPartition.release(self.job.id)
+                except Exception:
+                    self.log.exception("Exception when releasing DAG partitions")
             self.log.info("Exited execute loop")
         return None
 
@@ -927,9 +1092,25 @@ class SchedulerJobRunner(BaseJobRunner[Job], LoggingMixin):
 
         timers = EventScheduler()
 
+        self._wakeup_channel = get_wakeup_channel()
+        if self._wakeup_channel:
+            try:
+                self._wakeup_channel.listen()
+                self.log.info("Listening for wake-ups on %s", type(self._wakeup_channel).__name__)
+            except Exception:
+                self.log.exception("Failed to listen on the wake-up channel, falling back to polling")
+                self._wakeup_channel = None
+
         # Check on start up, then every configured interval
         self.adopt_or_reset_orphaned_tasks()
 
+        if self._num_dag_partitions:
+            self._rebalance_dag_partitions()
+            timers.call_regular_interval(
+                conf.getfloat("scheduler", "dag_partition_rebalance_interval"),
+                self._rebalance_dag_partitions,
+            )
+
         timers.call_regular_interval(
             conf.getfloat("scheduler", "orphaned_tasks_check_interval", fallback=300.0),
             self.adopt_or_reset_orphaned_tasks,
@@ -1001,7 +1182,13 @@ class SchedulerJobRunner(BaseJobRunner[Job], LoggingMixin):
                 # If the scheduler is doing things, don't sleep. This means when there is work to do, the
                 # scheduler will run "as quick as possible", but when it's stopped, it can sleep, dropping CPU
                 # usage when "idle"
-                time.sleep(min(self._scheduler_idle_sleep_time, next_event if next_event else 0))
+                sleep_time = min(self._scheduler_idle_sleep_time, next_event if next_event else 0)
+                if self._wakeup_channel:
+                    # Sleep until something relevant changed, e.g. a task instance finished
+                    if self._wakeup_channel.wait(sleep_time):
+                        Stats.incr("scheduler.wakeups")
+                else:
+                    time.sleep(sleep_time)
 
             if loop_count >= self.num_runs > 0:
                 self.log.info(
@@ -1100,6 +1287,10 @@ class SchedulerJobRunner(BaseJobRunner[Job], LoggingMixin):
                 except OperationalError as e:
                     timer.stop(send=False)
 
+                    if self._concurrency_ledger:
+                        # Task instances may have been tracked as queued in a rolled back transaction
+                        self._concurrency_ledger.invalidate()
+
                     if is_lock_not_available_error(error=e):
                         self.log.debug("Critical section lock held by another Scheduler")
                         Stats.incr("scheduler.critical_section_busy")
@@ -1114,12 +1305,19 @@ class SchedulerJobRunner(BaseJobRunner[Job], LoggingMixin):
     @retry_db_transaction
     def _get_next_dagruns_to_examine(self, state: DagRunState, session: Session) -> Query:
         """Get Next DagRuns to Examine with retries."""
-        return DagRun.next_dagruns_to_examine(state, session)
+        return DagRun.next_dagruns_to_examine(
+            state,
+            session,
+            partition_ids=self._dag_partitions,
+            num_partitions=self._num_dag_partitions,
+        )
 
     @retry_db_transaction
     def _create_dagruns_for_dags(self, guard: CommitProhibitorGuard, session: Session) -> None:
         """Find Dag Models needing DagRuns and Create Dag Runs with retries in case of OperationalError."""
-        query, dataset_triggered_dag_info = DagModel.dags_needing_dagruns(session)
+        query, dataset_triggered_dag_info = DagModel.dags_needing_dagruns(
+            session, partition_ids=self._dag_partitions, num_partitions=self._num_dag_partitions
+        )
         all_dags_needing_dag_runs = set(query.all())
         dataset_triggered_dags = [
             dag for dag in all_dags_needing_dag_runs if dag.dag_id in dataset_triggered_dag_info
@@ -1551,6 +1749,8 @@ class SchedulerJobRunner(BaseJobRunner[Job], LoggingMixin):
         try:
             tis_for_warning_message = self.job.executor.cleanup_stuck_queued_tasks(tis=tasks_stuck_in_queued)
             if tis_for_warning_message:
+                if self._concurrency_ledger:
+                    self._concurrency_ledger.invalidate()
                 task_instance_str = "\n\t".join(tis_for_warning_message)
                 self.log.warning(
                     "Marked the following %s task instances stuck in queued as failed. "
@@ -1645,6 +1845,9 @@ class SchedulerJobRunner(BaseJobRunner[Job], LoggingMixin):
                     for ti in set(tis_to_reset_or_adopt) - set(to_reset):
                         ti.queued_by_job_id = self.job.id
 
+                    if to_reset and self._concurrency_ledger:
+                        self._concurrency_ledger.invalidate()
+
                     Stats.incr("scheduler.orphaned_tasks.cleared", len(to_reset))
                     Stats.incr("scheduler.orphaned_tasks.adopted", len(tis_to_reset_or_adopt) - len(to_reset))
 
@@ -1665,6 +1868,31 @@ class SchedulerJobRunner(BaseJobRunner[Job], LoggingMixin):
 
         return len(to_reset)
 
+    @provide_session
+    def _rebalance_dag_partitions(self, session: Session = NEW_SESSION) -> None:
+        """
+        Lease a fair share of the DAG partitions.
+
+        Partitions held by schedulers that stopped heartbeating are released first, so their DAGs are
+        picked up by the remaining schedulers.
+        """
+        try:
+            partitions = SchedulerPartition.rebalance(
+                job_id=self.job.id,
+                num_partitions=self._num_dag_partitions,
+                health_check_threshold=conf.getint("scheduler", "scheduler_health_check_threshold"),
+                session=session,
+            )
+            session.commit()
+        except (OperationalError, IntegrityError):
+            session.rollback()
+            self.log.exception("Failed to rebalance DAG partitions, keeping the current ones")
+            return
+
+        self._dag_partitions = partitions
+        self.log.debug("Scheduler holds DAG partitions %s", sorted(partitions))
+        Stats.gauge("scheduler.dag_partitions", len(partitions))
+
     @provide_session
     def check_trigger_timeouts(self, session: Session = NEW_SESSION) -> None:
         """Mark any "deferred" task as failed if the trigger or execution timeout has passed."""
@@ -1683,6 +1911,8 @@ class SchedulerJobRunner(BaseJobRunner[Job], LoggingMixin):
         ).rowcount
         if num_timed_out_tasks:
             self.log.info("Timed out %i deferred tasks without fired triggers", num_timed_out_tasks)
+            if self._concurrency_ledger:
+                self._concurrency_ledger.invalidate()
 
     def _find_zombies(self) -> None:
         """
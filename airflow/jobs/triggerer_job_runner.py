@@ -17,29 +17,40 @@
 from __future__ import annotations
 
 import asyncio
+import datetime
+import heapq
+import json
 import logging
+import multiprocessing
+import multiprocessing.connection
 import os
+import pickle
 import signal
 import sys
 import threading
 import time
 import warnings
-from collections import deque
+from collections import defaultdict, deque
 from contextlib import suppress
 from copy import copy
+from multiprocessing.connection import Connection as MultiprocessingConnection
 from queue import SimpleQueue
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from setproctitle import setproctitle
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from airflow import settings
 from airflow.configuration import conf
+from airflow.exceptions import AirflowConfigException, AirflowException
 from airflow.jobs.base_job_runner import BaseJobRunner
 from airflow.jobs.job import Job, perform_heartbeat
 from airflow.models.trigger import Trigger
 from airflow.serialization.pydantic.job import JobPydantic
 from airflow.stats import Stats
 from airflow.triggers.base import BaseTrigger, TriggerEvent
+from airflow.triggers.temporal import DateTimeTrigger
 from airflow.typing_compat import TypedDict
 from airflow.utils import timezone
 from airflow.utils.log.file_task_handler import FileTaskHandler
@@ -54,10 +65,13 @@ from airflow.utils.log.trigger_handler import (
     ctx_trigger_end,
     ctx_trigger_id,
 )
+from airflow.utils.mixins import MultiprocessingStartMethodMixin
 from airflow.utils.module_loading import import_string
 from airflow.utils.session import NEW_SESSION, provide_session
 
 if TYPE_CHECKING:
+    import multiprocessing.context
+
     from airflow.models import TaskInstance
 
 HANDLER_SUPPORTS_TRIGGERER = False
@@ -77,6 +91,21 @@ If handler natively supports triggers, may want to disable sending trigger end m
 
 logger = logging.getLogger(__name__)
 
+LOAD_MEASUREMENT_WINDOW = 10.0
+"""
+Seconds over which the load of the event loop of trigger runners is measured.
+
+:meta private:
+"""
+
+LOAD_REBALANCE_INTERVAL = 60.0
+"""
+Minimum seconds between two times a busy triggerer releases triggers, giving other triggerers and the
+load measurements time to catch up.
+
+:meta private:
+"""
+
 
 DISABLE_WRAPPER = conf.getboolean("logging", "disable_trigger_handler_wrapper", fallback=False)
 DISABLE_LISTENER = conf.getboolean("logging", "disable_trigger_handler_queue_listener", fallback=False)
@@ -259,6 +288,10 @@ class TriggererJobRunner(BaseJobRunner["Job | JobPydantic"], LoggingMixin):
             raise ValueError(f"Capacity number {capacity} is invalid")
 
         self.health_check_threshold = conf.getint("triggerer", "triggerer_health_check_threshold")
+        self.event_batch_size = max(conf.getint("triggerer", "event_batch_size", fallback=1000), 1)
+        self.max_load = conf.getfloat("triggerer", "max_load", fallback=0.8)
+        # Leave time for the load to be measured before releasing triggers
+        self.last_triggers_release = time.monotonic()
 
         should_queue = True
         if DISABLE_WRAPPER:
@@ -278,8 +311,13 @@ class TriggererJobRunner(BaseJobRunner["Job | JobPydantic"], LoggingMixin):
             self.log.warning("Skipping trigger logger queue listener; disabled by handler setting.")
         else:
             self.listener = setup_queue_listener()
-        # Set up runner async thread
-        self.trigger_runner = TriggerRunner()
+        # Set up runner async thread, or the child processes running the triggers
+        self.trigger_runner: TriggerRunner
+        num_shards = conf.getint("triggerer", "event_loop_processes", fallback=0)
+        if num_shards > 0:
+            self.trigger_runner = ShardedTriggerRunner(num_shards, listener=self.listener)
+        else:
+            self.trigger_runner = TriggerRunner()
 
     @provide_session
     def heartbeat_callback(self, session: Session = NEW_SESSION) -> None:
@@ -362,6 +400,8 @@ class TriggererJobRunner(BaseJobRunner["Job | JobPydantic"], LoggingMixin):
             self.handle_events()
             # Handle failed triggers
             self.handle_failed_triggers()
+            # Report the load with the heartbeat, for the triggerers to balance it
+            self.job.load = self.trigger_runner.load
             perform_heartbeat(self.job, heartbeat_callback=self.heartbeat_callback, only_if_necessary=True)
             # Collect stats
             self.emit_metrics()
@@ -370,19 +410,26 @@ class TriggererJobRunner(BaseJobRunner["Job | JobPydantic"], LoggingMixin):
 
     def load_triggers(self):
         """Query the database for the triggers we're supposed to be running and update the runner."""
-        Trigger.assign_unassigned(self.job.id, self.capacity, self.health_check_threshold)
+        if time.monotonic() - self.last_triggers_release >= LOAD_REBALANCE_INTERVAL:
+            released = Trigger.release_excess_triggers(
+                self.job.id, self.health_check_threshold, self.max_load
+            )
+            if released:
+                self.log.info("Released %d triggers for less busy triggerers to run", released)
+            self.last_triggers_release = time.monotonic()
+        Trigger.assign_unassigned(self.job.id, self.capacity, self.health_check_threshold, self.max_load)
         ids = Trigger.ids_for_triggerer(self.job.id)
         self.trigger_runner.update_triggers(set(ids))
 
     def handle_events(self):
         """Dispatch outbound events to the Trigger model which pushes them to the relevant task instances."""
         while self.trigger_runner.events:
-            # Get the event and its trigger ID
-            trigger_id, event = self.trigger_runner.events.popleft()
-            # Tell the model to wake up its tasks
-            Trigger.submit_event(trigger_id=trigger_id, event=event)
+            # Get a batch of events and their trigger IDs
+            events = self._pop_batch(self.trigger_runner.events)
+            # Tell the model to wake up their tasks
+            Trigger.submit_events(events)
             # Emit stat event
-            Stats.incr("triggers.succeeded")
+            Stats.incr("triggers.succeeded", len(events))
 
     def handle_failed_triggers(self):
         """
@@ -391,25 +438,37 @@ class TriggererJobRunner(BaseJobRunner["Job | JobPydantic"], LoggingMixin):
         Task Instances that depend on them need failing.
         """
         while self.trigger_runner.failed_triggers:
-            # Tell the model to fail this trigger's deps
-            trigger_id, saved_exc = self.trigger_runner.failed_triggers.popleft()
-            Trigger.submit_failure(trigger_id=trigger_id, exc=saved_exc)
+            # Tell the model to fail these triggers' deps
+            failures = self._pop_batch(self.trigger_runner.failed_triggers)
+            Trigger.submit_failures(failures)
             # Emit stat event
-            Stats.incr("triggers.failed")
+            Stats.incr("triggers.failed", len(failures))
+
+    def _pop_batch(self, items: deque) -> list:
+        """Pop up to ``event_batch_size`` items from the left of a deque filled by the trigger runner."""
+        batch = []
+        while items and len(batch) < self.event_batch_size:
+            batch.append(items.popleft())
+        return batch
 
     def emit_metrics(self):
         Stats.gauge(f"triggers.running.{self.job.hostname}", len(self.trigger_runner.triggers))
         Stats.gauge(
             "triggers.running", len(self.trigger_runner.triggers), tags={"hostname": self.job.hostname}
         )
+        Stats.gauge(f"triggerer.load.{self.job.hostname}", self.trigger_runner.load)
+        Stats.gauge("triggerer.load", self.trigger_runner.load, tags={"hostname": self.job.hostname})
 
 
 class TriggerDetails(TypedDict):
     """Type class for the trigger details dictionary."""
 
-    task: asyncio.Task
+    # The coroutine running the trigger, or the future resolved by the timer loop for timers
+    task: asyncio.Future
     name: str
     events: int
+    # Key shared by the identical triggers running in the same coroutine, if coalesced
+    coalescing_key: str | None
 
 
 class TriggerRunner(threading.Thread, LoggingMixin):
@@ -440,6 +499,16 @@ class TriggerRunner(threading.Thread, LoggingMixin):
     # Outbound queue of failed triggers
     failed_triggers: deque[tuple[int, BaseException]]
 
+    # Maps the coalescing keys of running triggers to the IDs of the triggers sharing their coroutine
+    coalesced_triggers: dict[str, set[int]]
+
+    # Heap of the pure-time triggers waiting for their moment: moment, trigger ID, the future standing for
+    # the trigger's task, and the IDs of the triggers sharing it, if coalesced
+    timers: list[tuple[datetime.datetime, int, asyncio.Future, set[int] | None]]
+
+    # Share of the time the event loop was busy over the last measurement window, see block_watchdog
+    load: float = 0.0
+
     # Should-we-stop flag
     stop: bool = False
 
@@ -451,19 +520,43 @@ class TriggerRunner(threading.Thread, LoggingMixin):
         self.to_cancel = deque()
         self.events = deque()
         self.failed_triggers = deque()
+        self.coalesced_triggers = {}
+        self.timers = []
         self.job_id = None
+        self.coalesce_triggers = conf.getboolean("triggerer", "coalesce_triggers", fallback=False)
+        self.use_uvloop = conf.getboolean("triggerer", "use_uvloop", fallback=False)
+        if self.use_uvloop:
+            try:
+                import uvloop  # noqa: F401
+            except ImportError:
+                raise AirflowConfigException(
+                    "[triggerer] use_uvloop requires the uvloop package, install apache-airflow[uvloop]"
+                )
 
     def run(self):
         """Sync entrypoint - just run a run in an async loop."""
-        asyncio.run(self.arun())
+        if not self.use_uvloop:
+            asyncio.run(self.arun())
+            return
+
+        import uvloop
+
+        # Create the loop directly rather than changing the event loop policy of the whole process
+        loop = uvloop.new_event_loop()
+        try:
+            loop.run_until_complete(self.arun())
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
 
     async def arun(self):
         """
         Run trigger addition/deletion/cleanup; main (asynchronous) logic loop.
 
-        Actual triggers run in their own separate coroutines.
+        Actual triggers run in their own separate coroutines, except timers which all run in one.
         """
         watchdog = asyncio.create_task(self.block_watchdog())
+        timer_loop = asyncio.create_task(self.run_timers())
         last_status = time.time()
         while not self.stop:
             try:
@@ -481,8 +574,9 @@ class TriggerRunner(threading.Thread, LoggingMixin):
             except Exception:
                 self.stop = True
                 raise
-        # Wait for watchdog to complete
+        # Wait for watchdog and timer loop to complete
         await watchdog
+        await timer_loop
 
     async def create_triggers(self):
         """Drain the to_create queue and create all new triggers that have been requested in the DB."""
@@ -495,11 +589,27 @@ class TriggerRunner(threading.Thread, LoggingMixin):
                 task_id = task_instance.task_id
                 map_index = task_instance.map_index
                 try_number = task_instance.try_number
-                self.triggers[trigger_id] = {
-                    "task": asyncio.create_task(self.run_trigger(trigger_id, trigger_instance)),
-                    "name": f"{dag_id}/{run_id}/{task_id}/{map_index}/{try_number} (ID {trigger_id})",
-                    "events": 0,
-                }
+                name = f"{dag_id}/{run_id}/{task_id}/{map_index}/{try_number} (ID {trigger_id})"
+                key = self.get_coalescing_key(trigger_instance) if self.coalesce_triggers else None
+                subscribers = self.coalesced_triggers.get(key) if key else None
+                if subscribers and self._accepts_subscribers(subscribers):
+                    # Share the coroutine of the identical trigger, which fans its events out
+                    task = self.triggers[next(iter(subscribers))]["task"]
+                    subscribers.add(trigger_id)
+                    self.log.info(
+                        "Trigger %s coalesced with %d identical triggers", name, len(subscribers) - 1
+                    )
+                else:
+                    subscribers = None
+                    if key:
+                        subscribers = self.coalesced_triggers[key] = {trigger_id}
+                    if self.is_timer(trigger_instance):
+                        task = self.add_timer(trigger_id, trigger_instance, subscribers)
+                    else:
+                        task = asyncio.create_task(
+                            self.run_trigger(trigger_id, trigger_instance, subscribers)
+                        )
+                self.triggers[trigger_id] = {"task": task, "name": name, "events": 0, "coalescing_key": key}
             else:
                 self.log.warning("Trigger %s had insertion attempted twice", trigger_id)
             await asyncio.sleep(0)
@@ -513,10 +623,46 @@ class TriggerRunner(threading.Thread, LoggingMixin):
         while self.to_cancel:
             trigger_id = self.to_cancel.popleft()
             if trigger_id in self.triggers:
-                # We only delete if it did not exit already
-                self.triggers[trigger_id]["task"].cancel()
+                subscribers = self._unsubscribe(trigger_id)
+                if subscribers:
+                    # Identical triggers still need the coroutine, only stop sending this one events
+                    del self.triggers[trigger_id]
+                else:
+                    # We only delete if it did not exit already
+                    self.triggers[trigger_id]["task"].cancel()
             await asyncio.sleep(0)
 
+    @staticmethod
+    def get_coalescing_key(trigger: BaseTrigger) -> str | None:
+        """
+        Return a key identical for triggers with the same classpath and arguments, which fire the same events.
+
+        :return: the key, or None if the arguments of the trigger cannot be serialized
+        """
+        from airflow.serialization.serialized_objects import BaseSerialization
+
+        try:
+            classpath, kwargs = trigger.serialize()
+            return json.dumps([classpath, BaseSerialization.serialize(kwargs)], sort_keys=True)
+        except Exception:
+            return None
+
+    def _accepts_subscribers(self, subscribers: set[int]) -> bool:
+        # Triggers joining a coroutine which already fired an event, or exited, would miss it
+        details = self.triggers[next(iter(subscribers))]
+        return details["events"] == 0 and not details["task"].done()
+
+    def _unsubscribe(self, trigger_id: int) -> set[int] | None:
+        """Remove a trigger from the triggers sharing its coroutine, and return those left, if any."""
+        key = self.triggers[trigger_id].get("coalescing_key")
+        subscribers = self.coalesced_triggers.get(key) if key else None
+        if subscribers is None or trigger_id not in subscribers:
+            return None
+        subscribers.discard(trigger_id)
+        if not subscribers:
+            del self.coalesced_triggers[key]  # type: ignore[arg-type]
+        return subscribers
+
     async def cleanup_finished_triggers(self):
         """
         Go through all trigger tasks (coroutines) and clean up entries for ones that have exited.
@@ -525,6 +671,7 @@ class TriggerRunner(threading.Thread, LoggingMixin):
         """
         for trigger_id, details in list(self.triggers.items()):
             if details["task"].done():
+                self._unsubscribe(trigger_id)
                 # Check to see if it exited for good reasons
                 saved_exc = None
                 try:
@@ -556,6 +703,64 @@ class TriggerRunner(threading.Thread, LoggingMixin):
                 del self.triggers[trigger_id]
             await asyncio.sleep(0)
 
+    @staticmethod
+    def is_timer(trigger: BaseTrigger) -> bool:
+        """Whether the trigger only waits for its moment, so the timer loop can run it without a coroutine."""
+        return (
+            isinstance(trigger, DateTimeTrigger)
+            and type(trigger).run is DateTimeTrigger.run
+            and type(trigger).cleanup is BaseTrigger.cleanup
+        )
+
+    def add_timer(
+        self, trigger_id: int, trigger: DateTimeTrigger, subscribers: set[int] | None = None
+    ) -> asyncio.Future:
+        """
+        Add a pure-time trigger to the timers, see :meth:`run_timers`.
+
+        :param trigger_id: the ID of the trigger
+        :param trigger: the trigger
+        :param subscribers: the IDs of the identical triggers sharing it, if coalesced
+        :return: a future standing for the task of the trigger, resolved when it fires
+        """
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self.timers, (trigger.moment, trigger_id, future, subscribers))
+        return future
+
+    async def run_timers(self):
+        """
+        Fire the events of the pure-time triggers whose moment passed, in batches.
+
+        All :class:`~airflow.triggers.temporal.DateTimeTrigger` and
+        :class:`~airflow.triggers.temporal.TimeDeltaTrigger` instances wait in a single heap instead of
+        running a coroutine each, so waiting triggers only take a heap entry and a future. Cancelled
+        triggers are dropped from the heap when their moment passes, or when the heap is compacted.
+        """
+        last_compaction = time.monotonic()
+        while not self.stop:
+            now = timezone.utcnow()
+            fired = 0
+            while self.timers and self.timers[0][0] <= now:
+                moment, trigger_id, future, subscribers = heapq.heappop(self.timers)
+                if future.done():
+                    # Cancelled
+                    continue
+                event = TriggerEvent(moment)
+                for subscriber_id in sorted(subscribers) if subscribers is not None else [trigger_id]:
+                    self.triggers[subscriber_id]["events"] += 1
+                    self.events.append((subscriber_id, event))
+                future.set_result(None)
+                fired += 1
+            if fired:
+                self.log.info("%d timers fired", fired)
+            if time.monotonic() - last_compaction >= 60:
+                self.timers = [timer for timer in self.timers if not timer[2].done()]
+                heapq.heapify(self.timers)
+                last_compaction = time.monotonic()
+            # Wake up for the next timer, or at least every second to see the new ones
+            delay = (self.timers[0][0] - now).total_seconds() if self.timers else 1
+            await asyncio.sleep(min(max(delay, 0), 1))
+
     async def block_watchdog(self):
         """
         Watchdog loop that detects blocking (badly-written) triggers.
@@ -567,13 +772,28 @@ class TriggerRunner(threading.Thread, LoggingMixin):
 
         Unfortunately, we can't tell what trigger is blocking things, but
         we can at least detect the top-level problem.
+
+        It also measures the load of the event loop, the share of the time it was
+        busy, as the larger of the CPU time of its thread and the time the watchdog
+        was woken up late.
         """
+        window_start = time.monotonic()
+        window_cpu_start = time.thread_time()
+        window_delay = 0.0
         while not self.stop:
             last_run = time.monotonic()
             await asyncio.sleep(0.1)
             # We allow a generous amount of buffer room for now, since it might
             # be a busy event loop.
             time_elapsed = time.monotonic() - last_run
+            window_delay += max(time_elapsed - 0.1, 0)
+            window = time.monotonic() - window_start
+            if window >= LOAD_MEASUREMENT_WINDOW:
+                busy = max(time.thread_time() - window_cpu_start, window_delay)
+                self.load = min(busy / window, 1.0)
+                window_start = time.monotonic()
+                window_cpu_start = time.thread_time()
+                window_delay = 0.0
             if time_elapsed > 0.2:
                 self.log.info(
                     "Triggerer's async thread was blocked for %.2f seconds, "
@@ -594,16 +814,25 @@ class TriggerRunner(threading.Thread, LoggingMixin):
         # mark that we're in the context of an individual trigger so log records can be filtered
         ctx_indiv_trigger.set(True)
 
-    async def run_trigger(self, trigger_id, trigger):
-        """Run a trigger (they are async generators) and push their events into our outbound event deque."""
+    async def run_trigger(self, trigger_id, trigger, subscribers: set[int] | None = None):
+        """
+        Run a trigger (they are async generators) and push their events into our outbound event deque.
+
+        :param trigger_id: the ID of the trigger
+        :param trigger: the trigger to run
+        :param subscribers: the IDs of the identical triggers sharing the coroutine, to send the events
+            to, if coalesced. It changes as triggers join or are cancelled.
+        """
         name = self.triggers[trigger_id]["name"]
         self.log.info("trigger %s starting", name)
         try:
+            # Identical triggers sharing the coroutine log to the log of this trigger only
             self.set_individual_trigger_logging(trigger)
             async for event in trigger.run():
-                self.log.info("Trigger %s fired: %s", self.triggers[trigger_id]["name"], event)
-                self.triggers[trigger_id]["events"] += 1
-                self.events.append((trigger_id, event))
+                for subscriber_id in sorted(subscribers) if subscribers is not None else [trigger_id]:
+                    self.log.info("Trigger %s fired: %s", self.triggers[subscriber_id]["name"], event)
+                    self.triggers[subscriber_id]["events"] += 1
+                    self.events.append((subscriber_id, event))
         except asyncio.CancelledError as err:
             if timeout := trigger.task_instance.trigger_timeout:
                 timeout = timeout.replace(tzinfo=timezone.utc) if not timeout.tzinfo else timeout
@@ -712,3 +941,295 @@ class TriggerRunner(threading.Thread, LoggingMixin):
         if classpath not in self.trigger_cache:
             self.trigger_cache[classpath] = import_string(classpath)
         return self.trigger_cache[classpath]
+
+
+def _shard_state(runner: TriggerRunner) -> tuple[set[int], list, list, float]:
+    """Return the IDs of the triggers a shard runs, the events and failures it did not send, and its load."""
+    # Take the running triggers first: a trigger missing from them finished before, so its events and
+    # failure are already in the queues
+    running = set(runner.triggers).union(trigger_id for trigger_id, _ in list(runner.to_create))
+    events = []
+    while runner.events:
+        events.append(runner.events.popleft())
+    failures = []
+    while runner.failed_triggers:
+        trigger_id, exc = runner.failed_triggers.popleft()
+        try:
+            pickle.dumps(exc)
+        except Exception:
+            # The traceback was logged by the runner already
+            exc = AirflowException(f"{type(exc).__name__}: {exc}")
+        failures.append((trigger_id, exc))
+    return running, events, failures, runner.load
+
+
+def _unpickle_triggers(runner: TriggerRunner, pickled_triggers: list[tuple[int, bytes]]) -> None:
+    """Queue the triggers pickled by the triggerer to be created, or report those failing to unpickle."""
+    for trigger_id, pickled_trigger in pickled_triggers:
+        try:
+            runner.to_create.append((trigger_id, pickle.loads(pickled_trigger)))
+        except Exception as e:
+            runner.log.exception("Trigger %s cannot be unpickled", trigger_id)
+            runner.failed_triggers.append((trigger_id, e))
+
+
+def _run_trigger_shard(
+    shard: int,
+    job_id: int | None,
+    connection: MultiprocessingConnection,
+    parent_connection: MultiprocessingConnection,
+    listener: logging.handlers.QueueListener | None,
+) -> None:
+    """
+    Run the triggers received on the connection in an event loop, and send their events back.
+
+    :param shard: the index of the shard, to name the process
+    :param job_id: the ID of the triggerer job, used in the trigger log file names
+    :param connection: the connection to receive triggers to run or cancel on, and to send events with
+    :param parent_connection: the parent end of the connection to close in the child
+    :param listener: the log queue listener of the triggerer if the child was forked from it
+    """
+    # This helper runs in the newly created process
+    parent_connection.close()
+    del parent_connection
+
+    # The triggerer stops its shards itself
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    setproctitle(f"airflow triggerer -- shard {shard}")
+    # Re-configure the ORM engine as there are issues with multiple processes, trigger log handlers
+    # may query the database
+    settings.configure_orm()
+    if listener is not None:
+        # Threads do not survive a fork, start a new listener for the queue inherited from the triggerer
+        listener = logging.handlers.QueueListener(
+            listener.queue, *listener.handlers, respect_handler_level=True
+        )
+        listener.start()
+
+    runner = TriggerRunner()
+    runner.job_id = job_id
+    runner.start()
+    try:
+        while runner.is_alive():
+            try:
+                if connection.poll(1):
+                    command, payload = connection.recv()
+                    if command == "create":
+                        _unpickle_triggers(runner, payload)
+                    elif command == "cancel":
+                        runner.to_cancel.extend(payload)
+                    elif command == "stop":
+                        runner.stop = True
+                connection.send(_shard_state(runner))
+            except (EOFError, OSError):
+                # The triggerer is gone
+                break
+    finally:
+        runner.stop = True
+        runner.join(30)
+        with suppress(EOFError, OSError):
+            connection.send(_shard_state(runner))
+        connection.close()
+        if listener is not None:
+            listener.stop()
+        # We re-initialized the ORM within this Process above so we need to
+        # tear it down manually here
+        settings.dispose_orm()
+
+
+class TriggerRunnerShard(LoggingMixin):
+    """
+    A child process running a share of the triggers in its own event loop, see :func:`_run_trigger_shard`.
+
+    :param context: the multiprocessing context to start the process with
+    :param index: the index of the shard
+    :param job_id: the ID of the triggerer job
+    :param listener: the log queue listener of the triggerer
+    """
+
+    def __init__(
+        self,
+        context: multiprocessing.context.DefaultContext,
+        index: int,
+        job_id: int | None,
+        listener: logging.handlers.QueueListener | None,
+    ):
+        super().__init__()
+        self.index = index
+        # Trigger IDs the shard runs, or was asked to run
+        self.trigger_ids: set[int] = set()
+        self.load = 0.0
+        self.connection, child_connection = context.Pipe()
+        self.process = context.Process(
+            target=_run_trigger_shard,
+            args=(index, job_id, child_connection, self.connection, listener),
+            name=f"TriggerRunnerShard-{index}",
+        )
+        self.process.start()
+        # Close the child side of the pipe now the subprocess has started
+        child_connection.close()
+
+
+class ShardedTriggerRunner(TriggerRunner, MultiprocessingStartMethodMixin):
+    """
+    Runs the triggers in several child processes, each with its own event loop, to use several cores.
+
+    It has the same interface as :class:`TriggerRunner`, which runs in a thread of the triggerer: the main
+    thread still does all the database queries and exchanges triggers and events through the deques. This
+    thread only dispatches the new triggers to the shard running the fewest triggers, relays
+    cancellations to the shard running the trigger, and collects the events and failures of the shards.
+    If triggers are coalesced, identical triggers are sent to the same shard, which runs them in a single
+    coroutine.
+
+    A trigger blocking its event loop only delays the triggers of its shard. If a shard dies, the runner
+    stops, as :class:`TriggerRunner` does when its thread dies.
+
+    :param num_shards: the number of child processes to run the triggers in
+    :param listener: the log queue listener of the triggerer, restarted in the child processes
+    """
+
+    # Maps trigger IDs to the index of the shard running them
+    triggers: dict[int, int]  # type: ignore[assignment]
+    # Maps the coalescing keys of the triggers sent to the shards to their IDs, to send identical
+    # triggers to the same shard
+    coalesced_triggers: dict[str, set[int]]
+
+    def __init__(self, num_shards: int, listener: logging.handlers.QueueListener | None = None):
+        super().__init__()
+        self.num_shards = num_shards
+        self.listener = listener
+        self.shards: list[TriggerRunnerShard] = []
+        # Triggers sent to a shard which did not report them yet
+        self._unconfirmed: set[int] = set()
+        # Maps the IDs of the triggers sent to the shards to their coalescing keys, if coalesced
+        self._coalescing_keys: dict[int, str] = {}
+
+    def start(self) -> None:
+        """Start the shards from the calling thread, then the thread exchanging triggers with them."""
+        context = self._get_multiprocessing_context()
+        # Only a forked process can reuse the log handlers of the triggerer
+        listener = self.listener if self._get_multiprocessing_start_method() == "fork" else None
+        self.shards = [
+            TriggerRunnerShard(context, index, self.job_id, listener) for index in range(self.num_shards)
+        ]
+        super().start()
+
+    def run(self) -> None:
+        """Exchange triggers and events with the shards until asked to stop, or a shard dies."""
+        try:
+            while not self.stop:
+                self.dispatch_triggers()
+                self.receive_shard_states(timeout=1)
+                dead_shards = [shard.index for shard in self.shards if not shard.process.is_alive()]
+                if dead_shards:
+                    self.log.error("Trigger runner shards %s have died!", dead_shards)
+                    break
+        finally:
+            self.stop_shards()
+
+    def dispatch_triggers(self) -> None:
+        """
+        Send the new triggers to the least busy shards, and the triggers to cancel to their shards.
+
+        A trigger identical to triggers already sent, if coalesced, is sent to their shard instead.
+        """
+        to_create: dict[int, list[tuple[int, bytes]]] = defaultdict(list)
+        while self.to_create:
+            trigger_id, trigger = self.to_create.popleft()
+            if trigger_id in self.triggers:
+                self.log.warning("Trigger %s had insertion attempted twice", trigger_id)
+                continue
+            # Each trigger is pickled on its own, so that a trigger which cannot be pickled only fails itself
+            try:
+                pickled_trigger = pickle.dumps(trigger)
+            except Exception as e:
+                self.log.exception("Trigger %s cannot be sent to a trigger runner shard", trigger_id)
+                self.failed_triggers.append((trigger_id, e))
+                continue
+            key = self.get_coalescing_key(trigger) if self.coalesce_triggers else None
+            subscribers = self.coalesced_triggers.get(key) if key else None
+            if subscribers:
+                shard = self.shards[self.triggers[next(iter(subscribers))]]
+                subscribers.add(trigger_id)
+            else:
+                shard = min(self.shards, key=lambda s: len(s.trigger_ids))
+                if key:
+                    self.coalesced_triggers[key] = {trigger_id}
+            if key:
+                self._coalescing_keys[trigger_id] = key
+            shard.trigger_ids.add(trigger_id)
+            self._unconfirmed.add(trigger_id)
+            self.triggers[trigger_id] = shard.index
+            to_create[shard.index].append((trigger_id, pickled_trigger))
+        to_cancel: dict[int, list[int]] = defaultdict(list)
+        while self.to_cancel:
+            trigger_id = self.to_cancel.popleft()
+            if trigger_id in self.triggers:
+                to_cancel[self.triggers[trigger_id]].append(trigger_id)
+        for index, triggers in to_create.items():
+            self._send(self.shards[index], ("create", triggers))
+        for index, trigger_ids in to_cancel.items():
+            self._send(self.shards[index], ("cancel", trigger_ids))
+
+    def _send(self, shard: TriggerRunnerShard, message: tuple[str, Any]) -> None:
+        try:
+            shard.connection.send(message)
+        except (EOFError, OSError):
+            # The shard died, which run() handles
+            self.log.warning("Could not send %r to trigger runner shard %s", message[0], shard.index)
+
+    def receive_shard_states(self, timeout: float) -> None:
+        """Wait for the shards to report the triggers they run, and queue their events and failures."""
+        connections = {shard.connection: shard for shard in self.shards}
+        for connection in multiprocessing.connection.wait(list(connections), timeout=timeout):
+            shard = connections[connection]  # type: ignore[index]
+            try:
+                while connection.poll():
+                    self._update_shard_state(shard, *connection.recv())
+            except (EOFError, OSError):
+                # The shard died, which run() handles
+                pass
+
+    def _update_shard_state(
+        self,
+        shard: TriggerRunnerShard,
+        running: set[int],
+        events: list[tuple[int, TriggerEvent]],
+        failures: list[tuple[int, BaseException]],
+        load: float,
+    ) -> None:
+        shard.load = load
+        # Each shard has an event loop, so their average load is the share of the capacity in use
+        self.load = sum(s.load for s in self.shards) / len(self.shards)
+        # Queue the events first, so update_triggers always sees finished triggers somewhere
+        self.events.extend(events)
+        self.failed_triggers.extend(failures)
+        reported = running.union(trigger_id for trigger_id, _ in events).union(
+            trigger_id for trigger_id, _ in failures
+        )
+        self._unconfirmed -= reported
+        for trigger_id in shard.trigger_ids - running - self._unconfirmed:
+            shard.trigger_ids.discard(trigger_id)
+            self.triggers.pop(trigger_id, None)
+            key = self._coalescing_keys.pop(trigger_id, None)
+            if key:
+                subscribers = self.coalesced_triggers[key]
+                subscribers.discard(trigger_id)
+                if not subscribers:
+                    del self.coalesced_triggers[key]
+
+    def stop_shards(self) -> None:
+        """Ask the shards to stop, collecting the events of their last triggers, and kill the stragglers."""
+        for shard in self.shards:
+            self._send(shard, ("stop", None))
+        deadline = time.monotonic() + 30
+        while any(shard.process.is_alive() for shard in self.shards) and time.monotonic() < deadline:
+            self.receive_shard_states(timeout=0.1)
+        self.receive_shard_states(timeout=0)
+        for shard in self.shards:
+            if shard.process.is_alive():
+                self.log.warning("Killing trigger runner shard %s (PID=%d)", shard.index, shard.process.pid)
+                shard.process.kill()
+            shard.process.join()
+            shard.connection.close()
@@ -0,0 +1,53 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Add scheduler_partition table
+
+Revision ID: 4f8a2c9e1b7d
+Revises: 405de8318b3a
+Create Date: 2023-07-28 10:12:43.518237
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+from airflow.utils.sqlalchemy import UtcDateTime
+
+# revision identifiers, used by Alembic.
+revision = "4f8a2c9e1b7d"
+down_revision = "405de8318b3a"
+branch_labels = None
+depends_on = None
+airflow_version = "2.7.0"
+
+
+def upgrade():
+    """Apply Add scheduler_partition table"""
+    op.create_table(
+        "scheduler_partition",
+        sa.Column("partition_id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("scheduler_job_id", sa.Integer(), nullable=True),
+        sa.Column("acquired_at", UtcDateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("partition_id", name=op.f("scheduler_partition_pkey")),
+    )
+
+
+def downgrade():
+    """Unapply Add scheduler_partition table"""
+    op.drop_table("scheduler_partition")
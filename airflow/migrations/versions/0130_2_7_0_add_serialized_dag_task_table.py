@@ -0,0 +1,55 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Add serialized_dag_task table
+
+Revision ID: 6aa921c62010
+Revises: 4f8a2c9e1b7d
+Create Date: 2023-07-31 14:05:21.873412
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+from airflow.migrations.db_types import StringID
+
+# revision identifiers, used by Alembic.
+revision = "6aa921c62010"
+down_revision = "4f8a2c9e1b7d"
+branch_labels = None
+depends_on = None
+airflow_version = "2.7.0"
+
+
+def upgrade():
+    """Apply Add serialized_dag_task table"""
+    op.create_table(
+        "serialized_dag_task",
+        sa.Column("dag_id", StringID(), nullable=False),
+        sa.Column("task_id", StringID(), nullable=False),
+        sa.Column("data", sa.JSON(), nullable=True),
+        sa.Column("data_compressed", sa.LargeBinary(), nullable=True),
+        sa.Column("task_hash", sa.String(length=32), nullable=False),
+        sa.PrimaryKeyConstraint("dag_id", "task_id", name=op.f("serialized_dag_task_pkey")),
+    )
+
+
+def downgrade():
+    """Unapply Add serialized_dag_task table"""
+    op.drop_table("serialized_dag_task")
@@ -0,0 +1,152 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Add compression columns to serialized_dag, serialized_dag_task and dag_code
+
+Revision ID: 8678beacf319
+Revises: 6aa921c62010
+Create Date: 2023-08-02 09:41:12.270593
+
+"""
+
+import logging
+import zlib
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import mysql
+
+# revision identifiers, used by Alembic.
+revision = "8678beacf319"
+down_revision = "6aa921c62010"
+branch_labels = None
+depends_on = None
+airflow_version = "2.7.0"
+
+log = logging.getLogger(__name__)
+
+
+def upgrade():
+    """Apply Add compression columns to serialized_dag, serialized_dag_task and dag_code"""
+    for table_name in ("serialized_dag", "serialized_dag_task"):
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.add_column(sa.Column("compression", sa.String(length=250), nullable=True))
+    with op.batch_alter_table("dag_code") as batch_op:
+        batch_op.alter_column(
+            "source_code",
+            existing_type=sa.UnicodeText().with_variant(mysql.MEDIUMTEXT(), "mysql"),
+            nullable=True,
+        )
+        batch_op.add_column(sa.Column("source_code_compressed", sa.LargeBinary(), nullable=True))
+        batch_op.add_column(sa.Column("compression", sa.String(length=250), nullable=True))
+
+
+def _decompress(data, compression, row_description):
+    """Decompress the data of a row, or return None if it cannot be decompressed."""
+    from airflow.serialization.compression import decompress
+
+    try:
+        return decompress(data, compression)
+    except Exception as e:
+        # The row is written again when its DAG file is parsed
+        log.warning("Deleting %s, which cannot be decompressed: %s", row_description, e)
+        return None
+
+
+def downgrade():
+    """Unapply Add compression columns to serialized_dag, serialized_dag_task and dag_code"""
+    # Before this revision, DAG code was not compressed and serialized DAGs could only be compressed
+    # with zlib, stored without the name of their codec
+    conn = op.get_bind()
+    dag_code = sa.table(
+        "dag_code",
+        sa.column("fileloc_hash"),
+        sa.column("fileloc"),
+        sa.column("source_code"),
+        sa.column("source_code_compressed", sa.LargeBinary),
+        sa.column("compression"),
+    )
+    rows = conn.execute(
+        sa.select(
+            dag_code.c.fileloc_hash,
+            dag_code.c.fileloc,
+            dag_code.c.source_code_compressed,
+            dag_code.c.compression,
+        ).where(dag_code.c.source_code_compressed.is_not(None))
+    )
+    for fileloc_hash, fileloc, source_code_compressed, compression in rows.all():
+        source_code = _decompress(source_code_compressed, compression, f"the code of {fileloc}")
+        if source_code is None:
+            conn.execute(dag_code.delete().where(dag_code.c.fileloc_hash == fileloc_hash))
+        else:
+            conn.execute(
+                dag_code.update()
+                .where(dag_code.c.fileloc_hash == fileloc_hash)
+                .values(source_code=source_code.decode("utf-8"), source_code_compressed=None)
+            )
+
+    serialized_dag = sa.table(
+        "serialized_dag",
+        sa.column("dag_id"),
+        sa.column("data_compressed", sa.LargeBinary),
+        sa.column("compression"),
+    )
+    serialized_dag_task = sa.table(
+        "serialized_dag_task",
+        sa.column("dag_id"),
+        sa.column("task_id"),
+        sa.column("data_compressed", sa.LargeBinary),
+        sa.column("compression"),
+    )
+    deleted_dag_ids = set()
+    for table, key_columns in (
+        (serialized_dag, [serialized_dag.c.dag_id]),
+        (serialized_dag_task, [serialized_dag_task.c.dag_id, serialized_dag_task.c.task_id]),
+    ):
+        rows = conn.execute(
+            sa.select(*key_columns, table.c.data_compressed, table.c.compression).where(
+                table.c.data_compressed.is_not(None), table.c.compression != "zlib"
+            )
+        )
+        for *keys, data_compressed, compression in rows.all():
+            if keys[0] in deleted_dag_ids:
+                continue
+            data = _decompress(data_compressed, compression, f"the serialized DAG {keys[0]}")
+            if data is None:
+                # A DAG cannot be read without all its tasks
+                deleted_dag_ids.add(keys[0])
+                for dag_table in (serialized_dag, serialized_dag_task):
+                    conn.execute(dag_table.delete().where(dag_table.c.dag_id == keys[0]))
+            else:
+                conn.execute(
+                    table.update()
+                    .where(*(column == key for column, key in zip(key_columns, keys)))
+                    .values(data_compressed=zlib.compress(data))
+                )
+
+    with op.batch_alter_table("dag_code") as batch_op:
+        batch_op.drop_column("compression")
+        batch_op.drop_column("source_code_compressed")
+        batch_op.alter_column(
+            "source_code",
+            existing_type=sa.UnicodeText().with_variant(mysql.MEDIUMTEXT(), "mysql"),
+            nullable=False,
+        )
+    for table_name in ("serialized_dag", "serialized_dag_task"):
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.drop_column("compression")
@@ -0,0 +1,47 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Add load column to job
+
+Revision ID: e2b4c9d1a7f3
+Revises: 8678beacf319
+Create Date: 2023-08-03 14:12:45.103286
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e2b4c9d1a7f3"
+down_revision = "8678beacf319"
+branch_labels = None
+depends_on = None
+airflow_version = "2.7.0"
+
+
+def upgrade():
+    """Apply Add load column to job"""
+    with op.batch_alter_table("job") as batch_op:
+        batch_op.add_column(sa.Column("load", sa.Float(), nullable=True))
+
+
+def downgrade():
+    """Unapply Add load column to job"""
+    with op.batch_alter_table("job") as batch_op:
+        batch_op.drop_column("load")
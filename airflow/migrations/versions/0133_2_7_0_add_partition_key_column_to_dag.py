@@ -0,0 +1,64 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Add partition_key column to dag
+
+Revision ID: 2d8e1f4b6a9c
+Revises: e2b4c9d1a7f3
+Create Date: 2023-08-07 09:41:17.286531
+
+"""
+
+import zlib
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2d8e1f4b6a9c"
+down_revision = "e2b4c9d1a7f3"
+branch_labels = None
+depends_on = None
+airflow_version = "2.7.0"
+
+
+def upgrade():
+    """Apply Add partition_key column to dag"""
+    with op.batch_alter_table("dag") as batch_op:
+        batch_op.add_column(sa.Column("partition_key", sa.BigInteger(), nullable=True))
+
+    # The key is a crc32 of the dag_id, see DagModel.partition_key_for_dag
+    dag = sa.table("dag", sa.column("dag_id"), sa.column("partition_key"))
+    conn = op.get_bind()
+    dag_ids = conn.execute(sa.select(dag.c.dag_id)).scalars().all()
+    if dag_ids:
+        conn.execute(
+            dag.update()
+            .where(dag.c.dag_id == sa.bindparam("b_dag_id"))
+            .values(partition_key=sa.bindparam("b_partition_key")),
+            [
+                {"b_dag_id": dag_id, "b_partition_key": zlib.crc32(dag_id.encode("utf-8"))}
+                for dag_id in dag_ids
+            ],
+        )
+
+
+def downgrade():
+    """Unapply Add partition_key column to dag"""
+    with op.batch_alter_table("dag") as batch_op:
+        batch_op.drop_column("partition_key")
@@ -61,6 +61,7 @@ def import_all_models():
 
     import airflow.models.dagwarning
     import airflow.models.dataset
+    import airflow.models.scheduler_partition
     import airflow.models.serialized_dag
     import airflow.models.tasklog
 
@@ -30,6 +30,7 @@ import sys
 import traceback
 import warnings
 import weakref
+import zlib
 from collections import deque
 from datetime import datetime, timedelta
 from inspect import signature
@@ -56,6 +57,7 @@ import re2
 from dateutil.relativedelta import relativedelta
 from pendulum.tz.timezone import Timezone
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     ForeignKey,
@@ -3409,6 +3411,9 @@ class DagModel(Base):
     # Earliest time at which this ``next_dagrun`` can be created.
     next_dagrun_create_after = Column(UtcDateTime)
 
+    # A hash of the dag_id, whose remainder by ``[scheduler] num_dag_partitions`` is the partition of the DAG
+    partition_key = Column(BigInteger, nullable=True)
+
     __table_args__ = (
         Index("idx_root_dag_id", root_dag_id, unique=False),
         Index("idx_next_dagrun_create_after", next_dagrun_create_after, unique=False),
@@ -3450,9 +3455,22 @@ class DagModel(Base):
             # Be safe -- this will be updated later once the DAG is parsed
             self.has_task_concurrency_limits = True
 
+        if self.partition_key is None and self.dag_id is not None:
+            self.partition_key = self.partition_key_for_dag(self.dag_id)
+
     def __repr__(self):
         return f"<DAG: {self.dag_id}>"
 
+    @staticmethod
+    def partition_key_for_dag(dag_id: str) -> int:
+        """Return the partition key of a DAG; this is stable across processes and hosts."""
+        return zlib.crc32(dag_id.encode("utf-8"))
+
+    @classmethod
+    def in_partitions(cls, partition_ids: Collection[int], num_partitions: int):
+        """Filter the DAGs in some of ``num_partitions`` partitions, see :class:`SchedulerPartition`."""
+        return (cls.partition_key % num_partitions).in_(partition_ids)
+
     @property
     def next_dagrun_data_interval(self) -> DataInterval | None:
         return _get_model_data_interval(
@@ -3591,13 +3609,22 @@ class DagModel(Base):
                 dag_model.is_active = False
 
     @classmethod
-    def dags_needing_dagruns(cls, session: Session) -> tuple[Query, dict[str, tuple[datetime, datetime]]]:
+    def dags_needing_dagruns(
+        cls,
+        session: Session,
+        partition_ids: Collection[int] | None = None,
+        num_partitions: int | None = None,
+    ) -> tuple[Query, dict[str, tuple[datetime, datetime]]]:
         """
         Return (and lock) a list of Dag objects that are due to create a new DagRun.
 
         This will return a resultset of rows that is row-level-locked with a "SELECT ... FOR UPDATE" query,
         you should ensure that any scheduling decisions are made in a single transaction -- as soon as the
         transaction is committed it will be unlocked.
+
+        :param partition_ids: If given, only consider the DAGs in these partitions (e.g. the partitions
+            leased by the scheduler).
+        :param num_partitions: The total number of partitions, required with ``partition_ids``.
         """
         from airflow.models.dataset import DagScheduleDatasetReference, DatasetDagRunQueue as DDRQ
 
@@ -3648,6 +3675,8 @@ class DagModel(Base):
             .order_by(cls.next_dagrun_create_after)
             .limit(cls.NUM_DAGS_PER_DAGRUN_QUERY)
         )
+        if partition_ids is not None and num_partitions:
+            query = query.where(cls.in_partitions(partition_ids, num_partitions))
 
         return (
             session.scalars(with_row_locks(query, of=cls, session=session, **skip_locked(session=session))),
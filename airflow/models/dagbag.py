@@ -51,6 +51,7 @@ from airflow.utils.docs import get_docs_url
 from airflow.utils.file import correct_maybe_zipped, list_py_file_paths, might_contain_dag
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.retries import MAX_DB_RETRIES, run_with_db_retries
+from airflow.utils.scheduler_wakeup import notify_scheduler
 from airflow.utils.session import NEW_SESSION, provide_session
 from airflow.utils.timeout import timeout
 from airflow.utils.types import NOTSET, ArgNotSet
@@ -89,6 +90,8 @@ class DagBag(LoggingMixin):
     :param load_op_links: Should the extra operator link be loaded via plugins when
         de-serializing the DAG? This flag is set to False in Scheduler so that Extra Operator links
         are not loaded to not run User code in Scheduler.
+    :param lazy_load_tasks: Should the operators of DAGs read from DB only be de-serialized when they
+        are accessed? This lowers the cost of loading large DAGs for read-only uses, like the webserver.
     """
 
     def __init__(
@@ -100,6 +103,7 @@ class DagBag(LoggingMixin):
         store_serialized_dags: bool | None = None,
         load_op_links: bool = True,
         collect_dags: bool = True,
+        lazy_load_tasks: bool = False,
     ):
         # Avoid circular import
 
@@ -133,6 +137,8 @@ class DagBag(LoggingMixin):
         self.read_dags_from_db = read_dags_from_db
         # Only used by read_dags_from_db=True
         self.dags_last_fetched: dict[str, datetime] = {}
+        # Last time DAGs were found unchanged in DB, to check them once per min_serialized_dag_fetch_secs
+        self.dags_last_checked: dict[str, datetime] = {}
         # Only used by SchedulerJob to compare the dag_hash to identify change in DAGs
         self.dags_hash: dict[str, str] = {}
 
@@ -147,6 +153,7 @@ class DagBag(LoggingMixin):
         # Should the extra operator link be loaded via plugins?
         # This flag is set to False in Scheduler so that Extra Operator links are not loaded
         self.load_op_links = load_op_links
+        self.lazy_load_tasks = lazy_load_tasks
 
     def size(self) -> int:
         """:return: the amount of dags contained in this dagbag"""
@@ -182,9 +189,6 @@ class DagBag(LoggingMixin):
         from airflow.models.dag import DagModel
 
         if self.read_dags_from_db:
-            # Import here so that serialized dag is only imported when serialization is enabled
-            from airflow.models.serialized_dag import SerializedDagModel
-
             if dag_id not in self.dags:
                 # Load from DB if not (yet) in the bag
                 self._add_dag_from_db(dag_id=dag_id, session=session)
@@ -193,34 +197,12 @@ class DagBag(LoggingMixin):
             # If DAG is in the DagBag, check the following
             # 1. if time has come to check if DAG is updated (controlled by min_serialized_dag_fetch_secs)
             # 2. check the last_updated and hash columns in SerializedDag table to see if
-            # Serialized DAG is updated
+            # Serialized DAG is updated, along with the other DAGs due for a check
             # 3. if (2) is yes, fetch the Serialized DAG.
             # 4. if (2) returns None (i.e. Serialized DAG is deleted), remove dag from dagbag
             # if it exists and return None.
-            min_serialized_dag_fetch_secs = timedelta(seconds=settings.MIN_SERIALIZED_DAG_FETCH_INTERVAL)
-            if (
-                dag_id in self.dags_last_fetched
-                and timezone.utcnow() > self.dags_last_fetched[dag_id] + min_serialized_dag_fetch_secs
-            ):
-                sd_latest_version_and_updated_datetime = (
-                    SerializedDagModel.get_latest_version_hash_and_updated_datetime(
-                        dag_id=dag_id, session=session
-                    )
-                )
-                if not sd_latest_version_and_updated_datetime:
-                    self.log.warning("Serialized DAG %s no longer exists", dag_id)
-                    del self.dags[dag_id]
-                    del self.dags_last_fetched[dag_id]
-                    del self.dags_hash[dag_id]
-                    return None
-
-                sd_latest_version, sd_last_updated_datetime = sd_latest_version_and_updated_datetime
-
-                if (
-                    sd_last_updated_datetime > self.dags_last_fetched[dag_id]
-                    or sd_latest_version != self.dags_hash[dag_id]
-                ):
-                    self._add_dag_from_db(dag_id=dag_id, session=session)
+            if self._is_due_for_refresh(dag_id, timezone.utcnow()):
+                self._refresh_dags_from_db(dag_id=dag_id, session=session)
 
             return self.dags.get(dag_id)
 
@@ -260,6 +242,49 @@ class DagBag(LoggingMixin):
                 del self.dags[dag_id]
         return self.dags.get(dag_id)
 
+    def _is_due_for_refresh(self, dag_id: str, now: datetime) -> bool:
+        if dag_id not in self.dags_last_fetched:
+            return False
+        last_checked = self.dags_last_checked.get(dag_id, self.dags_last_fetched[dag_id])
+        return now > last_checked + timedelta(seconds=settings.MIN_SERIALIZED_DAG_FETCH_INTERVAL)
+
+    def _refresh_dags_from_db(self, dag_id: str, session: Session) -> None:
+        """
+        Refresh a DAG from DB, checking all the DAGs due for a check in the same query.
+
+        The other DAGs which changed are removed from the DagBag, to be loaded again when requested.
+        """
+        from airflow.models.serialized_dag import SerializedDagModel
+
+        now = timezone.utcnow()
+        dag_ids = [key for key in self.dags_last_fetched if self._is_due_for_refresh(key, now)]
+        latest_versions = SerializedDagModel.get_latest_version_hashes_and_updated_datetimes(
+            dag_ids, session=session
+        )
+        for key in dag_ids:
+            if key not in latest_versions:
+                self.log.warning("Serialized DAG %s no longer exists", key)
+                self._remove_dag_from_db_cache(key)
+                continue
+
+            sd_latest_version, sd_last_updated_datetime = latest_versions[key]
+            if (
+                sd_last_updated_datetime > self.dags_last_fetched[key]
+                or sd_latest_version != self.dags_hash[key]
+            ):
+                if key == dag_id:
+                    self._add_dag_from_db(dag_id=key, session=session)
+                else:
+                    self._remove_dag_from_db_cache(key)
+            else:
+                self.dags_last_checked[key] = now
+
+    def _remove_dag_from_db_cache(self, dag_id: str) -> None:
+        del self.dags[dag_id]
+        del self.dags_last_fetched[dag_id]
+        del self.dags_hash[dag_id]
+        self.dags_last_checked.pop(dag_id, None)
+
     def _add_dag_from_db(self, dag_id: str, session: Session):
         """Add DAG to DagBag from DB."""
         from airflow.models.serialized_dag import SerializedDagModel
@@ -269,11 +294,13 @@ class DagBag(LoggingMixin):
             return None
 
         row.load_op_links = self.load_op_links
+        row.lazy_load_tasks = self.lazy_load_tasks
         dag = row.dag
         for subdag in dag.subdags:
             self.dags[subdag.dag_id] = subdag
         self.dags[dag.dag_id] = dag
         self.dags_last_fetched[dag.dag_id] = timezone.utcnow()
+        self.dags_last_checked.pop(dag.dag_id, None)
         self.dags_hash[dag.dag_id] = row.dag_hash
 
     def process_file(self, filepath, only_if_updated=True, safe_mode=True):
@@ -623,32 +650,85 @@ class DagBag(LoggingMixin):
 
         log = cls.logger()
 
-        def _serialize_dag_capturing_errors(dag, session):
+        def _format_error():
+            dagbag_import_error_traceback_depth = conf.getint("core", "dagbag_import_error_traceback_depth")
+            return traceback.format_exc(limit=-dagbag_import_error_traceback_depth)
+
+        def _serialize_dag_capturing_errors(dag):
             """
-            Try to serialize the dag to the DB, but make a note of any errors.
+            Try to serialize the dag, but make a note of any errors.
 
-            We can't place them directly in import_errors, as this may be retried, and work the next time
+            We can't place them directly in import_errors, as writing to the DB may be retried,
+            and work the next time
             """
-            if dag.is_subdag:
-                return []
             try:
-                # We can't use bulk_write_to_db as we want to capture each error individually
-                dag_was_updated = SerializedDagModel.write_dag(
-                    dag,
-                    min_update_interval=settings.MIN_SERIALIZED_DAG_UPDATE_INTERVAL,
-                    session=session,
-                )
-                if dag_was_updated:
-                    DagBag._sync_perm_for_dag(dag, session=session)
+                return SerializedDagModel(dag), []
+            except Exception:
+                log.exception("Failed to serialize DAG: %s", dag.fileloc)
+                return None, [(dag.fileloc, _format_error())]
+
+        def _write_serialized_dags_capturing_errors(serialized_dags, session):
+            """
+            Write the serialized DAGs in bulk, falling back to writing them one by one when that fails.
+
+            Errors of the individual writes are captured like the serialization errors, so that a DAG
+            which cannot be written does not prevent the other DAGs of the file from being written.
+            """
+            try:
+                with session.begin_nested():
+                    return (
+                        SerializedDagModel.write_serialized_dags(
+                            serialized_dags,
+                            min_update_interval=settings.MIN_SERIALIZED_DAG_UPDATE_INTERVAL,
+                            session=session,
+                        ),
+                        [],
+                    )
+            except OperationalError:
+                raise
+            except Exception:
+                log.exception("Failed to write serialized DAGs in bulk, writing them one by one")
+            written_dag_ids, errors = [], []
+            for serialized_dag in serialized_dags:
+                try:
+                    with session.begin_nested():
+                        written_dag_ids.extend(
+                            SerializedDagModel.write_serialized_dags(
+                                [serialized_dag],
+                                min_update_interval=settings.MIN_SERIALIZED_DAG_UPDATE_INTERVAL,
+                                session=session,
+                            )
+                        )
+                except OperationalError:
+                    raise
+                except Exception:
+                    fileloc = dags[serialized_dag.dag_id].fileloc
+                    log.exception("Failed to write serialized DAG: %s", fileloc)
+                    errors.append((fileloc, _format_error()))
+            return written_dag_ids, errors
+
+        def _sync_perm_for_dag_capturing_errors(dag, session):
+            """Sync the permissions of the dag, making a note of any errors like for its serialization."""
+            try:
+                DagBag._sync_perm_for_dag(dag, session=session)
                 return []
             except OperationalError:
                 raise
             except Exception:
-                log.exception("Failed to write serialized DAG: %s", dag.fileloc)
-                dagbag_import_error_traceback_depth = conf.getint(
-                    "core", "dagbag_import_error_traceback_depth"
-                )
-                return [(dag.fileloc, traceback.format_exc(limit=-dagbag_import_error_traceback_depth))]
+                log.exception("Failed to sync the permissions of DAG: %s", dag.fileloc)
+                return [(dag.fileloc, _format_error())]
+
+        # Serialize the DAGs once, errors are captured individually, then write the ones which changed
+        # in bulk
+        serialized_dags = []
+        serialize_errors = []
+        for dag in dags.values():
+            if dag.is_subdag:
+                continue
+            serialized_dag, errors = _serialize_dag_capturing_errors(dag)
+            if serialized_dag is not None:
+                serialized_dags.append(serialized_dag)
+            serialize_errors.extend(errors)
 
         # Retry 'DAG.bulk_write_to_db' & 'SerializedDagModel.bulk_sync_to_db' in case
         # of any Operational Errors
@@ -656,7 +736,6 @@ class DagBag(LoggingMixin):
         import_errors = {}
         for attempt in run_with_db_retries(logger=log):
             with attempt:
-                serialize_errors = []
                 log.debug(
                     "Running dagbag.sync_to_db with retries. Try %d of %d",
                     attempt.retry_state.attempt_number,
@@ -664,9 +743,13 @@ class DagBag(LoggingMixin):
                 )
                 log.debug("Calling the DAG.bulk_sync_to_db method")
                 try:
-                    # Write Serialized DAGs to DB, capturing errors
-                    for dag in dags.values():
-                        serialize_errors.extend(_serialize_dag_capturing_errors(dag, session))
+                    written_dag_ids, write_errors = _write_serialized_dags_capturing_errors(
+                        serialized_dags, session
+                    )
+                    for dag_id in written_dag_ids:
+                        write_errors.extend(_sync_perm_for_dag_capturing_errors(dags[dag_id], session))
+                    if written_dag_ids:
+                        notify_scheduler(session=session)
 
                     DAG.bulk_write_to_db(dags.values(), processor_subdir=processor_subdir, session=session)
                 except OperationalError:
@@ -675,6 +758,7 @@ class DagBag(LoggingMixin):
                 # Only now we are "complete" do we update import_errors - don't want to record errors from
                 # previous failed attempts
                 import_errors.update(dict(serialize_errors))
+                import_errors.update(dict(write_errors))
 
         return import_errors
 
@@ -22,13 +22,15 @@ import struct
 from datetime import datetime
 from typing import Collection, Iterable
 
-from sqlalchemy import BigInteger, Column, String, Text, delete, select
+from sqlalchemy import BigInteger, Column, LargeBinary, String, Text, delete, select
 from sqlalchemy.dialects.mysql import MEDIUMTEXT
 from sqlalchemy.orm import Session
 from sqlalchemy.sql.expression import literal
 
 from airflow.exceptions import AirflowException, DagCodeNotFound
 from airflow.models.base import Base
+from airflow.serialization.compression import compress, decompress
+from airflow.settings import COMPRESS_DAG_CODE
 from airflow.utils import timezone
 from airflow.utils.file import correct_maybe_zipped, open_maybe_zipped
 from airflow.utils.session import NEW_SESSION, provide_session
@@ -51,13 +53,31 @@ class DagCode(Base):
     fileloc = Column(String(2000), nullable=False)
     # The max length of fileloc exceeds the limit of indexing.
     last_updated = Column(UtcDateTime, nullable=False)
-    source_code = Column(Text().with_variant(MEDIUMTEXT(), "mysql"), nullable=False)
+    source_code = Column(Text().with_variant(MEDIUMTEXT(), "mysql"), nullable=True)
+    source_code_compressed = Column(LargeBinary, nullable=True)
+    # The codec of source_code_compressed, see airflow.serialization.compression
+    compression = Column(String(250), nullable=True)
 
     def __init__(self, full_filepath: str, source_code: str | None = None):
         self.fileloc = full_filepath
         self.fileloc_hash = DagCode.dag_fileloc_hash(self.fileloc)
         self.last_updated = timezone.utcnow()
-        self.source_code = source_code or DagCode.code(self.fileloc)
+        self._set_source_code(source_code or DagCode.code(self.fileloc))
+
+    def _set_source_code(self, source_code: str) -> None:
+        """Set the source code, compressed when ``[core] compress_dag_code`` is True."""
+        if COMPRESS_DAG_CODE:
+            self.source_code = None
+            self.source_code_compressed, self.compression = compress(source_code.encode("utf-8"))
+        else:
+            self.source_code = source_code
+            self.source_code_compressed = None
+            self.compression = None
+
+    def _get_source_code(self) -> str:
+        if self.source_code_compressed is not None:
+            return decompress(self.source_code_compressed, self.compression).decode("utf-8")
+        return self.source_code
 
     @provide_session
     def sync_to_db(self, session: Session = NEW_SESSION) -> None:
@@ -120,7 +140,7 @@ class DagCode(Base):
             if file_mod_time > current_version.last_updated:
                 orm_dag_code = existing_orm_dag_codes_map[fileloc]
                 orm_dag_code.last_updated = file_mod_time
-                orm_dag_code.source_code = cls._get_code_from_file(orm_dag_code.fileloc)
+                orm_dag_code._set_source_code(cls._get_code_from_file(orm_dag_code.fileloc))
                 session.merge(orm_dag_code)
 
     @classmethod
@@ -195,7 +215,7 @@ class DagCode(Base):
         if not dag_code:
             raise DagCodeNotFound()
         else:
-            code = dag_code.source_code
+            code = dag_code._get_source_code()
         return code
 
     @staticmethod
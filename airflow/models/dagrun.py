@@ -22,7 +22,18 @@ import os
 import warnings
 from collections import defaultdict
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, NamedTuple, Sequence, TypeVar, overload
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Collection,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Sequence,
+    TypeVar,
+    overload,
+)
 
 import re2
 from sqlalchemy import (
@@ -318,6 +329,8 @@ class DagRun(Base, LoggingMixin):
         state: DagRunState,
         session: Session,
         max_number: int | None = None,
+        partition_ids: Collection[int] | None = None,
+        num_partitions: int | None = None,
     ) -> Query:
         """
         Return the next DagRuns that the scheduler should attempt to schedule.
@@ -326,6 +339,9 @@ class DagRun(Base, LoggingMixin):
         query, you should ensure that any scheduling decisions are made in a single transaction -- as soon as
         the transaction is committed it will be unlocked.
 
+        :param partition_ids: If given, only consider DagRuns of the DAGs in these partitions (e.g. the
+            partitions leased by the scheduler).
+        :param num_partitions: The total number of partitions, required with ``partition_ids``.
         """
         from airflow.models.dag import DagModel
 
@@ -340,6 +356,8 @@ class DagRun(Base, LoggingMixin):
             .join(DagModel, DagModel.dag_id == cls.dag_id)
             .where(DagModel.is_paused == false(), DagModel.is_active == true())
         )
+        if partition_ids is not None and num_partitions:
+            query = query.where(DagModel.in_partitions(partition_ids, num_partitions))
         if state == DagRunState.QUEUED:
             # For dag runs in the queued state, we check if they have reached the max_active_runs limit
             # and if so we drop them
@@ -815,6 +833,7 @@ class DagRun(Base, LoggingMixin):
             flag_upstream_failed=True,
             ignore_unmapped_tasks=True,  # Ignore this Dep, as we will expand it if we can.
             finished_tis=finished_tis,
+            batch_upstream_counts=True,
         )
 
         def _expand_mapped_task_if_needed(ti: TI) -> Iterable[TI] | None:
@@ -867,11 +886,15 @@ class DagRun(Base, LoggingMixin):
                 if new_tis is not None:
                     additional_tis.extend(new_tis)
                     expansion_happened = True
+                    dep_context.invalidate_ti_map_indexes()
             if new_tis is None and schedulable.state in SCHEDULEABLE_STATES:
                 # It's enough to revise map index once per task id,
                 # checking the map index for each mapped task significantly slows down scheduling
                 if schedulable.task.task_id not in revised_map_index_task_ids:
-                    ready_tis.extend(self._revise_map_indexes_if_mapped(schedulable.task, session=session))
+                    revised_tis = list(self._revise_map_indexes_if_mapped(schedulable.task, session=session))
+                    if revised_tis:
+                        dep_context.invalidate_ti_map_indexes()
+                    ready_tis.extend(revised_tis)
                     revised_map_index_task_ids.add(schedulable.task.task_id)
                 ready_tis.append(schedulable)
 
@@ -894,6 +917,7 @@ class DagRun(Base, LoggingMixin):
             ignore_in_retry_period=True,
             ignore_in_reschedule_period=True,
             finished_tis=finished_tis,
+            batch_upstream_counts=True,
         )
         # there might be runnable tasks that are up for retry and for some reason(retry delay, etc.) are
         # not ready yet, so we set the flags to count them in
@@ -1310,6 +1334,31 @@ class DagRun(Base, LoggingMixin):
             )
         ).all()
 
+    @classmethod
+    def touch_finished(cls, dag_run_keys: Collection[tuple[str, str]], *, session: Session) -> None:
+        """
+        Update the ``updated_at`` of the finished DAG runs among the given ones.
+
+        The task instances of finished runs only change when users mark or annotate them, and the grid
+        view takes such runs as unchanged as long as they are not updated. Unfinished runs are left
+        alone, not to wait for the scheduler locking them.
+
+        :meta private:
+        :param dag_run_keys: the DAG IDs and run IDs of the runs whose task instances changed
+        :param session: ORM session
+        """
+        if not dag_run_keys:
+            return
+        session.execute(
+            update(cls)
+            .where(
+                tuple_in_condition((cls.dag_id, cls.run_id), dag_run_keys),
+                cls.state.in_(State.finished_dr_states),
+            )
+            .values(updated_at=timezone.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+
     @provide_session
     def schedule_tis(
         self,
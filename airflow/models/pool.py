@@ -17,7 +17,7 @@
 # under the License.
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterable
 
 from sqlalchemy import Boolean, Column, Integer, String, Text, func, select
 from sqlalchemy.orm.session import Session
@@ -150,6 +150,7 @@ class Pool(Base):
     def slots_stats(
         *,
         lock_rows: bool = False,
+        slots_by_pool_state: Iterable[tuple[str, TaskInstanceState, int]] | None = None,
         session: Session = NEW_SESSION,
     ) -> dict[str, PoolStats]:
         """
@@ -160,6 +161,9 @@ class Pool(Base):
         OperationalError.
 
         :param lock_rows: Should we attempt to obtain a row-level lock on all the Pool rows returns
+        :param slots_by_pool_state: Occupied slots as ``(pool, state, slots)`` tuples. If given, these are
+            used instead of aggregating the task instance table, e.g. when the caller already keeps track
+            of the occupied slots itself.
         :param session: SQLAlchemy ORM Session
         """
         from airflow.models.taskinstance import TaskInstance  # Avoid circular import
@@ -182,11 +186,14 @@ class Pool(Base):
         allowed_execution_states = EXECUTION_STATES | {
             TaskInstanceState.DEFERRED,
         }
-        state_count_by_pool = session.execute(
-            select(TaskInstance.pool, TaskInstance.state, func.sum(TaskInstance.pool_slots))
-            .filter(TaskInstance.state.in_(allowed_execution_states))
-            .group_by(TaskInstance.pool, TaskInstance.state)
-        )
+        if slots_by_pool_state is None:
+            state_count_by_pool = session.execute(
+                select(TaskInstance.pool, TaskInstance.state, func.sum(TaskInstance.pool_slots))
+                .filter(TaskInstance.state.in_(allowed_execution_states))
+                .group_by(TaskInstance.pool, TaskInstance.state)
+            )
+        else:
+            state_count_by_pool = slots_by_pool_state
 
         # calculate queued and running metrics
         for pool_name, state, count in state_count_by_pool:
@@ -0,0 +1,174 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import math
+from datetime import timedelta
+
+from sqlalchemy import Column, Integer, delete, exc, select
+from sqlalchemy.orm import Session
+
+from airflow.models.base import Base
+from airflow.models.dag import DagModel
+from airflow.utils import timezone
+from airflow.utils.log.logging_mixin import LoggingMixin
+from airflow.utils.session import NEW_SESSION, provide_session
+from airflow.utils.sqlalchemy import UtcDateTime, with_row_locks
+from airflow.utils.state import JobState
+
+
+class SchedulerPartition(Base, LoggingMixin):
+    """
+    A lease on a partition of the DAGs, held by a scheduler.
+
+    When ``[scheduler] num_dag_partitions`` is set, DAGs are split into that many partitions by the
+    ``partition_key`` hash of their ``dag_id`` stored in the ``dag`` table, and each running scheduler
+    leases a fair share of the partitions. A scheduler then only creates and examines DAG runs of the
+    DAGs in its own partitions, instead of competing with the other schedulers for the same rows.
+    Partitions of schedulers that stopped heartbeating are released and picked up by the remaining
+    schedulers when they rebalance.
+    """
+
+    __tablename__ = "scheduler_partition"
+
+    partition_id = Column(Integer, primary_key=True, autoincrement=False)
+    scheduler_job_id = Column(Integer, nullable=True)
+    acquired_at = Column(UtcDateTime, nullable=True)
+
+    def __init__(self, partition_id: int):
+        super().__init__()
+        self.partition_id = partition_id
+
+    def __repr__(self) -> str:
+        return f"<SchedulerPartition {self.partition_id}: job {self.scheduler_job_id}>"
+
+    @staticmethod
+    def partition_for_dag(dag_id: str, num_partitions: int) -> int:
+        """Return the partition a DAG belongs to; this is stable across processes and hosts."""
+        return DagModel.partition_key_for_dag(dag_id) % num_partitions
+
+    @classmethod
+    @provide_session
+    def rebalance(
+        cls,
+        job_id: int,
+        num_partitions: int,
+        health_check_threshold: float,
+        session: Session = NEW_SESSION,
+    ) -> set[int]:
+        """
+        Release partitions of dead schedulers and claim a fair share of the partitions for this job.
+
+        A scheduler holding more than its fair share (e.g. after another scheduler joined) gives up
+        the extra partitions, so they can be claimed by the other schedulers on their next rebalance.
+
+        :param job_id: The id of the scheduler job claiming partitions.
+        :param num_partitions: The total number of partitions.
+        :param health_check_threshold: Number of seconds after which a scheduler that has not
+            heartbeated is considered dead.
+        :param session: SQLAlchemy ORM Session
+        :return: The ids of the partitions now held by ``job_id``.
+        """
+        from airflow.jobs.job import Job
+
+        limit_dttm = timezone.utcnow() - timedelta(seconds=health_check_threshold)
+        alive_job_ids = set(
+            session.scalars(
+                select(Job.id).where(
+                    Job.job_type == "SchedulerJob",
+                    Job.state == JobState.RUNNING,
+                    Job.latest_heartbeat > limit_dttm,
+                )
+            )
+        )
+        alive_job_ids.add(job_id)
+
+        existing_ids = set(session.scalars(select(cls.partition_id)))
+        missing_ids = [
+            partition_id for partition_id in range(num_partitions) if partition_id not in existing_ids
+        ]
+        if missing_ids:
+            cls._insert_partitions(missing_ids, session=session)
+        if any(partition_id >= num_partitions for partition_id in existing_ids):
+            session.execute(delete(cls).where(cls.partition_id >= num_partitions))
+
+        partitions = session.scalars(
+            with_row_locks(select(cls).order_by(cls.partition_id), of=cls, session=session)
+        ).all()
+
+        for partition in partitions:
+            if partition.scheduler_job_id is not None and partition.scheduler_job_id not in alive_job_ids:
+                cls.logger().info(
+                    "Releasing DAG partition %s held by dead scheduler job %s",
+                    partition.partition_id,
+                    partition.scheduler_job_id,
+                )
+                partition.scheduler_job_id = None
+                partition.acquired_at = None
+
+        fair_share = math.ceil(num_partitions / len(alive_job_ids))
+        owned = [p for p in partitions if p.scheduler_job_id == job_id]
+        for partition in owned[fair_share:]:
+            partition.scheduler_job_id = None
+            partition.acquired_at = None
+        owned = owned[:fair_share]
+
+        free = [p for p in partitions if p.scheduler_job_id is None and p not in owned]
+        for partition in free[: fair_share - len(owned)]:
+            partition.scheduler_job_id = job_id
+            partition.acquired_at = timezone.utcnow()
+            owned.append(partition)
+
+        session.flush()
+        return {partition.partition_id for partition in owned}
+
+    @classmethod
+    def _insert_partitions(cls, partition_ids: list[int], *, session: Session) -> None:
+        """
+        Insert partitions, skipping the ones inserted meanwhile by another scheduler.
+
+        Schedulers starting together on an empty table all insert the same partitions.
+        """
+        dialect_name = session.bind.dialect.name
+        rows = [{"partition_id": partition_id} for partition_id in partition_ids]
+        if dialect_name in ("postgresql", "sqlite"):
+            if dialect_name == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert
+            session.execute(insert(cls.__table__).on_conflict_do_nothing(), rows)
+        elif dialect_name == "mysql":
+            from sqlalchemy.dialects.mysql import insert
+
+            session.execute(insert(cls.__table__).prefix_with("IGNORE"), rows)
+        else:
+            for partition_id in partition_ids:
+                try:
+                    with session.begin_nested():
+                        session.add(cls(partition_id))
+                except exc.IntegrityError:
+                    cls.logger().debug("DAG partition %s was inserted by another scheduler", partition_id)
+
+    @classmethod
+    @provide_session
+    def release(cls, job_id: int, session: Session = NEW_SESSION) -> None:
+        """Release all partitions held by a scheduler job, e.g. when it shuts down."""
+        for partition in session.scalars(select(cls).where(cls.scheduler_job_id == job_id)):
+            partition.scheduler_job_id = None
+            partition.acquired_at = None
+        session.flush()
@@ -19,28 +19,39 @@
 from __future__ import annotations
 
 import logging
-import zlib
 from datetime import datetime, timedelta
-from typing import Collection
+from typing import Any, Collection
 
 import sqlalchemy_jsonfield
-from sqlalchemy import BigInteger, Column, Index, LargeBinary, String, and_, or_, select
-from sqlalchemy.orm import Session, backref, foreign, relationship
+from sqlalchemy import BigInteger, Column, Index, LargeBinary, String, and_, delete, or_, select, update
+from sqlalchemy.orm import Session, backref, foreign, object_session, relationship
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.sql.expression import func, literal
 
-from airflow.models.base import ID_LEN, Base
+from airflow.models.base import COLLATION_ARGS, ID_LEN, Base
 from airflow.models.dag import DAG, DagModel
 from airflow.models.dagcode import DagCode
 from airflow.models.dagrun import DagRun
+from airflow.serialization.compression import compress, decompress
+from airflow.serialization.json_backend import get_canonical_json_dumps, json_dumps
 from airflow.serialization.serialized_objects import DagDependency, SerializedDAG
-from airflow.settings import COMPRESS_SERIALIZED_DAGS, MIN_SERIALIZED_DAG_UPDATE_INTERVAL, json
+from airflow.settings import (
+    COMPRESS_SERIALIZED_DAGS,
+    MIN_SERIALIZED_DAG_UPDATE_INTERVAL,
+    SERIALIZED_DAG_CHUNK_MIN_TASKS,
+    SERIALIZED_DAG_JSON_BACKEND,
+    json,
+)
 from airflow.utils import timezone
 from airflow.utils.hashlib_wrapper import md5
-from airflow.utils.session import NEW_SESSION, provide_session
+from airflow.utils.session import NEW_SESSION, create_session, provide_session
 from airflow.utils.sqlalchemy import UtcDateTime
 
 log = logging.getLogger(__name__)
 
+# Number of reads of the tasks of a DAG stored in chunks while the DAG is written again concurrently
+MAX_TASK_CHUNKS_READ_ATTEMPTS = 5
+
 
 class SerializedDagModel(Base):
     """A table for serialized DAGs.
@@ -56,6 +67,9 @@ class SerializedDagModel(Base):
       to use a smaller interval such as 60
     * ``[core] compress_serialized_dags``:
       whether compressing the dag data to the Database.
+    * ``[core] serialized_dag_chunk_min_tasks``:
+      number of tasks from which the tasks of a DAG are stored in the
+      serialized_dag_task table, see :class:`SerializedDagTaskModel`.
 
     It is used by webserver to load dags
     because reading from database is lightweight compared to importing from files,
@@ -70,6 +84,8 @@ class SerializedDagModel(Base):
     fileloc_hash = Column(BigInteger(), nullable=False)
     _data = Column("data", sqlalchemy_jsonfield.JSONField(json=json), nullable=True)
     _data_compressed = Column("data_compressed", LargeBinary, nullable=True)
+    # The codec of data_compressed, see airflow.serialization.compression
+    compression = Column(String(250), nullable=True)
     last_updated = Column(UtcDateTime, nullable=False)
     dag_hash = Column(String(32), nullable=False)
     processor_subdir = Column(String(2000), nullable=True)
@@ -92,6 +108,9 @@ class SerializedDagModel(Base):
     )
 
     load_op_links = True
+    lazy_load_tasks = False
+    # The tasks stored separately, loaded on first access of the data of a DAG stored in chunks
+    _task_chunks: list[SerializedDagTaskModel] | None = None
 
     def __init__(self, dag: DAG, processor_subdir: str | None = None) -> None:
         self.dag_id = dag.dag_id
@@ -101,16 +120,39 @@ class SerializedDagModel(Base):
         self.processor_subdir = processor_subdir
 
         dag_data = SerializedDAG.to_dict(dag)
-        dag_data_json = json.dumps(dag_data, sort_keys=True).encode("utf-8")
-
-        self.dag_hash = md5(dag_data_json).hexdigest()
+        # The hashes are computed over the standard library encoding, so they do not depend on the JSON
+        # backend in use. The JSON backend only encodes the data which is compressed, the data stored
+        # uncompressed is encoded by its column.
+        tasks = dag_data["dag"].get("tasks", [])
+        if SERIALIZED_DAG_CHUNK_MIN_TASKS and len(tasks) >= SERIALIZED_DAG_CHUNK_MIN_TASKS:
+            self._task_chunks = [SerializedDagTaskModel(self.dag_id, task) for task in tasks]
+            # The tasks are replaced by their IDs, which keeps their order
+            stored_data = {
+                **dag_data,
+                "dag": {**dag_data["dag"], "tasks": [task["task_id"] for task in tasks]},
+            }
+            # The tasks are only encoded once, the hash of the DAG is the one of the rest of the DAG
+            # and of the hashes of its tasks
+            stored_data_json = json_dumps(stored_data)
+            dag_hash = md5(stored_data_json)
+            for chunk in self._task_chunks:
+                dag_hash.update(chunk.task_hash.encode("ascii"))
+        else:
+            stored_data = dag_data
+            stored_data_json = json_dumps(dag_data)
+            dag_hash = md5(stored_data_json)
+        self.dag_hash = dag_hash.hexdigest()
 
         if COMPRESS_SERIALIZED_DAGS:
+            dumps = get_canonical_json_dumps(SERIALIZED_DAG_JSON_BACKEND)
+            if dumps is not json_dumps:
+                stored_data_json = dumps(stored_data)
             self._data = None
-            self._data_compressed = zlib.compress(dag_data_json)
+            self._data_compressed, self.compression = compress(stored_data_json)
         else:
-            self._data = dag_data
+            self._data = stored_data
             self._data_compressed = None
+            self.compression = None
 
         # serve as cache so no need to decompress and load, when accessing data field
         # when COMPRESS_SERIALIZED_DAGS is True
@@ -168,9 +210,66 @@ class SerializedDagModel(Base):
 
         log.debug("Writing Serialized DAG: %s to the DB", dag.dag_id)
         session.merge(new_serialized_dag)
+        new_serialized_dag._write_task_chunks(session)
         log.debug("DAG: %s written to the DB", dag.dag_id)
         return True
 
+    def _write_task_chunks(self, session: Session) -> None:
+        """Write the tasks stored separately from the DAG, skipping the ones which did not change."""
+        if self._task_chunks is None:
+            if SERIALIZED_DAG_CHUNK_MIN_TASKS:
+                # The DAG may have been stored in chunks before it got fewer tasks
+                session.execute(
+                    delete(SerializedDagTaskModel).where(SerializedDagTaskModel.dag_id == self.dag_id)
+                )
+            return
+
+        stored_task_hashes = dict(
+            session.execute(
+                select(SerializedDagTaskModel.task_id, SerializedDagTaskModel.task_hash).where(
+                    SerializedDagTaskModel.dag_id == self.dag_id
+                )
+            ).all()
+        )
+        removed_task_ids = stored_task_hashes.keys() - {chunk.task_id for chunk in self._task_chunks}
+        if removed_task_ids:
+            session.execute(
+                delete(SerializedDagTaskModel).where(
+                    SerializedDagTaskModel.dag_id == self.dag_id,
+                    SerializedDagTaskModel.task_id.in_(removed_task_ids),
+                )
+            )
+        num_changed = 0
+        for chunk in self._task_chunks:
+            if chunk.task_id not in stored_task_hashes:
+                session.add(chunk)
+            elif stored_task_hashes[chunk.task_id] != chunk.task_hash:
+                session.execute(
+                    update(SerializedDagTaskModel)
+                    .where(
+                        SerializedDagTaskModel.dag_id == self.dag_id,
+                        SerializedDagTaskModel.task_id == chunk.task_id,
+                    )
+                    .values(
+                        {
+                            SerializedDagTaskModel._data: chunk._data,
+                            SerializedDagTaskModel._data_compressed: chunk._data_compressed,
+                            SerializedDagTaskModel.compression: chunk.compression,
+                            SerializedDagTaskModel.task_hash: chunk.task_hash,
+                        }
+                    )
+                )
+            else:
+                continue
+            num_changed += 1
+        log.debug(
+            "Wrote %d changed tasks of %d and removed %d tasks of DAG %s",
+            num_changed,
+            len(self._task_chunks),
+            len(removed_task_ids),
+            self.dag_id,
+        )
+
     @classmethod
     @provide_session
     def read_all_dags(cls, session: Session = NEW_SESSION) -> dict[str, SerializedDAG]:
@@ -201,24 +300,99 @@ class SerializedDagModel(Base):
     def data(self) -> dict | None:
         # use __data_cache to avoid decompress and loads
         if not hasattr(self, "__data_cache") or self.__data_cache is None:
-            if self._data_compressed:
-                self.__data_cache = json.loads(zlib.decompress(self._data_compressed))
-            else:
-                self.__data_cache = self._data
+            self.__data_cache = self._decode_data(self._data, self._data_compressed, self.compression)
+            if self._is_stored_in_chunks(self.__data_cache):
+                self.__data_cache = self._with_task_chunks(self.__data_cache)
 
         return self.__data_cache
 
+    @staticmethod
+    def _decode_data(data: Any, data_compressed: bytes | None, compression: str | None) -> Any:
+        if data_compressed:
+            return json.loads(decompress(data_compressed, compression))
+        return data
+
+    @staticmethod
+    def _is_stored_in_chunks(data: Any) -> bool:
+        if not isinstance(data, dict):
+            return False
+        tasks = data["dag"].get("tasks")
+        return bool(tasks) and isinstance(tasks[0], str)
+
+    def _with_task_chunks(self, data: dict) -> dict:
+        """Replace the task IDs of data stored in chunks by the serialized tasks."""
+        if self._task_chunks is None:
+            session = object_session(self)
+            if session is not None:
+                data = self._read_task_chunks(data, session)
+            else:
+                with create_session() as session:
+                    data = self._read_task_chunks(data, session)
+                    session.expunge_all()
+            if not self._is_stored_in_chunks(data):
+                return data
+        tasks = {chunk.task_id: chunk.data for chunk in self._task_chunks or ()}
+        try:
+            return {
+                **data,
+                "dag": {**data["dag"], "tasks": [tasks[task_id] for task_id in data["dag"]["tasks"]]},
+            }
+        except KeyError as e:
+            raise ValueError(f"missing serialized task {e} of DAG {self.dag_id}")
+
+    def _read_task_chunks(self, data: dict, session: Session) -> Any:
+        """
+        Read the tasks of the DAG stored in chunks, matching the version of the DAG in data.
+
+        The tasks are read with the hash of the DAG row in the same statement. When the DAG was written
+        again since its row was read, the row is read again, until both match.
+
+        :return: the data of the DAG row the tasks belong to
+        """
+        query = (
+            select(SerializedDagModel.dag_hash, SerializedDagTaskModel)
+            .select_from(SerializedDagModel)
+            .outerjoin(SerializedDagTaskModel, SerializedDagTaskModel.dag_id == SerializedDagModel.dag_id)
+            .where(SerializedDagModel.dag_id == self.dag_id)
+            .execution_options(populate_existing=True)
+        )
+        dag_hash = self.dag_hash
+        for _ in range(MAX_TASK_CHUNKS_READ_ATTEMPTS):
+            rows = session.execute(query).all()
+            if not rows:
+                raise ValueError(f"serialized DAG {self.dag_id} was removed")
+            if rows[0].dag_hash == dag_hash:
+                self._task_chunks = [chunk for _, chunk in rows if chunk is not None]
+                return data
+            log.debug("Serialized DAG %s was written again while reading its tasks", self.dag_id)
+            columns = (
+                SerializedDagModel._data,
+                SerializedDagModel._data_compressed,
+                SerializedDagModel.compression,
+                SerializedDagModel.dag_hash,
+            )
+            row = session.execute(select(*columns).where(SerializedDagModel.dag_id == self.dag_id)).first()
+            if row is None:
+                raise ValueError(f"serialized DAG {self.dag_id} was removed")
+            # The attributes are set as loaded, they are not written back by the session
+            for column, value in zip(columns, row):
+                set_committed_value(self, column.key, value)
+            stored_data, data_compressed, compression, dag_hash = row
+            data = self._decode_data(stored_data, data_compressed, compression)
+            if not self._is_stored_in_chunks(data):
+                return data
+        raise ValueError(f"serialized DAG {self.dag_id} kept changing while reading its tasks")
+
     @property
     def dag(self) -> SerializedDAG:
         """The DAG deserialized from the ``data`` column."""
         SerializedDAG._load_operator_extra_links = self.load_op_links
-        if isinstance(self.data, dict):
-            data = self.data
-        elif isinstance(self.data, str):
-            data = json.loads(self.data)
-        else:
+        data = self.data
+        if isinstance(data, str):
+            data = json.loads(data)
+        elif not isinstance(data, dict):
             raise ValueError("invalid or missing serialized DAG data")
-        return SerializedDAG.from_dict(data)
+        return SerializedDAG.from_dict(data, lazy_tasks=self.lazy_load_tasks)
 
     @classmethod
     @provide_session
@@ -230,6 +404,7 @@ class SerializedDagModel(Base):
         :param session: ORM Session.
         """
         session.execute(cls.__table__.delete().where(cls.dag_id == dag_id))
+        session.execute(delete(SerializedDagTaskModel).where(SerializedDagTaskModel.dag_id == dag_id))
 
     @classmethod
     @provide_session
@@ -263,6 +438,11 @@ class SerializedDagModel(Base):
                 )
             )
         )
+        session.execute(
+            delete(SerializedDagTaskModel)
+            .where(SerializedDagTaskModel.dag_id.notin_(select(cls.dag_id)))
+            .execution_options(synchronize_session=False)
+        )
 
     @classmethod
     @provide_session
@@ -313,20 +493,99 @@ class SerializedDagModel(Base):
         """
         Save DAGs as Serialized DAG objects in the database.
 
-        Each DAG is saved in a separate database query.
+        The DAGs are saved in a few queries whatever their number, see :meth:`write_serialized_dags`.
 
         :param dags: the DAG objects to save to the DB
         :param session: ORM Session
         :return: None
         """
-        for dag in dags:
-            if not dag.is_subdag:
-                SerializedDagModel.write_dag(
-                    dag=dag,
-                    min_update_interval=MIN_SERIALIZED_DAG_UPDATE_INTERVAL,
-                    processor_subdir=processor_subdir,
-                    session=session,
+        SerializedDagModel.write_serialized_dags(
+            [SerializedDagModel(dag, processor_subdir) for dag in dags if not dag.is_subdag],
+            min_update_interval=MIN_SERIALIZED_DAG_UPDATE_INTERVAL,
+            session=session,
+        )
+
+    @classmethod
+    @provide_session
+    def write_serialized_dags(
+        cls,
+        serialized_dags: Collection[SerializedDagModel],
+        min_update_interval: int | None = None,
+        session: Session = NEW_SESSION,
+    ) -> list[str]:
+        """
+        Write the serialized DAGs which changed into database.
+
+        Unlike :meth:`write_dag` called for each DAG, the stored hashes of all the DAGs are fetched in
+        a single query and the changed DAGs are written in a single upsert where the database supports
+        it, whatever the number of DAGs.
+
+        :param serialized_dags: the serialized DAGs to write
+        :param min_update_interval: minimal interval in seconds to update serialized DAG
+        :param session: ORM Session
+        :return: the IDs of the DAGs written to the DB
+        """
+        if not serialized_dags:
+            return []
+        stored = {
+            row.dag_id: row
+            for row in session.execute(
+                select(cls.dag_id, cls.dag_hash, cls.processor_subdir, cls.last_updated).where(
+                    cls.dag_id.in_([serialized_dag.dag_id for serialized_dag in serialized_dags])
                 )
+            )
+        }
+        if min_update_interval is not None:
+            min_last_updated = timezone.utcnow() - timedelta(seconds=min_update_interval)
+        changed = []
+        for serialized_dag in serialized_dags:
+            stored_row = stored.get(serialized_dag.dag_id)
+            if stored_row is not None:
+                if min_update_interval is not None and min_last_updated < stored_row.last_updated:
+                    continue
+                if (
+                    stored_row.dag_hash == serialized_dag.dag_hash
+                    and stored_row.processor_subdir == serialized_dag.processor_subdir
+                ):
+                    continue
+            changed.append(serialized_dag)
+        log.debug("Writing %d changed Serialized DAGs of %d to the DB", len(changed), len(serialized_dags))
+        if changed:
+            cls._upsert(changed, session=session)
+            for serialized_dag in changed:
+                serialized_dag._write_task_chunks(session)
+        return [serialized_dag.dag_id for serialized_dag in changed]
+
+    @classmethod
+    def _upsert(cls, serialized_dags: list[SerializedDagModel], *, session: Session) -> None:
+        """Insert or update serialized DAGs, with one statement on the databases supporting it."""
+        dialect_name = session.bind.dialect.name
+        if dialect_name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect_name == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        elif dialect_name == "mysql":
+            from sqlalchemy.dialects.mysql import insert
+        else:
+            for serialized_dag in serialized_dags:
+                session.merge(serialized_dag)
+            return
+
+        # The keys are column names, which differ from the attribute names of the data columns
+        rows = [
+            {attr.columns[0].name: getattr(serialized_dag, attr.key) for attr in cls.__mapper__.column_attrs}
+            for serialized_dag in serialized_dags
+        ]
+        updated_columns = [name for name in rows[0] if name != "dag_id"]
+        stmt = insert(cls.__table__)
+        if dialect_name == "mysql":
+            stmt = stmt.on_duplicate_key_update({name: stmt.inserted[name] for name in updated_columns})
+        else:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[cls.__table__.c.dag_id],
+                set_={name: stmt.excluded[name] for name in updated_columns},
+            )
+        session.execute(stmt, rows)
 
     @classmethod
     @provide_session
@@ -380,6 +639,26 @@ class SerializedDagModel(Base):
             select(cls.dag_hash, cls.last_updated).where(cls.dag_id == dag_id)
         ).one_or_none()
 
+    @classmethod
+    def get_latest_version_hashes_and_updated_datetimes(
+        cls,
+        dag_ids: Collection[str],
+        *,
+        session: Session,
+    ) -> dict[str, tuple[str, datetime]]:
+        """
+        Get the latest versions of DAGs and the dates they were last updated, in a single query.
+
+        :meta private:
+        :param dag_ids: DAG IDs
+        :param session: ORM Session
+        :return: A dict of DAG Hash and last updated datetime by DAG ID, without the DAGs not found
+        """
+        if not dag_ids:
+            return {}
+        query = select(cls.dag_id, cls.dag_hash, cls.last_updated).where(cls.dag_id.in_(dag_ids))
+        return {dag_id: (dag_hash, last_updated) for dag_id, dag_hash, last_updated in session.execute(query)}
+
     @classmethod
     @provide_session
     def get_dag_dependencies(cls, session: Session = NEW_SESSION) -> dict[str, list[DagDependency]]:
@@ -401,3 +680,48 @@ class SerializedDagModel(Base):
                 select(cls.dag_id, func.json_extract_path(cls._data, "dag", "dag_dependencies"))
             )
         return {dag_id: [DagDependency(**d) for d in (deps_data or [])] for dag_id, deps_data in iterator}
+
+
+class SerializedDagTaskModel(Base):
+    """
+    A serialized task of a DAG with many tasks, stored separately from the rest of the DAG.
+
+    When a DAG has at least ``[core] serialized_dag_chunk_min_tasks`` tasks, the serialized_dag
+    table only stores the IDs of its tasks and each task is stored in a row of this table, along with
+    the hash of its content. Writing a new version of the DAG then only writes the tasks which
+    changed.
+    """
+
+    __tablename__ = "serialized_dag_task"
+
+    dag_id = Column(String(ID_LEN, **COLLATION_ARGS), primary_key=True)
+    task_id = Column(String(ID_LEN, **COLLATION_ARGS), primary_key=True)
+    _data = Column("data", sqlalchemy_jsonfield.JSONField(json=json), nullable=True)
+    _data_compressed = Column("data_compressed", LargeBinary, nullable=True)
+    compression = Column(String(250), nullable=True)
+    task_hash = Column(String(32), nullable=False)
+
+    def __init__(self, dag_id: str, task_data: dict[str, Any]) -> None:
+        self.dag_id = dag_id
+        self.task_id = task_data["task_id"]
+        task_data_json = json_dumps(task_data)
+        self.task_hash = md5(task_data_json).hexdigest()
+        if COMPRESS_SERIALIZED_DAGS:
+            dumps = get_canonical_json_dumps(SERIALIZED_DAG_JSON_BACKEND)
+            if dumps is not json_dumps:
+                task_data_json = dumps(task_data)
+            self._data = None
+            self._data_compressed, self.compression = compress(task_data_json)
+        else:
+            self._data = task_data
+            self._data_compressed = None
+            self.compression = None
+
+    def __repr__(self) -> str:
+        return f"<SerializedDagTask: {self.dag_id}.{self.task_id}>"
+
+    @property
+    def data(self) -> dict[str, Any]:
+        if self._data_compressed:
+            return json.loads(decompress(self._data_compressed, self.compression))
+        return self._data
@@ -345,6 +345,10 @@ def clear_task_instances(
                 if dag_run_state == DagRunState.QUEUED:
                     dr.last_scheduling_decision = None
                     dr.start_date = None
+    elif tis:
+        from airflow.models.dagrun import DagRun  # Avoid circular import
+
+        DagRun.touch_finished({(ti.dag_id, ti.run_id) for ti in tis}, session=session)
     session.flush()
 
 
@@ -17,6 +17,8 @@
 from __future__ import annotations
 
 import datetime
+import math
+from collections import defaultdict
 from traceback import format_exception
 from typing import Any, Iterable
 
@@ -27,9 +29,10 @@ from sqlalchemy.sql.functions import coalesce
 from airflow.api_internal.internal_api_call import internal_api_call
 from airflow.models.base import Base
 from airflow.models.taskinstance import TaskInstance
-from airflow.triggers.base import BaseTrigger
+from airflow.triggers.base import BaseTrigger, TriggerEvent
 from airflow.utils import timezone
 from airflow.utils.retries import run_with_db_retries
+from airflow.utils.scheduler_wakeup import notify_scheduler
 from airflow.utils.session import NEW_SESSION, provide_session
 from airflow.utils.sqlalchemy import ExtendedJSON, UtcDateTime, with_row_locks
 from airflow.utils.state import TaskInstanceState
@@ -143,19 +146,37 @@ class Trigger(Base):
     @provide_session
     def submit_event(cls, trigger_id, event, session: Session = NEW_SESSION) -> None:
         """Take an event from an instance of itself, and trigger all dependent tasks to resume."""
-        for task_instance in session.scalars(
-            select(TaskInstance).where(
-                TaskInstance.trigger_id == trigger_id, TaskInstance.state == TaskInstanceState.DEFERRED
-            )
-        ):
-            # Add the event's payload into the kwargs for the task
-            next_kwargs = task_instance.next_kwargs or {}
-            next_kwargs["event"] = event.payload
-            task_instance.next_kwargs = next_kwargs
-            # Remove ourselves as its trigger
-            task_instance.trigger_id = None
-            # Finally, mark it as scheduled so it gets re-queued
-            task_instance.state = TaskInstanceState.SCHEDULED
+        cls.submit_events([(trigger_id, event)], session=session)
+
+    @classmethod
+    @internal_api_call
+    @provide_session
+    def submit_events(
+        cls, events: Iterable[tuple[int, TriggerEvent]], session: Session = NEW_SESSION
+    ) -> None:
+        """
+        Take events from triggers, and trigger all dependent tasks to resume.
+
+        The task instances of all the triggers are fetched in a single query and updated in the same
+        transaction. Only the first event of a trigger resumes its tasks, as in :meth:`submit_event`.
+
+        :param events: pairs of trigger ID and event, in the order the events were fired
+        """
+        events = list(events)
+        if not events:
+            return
+        task_instances = cls._deferred_task_instances({trigger_id for trigger_id, _ in events}, session)
+        for trigger_id, event in events:
+            for task_instance in task_instances.pop(trigger_id, ()):
+                # Add the event's payload into the kwargs for the task
+                next_kwargs = task_instance.next_kwargs or {}
+                next_kwargs["event"] = event.payload
+                task_instance.next_kwargs = next_kwargs
+                # Remove ourselves as its trigger
+                task_instance.trigger_id = None
+                # Finally, mark it as scheduled so it gets re-queued
+                task_instance.state = TaskInstanceState.SCHEDULED
+        notify_scheduler(session=session)
 
     @classmethod
     @internal_api_call
@@ -176,19 +197,49 @@ class Trigger(Base):
         workers as first-class concepts, we can run the failure code here
         in-process, but we can't do that right now.
         """
+        cls.submit_failures([(trigger_id, exc)], session=session)
+
+    @classmethod
+    @internal_api_call
+    @provide_session
+    def submit_failures(
+        cls, failures: Iterable[tuple[int, BaseException | None]], session: Session = NEW_SESSION
+    ) -> None:
+        """
+        Mark everything that depended on failed triggers as failed, see :meth:`submit_failure`.
+
+        The task instances of all the triggers are fetched in a single query and updated in the same
+        transaction.
+
+        :param failures: pairs of trigger ID and the exception the trigger failed with, if any
+        """
+        failures = list(failures)
+        if not failures:
+            return
+        task_instances = cls._deferred_task_instances({trigger_id for trigger_id, _ in failures}, session)
+        for trigger_id, exc in failures:
+            traceback = format_exception(type(exc), exc, exc.__traceback__) if exc else None
+            for task_instance in task_instances.pop(trigger_id, ()):
+                # Add the error and set the next_method to the fail state
+                task_instance.next_method = "__fail__"
+                task_instance.next_kwargs = {"error": "Trigger failure", "traceback": traceback}
+                # Remove ourselves as its trigger
+                task_instance.trigger_id = None
+                # Finally, mark it as scheduled so it gets re-queued
+                task_instance.state = TaskInstanceState.SCHEDULED
+        notify_scheduler(session=session)
+
+    @staticmethod
+    def _deferred_task_instances(trigger_ids: set[int], session: Session) -> dict[int, list[TaskInstance]]:
+        """Fetch the task instances deferred on the given triggers, grouped by trigger ID."""
+        task_instances: dict[int, list[TaskInstance]] = defaultdict(list)
         for task_instance in session.scalars(
             select(TaskInstance).where(
-                TaskInstance.trigger_id == trigger_id, TaskInstance.state == TaskInstanceState.DEFERRED
+                TaskInstance.trigger_id.in_(trigger_ids), TaskInstance.state == TaskInstanceState.DEFERRED
             )
         ):
-            # Add the error and set the next_method to the fail state
-            traceback = format_exception(type(exc), exc, exc.__traceback__) if exc else None
-            task_instance.next_method = "__fail__"
-            task_instance.next_kwargs = {"error": "Trigger failure", "traceback": traceback}
-            # Remove ourselves as its trigger
-            task_instance.trigger_id = None
-            # Finally, mark it as scheduled so it gets re-queued
-            task_instance.state = TaskInstanceState.SCHEDULED
+            task_instances[task_instance.trigger_id].append(task_instance)
+        return task_instances
 
     @classmethod
     @internal_api_call
@@ -201,7 +252,12 @@ class Trigger(Base):
     @internal_api_call
     @provide_session
     def assign_unassigned(
-        cls, triggerer_id, capacity, health_check_threshold, session: Session = NEW_SESSION
+        cls,
+        triggerer_id,
+        capacity,
+        health_check_threshold,
+        max_load: float = 0.8,
+        session: Session = NEW_SESSION,
     ) -> None:
         """
         Assign unassigned triggers based on a number of conditions.
@@ -209,22 +265,22 @@ class Trigger(Base):
         Takes a triggerer_id, the capacity for that triggerer and the Triggerer job heartrate
         health check threshold, and assigns unassigned triggers until that capacity is reached,
         or there are no more unassigned triggers.
-        """
-        from airflow.jobs.job import Job  # To avoid circular import
 
+        Once the triggerer reports its load, it also stops short of going over ``max_load``,
+        estimating the cost of a trigger from the load of the triggers it runs, unless no other
+        triggerer is below ``max_load`` to take them.
+        """
         count = session.scalar(select(func.count(cls.id)).filter(cls.triggerer_id == triggerer_id))
         capacity -= count
 
         if capacity <= 0:
             return
 
-        alive_triggerer_ids = session.scalars(
-            select(Job.id).where(
-                Job.end_date.is_(None),
-                Job.latest_heartbeat > timezone.utcnow() - datetime.timedelta(seconds=health_check_threshold),
-                Job.job_type == "TriggererJob",
-            )
-        ).all()
+        triggerer_loads = cls._get_alive_triggerer_loads(health_check_threshold, session=session)
+        capacity = cls._capacity_under_load(triggerer_id, capacity, count, max_load, triggerer_loads)
+        if capacity <= 0:
+            return
+        alive_triggerer_ids = list(triggerer_loads)
 
         # Find triggers who do NOT have an alive triggerer_id, and then assign
         # up to `capacity` of those to us.
@@ -241,6 +297,92 @@ class Trigger(Base):
 
         session.commit()
 
+    @classmethod
+    @internal_api_call
+    @provide_session
+    def release_excess_triggers(
+        cls, triggerer_id, health_check_threshold, max_load: float, session: Session = NEW_SESSION
+    ) -> int:
+        """
+        Unassign triggers from a triggerer at ``max_load``, for less busy triggerers to take them.
+
+        The cost of a trigger is estimated from the load of the triggers the triggerer runs, and only as
+        many triggers as needed to go back under ``max_load`` are released, at least one, as long as the
+        other triggerers have room for them. The triggers of the lowest priority are released first.
+
+        :return: the number of triggers released
+        """
+        triggerer_loads = cls._get_alive_triggerer_loads(health_check_threshold, session=session)
+        load = triggerer_loads.get(triggerer_id)
+        if load is None or load < max_load:
+            return 0
+        count = session.scalar(select(func.count(cls.id)).where(cls.triggerer_id == triggerer_id))
+        if not count:
+            return 0
+        cost = load / count
+        # Triggerers which did not report their load yet are considered idle
+        room = sum(
+            (max_load - (other_load or 0.0)) / cost
+            for other_id, other_load in triggerer_loads.items()
+            if other_id != triggerer_id and (other_load or 0.0) < max_load
+        )
+        # Keep at least half of the triggers, in case the load moves with them
+        num_triggers = min(max(math.ceil((load - max_load) / cost), 1), int(room), count // 2)
+        if num_triggers <= 0:
+            return 0
+        trigger_ids = session.scalars(
+            select(cls.id)
+            .join(TaskInstance, cls.id == TaskInstance.trigger_id, isouter=False)
+            .where(cls.triggerer_id == triggerer_id)
+            .order_by(coalesce(TaskInstance.priority_weight, 0), cls.created_date.desc())
+            .limit(num_triggers)
+        ).all()
+        if trigger_ids:
+            session.execute(
+                update(cls)
+                .where(cls.id.in_(trigger_ids), cls.triggerer_id == triggerer_id)
+                .values(triggerer_id=None)
+                .execution_options(synchronize_session=False)
+            )
+        session.commit()
+        return len(trigger_ids)
+
+    @classmethod
+    def _get_alive_triggerer_loads(cls, health_check_threshold, session: Session) -> dict[int, float | None]:
+        """Return the load reported by each alive triggerer, None if it did not report it yet."""
+        from airflow.jobs.job import Job  # To avoid circular import
+
+        return {
+            job_id: load
+            for job_id, load in session.execute(
+                select(Job.id, Job.load).where(
+                    Job.end_date.is_(None),
+                    Job.latest_heartbeat
+                    > timezone.utcnow() - datetime.timedelta(seconds=health_check_threshold),
+                    Job.job_type == "TriggererJob",
+                )
+            )
+        }
+
+    @staticmethod
+    def _capacity_under_load(
+        triggerer_id, capacity: int, count: int, max_load: float, triggerer_loads: dict[int, float | None]
+    ) -> int:
+        """Limit the number of triggers to assign to a triggerer to the ones keeping it under max_load."""
+        load = triggerer_loads.get(triggerer_id)
+        if not load or not count:
+            # Nothing measured yet
+            return capacity
+        if not any(
+            other_load is None or other_load < max_load
+            for other_id, other_load in triggerer_loads.items()
+            if other_id != triggerer_id
+        ):
+            # No other triggerer to take the triggers
+            return capacity
+        cost = load / count
+        return min(capacity, int((max_load - load) / cost))
+
     @classmethod
     def get_sorted_triggers(cls, capacity, alive_triggerer_ids, session):
         query = with_row_locks(
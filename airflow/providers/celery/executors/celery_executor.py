@@ -26,10 +26,13 @@ from __future__ import annotations
 import argparse
 import logging
 import math
+import multiprocessing
 import operator
 import time
+import traceback
 from collections import Counter
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from multiprocessing import cpu_count
 from typing import TYPE_CHECKING, Any, Optional, Sequence, Tuple
 
@@ -86,9 +89,10 @@ CELERY_SEND_ERR_MSG_HEADER = "Error sending Celery task"
 if TYPE_CHECKING:
     from celery import Task
 
-    from airflow.executors.base_executor import CommandType, TaskTuple
+    from airflow.executors.base_executor import CommandType, QueuedTaskInstanceType, TaskTuple
     from airflow.models.taskinstance import TaskInstance
     from airflow.models.taskinstancekey import TaskInstanceKey
+    from airflow.providers.celery.executors.celery_executor_utils import TaskEventReceiver
 
     # Task instance that is sent over Celery queues
     # TaskInstanceKey, Command, queue_name, CallableTask
@@ -256,8 +260,36 @@ class CeleryExecutor(BaseExecutor):
         self.task_publish_retries: Counter[TaskInstanceKey] = Counter()
         self.task_publish_max_retries = conf.getint("celery", "task_publish_max_retries")
 
+        # With task events, the states of the tasks are updated from the events of the Celery workers, and
+        # only reconciled periodically with the states in the result backend.
+        self.sync_state_with_events = conf.getboolean("celery", "sync_state_with_events", fallback=False)
+        self.state_reconciliation_interval = conf.getfloat(
+            "celery", "state_reconciliation_interval", fallback=60
+        )
+        self.task_event_receiver: TaskEventReceiver | None = None
+        self._last_state_reconciliation = 0.0
+        # Events of tasks not in self.tasks yet, or not sent by this executor: celery task ID ->
+        # (time received, state, info)
+        self._unmatched_task_events: dict[str, tuple[float, str, Any]] = {}
+
+        # Sending tasks in the background, from processes kept for the lifetime of the executor
+        self.task_publish_max_in_flight = conf.getint("celery", "task_publish_max_in_flight", fallback=0)
+        self._send_pool: ProcessPoolExecutor | None = None
+        self._send_futures: dict[Future, list[TaskInstanceKey]] = {}
+        self._tasks_being_sent: set[TaskInstanceKey] = set()
+
     def start(self) -> None:
         self.log.debug("Starting Celery Executor using %s processes for syncing", self._sync_parallelism)
+        if self.task_publish_max_in_flight:
+            # All the processes are forked on the first submission, before the executor starts any thread
+            self._get_send_pool().submit(int).result()
+        self.bulk_state_fetcher.start()
+        if self.sync_state_with_events:
+            from airflow.providers.celery.executors.celery_executor_utils import TaskEventReceiver
+
+            self.task_event_receiver = TaskEventReceiver()
+            self.task_event_receiver.start()
+            self._last_state_reconciliation = time.monotonic()
 
     def _num_tasks_per_send_process(self, to_send_count: int) -> int:
         """
@@ -271,15 +303,24 @@ class CeleryExecutor(BaseExecutor):
         from airflow.providers.celery.executors.celery_executor_utils import execute_command
 
         task_tuples_to_send = [task_tuple[:3] + (execute_command,) for task_tuple in task_tuples]
-        first_task = next(t[3] for t in task_tuples_to_send)
 
-        # Celery state queries will stuck if we do not use one same backend
-        # for all tasks.
-        cached_celery_backend = first_task.backend
+        if self.task_publish_max_in_flight:
+            self._send_tasks_to_celery_in_background(task_tuples_to_send)
+            return
 
         key_and_async_results = self._send_tasks_to_celery(task_tuples_to_send)
         self.log.debug("Sent all tasks.")
-        from airflow.providers.celery.executors.celery_executor_utils import ExceptionWithTraceback
+        self._process_sent_tasks(key_and_async_results)
+
+    def _process_sent_tasks(self, key_and_async_results) -> None:
+        from airflow.providers.celery.executors.celery_executor_utils import (
+            ExceptionWithTraceback,
+            execute_command,
+        )
+
+        # Celery state queries will stuck if we do not use one same backend
+        # for all tasks.
+        cached_celery_backend = execute_command.backend
 
         for key, _, result in key_and_async_results:
             if isinstance(result, ExceptionWithTraceback) and isinstance(
@@ -311,8 +352,10 @@ class CeleryExecutor(BaseExecutor):
                 # which point we don't need the ID anymore anyway
                 self.event_buffer[key] = (TaskInstanceState.QUEUED, result.task_id)
 
-                # If the task runs _really quickly_ we may already have a result!
-                self.update_task_state(key, result.state, getattr(result, "info", None))
+                # If the task runs _really quickly_ we may already have a result! With task events,
+                # its events are matched on the next sync instead.
+                if not self.task_event_receiver:
+                    self.update_task_state(key, result.state, getattr(result, "info", None))
 
     def _send_tasks_to_celery(self, task_tuples_to_send: list[TaskInstanceInCelery]):
         from airflow.providers.celery.executors.celery_executor_utils import send_task_to_executor
@@ -332,12 +375,122 @@ class CeleryExecutor(BaseExecutor):
             )
         return key_and_async_results
 
+    def _send_tasks_to_celery_in_background(self, task_tuples_to_send: list[TaskInstanceInCelery]) -> None:
+        """
+        Send tasks to Celery in the processes of the send pool, without waiting for them to be sent.
+
+        The tasks stay queued until they are sent, and up to ``[celery] task_publish_max_in_flight`` tasks
+        are sent at once: the others stay queued, to be sent by a later heartbeat.
+        """
+        from airflow.providers.celery.executors.celery_executor_utils import send_tasks_to_executor
+
+        num_tasks_to_send = min(
+            len(task_tuples_to_send), self.task_publish_max_in_flight - len(self._tasks_being_sent)
+        )
+        if num_tasks_to_send < len(task_tuples_to_send):
+            self.log.debug(
+                "%d tasks are being sent to Celery already, keeping %d tasks queued",
+                len(self._tasks_being_sent),
+                len(task_tuples_to_send) - max(num_tasks_to_send, 0),
+            )
+        if num_tasks_to_send <= 0:
+            return
+
+        chunksize = self._num_tasks_per_send_process(num_tasks_to_send)
+        for start in range(0, num_tasks_to_send, chunksize):
+            chunk = task_tuples_to_send[start : min(start + chunksize, num_tasks_to_send)]
+            future = self._get_send_pool().submit(send_tasks_to_executor, chunk)
+            self._send_futures[future] = [task_tuple[0] for task_tuple in chunk]
+            self._tasks_being_sent.update(self._send_futures[future])
+
+    def _process_tasks_sent_in_background(self, wait: bool = False) -> None:
+        """
+        Process the results of the tasks sent in the background.
+
+        :param wait: whether to wait for all the tasks being sent, rather than only process those sent
+        """
+        from airflow.providers.celery.executors.celery_executor_utils import ExceptionWithTraceback
+
+        if wait:
+            futures = list(self._send_futures)
+        else:
+            futures = [future for future in self._send_futures if future.done()]
+        broken_pool = False
+        for future in futures:
+            keys = self._send_futures.pop(future)
+            self._tasks_being_sent.difference_update(keys)
+            try:
+                key_and_async_results = future.result()
+            except Exception as e:
+                broken_pool = broken_pool or isinstance(e, BrokenProcessPool)
+                exception_traceback = traceback.format_exc()
+                key_and_async_results = [
+                    (key, None, ExceptionWithTraceback(e, exception_traceback)) for key in keys
+                ]
+            self._process_sent_tasks(key_and_async_results)
+        if broken_pool:
+            # A process sending tasks died and all the pending tasks of the pool failed with it, the next
+            # tasks are sent by new processes
+            self._shutdown_send_pool()
+
+    def _get_send_pool(self) -> ProcessPoolExecutor:
+        """Get the pool sending tasks in the background, creating it on first use or after it broke."""
+        if self._send_pool is None:
+            mp_context = None
+            if self.task_event_receiver is not None:
+                # Forking is unsafe once the receiver thread runs, start the processes from scratch instead
+                mp_context = multiprocessing.get_context("spawn")
+            self._send_pool = ProcessPoolExecutor(max_workers=self._sync_parallelism, mp_context=mp_context)
+        return self._send_pool
+
+    def _shutdown_send_pool(self) -> None:
+        if self._send_pool is None:
+            return
+        # Tasks not being sent yet are dropped, shutdown(cancel_futures=True) is not available on Python 3.8
+        for future in self._send_futures:
+            future.cancel()
+        self._send_pool.shutdown(wait=True)
+        self._send_pool = None
+
+    def order_queued_tasks_by_priority(self) -> list[tuple[TaskInstanceKey, QueuedTaskInstanceType]]:
+        # Tasks being sent in the background stay queued until they are sent, but are not sent again
+        return [
+            (key, queued_task)
+            for key, queued_task in super().order_queued_tasks_by_priority()
+            if key not in self._tasks_being_sent
+        ]
+
     def sync(self) -> None:
+        if self._send_futures:
+            self._process_tasks_sent_in_background()
+        if self.task_event_receiver:
+            self.update_task_states_from_events()
+            if time.monotonic() - self._last_state_reconciliation < self.state_reconciliation_interval:
+                return
+            self._last_state_reconciliation = time.monotonic()
         if not self.tasks:
             self.log.debug("No task to query celery, skipping sync")
             return
         self.update_all_task_states()
 
+    def update_task_states_from_events(self) -> None:
+        """Updates states of the tasks from the Celery task events received since the last sync."""
+        now = time.monotonic()
+        for celery_task_id, state, info in self.task_event_receiver.get_events():
+            self._unmatched_task_events[celery_task_id] = (now, state, info)
+        if not self._unmatched_task_events:
+            return
+
+        keys_by_celery_task_id = {result.task_id: key for key, result in self.tasks.items()}
+        for celery_task_id, (received_at, state, info) in list(self._unmatched_task_events.items()):
+            key = keys_by_celery_task_id.get(celery_task_id)
+            if key is not None:
+                del self._unmatched_task_events[celery_task_id]
+                self.update_task_state(key, state, info)
+            elif now - received_at > self.state_reconciliation_interval:
+                # Most likely a task of another scheduler
+                del self._unmatched_task_events[celery_task_id]
+
     def debug_dump(self) -> None:
         """Called in response to SIGUSR2 by the scheduler."""
         super().debug_dump()
@@ -380,10 +533,19 @@ class CeleryExecutor(BaseExecutor):
         if synchronous:
             while any(task.state not in celery_states.READY_STATES for task in self.tasks.values()):
                 time.sleep(5)
+        self._process_tasks_sent_in_background(wait=True)
         self.sync()
+        self._stop_syncing()
 
     def terminate(self):
-        pass
+        self._stop_syncing()
+
+    def _stop_syncing(self) -> None:
+        self._shutdown_send_pool()
+        if self.task_event_receiver:
+            self.task_event_receiver.stop()
+            self.task_event_receiver = None
+        self.bulk_state_fetcher.close()
 
     def try_adopt_task_instances(self, tis: Sequence[TaskInstance]) -> Sequence[TaskInstance]:
         # See which of the TIs are still alive (or have finished even!)
@@ -25,10 +25,13 @@ from __future__ import annotations
 import logging
 import math
 import os
+import queue
 import subprocess
+import threading
 import traceback
 import warnings
 from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import TYPE_CHECKING, Any, Mapping, MutableMapping, Optional, Tuple
 
 from celery import Celery, Task, states as celery_states
@@ -205,6 +208,13 @@ def send_task_to_executor(
     return key, command, result
 
 
+def send_tasks_to_executor(
+    task_tuples: list[TaskInstanceInCelery],
+) -> list[tuple[TaskInstanceKey, CommandType, AsyncResult | ExceptionWithTraceback]]:
+    """Sends tasks to executor, in the processes sending them in the background."""
+    return [send_task_to_executor(task_tuple) for task_tuple in task_tuples]
+
+
 def fetch_celery_task_state(async_result: AsyncResult) -> tuple[str, str | ExceptionWithTraceback, Any]:
     """
     Fetch and return the state of the given celery task.
@@ -234,11 +244,36 @@ class BulkStateFetcher(LoggingMixin):
     If BaseKeyValueStoreBackend is used as result backend, the mget method is used.
     If DatabaseBackend is used as result backend, the SELECT ...WHERE task_id IN (...) query is used
     Otherwise, multiprocessing.Pool will be used. Each task status will be downloaded individually.
+    The processes of the pool are started once and reused by all the fetches, until :meth:`close`.
     """
 
     def __init__(self, sync_parallelism=None):
         super().__init__()
         self._sync_parallelism = sync_parallelism
+        self._sync_pool: ProcessPoolExecutor | None = None
+
+    def start(self) -> None:
+        """
+        Start the processes fetching the states of the tasks, if the result backend needs them.
+
+        The processes are forked, which is only safe before the executor starts threads of its own:
+        otherwise they are started on the first fetch.
+        """
+        if not isinstance(app.backend, (BaseKeyValueStoreBackend, DatabaseBackend)):
+            # All the processes are forked on the first submission
+            self._get_sync_pool().submit(int).result()
+
+    def close(self) -> None:
+        """Stop the processes fetching the states of the tasks."""
+        if self._sync_pool is not None:
+            # The fetches wait for their results, so there are no pending futures to cancel
+            self._sync_pool.shutdown(wait=True)
+            self._sync_pool = None
+
+    def _get_sync_pool(self) -> ProcessPoolExecutor:
+        if self._sync_pool is None:
+            self._sync_pool = ProcessPoolExecutor(max_workers=self._sync_parallelism)
+        return self._sync_pool
 
     def _tasks_list_to_task_ids(self, async_tasks) -> set[str]:
         return {a.task_id for a in async_tasks}
@@ -295,23 +330,89 @@ class BulkStateFetcher(LoggingMixin):
         return state_info
 
     def _get_many_using_multiprocessing(self, async_results) -> Mapping[str, EventBufferValueType]:
-        num_process = min(len(async_results), self._sync_parallelism)
-
-        with ProcessPoolExecutor(max_workers=num_process) as sync_pool:
-            chunksize = max(1, math.ceil(len(async_results) / self._sync_parallelism))
-
+        chunksize = max(1, math.ceil(len(async_results) / self._sync_parallelism))
+        try:
             task_id_to_states_and_info = list(
-                sync_pool.map(fetch_celery_task_state, async_results, chunksize=chunksize)
+                self._get_sync_pool().map(fetch_celery_task_state, async_results, chunksize=chunksize)
             )
+        except BrokenProcessPool:
+            # A process of the pool died, start new ones on the next fetch
+            self.close()
+            raise
 
-            states_and_info_by_task_id: MutableMapping[str, EventBufferValueType] = {}
-            for task_id, state_or_exception, info in task_id_to_states_and_info:
-                if isinstance(state_or_exception, ExceptionWithTraceback):
-                    self.log.error(
-                        CELERY_FETCH_ERR_MSG_HEADER + ":%s\n%s\n",
-                        state_or_exception.exception,
-                        state_or_exception.traceback,
-                    )
-                else:
-                    states_and_info_by_task_id[task_id] = state_or_exception, info
+        states_and_info_by_task_id: MutableMapping[str, EventBufferValueType] = {}
+        for task_id, state_or_exception, info in task_id_to_states_and_info:
+            if isinstance(state_or_exception, ExceptionWithTraceback):
+                self.log.error(
+                    CELERY_FETCH_ERR_MSG_HEADER + ":%s\n%s\n",
+                    state_or_exception.exception,
+                    state_or_exception.traceback,
+                )
+            else:
+                states_and_info_by_task_id[task_id] = state_or_exception, info
         return states_and_info_by_task_id
+
+
+# The states of the Celery tasks reported by their events
+TASK_EVENT_STATES = {
+    "task-started": celery_states.STARTED,
+    "task-succeeded": celery_states.SUCCESS,
+    "task-failed": celery_states.FAILURE,
+    "task-revoked": celery_states.REVOKED,
+}
+
+
+class TaskEventReceiver(LoggingMixin):
+    """
+    Receives the events of the Celery tasks in a thread, following their states without polling them.
+
+    The Celery workers only send task events when ``worker_send_task_events`` is enabled in the Celery
+    configuration, as done by ``[celery] sync_state_with_events``. The events are sent to all the
+    receivers, so each receiver also gets the events of the tasks sent by other schedulers.
+
+    :param reconnect_interval: seconds to wait before reconnecting to the broker after an error
+    """
+
+    def __init__(self, reconnect_interval: float = 5):
+        super().__init__()
+        self.reconnect_interval = reconnect_interval
+        self._events: queue.SimpleQueue[tuple[str, str, Any]] = queue.SimpleQueue()
+        self._receiver = None
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="celery-task-event-receiver", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._receiver is not None:
+            self._receiver.should_stop = True
+        # The receiver checks whether it should stop every second while waiting for events
+        self._thread.join(timeout=5)
+
+    def get_events(self) -> list[tuple[str, str, Any]]:
+        """Return the Celery task ID, state and info of the task events received since the last call."""
+        events = []
+        while True:
+            try:
+                events.append(self._events.get_nowait())
+            except queue.Empty:
+                return events
+
+    def _on_event(self, event: dict[str, Any]) -> None:
+        state = TASK_EVENT_STATES.get(event.get("type", ""))
+        if state is not None:
+            self._events.put((event["uuid"], state, event.get("exception")))
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                with app.connection_for_read() as connection:
+                    self._receiver = app.events.Receiver(connection, handlers={"*": self._on_event})
+                    if self._stopped.is_set():
+                        return
+                    self._receiver.capture(limit=None, timeout=None, wakeup=False)
+            except Exception:
+                self.log.exception("Error receiving the Celery task events, reconnecting")
+                self._stopped.wait(self.reconnect_interval)
@@ -84,6 +84,7 @@ DEFAULT_CELERY_CONFIG = {
     ),
     "worker_concurrency": conf.getint("celery", "WORKER_CONCURRENCY", fallback=16),
     "worker_enable_remote_control": conf.getboolean("celery", "worker_enable_remote_control", fallback=True),
+    "worker_send_task_events": conf.getboolean("celery", "sync_state_with_events", fallback=False),
 }
 
 
@@ -24,15 +24,17 @@ KubernetesExecutor.
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import logging
 import multiprocessing
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from datetime import datetime
 from queue import Empty, Queue
-from typing import TYPE_CHECKING, Any, Sequence
+from typing import TYPE_CHECKING, Any, Callable, Sequence
 
 from sqlalchemy.orm import Session
 
@@ -94,6 +96,7 @@ if TYPE_CHECKING:
     )
     from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils import (
         AirflowKubernetesScheduler,
+        RateLimiter,
     )
 
 
@@ -161,6 +164,8 @@ class KubernetesExecutor(BaseExecutor):
         self.event_scheduler: EventScheduler | None = None
         self.last_handled: dict[TaskInstanceKey, float] = {}
         self.kubernetes_queue: str | None = None
+        self._pod_creation_pool: ThreadPoolExecutor | None = None
+        self._pod_creation_rate_limiter: RateLimiter | None = None
         super().__init__(parallelism=self.kube_config.parallelism)
 
     def _list_pods(self, query_kwargs):
@@ -276,6 +281,7 @@ class KubernetesExecutor(BaseExecutor):
         self.log.debug("Start with scheduler_job_id: %s", self.scheduler_job_id)
         from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils import (
             AirflowKubernetesScheduler,
+            RateLimiter,
         )
         from airflow.providers.cncf.kubernetes.kube_client import get_kube_client
 
@@ -286,6 +292,13 @@ class KubernetesExecutor(BaseExecutor):
             kube_client=self.kube_client,
             scheduler_job_id=self.scheduler_job_id,
         )
+        if self.kube_config.worker_pods_creation_parallelism > 1:
+            self._pod_creation_pool = ThreadPoolExecutor(
+                max_workers=self.kube_config.worker_pods_creation_parallelism,
+                thread_name_prefix="pod-creation",
+            )
+        if self.kube_config.worker_pods_creation_rate > 0:
+            self._pod_creation_rate_limiter = RateLimiter(self.kube_config.worker_pods_creation_rate)
         self.event_scheduler = EventScheduler()
 
         self.event_scheduler.call_regular_interval(
@@ -380,50 +393,74 @@ class KubernetesExecutor(BaseExecutor):
 
         from kubernetes.client.rest import ApiException
 
+        tasks: list[KubernetesJobType] = []
         for _ in range(self.kube_config.worker_pods_creation_batch_size):
             try:
-                task = self.task_queue.get_nowait()
+                tasks.append(self.task_queue.get_nowait())
+            except Empty:
+                break
 
-                try:
-                    self.kube_scheduler.run_next(task)
-                except PodReconciliationError as e:
-                    self.log.error(
-                        "Pod reconciliation failed, likely due to kubernetes library upgrade. "
-                        "Try clearing the task to re-run.",
-                        exc_info=True,
-                    )
-                    self.fail(task[0], e)
-                except ApiException as e:
-                    # These codes indicate something is wrong with pod definition; otherwise we assume pod
-                    # definition is ok, and that retrying may work
-                    if e.status in (400, 422):
-                        self.log.error("Pod creation failed with reason %r. Failing task", e.reason)
-                        key, _, _, _ = task
-                        self.change_state(key, TaskInstanceState.FAILED, e)
-                    else:
-                        self.log.warning(
-                            "ApiException when attempting to run task, re-queueing. Reason: %r. Message: %s",
-                            e.reason,
-                            json.loads(e.body)["message"],
-                        )
-                        self.task_queue.put(task)
-                except PodMutationHookException as e:
+        for task, create_pod in zip(tasks, self._create_pods(tasks)):
+            try:
+                create_pod()
+            except PodReconciliationError as e:
+                self.log.error(
+                    "Pod reconciliation failed, likely due to kubernetes library upgrade. "
+                    "Try clearing the task to re-run.",
+                    exc_info=True,
+                )
+                self.fail(task[0], e)
+            except ApiException as e:
+                # These codes indicate something is wrong with pod definition; otherwise we assume pod
+                # definition is ok, and that retrying may work
+                if e.status in (400, 422):
+                    self.log.error("Pod creation failed with reason %r. Failing task", e.reason)
                     key, _, _, _ = task
-                    self.log.error(
-                        "Pod Mutation Hook failed for the task %s. Failing task. Details: %s",
-                        key,
-                        e.__cause__,
+                    self.change_state(key, TaskInstanceState.FAILED, e)
+                else:
+                    self.log.warning(
+                        "ApiException when attempting to run task, re-queueing. Reason: %r. Message: %s",
+                        e.reason,
+                        json.loads(e.body)["message"],
                     )
-                    self.fail(key, e)
-                finally:
-                    self.task_queue.task_done()
-            except Empty:
-                break
+                    self.task_queue.put(task)
+            except PodMutationHookException as e:
+                key, _, _, _ = task
+                self.log.error(
+                    "Pod Mutation Hook failed for the task %s. Failing task. Details: %s",
+                    key,
+                    e.__cause__,
+                )
+                self.fail(key, e)
+            finally:
+                self.task_queue.task_done()
 
         # Run any pending timed events
         next_event = self.event_scheduler.run(blocking=False)
         self.log.debug("Next timed event is in %f", next_event)
 
+    def _create_pods(self, tasks: list[KubernetesJobType]) -> list[Callable[[], None]]:
+        """
+        Create the pods of the tasks, concurrently when the executor has a pod creation pool.
+
+        :return: a callable per task, returning once its pod is created and raising its creation error
+        """
+        if TYPE_CHECKING:
+            assert self.kube_scheduler
+
+        if not self._pod_creation_pool or len(tasks) < 2:
+            return [functools.partial(self._run_next, task) for task in tasks]
+        futures = [self._pod_creation_pool.submit(self._run_next, task) for task in tasks]
+        return [future.result for future in futures]
+
+    def _run_next(self, task: KubernetesJobType) -> None:
+        if TYPE_CHECKING:
+            assert self.kube_scheduler
+
+        if self._pod_creation_rate_limiter:
+            self._pod_creation_rate_limiter.wait()
+        self.kube_scheduler.run_next(task)
+
     @provide_session
     def _change_state(
         self,
@@ -717,6 +754,8 @@ class KubernetesExecutor(BaseExecutor):
             self.log.exception("Connection Reset error while flushing task_queue and result_queue.")
         if self.kube_scheduler:
             self.kube_scheduler.terminate()
+        if self._pod_creation_pool:
+            self._pod_creation_pool.shutdown()
         self._manager.shutdown()
 
     def terminate(self):
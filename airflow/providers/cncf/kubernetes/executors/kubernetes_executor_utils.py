@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import json
 import multiprocessing
+import threading
 import time
 from queue import Empty, Queue
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
@@ -81,7 +82,14 @@ class ResourceVersion(metaclass=Singleton):
 
 
 class KubernetesJobWatcher(multiprocessing.Process, LoggingMixin):
-    """Watches for Kubernetes jobs."""
+    """
+    Watches for Kubernetes jobs.
+
+    With an ``event_coalescing_interval``, the events of the pods are forwarded to the scheduler every
+    interval rather than as soon as they are received, and only the latest event of each pod is.
+
+    :param event_coalescing_interval: seconds between two forwards of the events, 0 forwards them at once
+    """
 
     def __init__(
         self,
@@ -90,6 +98,7 @@ class KubernetesJobWatcher(multiprocessing.Process, LoggingMixin):
         resource_version: str | None,
         scheduler_job_id: str,
         kube_config: Configuration,
+        event_coalescing_interval: float = 0,
     ):
         super().__init__()
         self.namespace = namespace
@@ -97,12 +106,19 @@ class KubernetesJobWatcher(multiprocessing.Process, LoggingMixin):
         self.watcher_queue = watcher_queue
         self.resource_version = resource_version
         self.kube_config = kube_config
+        self.event_coalescing_interval = event_coalescing_interval
+        # Latest event of each pod not forwarded yet, by namespace and pod name
+        self._pending_events: dict[tuple[str, str], KubernetesWatchType] = {}
+        # Created by the watcher process itself, along with the thread forwarding the events
+        self._pending_events_lock: threading.Lock | None = None
 
     def run(self) -> None:
         """Performs watching."""
         if TYPE_CHECKING:
             assert self.scheduler_job_id
 
+        if self.event_coalescing_interval:
+            self._start_forwarding_events()
         kube_client: client.CoreV1Api = get_kube_client()
         while True:
             try:
@@ -118,6 +134,7 @@ class KubernetesJobWatcher(multiprocessing.Process, LoggingMixin):
                 self.log.exception("Unknown error in KubernetesJobWatcher. Failing")
                 self.resource_version = "0"
                 ResourceVersion().resource_version[self.namespace] = "0"
+                self._forward_pending_events()
                 raise
             else:
                 self.log.warning(
@@ -125,6 +142,40 @@ class KubernetesJobWatcher(multiprocessing.Process, LoggingMixin):
                     self.resource_version,
                 )
 
+    def _start_forwarding_events(self) -> None:
+        self._pending_events_lock = threading.Lock()
+        thread = threading.Thread(
+            target=self._forward_events_periodically, name="event-forwarder", daemon=True
+        )
+        thread.start()
+
+    def _forward_events_periodically(self) -> None:
+        while True:
+            time.sleep(self.event_coalescing_interval)
+            try:
+                self._forward_pending_events()
+            except Exception:
+                self.log.exception("Error forwarding the pod events to the scheduler")
+
+    def _forward_pending_events(self) -> None:
+        if self._pending_events_lock is None:
+            return
+        with self._pending_events_lock:
+            events, self._pending_events = self._pending_events, {}
+        for task in events.values():
+            self.watcher_queue.put(task)
+
+    def _put_event(self, task: KubernetesWatchType) -> None:
+        """Forward the event of a pod to the scheduler, or keep it to forward it later if coalescing."""
+        if self._pending_events_lock is None:
+            self.watcher_queue.put(task)
+            return
+        pod_name, namespace, *_ = task
+        with self._pending_events_lock:
+            # Replaces the previous event of the pod not forwarded yet
+            self._pending_events.pop((namespace, pod_name), None)
+            self._pending_events[(namespace, pod_name)] = task
+
     def _pod_events(self, kube_client: client.CoreV1Api, query_kwargs: dict):
         watcher = watch.Watch()
         try:
@@ -223,16 +274,14 @@ class KubernetesJobWatcher(multiprocessing.Process, LoggingMixin):
             # since kube server have received request to delete pod set TI state failed
             if event["type"] == "DELETED" and pod.metadata.deletion_timestamp:
                 self.log.info("Event: Failed to start pod %s, annotations: %s", pod_name, annotations_string)
-                self.watcher_queue.put(
+                self._put_event(
                     (pod_name, namespace, TaskInstanceState.FAILED, annotations, resource_version)
                 )
             else:
                 self.log.debug("Event: %s Pending, annotations: %s", pod_name, annotations_string)
         elif status == "Failed":
             self.log.error("Event: %s Failed, annotations: %s", pod_name, annotations_string)
-            self.watcher_queue.put(
-                (pod_name, namespace, TaskInstanceState.FAILED, annotations, resource_version)
-            )
+            self._put_event((pod_name, namespace, TaskInstanceState.FAILED, annotations, resource_version))
         elif status == "Succeeded":
             # We get multiple events once the pod hits a terminal state, and we only want to
             # send it along to the scheduler once.
@@ -250,7 +299,7 @@ class KubernetesJobWatcher(multiprocessing.Process, LoggingMixin):
                 )
                 return
             self.log.info("Event: %s Succeeded, annotations: %s", pod_name, annotations_string)
-            self.watcher_queue.put((pod_name, namespace, None, annotations, resource_version))
+            self._put_event((pod_name, namespace, None, annotations, resource_version))
         elif status == "Running":
             # deletion_timestamp is set by kube server when a graceful deletion is requested.
             # since kube server have received request to delete pod set TI state failed
@@ -260,7 +309,7 @@ class KubernetesJobWatcher(multiprocessing.Process, LoggingMixin):
                     pod_name,
                     annotations_string,
                 )
-                self.watcher_queue.put(
+                self._put_event(
                     (pod_name, namespace, TaskInstanceState.FAILED, annotations, resource_version)
                 )
             else:
@@ -323,6 +372,7 @@ class AirflowKubernetesScheduler(LoggingMixin):
             resource_version=resource_version,
             scheduler_job_id=self.scheduler_job_id,
             kube_config=self.kube_config,
+            event_coalescing_interval=self.kube_config.watcher_event_coalescing_interval,
         )
         watcher.start()
         return watcher
@@ -490,6 +540,28 @@ class AirflowKubernetesScheduler(LoggingMixin):
         self._manager.shutdown()
 
 
+class RateLimiter:
+    """
+    Spaces calls evenly, to make at most ``rate`` calls per second across all threads.
+
+    :param rate: the maximum number of calls per second
+    """
+
+    def __init__(self, rate: float):
+        self._interval = 1 / rate
+        self._next_call = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Wait until the next call can be made."""
+        with self._lock:
+            now = time.monotonic()
+            call = max(now, self._next_call)
+            self._next_call = call + self._interval
+        if call > now:
+            time.sleep(call - now)
+
+
 def get_base_pod_from_template(pod_template_file: str | None, kube_config: Any) -> k8s.V1Pod:
     """
     Get base pod from template.
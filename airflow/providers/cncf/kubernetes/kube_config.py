@@ -43,6 +43,15 @@ class KubeConfig:
         self.worker_pods_creation_batch_size = conf.getint(
             self.kubernetes_section, "worker_pods_creation_batch_size"
         )
+        self.worker_pods_creation_parallelism = conf.getint(
+            self.kubernetes_section, "worker_pods_creation_parallelism", fallback=1
+        )
+        self.worker_pods_creation_rate = conf.getfloat(
+            self.kubernetes_section, "worker_pods_creation_rate", fallback=0
+        )
+        self.watcher_event_coalescing_interval = conf.getfloat(
+            self.kubernetes_section, "watcher_event_coalescing_interval", fallback=0
+        )
         self.worker_container_repository = conf.get(self.kubernetes_section, "worker_container_repository")
         self.worker_container_tag = conf.get(self.kubernetes_section, "worker_container_tag")
         if self.worker_container_repository and self.worker_container_tag:
@@ -0,0 +1,174 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Codecs compressing serialized DAGs and DAG code stored in the database.
+
+The name of the codec is stored along with each compressed row, so rows stay readable when
+``[core] serialized_dag_compression_codec`` changes. Rows compressed before the name was stored
+were compressed with zlib.
+"""
+from __future__ import annotations
+
+import functools
+import threading
+import zlib
+
+from airflow.exceptions import AirflowConfigException, AirflowException
+from airflow.utils.module_loading import import_string
+
+
+class CompressionCodec:
+    """Base class of the codecs, compressing bytes to bytes."""
+
+    def compress(self, data: bytes) -> bytes:
+        raise NotImplementedError()
+
+    def decompress(self, data: bytes) -> bytes:
+        raise NotImplementedError()
+
+
+class ZlibCodec(CompressionCodec):
+    """The zlib codec of the standard library, compact but slow."""
+
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return zlib.decompress(data)
+
+
+class Lz4Codec(CompressionCodec):
+    """The lz4 frame codec, less compact than zlib but much faster, requires the ``lz4`` package."""
+
+    def __init__(self):
+        try:
+            import lz4.frame
+        except ImportError:
+            raise AirflowConfigException(
+                "The lz4 codec requires the lz4 package, install apache-airflow[compression]"
+            )
+        self._lz4 = lz4.frame
+
+    def compress(self, data: bytes) -> bytes:
+        return self._lz4.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._lz4.decompress(data)
+
+
+class ZstdCodec(CompressionCodec):
+    """
+    The Zstandard codec, more compact and faster than zlib, requires the ``zstandard`` package.
+
+    Serialized DAGs share a lot of structure, so a dictionary trained on them makes each DAG notably
+    smaller. Data compressed with a dictionary records its ID, and needs the same dictionary to be
+    decompressed: keep the dictionary configured as long as rows compressed with it exist.
+
+    :param dictionary_path: path to a dictionary trained with ``zstandard.train_dictionary``
+    :param level: the compression level
+    """
+
+    def __init__(self, dictionary_path: str | None = None, level: int = 3):
+        try:
+            import zstandard
+        except ImportError:
+            raise AirflowConfigException(
+                "The zstd codec requires the zstandard package, install apache-airflow[compression]"
+            )
+        self._zstd = zstandard
+        self._level = level
+        self._dictionary = None
+        if dictionary_path:
+            with open(dictionary_path, "rb") as f:
+                self._dictionary = zstandard.ZstdCompressionDict(f.read())
+            self._dictionary.precompute_compress(level=level)
+        # Compressors and decompressors cannot be used by several threads at once
+        self._local = threading.local()
+
+    def compress(self, data: bytes) -> bytes:
+        compressor = getattr(self._local, "compressor", None)
+        if compressor is None:
+            compressor = self._local.compressor = self._zstd.ZstdCompressor(
+                level=self._level, dict_data=self._dictionary
+            )
+        return compressor.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        dictionary_id = self._zstd.get_frame_parameters(data).dict_id
+        if dictionary_id and (self._dictionary is None or self._dictionary.dict_id() != dictionary_id):
+            raise AirflowException(
+                f"The data was compressed with the zstd dictionary {dictionary_id}, "
+                "set [core] serialized_dag_compression_dictionary to it to decompress it"
+            )
+        decompressor = getattr(self._local, "decompressor", None)
+        if decompressor is None:
+            decompressor = self._local.decompressor = self._zstd.ZstdDecompressor(dict_data=self._dictionary)
+        return decompressor.decompress(data)
+
+
+COMPRESSION_CODECS: dict[str, type[CompressionCodec]] = {
+    "zlib": ZlibCodec,
+    "lz4": Lz4Codec,
+    "zstd": ZstdCodec,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def get_compression_codec(name: str | None, dictionary_path: str | None = None) -> CompressionCodec:
+    """
+    Return the codec with the given name, as stored with the compressed rows.
+
+    :param name: a name from ``COMPRESSION_CODECS``, the import path of a ``CompressionCodec``
+        subclass, or None for rows compressed before the codec was stored, with zlib.
+    :param dictionary_path: path to the dictionary of the zstd codec, if any
+    """
+    if name is None:
+        return ZlibCodec()
+    if name == "zstd":
+        return ZstdCodec(dictionary_path)
+    if name in COMPRESSION_CODECS:
+        return COMPRESSION_CODECS[name]()
+    try:
+        return import_string(name)()
+    except ImportError as e:
+        raise AirflowConfigException(f"Cannot import the compression codec {name!r}: {e}")
+
+
+def compress(data: bytes) -> tuple[bytes, str]:
+    """
+    Compress data with ``[core] serialized_dag_compression_codec``.
+
+    :return: the compressed data and the name of the codec, to store along with it
+    """
+    from airflow import settings
+
+    name = settings.SERIALIZED_DAG_COMPRESSION_CODEC
+    codec = get_compression_codec(name, settings.SERIALIZED_DAG_COMPRESSION_DICTIONARY)
+    return codec.compress(data), name
+
+
+def decompress(data: bytes, name: str | None) -> bytes:
+    """
+    Decompress data compressed by :func:`compress`.
+
+    :param data: the compressed data
+    :param name: the name of the codec stored along with the data
+    """
+    from airflow import settings
+
+    return get_compression_codec(name, settings.SERIALIZED_DAG_COMPRESSION_DICTIONARY).decompress(data)
@@ -0,0 +1,102 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+JSON backends used to encode serialized DAGs before they are stored.
+
+All backends sort keys and write no whitespace, but they format some floats differently, e.g.
+``1e+20`` with the standard library and ``1e20`` with orjson. The hashes of serialized DAGs are
+therefore always computed over the encoding of :func:`json_dumps`, whatever backend stores them, so
+they do not depend on the backend in use.
+"""
+from __future__ import annotations
+
+import functools
+import json
+from typing import Any, Callable
+
+from airflow.exceptions import AirflowConfigException
+from airflow.utils.module_loading import import_string
+
+CanonicalJSONDumps = Callable[[Any], bytes]
+
+
+def json_dumps(obj: Any) -> bytes:
+    """
+    Encode ``obj`` as canonical JSON with the standard library, the encoding hashed.
+
+    Lone surrogates are kept as is, as ``json.loads`` reads them back from bytes.
+    """
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode(
+        "utf-8", "surrogatepass"
+    )
+
+
+def orjson_dumps(obj: Any) -> bytes:
+    """
+    Encode ``obj`` as canonical JSON with orjson.
+
+    Falls back to the standard library for what orjson does not support, e.g. integers larger
+    than 64 bits or lone surrogates, and for non-finite floats, which orjson encodes as ``null``.
+    """
+    import orjson
+
+    try:
+        data = orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        return json_dumps(obj)
+    if b"null" in data:
+        canonical_data = json_dumps(obj)
+        if b"NaN" in canonical_data or b"Infinity" in canonical_data:
+            return canonical_data
+    return data
+
+
+JSON_BACKENDS: dict[str, CanonicalJSONDumps] = {
+    "json": json_dumps,
+    "orjson": orjson_dumps,
+}
+
+
+def _has_orjson() -> bool:
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def get_canonical_json_dumps(backend: str) -> CanonicalJSONDumps:
+    """
+    Return the function encoding serialized DAGs for ``[core] serialized_dag_json_backend``.
+
+    :param backend: ``auto`` (orjson if installed, else json), a name from ``JSON_BACKENDS``, or the
+        import path of a function taking an object and returning the canonical JSON bytes.
+    """
+    if backend == "auto":
+        backend = "orjson" if _has_orjson() else "json"
+    if backend == "orjson" and not _has_orjson():
+        raise AirflowConfigException(
+            "The orjson serialized DAG JSON backend requires the orjson package to be installed"
+        )
+    if backend in JSON_BACKENDS:
+        return JSON_BACKENDS[backend]
+    try:
+        return import_string(backend)
+    except ImportError as e:
+        raise AirflowConfigException(f"Cannot import the serialized DAG JSON backend {backend!r}: {e}")
@@ -41,6 +41,7 @@ class JobPydantic(BaseModelPydantic):
     executor_class: Optional[str]
     hostname: Optional[str]
     unixname: Optional[str]
+    load: Optional[float]
 
     # not an ORM field
     heartrate: Optional[int]
@@ -20,7 +20,6 @@ from __future__ import annotations
 import collections.abc
 import datetime
 import enum
-import inspect
 import logging
 import warnings
 import weakref
@@ -101,6 +100,29 @@ def get_operator_extra_links() -> set[str]:
     return _OPERATOR_EXTRA_LINKS
 
 
+# Fields to serialize per serialized class, then per serializer. Classes defined in DAG files are
+# created again each time the file is parsed, hence the weak references.
+_SERIALIZATION_SCHEMAS: weakref.WeakKeyDictionary[
+    type, dict[type, tuple[str, ...]]
+] = weakref.WeakKeyDictionary()
+
+
+def _is_empty_dict_or_list(value: Any) -> bool:
+    """
+    Whether ``value`` equals ``{}`` or ``[]``.
+
+    This avoids ``value in [{}, []]``, which calls ``__eq__`` of arbitrary objects, e.g. a non-empty
+    ``ParamsDict`` resolves all its params to compare itself with ``{}``.
+    """
+    return isinstance(value, (collections.abc.Mapping, list)) and not value
+
+
+@cache
+def _get_forbidden_template_fields() -> frozenset[str]:
+    """Names of the BaseOperator arguments, which cannot be templated."""
+    return frozenset(signature(BaseOperator.__init__).parameters)
+
+
 @cache
 def _get_default_mapped_partial() -> dict[str, Any]:
     """Get default partial kwargs in a mapped operator.
@@ -300,6 +322,9 @@ class BaseSerialization:
 
     _CONSTRUCTOR_PARAMS: dict[str, Parameter] = {}
 
+    # Fields overwritten by the serializer after ``serialize_to_json``, no need to serialize them twice.
+    _fields_serialized_separately: frozenset[str] = frozenset()
+
     SERIALIZER_VERSION = 1
 
     @classmethod
@@ -360,13 +385,28 @@ class BaseSerialization:
             attrname, var, instance
         )
 
+    @classmethod
+    def _get_serialization_schema(cls, object_type: type) -> tuple[str, ...]:
+        """
+        Return the fields to serialize for instances of ``object_type``, in order.
+
+        This is computed once per class rather than for every serialized DAG or operator.
+        """
+        schemas = _SERIALIZATION_SCHEMAS.setdefault(object_type, {})
+        try:
+            return schemas[cls]
+        except KeyError:
+            schema = tuple(sorted(object_type.get_serialized_fields() - cls._fields_serialized_separately))
+            schemas[cls] = schema
+            return schema
+
     @classmethod
     def serialize_to_json(
         cls, object_to_serialize: BaseOperator | MappedOperator | DAG, decorated_fields: set
     ) -> dict[str, Any]:
         """Serialize an object to JSON."""
         serialized_object: dict[str, Any] = {}
-        keys_to_serialize = object_to_serialize.get_serialized_fields()
+        keys_to_serialize = cls._get_serialization_schema(type(object_to_serialize))
         for key in keys_to_serialize:
             # None is ignored in serialized form and is added back in deserialization.
             value = getattr(object_to_serialize, key, None)
@@ -604,7 +644,7 @@ class BaseSerialization:
         ``field = field or {}`` set.
         """
         if attrname in cls._CONSTRUCTOR_PARAMS and (
-            cls._CONSTRUCTOR_PARAMS[attrname] is value or (value in [{}, []])
+            cls._CONSTRUCTOR_PARAMS[attrname] is value or _is_empty_dict_or_list(value)
         ):
             return True
         return False
@@ -757,6 +797,8 @@ class SerializedBaseOperator(BaseOperator, BaseSerialization):
 
     _decorated_fields = {"executor_config"}
 
+    _fields_serialized_separately = frozenset({"params"})
+
     _CONSTRUCTOR_PARAMS = {
         k: v.default
         for k, v in signature(BaseOperator.__init__).parameters.items()
@@ -851,7 +893,7 @@ class SerializedBaseOperator(BaseOperator, BaseSerialization):
         # Store all template_fields as they are if there are JSON Serializable
         # If not, store them as strings
         # And raise an exception if the field is not templateable
-        forbidden_fields = set(inspect.signature(BaseOperator.__init__).parameters.keys())
+        forbidden_fields = _get_forbidden_template_fields()
         if op.template_fields:
             for template_field in op.template_fields:
                 if template_field in forbidden_fields:
@@ -1008,12 +1050,15 @@ class SerializedBaseOperator(BaseOperator, BaseSerialization):
         setattr(op, "_is_empty", bool(encoded_op.get("_is_empty", False)))
 
     @staticmethod
-    def set_task_dag_references(task: Operator, dag: DAG) -> None:
+    def set_task_dag_references(task: Operator, dag: DAG, *, update_downstream_tasks: bool = True) -> None:
         """Handle DAG references on an operator.
 
         The operator should have been mostly populated earlier by calling
         ``populate_operator``. This function further fixes object references
         that were not possible before the task's containing DAG is hydrated.
+
+        :param update_downstream_tasks: whether to add the operator to the upstream task IDs
+            of its downstream tasks, which are looked up in the DAG.
         """
         task.dag = dag
 
@@ -1029,6 +1074,8 @@ class SerializedBaseOperator(BaseOperator, BaseSerialization):
             if isinstance(kwargs_ref := getattr(task, k, None), _ExpandInputRef):
                 setattr(task, k, kwargs_ref.deref(dag))
 
+        if not update_downstream_tasks:
+            return
         for task_id in task.downstream_task_ids:
             # Bypass set_upstream etc here - it does more than we want
             dag.task_dict[task_id].upstream_task_ids.add(task.task_id)
@@ -1312,17 +1359,25 @@ class SerializedDAG(DAG, BaseSerialization):
             raise SerializationError(f"Failed to serialize DAG {dag.dag_id!r}: {e}")
 
     @classmethod
-    def deserialize_dag(cls, encoded_dag: dict[str, Any]) -> SerializedDAG:
-        """Deserializes a DAG from a JSON object."""
+    def deserialize_dag(cls, encoded_dag: dict[str, Any], lazy_tasks: bool = False) -> SerializedDAG:
+        """
+        Deserializes a DAG from a JSON object.
+
+        :param lazy_tasks: only deserialize operators when they are accessed, see
+            :class:`LazyDeserializedTaskDict`.
+        """
         dag = SerializedDAG(dag_id=encoded_dag["_dag_id"])
 
         for k, v in encoded_dag.items():
             if k == "_downstream_task_ids":
                 v = set(v)
             elif k == "tasks":
-                SerializedBaseOperator._load_operator_extra_links = cls._load_operator_extra_links
+                if lazy_tasks:
+                    v = LazyDeserializedTaskDict(dag, v, cls._load_operator_extra_links)
+                else:
+                    SerializedBaseOperator._load_operator_extra_links = cls._load_operator_extra_links
 
-                v = {task["task_id"]: SerializedBaseOperator.deserialize_operator(task) for task in v}
+                    v = {task["task_id"]: SerializedBaseOperator.deserialize_operator(task) for task in v}
                 k = "task_dict"
             elif k == "timezone":
                 v = cls._deserialize_timezone(v)
@@ -1378,11 +1433,23 @@ class SerializedDAG(DAG, BaseSerialization):
         for k in keys_to_set_none:
             setattr(dag, k, None)
 
-        for task in dag.task_dict.values():
-            SerializedBaseOperator.set_task_dag_references(task, dag)
+        if not isinstance(dag.task_dict, LazyDeserializedTaskDict):
+            for task in dag.task_dict.values():
+                SerializedBaseOperator.set_task_dag_references(task, dag)
 
         return dag
 
+    @property
+    def subdags(self):
+        if not isinstance(self.task_dict, LazyDeserializedTaskDict):
+            return super().subdags
+        # Only deserialize the operators which hold a sub-DAG.
+        subdag_lst = []
+        for task in self.task_dict.get_tasks_of_type("SubDagOperator"):
+            subdag_lst.append(task.subdag)
+            subdag_lst += task.subdag.subdags
+        return subdag_lst
+
     @classmethod
     def to_dict(cls, var: Any) -> dict:
         """Stringifies DAGs and operators contained by var and returns a dict of var."""
@@ -1393,12 +1460,17 @@ class SerializedDAG(DAG, BaseSerialization):
         return json_dict
 
     @classmethod
-    def from_dict(cls, serialized_obj: dict) -> SerializedDAG:
-        """Deserializes a python dict in to the DAG and operators it contains."""
+    def from_dict(cls, serialized_obj: dict, lazy_tasks: bool = False) -> SerializedDAG:
+        """
+        Deserializes a python dict in to the DAG and operators it contains.
+
+        :param lazy_tasks: only deserialize operators when they are accessed, see
+            :class:`LazyDeserializedTaskDict`.
+        """
         ver = serialized_obj.get("__version", "<not present>")
         if ver != cls.SERIALIZER_VERSION:
             raise ValueError(f"Unsure how to deserialize version {ver!r}")
-        return cls.deserialize_dag(serialized_obj["dag"])
+        return cls.deserialize_dag(serialized_obj["dag"], lazy_tasks=lazy_tasks)
 
 
 class TaskGroupSerialization(BaseSerialization):
@@ -1469,12 +1541,23 @@ class TaskGroupSerialization(BaseSerialization):
             task.task_group = weakref.proxy(group)
             return task
 
-        group.children = {
-            label: set_ref(task_dict[val])
-            if _type == DAT.OP
-            else cls.deserialize_task_group(val, group, task_dict, dag=dag)
-            for label, (_type, val) in encoded_group["children"].items()
-        }
+        if isinstance(task_dict, LazyDeserializedTaskDict):
+            # Keep the task IDs, the operators get their task group when they are deserialized.
+            children: dict[str, TaskGroup | str] = {}
+            for label, (_type, val) in encoded_group["children"].items():
+                if _type == DAT.OP:
+                    task_dict.set_task_group(val, group)
+                    children[label] = val
+                else:
+                    children[label] = cls.deserialize_task_group(val, group, task_dict, dag=dag)
+            group.children = _LazyTaskGroupChildren(task_dict, children)  # type: ignore[assignment]
+        else:
+            group.children = {
+                label: set_ref(task_dict[val])
+                if _type == DAT.OP
+                else cls.deserialize_task_group(val, group, task_dict, dag=dag)
+                for label, (_type, val) in encoded_group["children"].items()
+            }
         group.upstream_group_ids.update(cls.deserialize(encoded_group["upstream_group_ids"]))
         group.downstream_group_ids.update(cls.deserialize(encoded_group["downstream_group_ids"]))
         group.upstream_task_ids.update(cls.deserialize(encoded_group["upstream_task_ids"]))
@@ -1482,6 +1565,123 @@ class TaskGroupSerialization(BaseSerialization):
         return group
 
 
+class LazyDeserializedTaskDict(collections.abc.MutableMapping):
+    """
+    Task dict of a :class:`SerializedDAG`, deserializing each operator the first time it is accessed.
+
+    Task IDs, the task group structure and the dependencies between tasks are known without
+    deserializing any operator, so views showing a few tasks of a large DAG only pay for those.
+    Iterating over the values deserializes all the operators, as does ``dag.tasks``.
+
+    :param dag: the DAG the tasks belong to
+    :param encoded_tasks: the serialized operators
+    :param load_operator_extra_links: whether to load the operator extra links from plugins
+    """
+
+    def __init__(
+        self, dag: SerializedDAG, encoded_tasks: list[dict[str, Any]], load_operator_extra_links: bool
+    ):
+        self._dag = dag
+        self._load_operator_extra_links = load_operator_extra_links
+        # Values are serialized operators (dicts) until they are deserialized
+        self._data: dict[str, Operator | dict[str, Any]] = {task["task_id"]: task for task in encoded_tasks}
+        self._upstream_task_ids: dict[str, set[str]] = collections.defaultdict(set)
+        for task in encoded_tasks:
+            for downstream_task_id in task.get("downstream_task_ids", ()):
+                self._upstream_task_ids[downstream_task_id].add(task["task_id"])
+        self._task_groups: dict[str, TaskGroup] = {}
+
+    def set_task_group(self, task_id: str, group: TaskGroup) -> None:
+        """Record the task group the operator is added to when deserialized."""
+        task = self._data[task_id]
+        if isinstance(task, dict):
+            self._task_groups[task_id] = group
+        else:
+            task.task_group = weakref.proxy(group)
+
+    def get_tasks_of_type(self, task_type: str) -> list[Operator]:
+        """Return the operators with the given task type, deserializing only them."""
+        return [
+            self[task_id]
+            for task_id, task in self._data.items()
+            if (task.get("_task_type") if isinstance(task, dict) else task.task_type) == task_type
+        ]
+
+    def _deserialize(self, task_id: str, encoded_op: dict[str, Any]) -> Operator:
+        SerializedBaseOperator._load_operator_extra_links = self._load_operator_extra_links
+        task = SerializedBaseOperator.deserialize_operator(encoded_op)
+        # Stored first, as setting the DAG of the operator looks it up in the DAG.
+        self._data[task_id] = task
+        group = self._task_groups.pop(task_id, None)
+        if group is not None:
+            task.task_group = weakref.proxy(group)
+        task.upstream_task_ids.update(self._upstream_task_ids.get(task_id, ()))
+        SerializedBaseOperator.set_task_dag_references(task, self._dag, update_downstream_tasks=False)
+        return task
+
+    def __getitem__(self, task_id: str) -> Operator:
+        task = self._data[task_id]
+        if isinstance(task, dict):
+            return self._deserialize(task_id, task)
+        return task
+
+    def __setitem__(self, task_id: str, task: Operator) -> None:
+        self._data[task_id] = task
+
+    def __delitem__(self, task_id: str) -> None:
+        del self._data[task_id]
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __copy__(self) -> dict[str, Operator]:
+        # A copy deserializing operators on its own would hold operators different from this dict's.
+        return dict(self)
+
+
+class _LazyTaskGroupChildren(collections.abc.MutableMapping):
+    """
+    Children of a deserialized task group, resolving operators from a lazy task dict on access.
+
+    :param task_dict: the task dict of the DAG
+    :param children: the child task groups, and the task IDs of the child operators
+    """
+
+    def __init__(self, task_dict: LazyDeserializedTaskDict, children: dict[str, TaskGroup | str]):
+        self._task_dict = task_dict
+        self._data: dict[str, DAGNode | str] = children
+
+    def __getitem__(self, key: str) -> DAGNode:
+        child = self._data[key]
+        if isinstance(child, str):
+            child = self._data[key] = self._task_dict[child]
+        return child
+
+    def __setitem__(self, key: str, child: DAGNode) -> None:
+        self._data[key] = child
+
+    def __delitem__(self, key: str) -> None:
+        del self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __copy__(self) -> _LazyTaskGroupChildren:
+        return _LazyTaskGroupChildren(self._task_dict, dict(self._data))
+
+
 @dataclass(frozen=True, order=True)
 class DagDependency:
     """
@@ -544,6 +544,21 @@ MIN_SERIALIZED_DAG_UPDATE_INTERVAL = conf.getint("core", "min_serialized_dag_upd
 # If set to True, serialized DAGs is compressed before writing to DB,
 COMPRESS_SERIALIZED_DAGS = conf.getboolean("core", "compress_serialized_dags", fallback=False)
 
+# If set to True, the code of DAG files is compressed before writing to DB.
+COMPRESS_DAG_CODE = conf.getboolean("core", "compress_dag_code", fallback=False)
+
+# Codec compressing serialized DAGs and DAG code, and the zstd dictionary to use, if any.
+SERIALIZED_DAG_COMPRESSION_CODEC = conf.get("core", "serialized_dag_compression_codec", fallback="zlib")
+SERIALIZED_DAG_COMPRESSION_DICTIONARY = (
+    conf.get("core", "serialized_dag_compression_dictionary", fallback="") or None
+)
+
+# Number of tasks from which the tasks of serialized DAGs are stored separately, 0 to never do so.
+SERIALIZED_DAG_CHUNK_MIN_TASKS = conf.getint("core", "serialized_dag_chunk_min_tasks", fallback=0)
+# JSON library used to encode serialized DAGs before they are compressed and written to DB.
+# JSON library used to encode serialized DAGs before they are hashed and written to DB.
+SERIALIZED_DAG_JSON_BACKEND = conf.get("core", "serialized_dag_json_backend", fallback="auto")
+
 # Fetching serialized DAG can not be faster than a minimum interval to reduce database
 # read rate. This config controls when your DAGs are updated in the Webserver
 MIN_SERIALIZED_DAG_FETCH_INTERVAL = conf.getint("core", "min_serialized_dag_fetch_interval", fallback=10)
@@ -26,6 +26,7 @@ from setproctitle import setproctitle
 
 from airflow.jobs.local_task_job_runner import LocalTaskJobRunner
 from airflow.models.taskinstance import TaskReturnCode
+from airflow.serialization.serialized_objects import SerializedDAG
 from airflow.settings import CAN_FORK
 from airflow.task.task_runner.base_task_runner import BaseTaskRunner
 from airflow.utils.dag_parsing_context import _airflow_parsing_context_manager
@@ -39,6 +40,9 @@ class StandardTaskRunner(BaseTaskRunner):
         super().__init__(job_runner=job_runner)
         self._rc = None
         self.dag = self._task_instance.task.dag
+        if isinstance(self.dag, SerializedDAG):
+            # The serialized DAG of the supervisor cannot run the task, the task parses its DAG file
+            self.dag = None
 
     def start(self):
         if CAN_FORK and not self.run_as_user:
@@ -17,9 +17,11 @@
 # under the License.
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
 import attr
+from sqlalchemy import select
 from sqlalchemy.orm.session import Session
 
 from airflow.exceptions import TaskNotFound
@@ -65,6 +67,10 @@ class DepContext:
         trigger rule
     :param ignore_ti_state: Ignore the task instance's previous failure/success
     :param finished_tis: A list of all the finished task instances of this run
+    :param batch_upstream_counts: Count the upstream task instances of mapped tasks from the map
+        indexes of the dag run's task instances, loaded once with :meth:`ensure_ti_map_indexes`,
+        instead of querying the database for every task instance evaluated. This is meant for
+        evaluating many task instances of the same dag run, e.g. in scheduling decisions.
     """
 
     deps: set = attr.ib(factory=set)
@@ -78,11 +84,16 @@ class DepContext:
     ignore_ti_state: bool = False
     ignore_unmapped_tasks: bool = False
     finished_tis: list[TaskInstance] | None = None
+    batch_upstream_counts: bool = False
     description: str | None = None
 
     have_changed_ti_states: bool = False
     """Have any of the TIs state's been changed as a result of evaluating dependencies"""
 
+    _finished_tis_by_task_id: dict[str, list[TaskInstance]] | None = attr.ib(default=None, init=False)
+    _finished_tis_source: list[TaskInstance] | None = attr.ib(default=None, init=False)
+    _ti_map_indexes: dict[tuple[str, str], dict[str, list[int]]] = attr.ib(factory=dict, init=False)
+
     def ensure_finished_tis(self, dag_run: DagRun, session: Session) -> list[TaskInstance]:
         """
         Ensure finished_tis is populated if it's currently None, which allows running tasks without dag_run.
@@ -103,3 +114,53 @@ class DepContext:
         else:
             finished_tis = self.finished_tis
         return finished_tis
+
+    def ensure_finished_tis_by_task_id(
+        self, dag_run: DagRun, session: Session
+    ) -> dict[str, list[TaskInstance]]:
+        """
+        Get the finished tis of the dag run, indexed by task id.
+
+        This allows dependencies to only look at the finished tis of the upstream tasks, rather
+        than scanning all finished tis of the dag run for every task instance evaluated.
+
+        :param dag_run: The DagRun for which to find finished tasks
+        :return: A mapping of task id to the finished task instances of that task
+        """
+        finished_tis = self.ensure_finished_tis(dag_run, session)
+        if self._finished_tis_by_task_id is None or self._finished_tis_source is not finished_tis:
+            finished_tis_by_task_id: dict[str, list[TaskInstance]] = defaultdict(list)
+            for ti in finished_tis:
+                finished_tis_by_task_id[ti.task_id].append(ti)
+            self._finished_tis_by_task_id = finished_tis_by_task_id
+            self._finished_tis_source = finished_tis
+        return self._finished_tis_by_task_id
+
+    def ensure_ti_map_indexes(self, dag_run: DagRun, session: Session) -> dict[str, list[int]]:
+        """
+        Get the map indexes of all task instances of the dag run, indexed by task id.
+
+        This is loaded with a single query for the whole dag run and lets dependencies count the
+        (mapped) task instances of upstream tasks without issuing a query per task instance. Call
+        :meth:`invalidate_ti_map_indexes` after creating or removing task instances of the dag run.
+
+        :param dag_run: The DagRun for which to find the task instances
+        :return: A mapping of task id to the map indexes of the task instances of that task
+        """
+        from airflow.models.taskinstance import TaskInstance
+
+        key = (dag_run.dag_id, dag_run.run_id)
+        if key not in self._ti_map_indexes:
+            map_indexes: dict[str, list[int]] = defaultdict(list)
+            for task_id, map_index in session.execute(
+                select(TaskInstance.task_id, TaskInstance.map_index).where(
+                    TaskInstance.dag_id == dag_run.dag_id, TaskInstance.run_id == dag_run.run_id
+                )
+            ):
+                map_indexes[task_id].append(map_index)
+            self._ti_map_indexes[key] = map_indexes
+        return self._ti_map_indexes[key]
+
+    def invalidate_ti_map_indexes(self) -> None:
+        """Forget the map indexes loaded by :meth:`ensure_ti_map_indexes`, e.g. after a task was expanded."""
+        self._ti_map_indexes.clear()
@@ -176,9 +176,12 @@ class TriggerRuleDep(BaseTIDep):
                 return True
             return False
 
+        dag_run = ti.get_dagrun(session)
+        finished_tis_by_task_id = dep_context.ensure_finished_tis_by_task_id(dag_run, session)
         finished_upstream_tis = (
             finished_ti
-            for finished_ti in dep_context.ensure_finished_tis(ti.get_dagrun(session), session)
+            for upstream_id in upstream_tasks
+            for finished_ti in finished_tis_by_task_id.get(upstream_id, ())
             if _is_relevant_upstream(finished_ti)
         )
         upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
@@ -221,18 +224,40 @@ class TriggerRuleDep(BaseTIDep):
                 else:
                     yield and_(TaskInstance.task_id == upstream_id, TaskInstance.map_index == map_indexes)
 
+        def _count_upstream_tis() -> list[tuple[str, int]]:
+            # Counts the same task instances as the ``_iter_upstream_conditions`` query, but using the
+            # map indexes of the dag run's task instances, which are loaded once per dependency context.
+            ti_map_indexes = dep_context.ensure_ti_map_indexes(dag_run, session)
+            in_mapped_task_group = task.get_closest_mapped_task_group() is not None
+            counts = []
+            for upstream_id in upstream_tasks:
+                map_indexes = ti_map_indexes.get(upstream_id, ())
+                relevant = _get_relevant_upstream_map_indexes(upstream_id) if in_mapped_task_group else None
+                if relevant is None:
+                    count = len(map_indexes)
+                elif isinstance(relevant, collections.abc.Container):
+                    count = sum(1 for i in map_indexes if i < 0 or i in relevant)
+                else:
+                    count = sum(1 for i in map_indexes if i < 0 or i == relevant)
+                if count:
+                    counts.append((upstream_id, count))
+            return counts
+
         # Optimization: Don't need to hit the database if all upstreams are
         # "simple" tasks (no task or task group mapping involved).
         if not any(needs_expansion(t) for t in upstream_tasks.values()):
             upstream = len(upstream_tasks)
             upstream_setup = sum(1 for x in upstream_tasks.values() if x.is_setup)
         else:
-            task_id_counts = session.execute(
-                select(TaskInstance.task_id, func.count(TaskInstance.task_id))
-                .where(TaskInstance.dag_id == ti.dag_id, TaskInstance.run_id == ti.run_id)
-                .where(or_(*_iter_upstream_conditions()))
-                .group_by(TaskInstance.task_id)
-            ).all()
+            if dep_context.batch_upstream_counts:
+                task_id_counts = _count_upstream_tis()
+            else:
+                task_id_counts = session.execute(
+                    select(TaskInstance.task_id, func.count(TaskInstance.task_id))
+                    .where(TaskInstance.dag_id == ti.dag_id, TaskInstance.run_id == ti.run_id)
+                    .where(or_(*_iter_upstream_conditions()))
+                    .group_by(TaskInstance.task_id)
+                ).all()
             upstream = sum(count for _, count in task_id_counts)
             upstream_setup = sum(c for t, c in task_id_counts if upstream_tasks[t].is_setup)
 
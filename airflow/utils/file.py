@@ -194,6 +194,32 @@ def open_maybe_zipped(fileloc, mode="r"):
         return open(fileloc, mode=mode)
 
 
+def _add_ignore_rules(
+    patterns: list[_IgnoreRule],
+    ignore_file_path: Path,
+    base_dir_path: str | os.PathLike[str],
+    ignore_rule_type: type[_IgnoreRule],
+) -> list[_IgnoreRule]:
+    """Return ``patterns`` extended with the rules of ``ignore_file_path``, if that file exists."""
+    if not ignore_file_path.is_file():
+        return patterns
+    with open(ignore_file_path) as ifile:
+        lines_no_comments = [re2.sub(r"\s*#.*", "", line) for line in ifile.read().split("\n")]
+        # append new patterns and filter out "None" objects, which are invalid patterns
+        patterns += [
+            p
+            for p in [
+                ignore_rule_type.compile(line, Path(base_dir_path), ignore_file_path)
+                for line in lines_no_comments
+                if line
+            ]
+            if p is not None
+        ]
+        # evaluation order of patterns is important with negation
+        # so that later patterns can override earlier patterns
+        return list(dict.fromkeys(patterns))
+
+
 def _find_path_from_directory(
     base_dir_path: str | os.PathLike[str],
     ignore_file_name: str,
@@ -213,23 +239,7 @@ def _find_path_from_directory(
     for root, dirs, files in os.walk(base_dir_path, followlinks=True):
         patterns: list[_IgnoreRule] = patterns_by_dir.get(Path(root).resolve(), [])
 
-        ignore_file_path = Path(root) / ignore_file_name
-        if ignore_file_path.is_file():
-            with open(ignore_file_path) as ifile:
-                lines_no_comments = [re2.sub(r"\s*#.*", "", line) for line in ifile.read().split("\n")]
-                # append new patterns and filter out "None" objects, which are invalid patterns
-                patterns += [
-                    p
-                    for p in [
-                        ignore_rule_type.compile(line, Path(base_dir_path), ignore_file_path)
-                        for line in lines_no_comments
-                        if line
-                    ]
-                    if p is not None
-                ]
-                # evaluation order of patterns is important with negation
-                # so that later patterns can override earlier patterns
-                patterns = list(dict.fromkeys(patterns))
+        patterns = _add_ignore_rules(patterns, Path(root) / ignore_file_name, base_dir_path, ignore_rule_type)
 
         dirs[:] = [subdir for subdir in dirs if not ignore_rule_type.match(Path(root) / subdir, patterns)]
 
@@ -273,6 +283,55 @@ def find_path_from_directory(
         raise ValueError(f"Unsupported ignore_file_syntax: {ignore_file_syntax}")
 
 
+def _is_path_ignored(
+    base_dir_path: str | os.PathLike[str],
+    file_path: str | os.PathLike[str],
+    ignore_file_name: str,
+    ignore_rule_type: type[_IgnoreRule],
+) -> bool:
+    """Check whether a single path below the base path is ignored, as in ``_find_path_from_directory``.
+
+    Only the ignore files of the directories between the base path and the file are read.
+    """
+    base_dir = Path(base_dir_path)
+    try:
+        relative_parts = Path(file_path).relative_to(base_dir).parts
+    except ValueError:
+        return True
+    if not relative_parts or relative_parts[-1] == ignore_file_name:
+        return True
+
+    patterns: list[_IgnoreRule] = []
+    current = base_dir
+    for part in relative_parts:
+        patterns = _add_ignore_rules(patterns, current / ignore_file_name, base_dir_path, ignore_rule_type)
+        current = current / part
+        if ignore_rule_type.match(current, patterns):
+            return True
+    return False
+
+
+def is_path_ignored(
+    base_dir_path: str | os.PathLike[str],
+    file_path: str | os.PathLike[str],
+    ignore_file_name: str,
+    ignore_file_syntax: str = conf.get_mandatory_value("core", "DAG_IGNORE_FILE_SYNTAX", fallback="regexp"),
+) -> bool:
+    """Check whether a path would be skipped by ``find_path_from_directory(base_dir_path, ...)``.
+
+    :param base_dir_path: the base path that would be searched
+    :param file_path: the path to check, files outside the base path are always ignored
+    :param ignore_file_name: the file name in which specifies the patterns of files/dirs to be ignored
+    :param ignore_file_syntax: the syntax of patterns in the ignore file: regexp or glob
+    """
+    if ignore_file_syntax == "glob":
+        return _is_path_ignored(base_dir_path, file_path, ignore_file_name, _GlobIgnoreRule)
+    elif ignore_file_syntax == "regexp" or not ignore_file_syntax:
+        return _is_path_ignored(base_dir_path, file_path, ignore_file_name, _RegexpIgnoreRule)
+    else:
+        raise ValueError(f"Unsupported ignore_file_syntax: {ignore_file_syntax}")
+
+
 def list_py_file_paths(
     directory: str | os.PathLike[str] | None,
     safe_mode: bool = conf.getboolean("core", "DAG_DISCOVERY_SAFE_MODE", fallback=True),
@@ -326,6 +385,25 @@ def find_dag_file_paths(directory: str | os.PathLike[str], safe_mode: bool) -> l
     return file_paths
 
 
+def is_dag_file_path(directory: str | os.PathLike[str], file_path: str, safe_mode: bool) -> bool:
+    """Check whether ``find_dag_file_paths(directory, ...)`` would return this file path.
+
+    This is much cheaper than listing the whole directory when only a few files have changed.
+    """
+    try:
+        if not os.path.isfile(file_path):
+            return False
+        _, file_ext = os.path.splitext(os.path.split(file_path)[-1])
+        if file_ext != ".py" and not zipfile.is_zipfile(file_path):
+            return False
+        if is_path_ignored(directory, file_path, ".airflowignore"):
+            return False
+        return might_contain_dag(file_path, safe_mode)
+    except Exception:
+        log.exception("Error while examining %s", file_path)
+        return False
+
+
 COMMENT_PATTERN = re2.compile(r"\s*#.*")
 
 
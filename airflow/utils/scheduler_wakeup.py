@@ -0,0 +1,243 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Channels used to wake up an idle scheduler as soon as there is something for it to do."""
+from __future__ import annotations
+
+import os
+import select
+import socket
+import time
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import event, text
+from sqlalchemy.exc import DBAPIError
+
+from airflow.configuration import conf
+from airflow.exceptions import AirflowConfigException
+from airflow.utils.log.logging_mixin import LoggingMixin
+from airflow.utils.session import create_session
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+POSTGRES_CHANNEL_NAME = "airflow_scheduler_wakeup"
+
+
+class BaseWakeupChannel(LoggingMixin):
+    """
+    Base class for scheduler wake-up channels.
+
+    Processes that change something the scheduler should act upon (task instances finishing,
+    triggers firing, DAGs being (re-)serialized) call :meth:`notify`; the scheduler calls
+    :meth:`listen` once and then :meth:`wait` instead of sleeping when it is idle.
+    """
+
+    def notify(self, session: Session | None = None) -> None:
+        """
+        Wake up the scheduler.
+
+        :param session: If given, the notification is only delivered once the session's current
+            transaction is committed, so the scheduler sees the changes it is woken up for.
+        """
+        raise NotImplementedError()
+
+    def listen(self) -> None:
+        """Start receiving notifications. Only called by the scheduler."""
+        raise NotImplementedError()
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Wait for a notification for at most ``timeout`` seconds.
+
+        :return: Whether a notification was received.
+        """
+        raise NotImplementedError()
+
+    def close(self) -> None:
+        """Stop receiving notifications."""
+
+
+class PostgresWakeupChannel(BaseWakeupChannel):
+    """Wake-up channel using Postgres ``LISTEN``/``NOTIFY``, which works across hosts."""
+
+    def __init__(self):
+        super().__init__()
+        self._connection: Any = None
+
+    def notify(self, session: Session | None = None) -> None:
+        # NOTIFY is transactional: it is only delivered when the transaction commits.
+        statement = text("SELECT pg_notify(:channel, '')").bindparams(channel=POSTGRES_CHANNEL_NAME)
+        if session is not None:
+            # In a savepoint, so that failing to notify does not abort the caller's transaction
+            try:
+                with session.begin_nested():
+                    session.execute(statement)
+            except DBAPIError:
+                self.log.debug("Failed to notify the scheduler", exc_info=True)
+            return
+        with create_session() as new_session:
+            new_session.execute(statement)
+
+    def listen(self) -> None:
+        from airflow import settings
+
+        # Use a dedicated connection, detached from the pool, as it stays in LISTEN mode.
+        connection = settings.engine.raw_connection()
+        connection.detach()
+        try:
+            dbapi_connection = connection.connection
+            dbapi_connection.autocommit = True
+            with dbapi_connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {POSTGRES_CHANNEL_NAME}")
+        except Exception:
+            connection.close()
+            raise
+        self._connection = connection
+
+    def wait(self, timeout: float) -> bool:
+        # When the connection was lost, plainly sleep until listening again succeeds
+        try:
+            if self._connection is None:
+                self.listen()
+            dbapi_connection = self._connection.connection
+            if not dbapi_connection.notifies:
+                readable, _, _ = select.select([dbapi_connection], [], [], timeout)
+                if readable:
+                    dbapi_connection.poll()
+        except Exception:
+            self.log.warning(
+                "Lost the connection listening for wake-ups, listening again later", exc_info=True
+            )
+            self.close()
+            time.sleep(timeout)
+            return False
+        woken = bool(dbapi_connection.notifies)
+        dbapi_connection.notifies.clear()
+        return woken
+
+    def close(self) -> None:
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except Exception:
+                self.log.debug("Failed to close the connection listening for wake-ups", exc_info=True)
+            self._connection = None
+
+
+class SocketWakeupChannel(BaseWakeupChannel):
+    """
+    Wake-up channel using a Unix datagram socket.
+
+    This only works for processes running on the same host as the scheduler, e.g. with the
+    LocalExecutor, and only one scheduler per host can listen on a given path.
+
+    :param path: The path of the socket the scheduler listens on.
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self._socket: socket.socket | None = None
+
+    def _send(self) -> None:
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+                sock.setblocking(False)
+                sock.sendto(b"\0", self.path)
+        except OSError:
+            # Nobody is listening, or there are already notifications pending: either way there
+            # is nothing more to do.
+            pass
+
+    def notify(self, session: Session | None = None) -> None:
+        if session is not None and session.in_transaction():
+            event.listen(session, "after_commit", lambda _: self._send(), once=True)
+            return
+        self._send()
+
+    def listen(self) -> None:
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.setblocking(False)
+        sock.bind(self.path)
+        self._socket = sock
+
+    def wait(self, timeout: float) -> bool:
+        if self._socket is None:
+            raise RuntimeError("The wake-up channel is not listening")
+        readable, _, _ = select.select([self._socket], [], [], timeout)
+        if not readable:
+            return False
+        # Drain all pending notifications, a single loop iteration handles all of them.
+        try:
+            while self._socket.recv(64):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self) -> None:
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+
+_channels: dict[tuple[str, str], BaseWakeupChannel] = {}
+
+
+def get_wakeup_channel() -> BaseWakeupChannel | None:
+    """Return the wake-up channel configured with ``[scheduler] wakeup_channel``, if any."""
+    kind = conf.get("scheduler", "wakeup_channel", fallback="none").lower()
+    path = conf.get("scheduler", "wakeup_socket_path", fallback="")
+    if kind == "auto":
+        sql_conn = conf.get_mandatory_value("database", "sql_alchemy_conn").lower()
+        kind = "postgres" if sql_conn.startswith("postgres") else "socket"
+    if kind == "none":
+        return None
+
+    key = (kind, path)
+    if key not in _channels:
+        if kind == "postgres":
+            _channels[key] = PostgresWakeupChannel()
+        elif kind == "socket":
+            _channels[key] = SocketWakeupChannel(path)
+        else:
+            raise AirflowConfigException(
+                f"Unknown [scheduler] wakeup_channel {kind!r}, expected one of none, auto, postgres, socket"
+            )
+    return _channels[key]
+
+
+def notify_scheduler(session: Session | None = None) -> None:
+    """
+    Wake up the scheduler through the configured wake-up channel; does nothing if there is none.
+
+    Failing to notify never fails the caller, the scheduler will pick up the changes on its next
+    regular loop anyway.
+
+    :param session: If given, the notification is delivered once the session's transaction commits.
+    """
+    try:
+        channel = get_wakeup_channel()
+        if channel:
+            channel.notify(session=session)
+    except Exception:
+        LoggingMixin().log.debug("Failed to notify the scheduler", exc_info=True)
@@ -0,0 +1,186 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Cache of the task instance summaries and payloads of the grid view, kept by each webserver worker."""
+from __future__ import annotations
+
+import collections
+import functools
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Collection, Hashable
+
+import sqlalchemy as sqla
+from sqlalchemy import func, select
+
+from airflow.configuration import conf
+from airflow.models.taskinstance import TaskInstance, TaskInstanceNote
+from airflow.stats import Stats
+from airflow.utils.hashlib_wrapper import md5
+from airflow.utils.state import State
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Row
+    from sqlalchemy.orm import Session
+
+    from airflow.models.dagrun import DagRun
+
+# Number of grid payloads kept, one per DAG and set of request arguments
+GRID_PAYLOAD_CACHE_SIZE = 32
+
+# Seconds after which the task instances of finished DAG runs are read again, see get_run_fingerprints
+FINISHED_RUN_RECHECK_INTERVAL = 300
+
+
+def get_ti_summaries(dag_id: str, run_ids: Collection[str], session: Session) -> list[Row]:
+    """
+    Return the summaries of the task instances of DAG runs shown in the grid view.
+
+    The summaries are grouped by task, run, state and try number, and sorted by task and run.
+    """
+    if not run_ids:
+        return []
+    return session.execute(
+        select(
+            TaskInstance.task_id,
+            TaskInstance.run_id,
+            TaskInstance.state,
+            TaskInstance._try_number,
+            func.min(TaskInstanceNote.content).label("note"),
+            func.count(func.coalesce(TaskInstance.state, sqla.literal("no_status"))).label("state_count"),
+            func.min(TaskInstance.queued_dttm).label("queued_dttm"),
+            func.min(TaskInstance.start_date).label("start_date"),
+            func.max(TaskInstance.end_date).label("end_date"),
+        )
+        .join(TaskInstance.task_instance_note, isouter=True)
+        .where(TaskInstance.dag_id == dag_id, TaskInstance.run_id.in_(run_ids))
+        .group_by(TaskInstance.task_id, TaskInstance.run_id, TaskInstance.state, TaskInstance._try_number)
+        .order_by(TaskInstance.task_id, TaskInstance.run_id)
+    ).all()
+
+
+def get_run_fingerprints(dag_runs: Collection[DagRun]) -> dict[str, tuple | None]:
+    """
+    Return a value per finished DAG run changing whenever a task instance of the run or its note changes.
+
+    The task instances of finished runs change when they are cleared, which changes the state of their
+    run, or when users mark or annotate them, which updates their run, see
+    :meth:`~airflow.models.dagrun.DagRun.touch_finished`. The fingerprint is therefore taken from the
+    run, without reading its task instances. It also changes every ``FINISHED_RUN_RECHECK_INTERVAL``,
+    for the task instances changed otherwise, e.g. by running a task of a finished run ignoring its
+    dependencies. Unfinished runs have no fingerprint, their task instances are always read.
+    """
+    recheck_epoch = int(time.time() // FINISHED_RUN_RECHECK_INTERVAL)
+    return {
+        dag_run.run_id: (dag_run.state, str(dag_run.updated_at), recheck_epoch)
+        if dag_run.state in State.finished_dr_states
+        else None
+        for dag_run in dag_runs
+    }
+
+
+def get_etag(*parts: Any) -> str:
+    """Return the ETag of a grid payload built from the given parts, as their hash."""
+    return md5(repr(parts).encode("utf-8")).hexdigest()
+
+
+class GridDataCache:
+    """
+    Least recently used caches of the data of the grid view.
+
+    The grid view is refreshed periodically while it is open, and summarizing the task instances of
+    all the runs it shows is the most expensive part of it. The summaries of finished runs are cached
+    along with the fingerprint of the run, and only the runs still in progress or whose fingerprint
+    changed are summarized again. The whole payload is cached as well, keyed by its ETag, so unchanged
+    grids are not built again.
+
+    :param size: the number of DAG runs to keep the summaries of, 0 to disable the cache
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._runs: collections.OrderedDict[
+            tuple[str, str], tuple[tuple, list[Row]]
+        ] = collections.OrderedDict()
+        self._payloads: collections.OrderedDict[Hashable, tuple[str, str]] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_ti_summaries(
+        self, dag_id: str, fingerprints: dict[str, tuple | None], session: Session
+    ) -> list[Row]:
+        """
+        Return the summaries of the task instances of DAG runs, as :func:`get_ti_summaries` does.
+
+        :param dag_id: DAG ID
+        :param fingerprints: the fingerprints of the DAG runs, from :func:`get_run_fingerprints`
+        :param session: ORM session
+        """
+        summaries: list[Row] = []
+        stale_run_ids = []
+        with self._lock:
+            for run_id, fingerprint in fingerprints.items():
+                cached = self._runs.get((dag_id, run_id))
+                if fingerprint is not None and cached and cached[0] == fingerprint:
+                    self._runs.move_to_end((dag_id, run_id))
+                    summaries.extend(cached[1])
+                else:
+                    stale_run_ids.append(run_id)
+        Stats.incr("grid_data_cache.hit", len(fingerprints) - len(stale_run_ids))
+        Stats.incr("grid_data_cache.miss", len(stale_run_ids))
+
+        fresh_summaries = get_ti_summaries(dag_id, stale_run_ids, session)
+        summaries.extend(fresh_summaries)
+        if self.size:
+            runs: dict[str, list[Row]] = {
+                run_id: [] for run_id in stale_run_ids if fingerprints[run_id] is not None
+            }
+            for summary in fresh_summaries:
+                if summary.run_id in runs:
+                    runs[summary.run_id].append(summary)
+            with self._lock:
+                for run_id, run_summaries in runs.items():
+                    self._runs[(dag_id, run_id)] = (fingerprints[run_id], run_summaries)
+                    self._runs.move_to_end((dag_id, run_id))
+                while len(self._runs) > self.size:
+                    self._runs.popitem(last=False)
+        summaries.sort(key=lambda summary: (summary.task_id, summary.run_id))
+        return summaries
+
+    def get_payload(self, key: Hashable, etag: str) -> str | None:
+        """Return the cached payload for the request key if its ETag is still the given one."""
+        with self._lock:
+            cached = self._payloads.get(key)
+            if cached and cached[0] == etag:
+                self._payloads.move_to_end(key)
+                return cached[1]
+        return None
+
+    def set_payload(self, key: Hashable, etag: str, payload: str) -> None:
+        """Cache the payload for the request key, replacing its previous one."""
+        if not self.size:
+            return
+        with self._lock:
+            self._payloads[key] = (etag, payload)
+            self._payloads.move_to_end(key)
+            while len(self._payloads) > GRID_PAYLOAD_CACHE_SIZE:
+                self._payloads.popitem(last=False)
+
+
+@functools.lru_cache(maxsize=None)
+def get_grid_data_cache() -> GridDataCache:
+    """Return the grid data cache of the process, sized by ``[webserver] grid_data_cache_size``."""
+    return GridDataCache(conf.getint("webserver", "grid_data_cache_size", fallback=1000))
@@ -31,7 +31,7 @@ from bisect import insort_left
 from collections import defaultdict
 from functools import cached_property, wraps
 from json import JSONDecodeError
-from typing import Any, Callable, Collection, Iterator, Mapping, MutableMapping, Sequence
+from typing import Any, Callable, Collection, Iterable, Iterator, Mapping, MutableMapping, Sequence
 from urllib.parse import unquote, urljoin, urlsplit
 
 import configupdater
@@ -68,8 +68,10 @@ from markupsafe import Markup, escape
 from pendulum.datetime import DateTime
 from pendulum.parsing.exceptions import ParserError
 from sqlalchemy import Date, and_, case, desc, func, inspect, or_, select, union_all
+from sqlalchemy.engine import Row
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
+from werkzeug.http import quote_etag
 from wtforms import BooleanField, validators
 
 import airflow
@@ -103,7 +105,7 @@ from airflow.models.dataset import DagScheduleDatasetReference, DatasetDagRunQue
 from airflow.models.mappedoperator import MappedOperator
 from airflow.models.operator import Operator
 from airflow.models.serialized_dag import SerializedDagModel
-from airflow.models.taskinstance import TaskInstance, TaskInstanceNote
+from airflow.models.taskinstance import TaskInstance
 from airflow.providers_manager import ProvidersManager
 from airflow.security import permissions
 from airflow.ti_deps.dep_context import DepContext
@@ -136,6 +138,7 @@ from airflow.www.forms import (
     TaskInstanceEditForm,
     create_connection_form_class,
 )
+from airflow.www.grid_cache import get_etag, get_grid_data_cache, get_run_fingerprints, get_ti_summaries
 from airflow.www.widgets import AirflowModelListWidget, AirflowVariableShowWidget
 
 PAGE_SIZE = conf.getint("webserver", "page_size")
@@ -287,34 +290,23 @@ def node_dict(node_id, label, node_class):
     }
 
 
-def dag_to_grid(dag: DagModel, dag_runs: Sequence[DagRun], session: Session):
+def dag_to_grid(
+    dag: DagModel, dag_runs: Sequence[DagRun], session: Session, ti_summaries: Iterable[Row] | None = None
+):
     """
     Create a nested dict representation of the DAG's TaskGroup and its children.
 
     Used to construct the Graph and Grid views.
+
+    :param ti_summaries: the summaries of the task instances of the runs, as returned by
+        :func:`airflow.www.grid_cache.get_ti_summaries`, queried if not given
     """
-    query = session.execute(
-        select(
-            TaskInstance.task_id,
-            TaskInstance.run_id,
-            TaskInstance.state,
-            TaskInstance._try_number,
-            func.min(TaskInstanceNote.content).label("note"),
-            func.count(func.coalesce(TaskInstance.state, sqla.literal("no_status"))).label("state_count"),
-            func.min(TaskInstance.queued_dttm).label("queued_dttm"),
-            func.min(TaskInstance.start_date).label("start_date"),
-            func.max(TaskInstance.end_date).label("end_date"),
-        )
-        .join(TaskInstance.task_instance_note, isouter=True)
-        .where(
-            TaskInstance.dag_id == dag.dag_id,
-            TaskInstance.run_id.in_([dag_run.run_id for dag_run in dag_runs]),
-        )
-        .group_by(TaskInstance.task_id, TaskInstance.run_id, TaskInstance.state, TaskInstance._try_number)
-        .order_by(TaskInstance.task_id, TaskInstance.run_id)
-    )
+    if ti_summaries is None:
+        ti_summaries = get_ti_summaries(dag.dag_id, [dag_run.run_id for dag_run in dag_runs], session)
 
-    grouped_tis = {task_id: list(tis) for task_id, tis in itertools.groupby(query, key=lambda ti: ti.task_id)}
+    grouped_tis = {
+        task_id: list(tis) for task_id, tis in itertools.groupby(ti_summaries, key=lambda ti: ti.task_id)
+    }
 
     sort_order = conf.get("webserver", "grid_view_sorting_order", fallback="topological")
     if sort_order == "topological":
@@ -3718,16 +3710,37 @@ class Airflow(AirflowBaseView):
             query, ordering=dag.timetable.run_ordering, limit=num_runs, session=session
         )
         encoded_runs = [wwwutils.encode_dag_run(dr, json_encoder=utils_json.WebEncoder) for dr in dag_runs]
-        data = {
-            "groups": dag_to_grid(dag, dag_runs, session),
-            "dag_runs": encoded_runs,
-            "ordering": dag.timetable.run_ordering,
-        }
-        # avoid spaces to reduce payload size
-        return (
-            htmlsafe_json_dumps(data, separators=(",", ":"), dumps=flask.json.dumps),
-            {"Content-Type": "application/json; charset=utf-8"},
+
+        # The grid is refreshed periodically while it is open: it only needs to be built again when a
+        # task instance of the shown runs, a run, or the DAG changed. Only the task instances of the
+        # unfinished runs and of the finished runs which changed are read.
+        fingerprints = get_run_fingerprints(dag_runs)
+        cache = get_grid_data_cache()
+        ti_summaries = cache.get_ti_summaries(dag.dag_id, fingerprints, session)
+        request_key = (dag.dag_id, tuple(sorted(request.args.items(multi=True))))
+        etag = get_etag(
+            request_key,
+            get_airflow_app().dag_bag.dags_hash.get(dag.dag_id, dag.last_loaded),
+            base_date,
+            encoded_runs,
+            fingerprints,
+            [tuple(summary) for summary in ti_summaries if fingerprints[summary.run_id] is None],
         )
+        headers = {"ETag": quote_etag(etag), "Cache-Control": "no-cache"}
+        if request.if_none_match.contains(etag):
+            return "", 304, headers
+
+        payload = cache.get_payload(request_key, etag)
+        if payload is None:
+            data = {
+                "groups": dag_to_grid(dag, dag_runs, session, ti_summaries),
+                "dag_runs": encoded_runs,
+                "ordering": dag.timetable.run_ordering,
+            }
+            # avoid spaces to reduce payload size
+            payload = htmlsafe_json_dumps(data, separators=(",", ":"), dumps=flask.json.dumps)
+            cache.set_payload(request_key, etag, payload)
+        return payload, {"Content-Type": "application/json; charset=utf-8", **headers}
 
     @expose("/object/historical_metrics_data")
     @auth.has_access(
@@ -0,0 +1,105 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import time
+
+import rich_click as click
+
+
+def _time(func, items, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for item in items:
+            func(item)
+    return (time.perf_counter() - start) / repeat
+
+
+@click.command()
+@click.option("--repeat", default=10, help="number of times to compress all the DAGs, to reduce variance")
+@click.option(
+    "--dag-folder",
+    default=None,
+    help="folder of the DAGs to serialize, defaults to the example DAGs shipped with Airflow",
+)
+@click.option(
+    "--train-dictionary",
+    default=None,
+    help="path to write a zstd dictionary trained on the serialized DAGs to",
+)
+@click.option("--dictionary-size", default=16384, help="size in bytes of the trained zstd dictionary")
+def main(repeat, dag_folder, train_dictionary, dictionary_size):
+    """
+    Compare the size and the compression and decompression times of serialized DAGs with each codec.
+
+    The zstd codec is also measured with a dictionary trained on half of the DAGs, and measured on
+    the other half. With --train-dictionary, a dictionary trained on all the DAGs is written for
+    ``[core] serialized_dag_compression_dictionary``.
+    """
+    from airflow.models.dagbag import DagBag
+    from airflow.serialization.compression import COMPRESSION_CODECS, get_compression_codec
+    from airflow.serialization.json_backend import json_dumps
+    from airflow.serialization.serialized_objects import SerializedDAG
+
+    if dag_folder:
+        dagbag = DagBag(dag_folder, include_examples=False, read_dags_from_db=False)
+    else:
+        dagbag = DagBag("/dev/null", include_examples=True, read_dags_from_db=False)
+    serialized_dags = [json_dumps(SerializedDAG.to_dict(dag)) for dag in dagbag.dags.values()]
+    # Measure the dictionary on DAGs it was not trained on
+    training_dags, measured_dags = serialized_dags[::2], serialized_dags[1::2]
+    total_size = sum(len(data) for data in measured_dags)
+    print(f"{len(measured_dags)} serialized DAGs measured, {total_size / 1024:.1f} KiB in total")
+    print(f"{'codec':<16} {'size':>10} {'ratio':>6} {'compress':>10} {'decompress':>11}")
+
+    codecs = {}
+    for name in COMPRESSION_CODECS:
+        try:
+            codecs[name] = get_compression_codec(name)
+        except Exception as e:
+            print(f"{name:<16} unavailable: {e}")
+    if "zstd" in codecs:
+        import tempfile
+
+        import zstandard
+
+        with tempfile.NamedTemporaryFile() as f:
+            f.write(zstandard.train_dictionary(dictionary_size, training_dags).as_bytes())
+            f.flush()
+            codecs["zstd+dictionary"] = get_compression_codec("zstd", f.name)
+
+    for name, codec in codecs.items():
+        compressed = [codec.compress(data) for data in measured_dags]
+        size = sum(len(data) for data in compressed)
+        compress_time = _time(codec.compress, measured_dags, repeat)
+        decompress_time = _time(codec.decompress, compressed, repeat)
+        print(
+            f"{name:<16} {size / 1024:>8.1f}KiB {total_size / size:>6.2f} "
+            f"{compress_time * 1000:>8.2f}ms {decompress_time * 1000:>9.2f}ms"
+        )
+
+    if train_dictionary:
+        import zstandard
+
+        with open(train_dictionary, "wb") as f:
+            f.write(zstandard.train_dictionary(dictionary_size, serialized_dags).as_bytes())
+        print(f"Dictionary trained on {len(serialized_dags)} DAGs written to {train_dictionary}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import statistics
+import time
+
+import rich_click as click
+
+
+def _time(func, repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _report(name: str, timings: list[float], num_dags: int) -> None:
+    mean = statistics.mean(timings)
+    stdev = statistics.stdev(timings) if len(timings) > 1 else 0.0
+    print(f"{name:<32} {mean * 1000:9.2f}ms ({stdev * 1000:.2f}ms) {mean * 1e6 / num_dags:9.1f}us/DAG")
+
+
+@click.command()
+@click.option("--repeat", default=10, help="number of times to serialize all the DAGs, to reduce variance")
+@click.option(
+    "--dag-folder",
+    default=None,
+    help="folder of the DAGs to serialize, defaults to the example DAGs shipped with Airflow",
+)
+def main(repeat, dag_folder):
+    """
+    Measure the time spent serializing DAGs, as done for each DAG each time its file is parsed.
+
+    It times ``SerializedDAG.to_dict``, then the encoding of the result to JSON and its hash with
+    every available ``[core] serialized_dag_json_backend``.
+    """
+    from airflow.models.dagbag import DagBag
+    from airflow.serialization.json_backend import JSON_BACKENDS, get_canonical_json_dumps
+    from airflow.serialization.serialized_objects import SerializedDAG
+    from airflow.utils.hashlib_wrapper import md5
+
+    if dag_folder:
+        dagbag = DagBag(dag_folder, include_examples=False, read_dags_from_db=False)
+    else:
+        dagbag = DagBag("/dev/null", include_examples=True, read_dags_from_db=False)
+    dags = list(dagbag.dags.values())
+    print(f"Serializing {len(dags)} DAGs, {sum(len(dag.tasks) for dag in dags)} tasks, {repeat} times")
+
+    _report(
+        "SerializedDAG.to_dict",
+        _time(lambda: [SerializedDAG.to_dict(dag) for dag in dags], repeat),
+        len(dags),
+    )
+
+    serialized_dags = [SerializedDAG.to_dict(dag) for dag in dags]
+    for backend in JSON_BACKENDS:
+        try:
+            dumps = get_canonical_json_dumps(backend)
+            dumps({})
+        except Exception as e:
+            print(f"{backend:<32} unavailable: {e}")
+            continue
+
+        def encode_and_hash():
+            for serialized_dag in serialized_dags:
+                md5(dumps(serialized_dag)).hexdigest()
+
+        _report(f"{backend} encoding + hash", _time(encode_and_hash, repeat), len(dags))
+
+
+if __name__ == "__main__":
+    main()
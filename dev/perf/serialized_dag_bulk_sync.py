@@ -0,0 +1,115 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import time
+
+import rich_click as click
+from sqlalchemy import delete, event
+
+DAG_ID_PREFIX = "perf_serialized_dag_bulk_sync_"
+
+
+def _make_dags(num_dags: int, num_tasks: int, version: int):
+    import pendulum
+
+    from airflow.models.dag import DAG
+    from airflow.operators.bash import BashOperator
+
+    dags = []
+    for i in range(num_dags):
+        with DAG(f"{DAG_ID_PREFIX}{i}", start_date=pendulum.datetime(2023, 1, 1), schedule=None) as dag:
+            for j in range(num_tasks):
+                # Only the first DAG changes between versions
+                BashOperator(task_id=f"task_{j}", bash_command=f"echo {version if i == 0 else 0}")
+        dags.append(dag)
+    return dags
+
+
+class _QueryCounter:
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def _after_cursor_execute(self, *args, **kwargs):
+        self.count += 1
+
+    def __enter__(self):
+        self.count = 0
+        event.listen(self.engine, "after_cursor_execute", self._after_cursor_execute)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, "after_cursor_execute", self._after_cursor_execute)
+
+
+@click.command()
+@click.option("--num-dags", default=200, help="number of DAGs generated by the simulated DAG file")
+@click.option("--num-tasks", default=10, help="number of tasks of each DAG")
+def main(num_dags, num_tasks):
+    """
+    Compare the round-trips to the database and time spent writing the serialized DAGs of a file.
+
+    The DAGs of a simulated file are written with ``SerializedDagModel.write_dag`` called for each
+    DAG, as done before, and with ``SerializedDagModel.bulk_sync_to_db``: first when they are new,
+    then when none of them changed, then when a single one changed.
+
+    It writes to the configured database, only DAG IDs starting with the prefix below are touched.
+    """
+    from airflow import settings
+    from airflow.models.serialized_dag import SerializedDagModel
+    from airflow.utils.session import create_session
+
+    def _clear():
+        with create_session() as session:
+            session.execute(
+                delete(SerializedDagModel)
+                .where(SerializedDagModel.dag_id.startswith(DAG_ID_PREFIX))
+                .execution_options(synchronize_session=False)
+            )
+
+    def _write_each(dags, session):
+        for dag in dags:
+            SerializedDagModel.write_dag(dag, session=session)
+
+    def _write_bulk(dags, session):
+        SerializedDagModel.write_serialized_dags([SerializedDagModel(dag) for dag in dags], session=session)
+
+    versions = [
+        ("new DAGs", _make_dags(num_dags, num_tasks, 0)),
+        ("unchanged DAGs", _make_dags(num_dags, num_tasks, 0)),
+        ("one changed DAG", _make_dags(num_dags, num_tasks, 1)),
+    ]
+    print(f"{num_dags} DAGs prefixed with {DAG_ID_PREFIX}, {num_tasks} tasks each")
+    print(f"{'':<20} {'method':<10} {'queries':>8} {'time':>10}")
+    try:
+        for name, write in (("per DAG", _write_each), ("bulk", _write_bulk)):
+            _clear()
+            for version_name, dags in versions:
+                with _QueryCounter(settings.engine) as counter, create_session() as session:
+                    start = time.perf_counter()
+                    write(dags, session)
+                    session.flush()
+                    duration = time.perf_counter() - start
+                print(f"{version_name:<20} {name:<10} {counter.count:>8} {duration * 1000:>8.1f}ms")
+    finally:
+        _clear()
+
+
+if __name__ == "__main__":
+    main()
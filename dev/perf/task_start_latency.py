@@ -0,0 +1,98 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import getpass
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import rich_click as click
+
+# Forked task processes reuse the DAG of the supervisor, tasks run as another user (here the
+# current one, so no sudo is needed) are started in a new interpreter which loads the DAG itself
+TASK_STARTS = {
+    "fork": {},
+    "new interpreter": {"AIRFLOW__CORE__DEFAULT_IMPERSONATION": getpass.getuser()},
+}
+
+
+def _run_task(dag_id: str, task_id: str, run_id: str, env: dict[str, str]) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "airflow", "tasks", "run", "--local", "--force", "--ignore-all-dependencies"]
+        + [dag_id, task_id, run_id],
+        env=env,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return time.perf_counter() - start
+
+
+@click.command()
+@click.option("--dag-file", required=True, help="DAG file of the task")
+@click.option("--dag-id", required=True, help="DAG ID of the task")
+@click.option("--task-id", required=True, help="ID of a short task")
+@click.option("--repeat", default=5, help="number of task runs to measure in each mode")
+def main(dag_file, dag_id, task_id, repeat):
+    """
+    Measure the end-to-end latency of ``airflow tasks run --local`` for a short task.
+
+    The task is run with and without ``[core] task_supervisor_uses_serialized_dag``, both in a forked
+    process and in a new interpreter, each run in a new ``airflow`` process. The time measured spans
+    from the start of the command to its end, so the task should do next to nothing. The DAG is
+    serialized to the database and a DAG run is created first.
+    """
+    from airflow.models.dagbag import DagBag
+    from airflow.models.serialized_dag import SerializedDagModel
+    from airflow.utils import timezone
+    from airflow.utils.state import State
+
+    dag = DagBag(dag_file, include_examples=False, read_dags_from_db=False).get_dag(dag_id)
+    dag.sync_to_db()
+    SerializedDagModel.write_dag(dag)
+    now = timezone.utcnow()
+    run_id = f"task_start_latency__{now.isoformat()}"
+    dag.create_dagrun(
+        run_id=run_id,
+        state=State.RUNNING,
+        execution_date=now,
+        data_interval=dag.timetable.infer_manual_data_interval(run_after=now),
+    )
+
+    for task_start, task_start_env in TASK_STARTS.items():
+        for serialized in (False, True):
+            env = {
+                **os.environ,
+                **task_start_env,
+                "AIRFLOW__CORE__DAGS_FOLDER": dag_file,
+                "AIRFLOW__CORE__TASK_SUPERVISOR_USES_SERIALIZED_DAG": str(serialized),
+            }
+            times = [_run_task(dag_id, task_id, run_id, env) for _ in range(repeat)]
+            mode = "serialized" if serialized else "parse"
+            click.echo(
+                f"{task_start:>15}, {mode:>10}: median {statistics.median(times) * 1000:.0f} ms, "
+                f"min {min(times) * 1000:.0f} ms, max {max(times) * 1000:.0f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -287,6 +287,10 @@ cgroups = [
     # Cgroupspy 0.2.2 added Python 3.10 compatibility
     "cgroupspy>=0.2.2",
 ]
+compression = [
+    "lz4>=4.0.0",
+    "zstandard>=0.18.0",
+]
 dask = [
     # Dask support is limited, we need Dask team to upgrade support for dask if we were to continue
     # Supporting it in the future
@@ -367,6 +371,9 @@ sentry = [
 statsd = [
     "statsd>=3.3.0",
 ]
+uvloop = [
+    "uvloop>=0.14.0",
+]
 virtualenv = [
     "virtualenv",
 ]
@@ -520,6 +527,7 @@ CORE_EXTRAS_DEPENDENCIES: dict[str, list[str]] = {
     "celery": celery,  # TODO: remove and move to a regular provider package in a separate PR
     "cgroups": cgroups,
     "cncf.kubernetes": kubernetes,  # TODO: remove and move to a regular provider package in a separate PR
+    "compression": compression,
     "dask": dask,  # TODO: remove and move to a provider package in a separate PR
     "deprecated_api": deprecated_api,
     "github_enterprise": flask_appbuilder_oauth,
@@ -533,6 +541,7 @@ CORE_EXTRAS_DEPENDENCIES: dict[str, list[str]] = {
     "rabbitmq": rabbitmq,
     "sentry": sentry,
     "statsd": statsd,
+    "uvloop": uvloop,
     "virtualenv": virtualenv,
 }
 
@@ -45,6 +45,7 @@ from airflow.exceptions import AirflowException, DagRunNotFound
 from airflow.models import DagBag, DagRun, Pool, TaskInstance
 from airflow.models.serialized_dag import SerializedDagModel
 from airflow.operators.bash import BashOperator
+from airflow.serialization.serialized_objects import SerializedDAG
 from airflow.utils import timezone
 from airflow.utils.session import create_session
 from airflow.utils.state import State
@@ -315,6 +316,23 @@ class TestCliTasks:
         )
         assert ("Filling up the DagBag from" in caplog.text) != from_db
 
+    @pytest.mark.parametrize("serialized", [True, False])
+    @mock.patch("airflow.cli.commands.task_command.LocalTaskJobRunner")
+    def test_run_supervisor_with_serialized_dag(self, mock_local_job_runner, caplog, serialized):
+        if serialized:
+            SerializedDagModel.write_dag(self.dag)
+        else:
+            SerializedDagModel.remove_dag(self.dag_id)
+        args = ["tasks", "run", "--ignore-all-dependencies", "--local", self.dag_id, "print_the_context"]
+        mock_local_job_runner.return_value.job_type = "LocalTaskJob"
+        with conf_vars({("core", "task_supervisor_uses_serialized_dag"): "True"}):
+            task_command.task_run(self.parser.parse_args([*args, self.run_id]))
+
+        task = mock_local_job_runner.call_args.kwargs["task_instance"].task
+        assert isinstance(task.dag, SerializedDAG) == serialized
+        # The DAG file is only parsed if the serialized DAG cannot be used
+        assert ("Filling up the DagBag from" in caplog.text) != serialized
+
     @mock.patch("airflow.cli.commands.task_command.LocalTaskJobRunner")
     def test_run_raises_when_theres_no_dagrun(self, mock_local_job):
         """
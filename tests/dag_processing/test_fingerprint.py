@@ -0,0 +1,81 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import pytest
+
+from airflow.dag_processing.fingerprint import DagFileFingerprinter
+
+
+@pytest.fixture
+def dag_dir(tmp_path):
+    (tmp_path / "dag.py").write_text(
+        "import os\n"
+        "import common.settings\n"
+        "from common import operators\n"
+        "from .sibling import helper\n"
+        "def load():\n"
+        "    import lazy\n"
+    )
+    (tmp_path / "common").mkdir()
+    (tmp_path / "common" / "__init__.py").write_text("")
+    (tmp_path / "common" / "settings.py").write_text("from . import defaults\n")
+    (tmp_path / "common" / "defaults.py").write_text("RETRIES = 1\n")
+    (tmp_path / "common" / "operators.py").write_text("")
+    (tmp_path / "sibling.py").write_text("def helper(): ...\n")
+    (tmp_path / "lazy.py").write_text("")
+    (tmp_path / "unrelated.py").write_text("")
+    return tmp_path
+
+
+class TestDagFileFingerprinter:
+    def test_fingerprint_is_stable(self, dag_dir):
+        fingerprinter = DagFileFingerprinter([str(dag_dir)])
+        fingerprint = fingerprinter.fingerprint(str(dag_dir / "dag.py"))
+        assert fingerprint is not None
+        assert fingerprinter.fingerprint(str(dag_dir / "dag.py")) == fingerprint
+        assert DagFileFingerprinter([str(dag_dir)]).fingerprint(str(dag_dir / "dag.py")) == fingerprint
+
+    @pytest.mark.parametrize(
+        "module",
+        ["dag.py", "common/__init__.py", "common/settings.py", "common/defaults.py", "common/operators.py"]
+        + ["sibling.py", "lazy.py"],
+    )
+    def test_fingerprint_changes_with_local_imports(self, dag_dir, module):
+        fingerprinter = DagFileFingerprinter([str(dag_dir)])
+        fingerprint = fingerprinter.fingerprint(str(dag_dir / "dag.py"))
+        with open(dag_dir / module, "a") as f:
+            f.write("# changed\n")
+        assert fingerprinter.fingerprint(str(dag_dir / "dag.py")) != fingerprint
+
+    def test_fingerprint_ignores_unrelated_files(self, dag_dir):
+        fingerprinter = DagFileFingerprinter([str(dag_dir)])
+        fingerprint = fingerprinter.fingerprint(str(dag_dir / "dag.py"))
+        (dag_dir / "unrelated.py").write_text("# changed\n")
+        assert fingerprinter.fingerprint(str(dag_dir / "dag.py")) == fingerprint
+
+    def test_always_reparse_marker(self, dag_dir):
+        (dag_dir / "common" / "operators.py").write_text("# airflow: always-reparse\n")
+        assert DagFileFingerprinter([str(dag_dir)]).fingerprint(str(dag_dir / "dag.py")) is None
+
+    def test_missing_file(self, dag_dir):
+        assert DagFileFingerprinter([str(dag_dir)]).fingerprint(str(dag_dir / "missing.py")) is None
+
+    def test_invalid_syntax(self, dag_dir):
+        (dag_dir / "dag.py").write_text("import (\n")
+        assert DagFileFingerprinter([str(dag_dir)]).fingerprint(str(dag_dir / "dag.py")) is not None
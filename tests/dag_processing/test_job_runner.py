@@ -186,6 +186,46 @@ class TestDagProcessorJobRunner:
         child_pipe.close()
         parent_pipe.close()
 
+    @conf_vars(
+        {
+            ("core", "load_examples"): "False",
+            ("scheduler", "parsing_worker_pool"): "True",
+            ("scheduler", "parsing_start_method"): "fork",
+        }
+    )
+    def test_parse_files_with_worker_pool(self, tmp_path):
+        (tmp_path / "valid_dag.py").write_text(
+            "from airflow import DAG\n"
+            "from datetime import datetime\n"
+            "dag = DAG('worker_pool_dag', start_date=datetime(2023, 1, 1), schedule=None)\n"
+        )
+        child_pipe, parent_pipe = multiprocessing.Pipe()
+        async_mode = "sqlite" not in conf.get("database", "sql_alchemy_conn")
+        manager = DagProcessorJobRunner(
+            job=Job(),
+            processor=DagFileProcessorManager(
+                dag_directory=tmp_path,
+                max_runs=1,
+                processor_timeout=timedelta(days=365),
+                signal_conn=child_pipe,
+                dag_ids=[],
+                pickle_dags=False,
+                async_mode=async_mode,
+            ),
+        )
+
+        try:
+            self.run_processor_manager_one_loop(manager, parent_pipe)
+            assert manager.processor.get_last_dag_count(str(tmp_path / "valid_dag.py")) == 1
+            with create_session() as session:
+                assert session.query(DagModel).filter_by(dag_id="worker_pool_dag").count() == 1
+            # The worker is kept for the next file
+            assert len(manager.processor._worker_pool._idle_workers) == 1
+        finally:
+            manager.processor.end()
+            child_pipe.close()
+            parent_pipe.close()
+
     @conf_vars({("core", "load_examples"): "False"})
     def test_max_runs_when_no_files(self):
         child_pipe, parent_pipe = multiprocessing.Pipe()
@@ -249,6 +289,72 @@ class TestDagProcessorJobRunner:
         assert file_2 in manager.processor._processors.keys()
         assert collections.deque([file_3]) == manager.processor._file_path_queue
 
+    @conf_vars({("scheduler", "skip_unchanged_dag_files"): "True"})
+    def test_start_new_processes_skips_unchanged_files(self, tmp_path):
+        dag_file = tmp_path / "dag.py"
+        dag_file.write_text("from airflow import DAG\nimport helpers\n")
+        helpers_file = tmp_path / "helpers.py"
+        helpers_file.write_text("VALUE = 1\n")
+        manager = DagFileProcessorManager(
+            dag_directory=tmp_path,
+            max_runs=-1,
+            processor_timeout=timedelta(days=365),
+            signal_conn=MagicMock(),
+            dag_ids=[],
+            pickle_dags=False,
+            async_mode=True,
+        )
+        manager.set_file_paths([str(dag_file)])
+
+        def parse_file():
+            manager._file_path_queue.append(str(dag_file))
+            with mock.patch.object(manager, "_create_process") as create_process:
+                create_process.return_value.file_path = str(dag_file)
+                create_process.return_value.result = (1, 0)
+                create_process.return_value.start_time = timezone.utcnow()
+                manager.start_new_processes()
+            if str(dag_file) not in manager._processors:
+                return False
+            manager._collect_results_from_processor(manager._processors.pop(str(dag_file)))
+            return True
+
+        with mock.patch.object(manager, "update_dags_last_parsed_time", return_value=1) as update_dags:
+            assert parse_file()
+            update_dags.assert_not_called()
+
+            assert not parse_file()
+            update_dags.assert_called_once_with(fileloc=str(dag_file), last_parsed_time=mock.ANY)
+            assert manager.get_run_count(str(dag_file)) == 2
+
+            # A local module the file imports changed
+            helpers_file.write_text("VALUE = 2\n")
+            assert parse_file()
+            assert not parse_file()
+
+            # The DAG was deleted from the database
+            update_dags.return_value = 0
+            assert parse_file()
+
+        # Opt out
+        dag_file.write_text("from airflow import DAG  # airflow: always-reparse\n")
+        assert parse_file()
+        assert parse_file()
+
+    def test_update_dags_last_parsed_time(self):
+        dagbag = DagBag(dag_folder="/dev/null", include_examples=False)
+        dagbag.process_file(os.path.join(TEST_DAGS_FOLDER, "test_example_bash_operator.py"))
+        dagbag.sync_to_db()
+        last_parsed_time = timezone.utcnow() + timedelta(hours=1)
+        fileloc = dagbag.get_dag("test_example_bash_operator").fileloc
+
+        assert DagFileProcessorManager.update_dags_last_parsed_time(fileloc, last_parsed_time) == 1
+        with create_session() as session:
+            dag_model = session.query(DagModel).filter_by(dag_id="test_example_bash_operator").one()
+            assert dag_model.last_parsed_time == last_parsed_time
+            dag_model.is_active = False
+
+        assert DagFileProcessorManager.update_dags_last_parsed_time(fileloc, last_parsed_time) == 0
+
     def test_set_file_paths_when_processor_file_path_not_in_new_file_paths(self):
         manager = DagProcessorJobRunner(
             job=Job(),
@@ -1000,6 +1106,60 @@ class TestDagProcessorJobRunner:
         # assert dag deactivated
         assert not dag.get_is_active()
 
+    @conf_vars(
+        {
+            ("scheduler", "dag_dir_watch_mode"): "polling",
+            ("scheduler", "dag_dir_list_interval"): "0",
+            ("core", "load_examples"): "False",
+        }
+    )
+    def test_refresh_dags_dir_with_watcher_only_looks_at_changed_files(self, tmp_path):
+        """Test DagProcessorJobRunner._refresh_dag_dir only handles changed files when watching the dir"""
+        dag_code = "from airflow import DAG\n"
+        (tmp_path / "dag_1.py").write_text(dag_code)
+        (tmp_path / "dag_2.py").write_text(dag_code)
+        manager = DagFileProcessorManager(
+            dag_directory=tmp_path,
+            max_runs=1,
+            processor_timeout=timedelta(days=365),
+            signal_conn=MagicMock(),
+            dag_ids=[],
+            pickle_dags=False,
+            async_mode=True,
+        )
+        try:
+            assert manager._refresh_dag_dir()
+            assert sorted(manager.file_paths) == [str(tmp_path / "dag_1.py"), str(tmp_path / "dag_2.py")]
+            manager._file_path_queue = collections.deque([str(tmp_path / "dag_1.py")])
+
+            (tmp_path / "dag_3.py").write_text(dag_code)
+            (tmp_path / "not_a_dag.py").write_text("print('hello')")
+            (tmp_path / "dag_2.py").write_text(dag_code + "# changed\n")
+            os.utime(tmp_path / "dag_2.py", (1000, 1000))
+            with mock.patch("airflow.dag_processing.manager.list_py_file_paths") as mock_list_py_file_paths:
+                assert manager._refresh_dag_dir()
+                mock_list_py_file_paths.assert_not_called()
+            assert sorted(manager.file_paths) == [
+                str(tmp_path / "dag_1.py"),
+                str(tmp_path / "dag_2.py"),
+                str(tmp_path / "dag_3.py"),
+            ]
+            assert manager._file_path_queue == collections.deque(
+                [str(tmp_path / "dag_2.py"), str(tmp_path / "dag_3.py"), str(tmp_path / "dag_1.py")]
+            )
+
+            (tmp_path / "dag_1.py").unlink()
+            assert manager._refresh_dag_dir()
+            assert sorted(manager.file_paths) == [str(tmp_path / "dag_2.py"), str(tmp_path / "dag_3.py")]
+            assert manager._file_path_queue == collections.deque(
+                [str(tmp_path / "dag_2.py"), str(tmp_path / "dag_3.py")]
+            )
+
+            # Nothing changed
+            assert not manager._refresh_dag_dir()
+        finally:
+            manager.end()
+
     def test_refresh_dags_dir_does_not_interfer_with_dags_outside_its_subdir(self, tmpdir):
         """Test DagProcessorJobRunner._refresh_dag_dir should not update dags outside its processor_subdir"""
 
@@ -18,7 +18,9 @@
 from __future__ import annotations
 
 import datetime
+import multiprocessing.context
 import os
+import time
 from unittest import mock
 from unittest.mock import MagicMock, patch
 from zipfile import ZipFile
@@ -957,6 +959,50 @@ class TestDagFileProcessor:
         )
         mock_redirect_stdout_for_file.assert_called_once()
 
+    @conf_vars({("logging", "dag_processor_log_target"): "stdout"})
+    @mock.patch("airflow.dag_processing.processor.settings.dispose_orm", MagicMock)
+    @mock.patch("airflow.dag_processing.processor.Stats.timing")
+    def test_dag_parser_reports_startup_time(self, mock_timing):
+        DagFileProcessorProcess._run_file_processor(
+            result_channel=MagicMock(),
+            parent_channel=MagicMock(),
+            file_path="/dags/fake_file_path.py",
+            pickle_dags=False,
+            dag_ids=[],
+            thread_name="fake_thread_name",
+            callback_requests=[],
+            dag_directory=[],
+            launch_time=time.time(),
+            start_method="forkserver",
+        )
+        mock_timing.assert_any_call("dag_processing.processor_startup_time.forkserver", mock.ANY)
+        mock_timing.assert_any_call(
+            "dag_processing.processor_startup_time",
+            mock.ANY,
+            tags={"start_method": "forkserver", "file_name": "fake_file_path"},
+        )
+
+    @conf_vars(
+        {
+            ("scheduler", "parsing_start_method"): "forkserver",
+            ("scheduler", "parsing_preload_modules"): "airflow.models, json,",
+        }
+    )
+    def test_forkserver_preloads_modules(self):
+        processor = DagFileProcessorProcess(
+            file_path="abc.txt",
+            pickle_dags=False,
+            dag_ids=[],
+            dag_directory=[],
+            callback_requests=[],
+        )
+        with mock.patch.object(
+            multiprocessing.context.ForkServerContext, "set_forkserver_preload"
+        ) as mock_set_forkserver_preload:
+            context = processor._get_multiprocessing_context()
+        assert context.get_start_method() == "forkserver"
+        mock_set_forkserver_preload.assert_called_once_with(["airflow.models", "json"])
+
     @mock.patch("airflow.dag_processing.processor.settings.dispose_orm", MagicMock)
     @mock.patch.object(DagFileProcessorProcess, "_get_multiprocessing_context")
     def test_no_valueerror_with_parseable_dag_in_zip(self, mock_context, tmpdir):
@@ -0,0 +1,134 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+import sys
+from unittest import mock
+
+import pytest
+
+from airflow.dag_processing.watcher import (
+    InotifyDagDirectoryWatcher,
+    PollingDagDirectoryWatcher,
+    start_dag_directory_watcher,
+)
+from airflow.exceptions import AirflowConfigException
+
+
+@pytest.fixture
+def dag_dir(tmp_path):
+    (tmp_path / "existing.py").write_text("# dag")
+    (tmp_path / "subdir").mkdir()
+    (tmp_path / "subdir" / "nested.py").write_text("# dag")
+    return tmp_path
+
+
+def _touch(path, mtime):
+    os.utime(path, (mtime, mtime))
+
+
+class TestPollingDagDirectoryWatcher:
+    def test_reports_created_modified_and_deleted_files(self, dag_dir):
+        watcher = PollingDagDirectoryWatcher(str(dag_dir), poll_interval=0)
+        watcher.start()
+        assert watcher.poll() == (set(), False)
+
+        (dag_dir / "new.py").write_text("# dag")
+        _touch(dag_dir / "subdir" / "nested.py", 1000)
+        (dag_dir / "existing.py").unlink()
+
+        changes = watcher.poll()
+        assert changes.paths == {
+            str(dag_dir / "new.py"),
+            str(dag_dir / "subdir" / "nested.py"),
+            str(dag_dir / "existing.py"),
+        }
+        assert not changes.rescan
+        assert watcher.poll() == (set(), False)
+
+    def test_ignore_file_change_requires_rescan(self, dag_dir):
+        watcher = PollingDagDirectoryWatcher(str(dag_dir), poll_interval=0)
+        watcher.start()
+        (dag_dir / "subdir" / ".airflowignore").write_text("nested")
+        assert watcher.poll().rescan
+
+    def test_poll_interval(self, dag_dir):
+        watcher = PollingDagDirectoryWatcher(str(dag_dir), poll_interval=3600)
+        watcher.start()
+        (dag_dir / "new.py").write_text("# dag")
+        assert watcher.poll() == (set(), False)
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is only available on Linux")
+class TestInotifyDagDirectoryWatcher:
+    @pytest.fixture
+    def watcher(self, dag_dir):
+        watcher = InotifyDagDirectoryWatcher(str(dag_dir))
+        watcher.start()
+        yield watcher
+        watcher.stop()
+
+    def test_reports_created_modified_and_deleted_files(self, dag_dir, watcher):
+        assert watcher.poll() == (set(), False)
+
+        (dag_dir / "new.py").write_text("# dag")
+        (dag_dir / "subdir" / "nested.py").write_text("# changed")
+        (dag_dir / "existing.py").unlink()
+
+        changes = watcher.poll()
+        assert changes.paths == {
+            str(dag_dir / "new.py"),
+            str(dag_dir / "subdir" / "nested.py"),
+            str(dag_dir / "existing.py"),
+        }
+        assert not changes.rescan
+        assert watcher.poll() == (set(), False)
+
+    def test_new_directory_is_watched_and_requires_rescan(self, dag_dir, watcher):
+        (dag_dir / "newdir").mkdir()
+        assert watcher.poll().rescan
+
+        (dag_dir / "newdir" / "dag.py").write_text("# dag")
+        assert watcher.poll() == ({str(dag_dir / "newdir" / "dag.py")}, False)
+
+    def test_ignore_file_change_requires_rescan(self, dag_dir, watcher):
+        (dag_dir / ".airflowignore").write_text("subdir")
+        assert watcher.poll().rescan
+
+
+class TestStartDagDirectoryWatcher:
+    def test_none(self, dag_dir):
+        assert start_dag_directory_watcher("none", str(dag_dir), 0) is None
+
+    def test_polling(self, dag_dir):
+        assert isinstance(start_dag_directory_watcher("polling", str(dag_dir), 0), PollingDagDirectoryWatcher)
+
+    def test_auto_falls_back_to_polling(self, dag_dir):
+        with mock.patch.object(InotifyDagDirectoryWatcher, "start", side_effect=OSError(28, "No space")):
+            watcher = start_dag_directory_watcher("auto", str(dag_dir), 0)
+        assert isinstance(watcher, PollingDagDirectoryWatcher)
+
+    def test_inotify_does_not_fall_back(self, dag_dir):
+        with mock.patch.object(InotifyDagDirectoryWatcher, "start", side_effect=OSError(28, "No space")):
+            with pytest.raises(OSError):
+                start_dag_directory_watcher("inotify", str(dag_dir), 0)
+
+    def test_unknown_mode(self, dag_dir):
+        with pytest.raises(AirflowConfigException, match="fanotify"):
+            start_dag_directory_watcher("fanotify", str(dag_dir), 0)
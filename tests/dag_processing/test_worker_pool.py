@@ -0,0 +1,119 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import multiprocessing
+import os
+import sys
+import time
+import types
+
+import pytest
+
+from airflow.configuration import TEST_DAGS_FOLDER
+from airflow.dag_processing.worker_pool import (
+    DagFileProcessorWorkerPool,
+    PooledDagFileProcessorProcess,
+    _unload_modules,
+)
+from tests.test_utils.config import conf_vars
+from tests.test_utils.db import clear_db_dags, clear_db_serialized_dags
+
+TEST_DAG_FILE = os.path.join(TEST_DAGS_FOLDER, "test_example_bash_operator.py")
+
+pytestmark = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="fork is required"
+)
+
+
+def _process(pool, file_path=TEST_DAG_FILE):
+    processor = PooledDagFileProcessorProcess(
+        pool,
+        file_path=file_path,
+        pickle_dags=False,
+        dag_ids=[],
+        dag_directory=TEST_DAGS_FOLDER,
+        callback_requests=[],
+    )
+    processor.start()
+    deadline = time.monotonic() + 60
+    while not processor.done:
+        assert time.monotonic() < deadline, "Timed out waiting for the worker"
+        time.sleep(0.05)
+    # Reading the result hands the worker back to the pool
+    assert processor.result == (1, 0)
+    return processor
+
+
+class TestDagFileProcessorWorkerPool:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        clear_db_dags()
+        clear_db_serialized_dags()
+        with conf_vars({("scheduler", "parsing_start_method"): "fork"}):
+            yield
+        clear_db_dags()
+        clear_db_serialized_dags()
+
+    def test_worker_is_reused(self):
+        pool = DagFileProcessorWorkerPool(max_files=10, max_memory_mb=0)
+        try:
+            first = _process(pool)
+            second = _process(pool)
+            assert first.pid == second.pid
+        finally:
+            pool.stop()
+
+    def test_worker_is_recycled_after_max_files(self):
+        pool = DagFileProcessorWorkerPool(max_files=1, max_memory_mb=0)
+        try:
+            first = _process(pool)
+            assert not first._worker.process.is_alive()
+            second = _process(pool)
+            assert first.pid != second.pid
+        finally:
+            pool.stop()
+
+    def test_killed_worker_is_replaced(self):
+        pool = DagFileProcessorWorkerPool(max_files=10, max_memory_mb=0)
+        try:
+            first = _process(pool)
+            pool._idle_workers[0].process.kill()
+            pool._idle_workers[0].process.join()
+            second = _process(pool)
+            assert first.pid != second.pid
+        finally:
+            pool.stop()
+
+    def test_stop(self):
+        pool = DagFileProcessorWorkerPool(max_files=10, max_memory_mb=0)
+        processor = _process(pool)
+        pool.stop()
+        assert not processor._worker.process.is_alive()
+
+
+def test_unload_modules(tmp_path):
+    local_module = types.ModuleType("local_helper")
+    local_module.__file__ = str(tmp_path / "local_helper.py")
+    sys.modules["local_helper"] = local_module
+    try:
+        _unload_modules({"local_helper", "os"}, str(tmp_path))
+        assert "local_helper" not in sys.modules
+        assert "os" in sys.modules
+    finally:
+        sys.modules.pop("local_helper", None)
@@ -18,13 +18,23 @@
 from __future__ import annotations
 
 import datetime
+import os
 import subprocess
+import sys
 from unittest import mock
 
+import pytest
+
 from airflow import settings
+from airflow.cli.cli_parser import get_parser
 from airflow.exceptions import AirflowException
-from airflow.executors.local_executor import LocalExecutor
+from airflow.executors.local_executor import LocalExecutor, WarmQueuedLocalWorker
 from airflow.utils.state import State
+from tests.test_utils.config import conf_vars
+
+TEST_DAG_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "dags", "test_example_bash_operator.py"
+)
 
 
 class TestLocalExecutor:
@@ -125,6 +135,83 @@ class TestLocalExecutor:
     def test_execution_limited_parallelism_fork(self):
         self.execution_parallelism_fork(parallelism=2)
 
+    @mock.patch.object(settings, "EXECUTE_TASKS_NEW_PYTHON_INTERPRETER", False)
+    @mock.patch("airflow.cli.commands.task_command.task_run")
+    @conf_vars({("core", "local_executor_dag_cache_size"): "4"})
+    def test_execution_warm_workers(self, mock_run):
+        command = ["airflow", "tasks", "run", "test_example_bash_operator", "runme_0", "2020-10-07"]
+        success_command = [*command, "--subdir", TEST_DAG_FILE]
+        fail_command = command
+
+        def fake_task_run(args, dag=None):
+            # The task only gets the DAG from the worker when its DAG file is given
+            if dag is None or dag.dag_id != args.dag_id:
+                raise AirflowException("Simulate failed task")
+
+        mock_run.side_effect = fake_task_run
+
+        self._test_execute(2, success_command, fail_command)
+
+    @conf_vars({("core", "local_executor_dag_cache_size"): "4"})
+    def test_warm_workers_require_parallelism(self):
+        with pytest.raises(AirflowException, match="requires parallelism"):
+            LocalExecutor(parallelism=0)
+
+    def test_warm_worker_caches_dag_files(self, tmp_path):
+        dag_file = tmp_path / "dag.py"
+        dag_file.write_text(open(TEST_DAG_FILE).read())
+        worker = WarmQueuedLocalWorker(mock.MagicMock(), mock.MagicMock(), dag_cache_size=1)
+        args = get_parser().parse_args(
+            ["tasks", "run", "test_example_bash_operator", "runme_0", "2020-10-07", "--subdir", str(dag_file)]
+        )
+
+        with mock.patch("airflow.models.dagbag.DagBag.process_file", autospec=True) as mock_process_file:
+            mock_process_file.side_effect = lambda dagbag, *args, **kwargs: []
+            worker._get_dag(args)
+            worker._get_dag(args)
+            assert mock_process_file.call_count == 1
+
+            # Parsed again once the DAG file changed
+            os.utime(dag_file, (0, 0))
+            worker._get_dag(args)
+            assert mock_process_file.call_count == 2
+            assert len(worker.dagbags) == 1
+
+        os.utime(dag_file, (1, 1))
+        dag = worker._get_dag(args)
+        assert dag.dag_id == "test_example_bash_operator"
+        assert worker._get_dag(args) is dag
+        args.dag_id = "missing"
+        assert worker._get_dag(args) is None
+
+    def test_warm_worker_reloads_changed_dag_folder_modules(self, tmp_path, monkeypatch):
+        monkeypatch.syspath_prepend(str(tmp_path))
+        helper_file = tmp_path / "warm_worker_helper.py"
+        helper_file.write_text('VALUE = "v1"\n')
+        dag_file = tmp_path / "dag.py"
+        dag_file.write_text(
+            "from datetime import datetime\n"
+            "from warm_worker_helper import VALUE\n"
+            "from airflow.models.dag import DAG\n"
+            "dag = DAG(f'warm_worker_{VALUE}', start_date=datetime(2023, 1, 1))\n"
+        )
+        worker = WarmQueuedLocalWorker(mock.MagicMock(), mock.MagicMock(), dag_cache_size=2)
+        args = get_parser().parse_args(
+            ["tasks", "run", "warm_worker_v1", "task", "2020-10-07", "--subdir", str(dag_file)]
+        )
+        try:
+            assert worker._get_dag(args).dag_id == "warm_worker_v1"
+            assert "warm_worker_helper" in worker.dag_folder_modules
+
+            # Only the helper changes, the DAG file is parsed again with its new version
+            helper_file.write_text('VALUE = "v2"\n')
+            os.utime(helper_file, (0, 0))
+            args.dag_id = "warm_worker_v2"
+            assert worker._get_dag(args).dag_id == "warm_worker_v2"
+            assert len(worker.dagbags) == 1
+        finally:
+            sys.modules.pop("warm_worker_helper", None)
+
     @mock.patch("airflow.executors.local_executor.LocalExecutor.sync")
     @mock.patch("airflow.executors.base_executor.BaseExecutor.trigger_tasks")
     @mock.patch("airflow.executors.base_executor.Stats.gauge")
@@ -73,6 +73,7 @@ from tests.test_utils.db import (
     clear_db_jobs,
     clear_db_pools,
     clear_db_runs,
+    clear_db_scheduler_partitions,
     clear_db_serialized_dags,
     clear_db_sla_miss,
     set_default_pool_slots,
@@ -131,6 +132,7 @@ class TestSchedulerJob:
         clear_db_import_errors()
         clear_db_jobs()
         clear_db_datasets()
+        clear_db_scheduler_partitions()
         # DO NOT try to run clear_db_serialized_dags() here - this will break the tests
         # The tests expect DAGs to be fully loaded here via setUpClass method below
 
@@ -622,6 +624,104 @@ class TestSchedulerJob:
         assert tis[3].key in res_keys
         session.rollback()
 
+    @conf_vars({("scheduler", "use_concurrency_ledger"): "True"})
+    def test_find_executable_task_instances_pool_with_concurrency_ledger(self, dag_maker, session):
+        dag_id = "SchedulerJobTest.test_find_executable_task_instances_pool_with_concurrency_ledger"
+        with dag_maker(dag_id=dag_id, max_active_tasks=16, session=session):
+            EmptyOperator(task_id="dummy", pool="a")
+
+        scheduler_job = Job()
+        self.job_runner = SchedulerJobRunner(job=scheduler_job, subdir=os.devnull)
+        assert self.job_runner._concurrency_ledger is not None
+
+        dr1 = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED)
+        dr2 = dag_maker.create_dagrun_after(dr1, run_type=DagRunType.SCHEDULED)
+        ti1 = dr1.get_task_instance("dummy", session=session)
+        ti2 = dr2.get_task_instance("dummy", session=session)
+        ti1.state = State.SCHEDULED
+        ti2.state = State.SCHEDULED
+        session.add(Pool(pool="a", slots=1, description="haha", include_deferred=False))
+        session.flush()
+
+        res = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+        session.flush()
+        assert [ti.key for ti in res] == [ti1.key]
+
+        # The ledger now knows the pool is full, without looking at the task instance table again
+        with mock.patch.object(self.job_runner._concurrency_ledger, "reconcile") as reconcile:
+            assert self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session) == []
+            reconcile.assert_not_called()
+
+        # Releasing the slot in the ledger lets the next task instance through
+        self.job_runner._concurrency_ledger.discard(ti1.key)
+        res = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+        assert [ti.key for ti in res] == [ti2.key]
+        session.rollback()
+
+    @conf_vars({("scheduler", "use_concurrency_ledger"): "True"})
+    def test_concurrency_ledger_updated_from_executor_events(self, dag_maker, session):
+        with dag_maker(dag_id="test_concurrency_ledger_updated_from_executor_events", session=session):
+            EmptyOperator(task_id="dummy")
+
+        dr = dag_maker.create_dagrun()
+        ti = dr.get_task_instance("dummy", session=session)
+        ti.state = State.QUEUED
+        session.flush()
+
+        scheduler_job = Job(executor=MockExecutor(do_update=False))
+        self.job_runner = SchedulerJobRunner(job=scheduler_job, subdir=os.devnull)
+        self.job_runner.processor_agent = mock.MagicMock()
+        ledger = self.job_runner._concurrency_ledger
+        ledger.reconcile(session=session)
+        assert ledger.slots_by_pool_state() == [(ti.pool, TaskInstanceState.QUEUED, 1)]
+        assert ledger.concurrency_map().dag_active_tasks_map[ti.dag_id] == 1
+
+        scheduler_job.executor.event_buffer[ti.key] = TaskInstanceState.RUNNING, None
+        self.job_runner._process_executor_events(session=session)
+        assert ledger.slots_by_pool_state() == [(ti.pool, TaskInstanceState.RUNNING, 1)]
+
+        ti.state = State.SUCCESS
+        session.flush()
+        scheduler_job.executor.event_buffer[ti.key] = TaskInstanceState.SUCCESS, None
+        self.job_runner._process_executor_events(session=session)
+        assert ledger.slots_by_pool_state() == []
+        assert ledger.concurrency_map().dag_active_tasks_map[ti.dag_id] == 0
+
+    @conf_vars({("scheduler", "use_concurrency_ledger"): "True"})
+    def test_concurrency_ledger_keeps_deferred_tasks_in_include_deferred_pool(self, dag_maker, session):
+        dag_id = "test_concurrency_ledger_keeps_deferred_tasks_in_include_deferred_pool"
+        with dag_maker(dag_id=dag_id, max_active_tasks=16, session=session):
+            EmptyOperator(task_id="dummy", pool="a")
+
+        scheduler_job = Job(executor=MockExecutor(do_update=False))
+        self.job_runner = SchedulerJobRunner(job=scheduler_job, subdir=os.devnull)
+        self.job_runner.processor_agent = mock.MagicMock()
+        ledger = self.job_runner._concurrency_ledger
+
+        dr1 = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED)
+        dr2 = dag_maker.create_dagrun_after(dr1, run_type=DagRunType.SCHEDULED)
+        ti1 = dr1.get_task_instance("dummy", session=session)
+        ti2 = dr2.get_task_instance("dummy", session=session)
+        ti1.state = State.RUNNING
+        ti2.state = State.SCHEDULED
+        session.add(Pool(pool="a", slots=1, description="haha", include_deferred=True))
+        session.flush()
+        ledger.reconcile(session=session)
+
+        # The process of the task exits successfully once the task deferred
+        ti1.state = State.DEFERRED
+        session.flush()
+        scheduler_job.executor.event_buffer[ti1.key] = TaskInstanceState.SUCCESS, None
+        self.job_runner._process_executor_events(session=session)
+        assert ledger.slots_by_pool_state() == [("a", TaskInstanceState.DEFERRED, 1)]
+        assert ledger.concurrency_map().dag_active_tasks_map[dag_id] == 0
+
+        # The deferred task still occupies the only slot of the pool
+        with mock.patch.object(ledger, "reconcile") as reconcile:
+            assert self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session) == []
+            reconcile.assert_not_called()
+        session.rollback()
+
     @pytest.mark.parametrize(
         "state, total_executed_ti",
         [
@@ -3772,6 +3872,72 @@ class TestSchedulerJob:
         assert dag_model.next_dagrun == DEFAULT_DATE + timedelta(days=1)
         session.rollback()
 
+    @conf_vars({("scheduler", "num_dag_partitions"): "2"})
+    def test_dag_partitions_limit_dagruns_to_examine(self, dag_maker, session):
+        """With DAG partitioning, the scheduler only examines runs of the DAGs in its own partitions"""
+        from airflow.models.scheduler_partition import SchedulerPartition
+
+        dag_ids = ["partition_dag_1", "partition_dag_2", "partition_dag_3", "partition_dag_4"]
+        dag_runs = {}
+        for dag_id in dag_ids:
+            with dag_maker(dag_id=dag_id, session=session):
+                EmptyOperator(task_id="dummy")
+            dag_runs[dag_id] = dag_maker.create_dagrun()
+        session.flush()
+
+        scheduler_job = Job(job_type="SchedulerJob", state=State.RUNNING)
+        session.add(scheduler_job)
+        session.flush()
+        self.job_runner = SchedulerJobRunner(job=scheduler_job, subdir=os.devnull)
+
+        # Another live scheduler already holds one of the two partitions
+        other_job = Job(job_type="SchedulerJob", state=State.RUNNING)
+        session.add(other_job)
+        session.flush()
+        taken_partition = SchedulerPartition(1)
+        taken_partition.scheduler_job_id = other_job.id
+        session.add_all([SchedulerPartition(0), taken_partition])
+        session.commit()
+
+        self.job_runner._rebalance_dag_partitions(session=session)
+        assert self.job_runner._dag_partitions == {0}
+
+        # DAGs created after the rebalance are filtered by their partition as well
+        with dag_maker(dag_id="partition_dag_8", session=session):
+            EmptyOperator(task_id="dummy")
+        dag_maker.create_dagrun()
+        session.flush()
+
+        expected = {"partition_dag_1", "partition_dag_2", "partition_dag_3", "partition_dag_8"}
+        runs = self.job_runner._get_next_dagruns_to_examine(DagRunState.RUNNING, session).all()
+        assert {run.dag_id for run in runs} == expected
+        session.rollback()
+
+    @conf_vars({("scheduler", "num_dag_partitions"): "2"})
+    def test_rebalance_dag_partitions_inserted_concurrently(self, session):
+        """Schedulers starting together on an empty table insert the same partitions without failing"""
+        from airflow.models.scheduler_partition import SchedulerPartition
+
+        scheduler_job = Job(job_type="SchedulerJob", state=State.RUNNING)
+        session.add(scheduler_job)
+        session.commit()
+        self.job_runner = SchedulerJobRunner(job=scheduler_job, subdir=os.devnull)
+
+        insert_partitions = SchedulerPartition._insert_partitions
+
+        def insert_after_other_scheduler(partition_ids, *, session):
+            # Another scheduler inserts the same partitions between the check and the insert
+            other_session = settings.Session.session_factory()
+            other_session.add_all(SchedulerPartition(partition_id) for partition_id in partition_ids)
+            other_session.commit()
+            other_session.close()
+            insert_partitions(partition_ids, session=session)
+
+        with mock.patch.object(SchedulerPartition, "_insert_partitions", insert_after_other_scheduler):
+            self.job_runner._rebalance_dag_partitions(session=session)
+        assert self.job_runner._dag_partitions == {0, 1}
+        assert session.query(SchedulerPartition).count() == 2
+
     @conf_vars({("scheduler", "use_job_schedule"): "false"})
     def test_do_schedule_max_active_runs_dag_timed_out(self, dag_maker):
         """Test that tasks are set to a finished state when their DAG times out"""
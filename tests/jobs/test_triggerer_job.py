@@ -21,16 +21,22 @@ import asyncio
 import datetime
 import importlib
 import time
-from threading import Thread
-from unittest.mock import MagicMock, patch
+from threading import Lock, Thread
+from unittest.mock import MagicMock, call, patch
 
 import pendulum
 import pytest
 
 from airflow import DAG
 from airflow.config_templates import airflow_local_settings
+from airflow.exceptions import AirflowConfigException
 from airflow.jobs.job import Job
-from airflow.jobs.triggerer_job_runner import TriggererJobRunner, TriggerRunner, setup_queue_listener
+from airflow.jobs.triggerer_job_runner import (
+    ShardedTriggerRunner,
+    TriggererJobRunner,
+    TriggerRunner,
+    setup_queue_listener,
+)
 from airflow.logging_config import configure_logging
 from airflow.models import DagModel, DagRun, TaskInstance, Trigger
 from airflow.models.baseoperator import BaseOperator
@@ -46,6 +52,7 @@ from airflow.utils.session import create_session
 from airflow.utils.state import State, TaskInstanceState
 from airflow.utils.types import DagRunType
 from tests.core.test_logging_config import reset_logging
+from tests.test_utils.config import conf_vars
 from tests.test_utils.db import clear_db_dags, clear_db_runs
 
 
@@ -285,6 +292,139 @@ class TestTriggerRunner:
             await trigger_runner.run_trigger(1, mock_trigger)
         assert "Trigger cancelled due to timeout" in caplog.text
 
+    @pytest.mark.asyncio
+    @patch("airflow.jobs.triggerer_job_runner.TriggerRunner.set_individual_trigger_logging")
+    async def test_coalesce_identical_triggers(self, mock_set_logging) -> None:
+        with conf_vars({("triggerer", "coalesce_triggers"): "True"}):
+            trigger_runner = TriggerRunner()
+        later = timezone.utcnow() + datetime.timedelta(days=1)
+        soon = timezone.utcnow() + datetime.timedelta(seconds=0.5)
+        for trigger_id, moment in [(1, later), (2, later), (3, soon), (4, soon), (5, later)]:
+            trigger = DateTimeTrigger(moment)
+            trigger.task_instance = MagicMock(trigger_timeout=None)
+            trigger_runner.to_create.append((trigger_id, trigger))
+        timer_loop = asyncio.create_task(trigger_runner.run_timers())
+        await trigger_runner.create_triggers()
+
+        tasks = {trigger_id: details["task"] for trigger_id, details in trigger_runner.triggers.items()}
+        assert tasks[1] is tasks[2] is tasks[5]
+        assert tasks[3] is tasks[4]
+        assert tasks[1] is not tasks[3]
+
+        # Cancelling some of the identical triggers keeps their coroutine running for the others
+        trigger_runner.to_cancel.extend([1, 5])
+        await trigger_runner.cancel_triggers()
+        await asyncio.sleep(1.5)
+        assert not tasks[2].cancelled()
+        assert sorted(trigger_runner.triggers) == [2, 3, 4]
+
+        # The event of the coroutine is sent to all the triggers sharing it
+        await trigger_runner.cleanup_finished_triggers()
+        assert sorted(trigger_runner.events) == [(3, TriggerEvent(soon)), (4, TriggerEvent(soon))]
+        assert sorted(trigger_runner.triggers) == [2]
+        assert not trigger_runner.failed_triggers
+
+        # Cancelling the last one stops the coroutine
+        trigger_runner.to_cancel.append(2)
+        await trigger_runner.cancel_triggers()
+        await asyncio.sleep(0.1)
+        await trigger_runner.cleanup_finished_triggers()
+        assert tasks[2].cancelled()
+        assert not trigger_runner.triggers
+        assert not trigger_runner.coalesced_triggers
+        trigger_runner.stop = True
+        await timer_loop
+
+    @pytest.mark.asyncio
+    @patch("airflow.jobs.triggerer_job_runner.TriggerRunner.set_individual_trigger_logging")
+    async def test_no_coalescing_with_triggers_which_fired(self, mock_set_logging) -> None:
+        with conf_vars({("triggerer", "coalesce_triggers"): "True"}):
+            trigger_runner = TriggerRunner()
+        trigger_runner.triggers = {
+            1: {"task": MagicMock(**{"done.return_value": False}), "name": "1", "events": 1}
+        }
+        trigger = DateTimeTrigger(timezone.utcnow() + datetime.timedelta(days=1))
+        trigger.task_instance = MagicMock()
+        trigger_runner.coalesced_triggers = {trigger_runner.get_coalescing_key(trigger): {1}}
+        trigger_runner.to_create.append((2, trigger))
+        await trigger_runner.create_triggers()
+
+        assert trigger_runner.triggers[2]["task"] is not trigger_runner.triggers[1]["task"]
+        trigger_runner.triggers[2]["task"].cancel()
+
+    @pytest.mark.parametrize(
+        "trigger, expected",
+        [
+            (DateTimeTrigger(timezone.utcnow()), True),
+            (TimeDeltaTrigger(datetime.timedelta(hours=1)), True),
+            (TimeDeltaTrigger_(datetime.timedelta(hours=1), "/dev/null"), False),
+            (SuccessTrigger(), False),
+        ],
+    )
+    def test_is_timer(self, trigger, expected):
+        assert TriggerRunner.is_timer(trigger) is expected
+
+    @pytest.mark.asyncio
+    async def test_timers_fire_in_batches(self) -> None:
+        trigger_runner = TriggerRunner()
+        earlier = timezone.utcnow() - datetime.timedelta(seconds=1)
+        later = timezone.utcnow() + datetime.timedelta(days=1)
+        for trigger_id, moment in [(1, later), (2, earlier), (3, earlier), (4, earlier)]:
+            trigger = DateTimeTrigger(moment)
+            trigger.task_instance = MagicMock()
+            trigger_runner.to_create.append((trigger_id, trigger))
+        await trigger_runner.create_triggers()
+        # No coroutine per trigger, just a future resolved by the timer loop
+        assert all(not isinstance(d["task"], asyncio.Task) for d in trigger_runner.triggers.values())
+        trigger_runner.to_cancel.append(4)
+        await trigger_runner.cancel_triggers()
+
+        timer_loop = asyncio.create_task(trigger_runner.run_timers())
+        await asyncio.sleep(0.1)
+        trigger_runner.stop = True
+        await timer_loop
+        await trigger_runner.cleanup_finished_triggers()
+
+        assert list(trigger_runner.events) == [(2, TriggerEvent(earlier)), (3, TriggerEvent(earlier))]
+        assert list(trigger_runner.triggers) == [1]
+        assert not trigger_runner.failed_triggers
+        assert [timer[:2] for timer in trigger_runner.timers] == [(later, 1)]
+
+    @pytest.mark.asyncio
+    @patch("airflow.jobs.triggerer_job_runner.LOAD_MEASUREMENT_WINDOW", 0.5)
+    async def test_block_watchdog_measures_load(self) -> None:
+        trigger_runner = TriggerRunner()
+        watchdog = asyncio.create_task(trigger_runner.block_watchdog())
+        await asyncio.sleep(0.6)
+        assert trigger_runner.load < 0.5
+        # Block the event loop for most of the next window
+        time.sleep(0.4)
+        await asyncio.sleep(0.2)
+        trigger_runner.stop = True
+        await watchdog
+        assert trigger_runner.load > 0.6
+
+    def test_uvloop(self):
+        uvloop = pytest.importorskip("uvloop")
+        with conf_vars({("triggerer", "use_uvloop"): "True"}):
+            trigger_runner = TriggerRunner()
+        loops = []
+
+        async def arun():
+            loops.append(asyncio.get_running_loop())
+
+        with patch.object(trigger_runner, "arun", arun):
+            trigger_runner.run()
+        assert isinstance(loops[0], uvloop.Loop)
+        assert loops[0].is_closed()
+        # The event loop policy of the process is unchanged
+        assert not isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy)
+
+    def test_uvloop_not_installed(self):
+        with patch.dict("sys.modules", {"uvloop": None}), conf_vars({("triggerer", "use_uvloop"): "True"}):
+            with pytest.raises(AirflowConfigException, match="requires the uvloop package"):
+                TriggerRunner()
+
     @patch("airflow.models.trigger.Trigger.bulk_fetch")
     @patch(
         "airflow.jobs.triggerer_job_runner.TriggerRunner.get_trigger_by_classpath",
@@ -641,6 +781,174 @@ def test_invalid_trigger(session, dag_maker):
     assert task_instance.next_kwargs["traceback"][-1] == "ModuleNotFoundError: No module named 'fake'\n"
 
 
+def _wait_for(condition, message):
+    # Child processes take longer to start than threads
+    for _ in range(100):
+        if condition():
+            return
+        time.sleep(0.1)
+    pytest.fail(message)
+
+
+class TestShardedTriggerRunner:
+    @pytest.fixture
+    def job_runner(self):
+        with conf_vars({("triggerer", "event_loop_processes"): "2"}):
+            job_runner = TriggererJobRunner(Job())
+        assert isinstance(job_runner.trigger_runner, ShardedTriggerRunner)
+        job_runner.trigger_runner.daemon = True
+        yield job_runner
+        # We always have to stop the runner
+        job_runner.trigger_runner.stop = True
+        job_runner.trigger_runner.join(30)
+        assert not any(shard.process.is_alive() for shard in job_runner.trigger_runner.shards)
+
+    def test_trigger_lifecycle(self, session, job_runner):
+        """Checks that triggers run in a shard, and are cancelled when they vanish from the database."""
+        trigger = TimeDeltaTrigger(datetime.timedelta(days=7))
+        dag_model, run, trigger_orm, task_instance = create_trigger_in_db(session, trigger)
+        job_runner.load_triggers()
+        job_runner.trigger_runner.start()
+
+        _wait_for(lambda: job_runner.trigger_runner.triggers, "The shards never created the trigger")
+        assert list(job_runner.trigger_runner.triggers) == [1]
+        assert job_runner.trigger_runner.shards[0].trigger_ids == {1}
+
+        session.delete(trigger_orm)
+        session.commit()
+        job_runner.load_triggers()
+        _wait_for(lambda: not job_runner.trigger_runner.triggers, "The shards never deleted the trigger")
+        assert not job_runner.trigger_runner.events
+        assert not job_runner.trigger_runner.failed_triggers
+
+    def test_trigger_firing_and_failing(self, session, dag_maker, job_runner):
+        """Checks that the events and failures of the triggers are sent back by the shards."""
+        with dag_maker(dag_id="test_sharded_triggers", session=session):
+            EmptyOperator(task_id="success")
+            EmptyOperator(task_id="failure")
+        dr = dag_maker.create_dagrun()
+        for trigger_id, task_id, trigger in [
+            (1, "success", SuccessTrigger()),
+            (2, "failure", FailureTrigger()),
+        ]:
+            trigger_orm = Trigger.from_object(trigger)
+            trigger_orm.id = trigger_id
+            session.add(trigger_orm)
+            task_instance = dr.get_task_instance(task_id, session=session)
+            task_instance.state = TaskInstanceState.DEFERRED
+            task_instance.trigger_id = trigger_id
+        session.commit()
+        job_runner.load_triggers()
+        job_runner.trigger_runner.start()
+
+        _wait_for(
+            lambda: job_runner.trigger_runner.events and job_runner.trigger_runner.failed_triggers,
+            "The shards never sent the event and the failure",
+        )
+        assert list(job_runner.trigger_runner.events) == [(1, TriggerEvent(True))]
+        [(trigger_id, exc)] = job_runner.trigger_runner.failed_triggers
+        assert trigger_id == 2
+        assert isinstance(exc, ValueError)
+        # Both triggers were spread over the shards, and are done
+        _wait_for(lambda: not job_runner.trigger_runner.triggers, "The shards never cleaned the triggers")
+        assert [shard.trigger_ids for shard in job_runner.trigger_runner.shards] == [set(), set()]
+
+    def test_unpicklable_trigger_fails_alone(self, session, job_runner):
+        """Checks that a trigger which cannot be sent to a shard fails, without stopping the others."""
+        create_trigger_in_db(session, TimeDeltaTrigger(datetime.timedelta(days=7)))
+        job_runner.load_triggers()
+        unpicklable_trigger = TimeDeltaTrigger(datetime.timedelta(days=7))
+        unpicklable_trigger.lock = Lock()
+        job_runner.trigger_runner.to_create.append((2, unpicklable_trigger))
+        job_runner.trigger_runner.start()
+
+        _wait_for(
+            lambda: job_runner.trigger_runner.triggers and job_runner.trigger_runner.failed_triggers,
+            "The runner never created the trigger and failed the unpicklable one",
+        )
+        assert list(job_runner.trigger_runner.triggers) == [1]
+        [(trigger_id, exc)] = job_runner.trigger_runner.failed_triggers
+        assert trigger_id == 2
+        assert isinstance(exc, TypeError)
+        assert job_runner.trigger_runner.is_alive()
+
+    @pytest.mark.parametrize("coalesce", [True, False])
+    def test_identical_triggers_are_sent_to_the_same_shard(self, coalesce):
+        """Checks that coalesced identical triggers run in the same shard, and their shard is forgotten."""
+        with conf_vars({("triggerer", "coalesce_triggers"): str(coalesce)}):
+            trigger_runner = ShardedTriggerRunner(num_shards=2)
+        trigger_runner.shards = [MagicMock(index=index, trigger_ids=set()) for index in range(2)]
+        later = timezone.utcnow() + datetime.timedelta(days=1)
+        for trigger_id in range(1, 4):
+            trigger_runner.to_create.append((trigger_id, DateTimeTrigger(later)))
+        with patch.object(ShardedTriggerRunner, "_send"):
+            trigger_runner.dispatch_triggers()
+
+        if coalesce:
+            assert trigger_runner.triggers == {1: 0, 2: 0, 3: 0}
+            assert list(trigger_runner.coalesced_triggers.values()) == [{1, 2, 3}]
+        else:
+            assert trigger_runner.triggers == {1: 0, 2: 1, 3: 0}
+            assert not trigger_runner.coalesced_triggers
+
+        # The shard of the identical triggers is forgotten once they are all done
+        for shard in trigger_runner.shards:
+            trigger_runner._update_shard_state(shard, set(shard.trigger_ids), [], [], 0.0)
+            trigger_runner._update_shard_state(shard, set(), [], [], 0.0)
+        assert not trigger_runner.triggers
+        assert not trigger_runner.coalesced_triggers
+
+    def test_dead_shard_stops_runner(self, job_runner):
+        """Checks that the runner stops, like the thread of TriggerRunner dying, when a shard dies."""
+        job_runner.trigger_runner.start()
+        job_runner.trigger_runner.shards[1].process.kill()
+        job_runner.trigger_runner.join(30)
+        assert not job_runner.trigger_runner.is_alive()
+
+
+@patch("airflow.jobs.triggerer_job_runner.Trigger.submit_events")
+def test_handle_events_in_batches(mock_submit_events):
+    """
+    Checks that the triggerer submits the events of its triggers in batches
+    of at most event_batch_size events.
+    """
+    job = Job()
+    job_runner = TriggererJobRunner(job)
+    job_runner.event_batch_size = 2
+    events = [(i, TriggerEvent(i)) for i in range(5)]
+    job_runner.trigger_runner.events.extend(events)
+
+    job_runner.handle_events()
+
+    assert not job_runner.trigger_runner.events
+    assert mock_submit_events.mock_calls == [call(events[0:2]), call(events[2:4]), call(events[4:5])]
+
+
+@patch("airflow.jobs.triggerer_job_runner.Trigger.assign_unassigned")
+@patch("airflow.jobs.triggerer_job_runner.Trigger.release_excess_triggers", return_value=0)
+@patch("airflow.jobs.triggerer_job_runner.Trigger.ids_for_triggerer", return_value=[])
+def test_load_triggers_releases_excess_triggers(mock_ids, mock_release, mock_assign):
+    """
+    Checks that the triggerer releases triggers over its maximum load at most
+    once per rebalance interval, and passes the maximum load to the assignment.
+    """
+    job = Job()
+    job.id = 1
+    with conf_vars({("triggerer", "max_load"): "0.8"}):
+        job_runner = TriggererJobRunner(job)
+
+    job_runner.load_triggers()
+    mock_release.assert_not_called()
+    job_runner.last_triggers_release -= 60
+    job_runner.load_triggers()
+    job_runner.load_triggers()
+
+    mock_release.assert_called_once_with(1, job_runner.health_check_threshold, 0.8)
+    assert (
+        mock_assign.mock_calls == [call(1, job_runner.capacity, job_runner.health_check_threshold, 0.8)] * 3
+    )
+
+
 @pytest.mark.parametrize("should_wrap", (True, False))
 @patch("airflow.jobs.triggerer_job_runner.configure_trigger_log_handler")
 def test_handler_config_respects_donot_wrap(mock_configure, should_wrap):
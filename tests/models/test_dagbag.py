@@ -806,7 +806,7 @@ class TestDagBag:
             new_serialized_dags_count = session.query(func.count(SerializedDagModel.dag_id)).scalar()
             assert new_serialized_dags_count == 1
 
-    @patch("airflow.models.serialized_dag.SerializedDagModel.write_dag")
+    @patch("airflow.models.serialized_dag.SerializedDAG.to_dict")
     def test_serialized_dag_errors_are_import_errors(self, mock_serialize, caplog):
         """
         Test that errors serializing a DAG are recorded as import_errors in the DB
@@ -831,10 +831,60 @@ class TestDagBag:
             assert "SerializationError" in err
             session.rollback()
 
+    def test_dag_access_control_with_unknown_role_is_import_error(self):
+        """
+        Test that a DAG whose access control names a missing role is recorded as an import error
+        and does not prevent the DAG from being written to the DB
+        """
+        db_clean_up()
+        path = os.path.join(TEST_DAGS_FOLDER, "test_example_bash_operator.py")
+        dagbag = DagBag(dag_folder=path, include_examples=False)
+        dagbag.dags["test_example_bash_operator"].access_control = {"NonExistentRole": {"can_read"}}
+
+        with create_session() as session:
+            dagbag.sync_to_db(session=session)
+
+            assert "NonExistentRole" in dagbag.import_errors[path]
+            assert session.query(DagModel).filter(DagModel.dag_id == "test_example_bash_operator").one()
+            assert (
+                session.query(SerializedDagModel)
+                .filter(SerializedDagModel.dag_id == "test_example_bash_operator")
+                .one()
+            )
+
+    def test_serialized_dag_write_errors_are_import_errors(self):
+        """
+        Test that when the bulk write of the serialized DAGs fails, they are written one by one and only
+        the DAGs failing to be written are recorded as import errors
+        """
+        db_clean_up()
+        path = os.path.join(TEST_DAGS_FOLDER, "test_example_bash_operator.py")
+        dagbag = DagBag(dag_folder=path, include_examples=False)
+        good_dag = dagbag.dags["test_example_bash_operator"]
+        bad_dag = models.DAG("test_serialized_dag_write_error", start_date=tz.datetime(2020, 1, 1))
+        bad_dag.fileloc = path
+        dagbag.bag_dag(bad_dag, root_dag=bad_dag)
+
+        write_serialized_dags = SerializedDagModel.write_serialized_dags
+
+        def _write_serialized_dags(serialized_dags, **kwargs):
+            if any(serialized_dag.dag_id == bad_dag.dag_id for serialized_dag in serialized_dags):
+                raise ValueError("Cannot write this DAG")
+            return write_serialized_dags(serialized_dags, **kwargs)
+
+        with create_session() as session, patch.object(
+            SerializedDagModel, "write_serialized_dags", side_effect=_write_serialized_dags
+        ):
+            dagbag.sync_to_db(session=session)
+
+            assert list(dagbag.import_errors) == [path]
+            assert "Cannot write this DAG" in dagbag.import_errors[path]
+            assert session.query(SerializedDagModel.dag_id).all() == [(good_dag.dag_id,)]
+
     @patch("airflow.models.dagbag.DagBag.collect_dags")
-    @patch("airflow.models.serialized_dag.SerializedDagModel.write_dag")
+    @patch("airflow.models.serialized_dag.SerializedDagModel")
     @patch("airflow.models.dag.DAG.bulk_write_to_db")
-    def test_sync_to_db_is_retried(self, mock_bulk_write_to_db, mock_s10n_write_dag, mock_collect_dags):
+    def test_sync_to_db_is_retried(self, mock_bulk_write_to_db, mock_s10n_model, mock_collect_dags):
         """Test that dagbag.sync_to_db is retried on OperationalError"""
 
         dagbag = DagBag("/dev/null")
@@ -843,6 +893,7 @@ class TestDagBag:
         dagbag.dags["mock_dag"] = mock_dag
 
         op_error = OperationalError(statement=mock.ANY, params=mock.ANY, orig=mock.ANY)
+        mock_s10n_model.write_serialized_dags.return_value = []
 
         # Mock error for the first 2 tries and a successful third try
         side_effect = [op_error, op_error, mock.ANY]
@@ -862,13 +913,12 @@ class TestDagBag:
         )
         # Assert that rollback is called twice (i.e. whenever OperationalError occurs)
         mock_session.rollback.assert_has_calls([mock.call(), mock.call()])
-        # Check that 'SerializedDagModel.write_dag' is also called
-        # Only called once since the other two times the 'DAG.bulk_write_to_db' error'd
-        # and the session was roll-backed before even reaching 'SerializedDagModel.write_dag'
-        mock_s10n_write_dag.assert_has_calls(
-            [
-                mock.call(mock_dag, min_update_interval=mock.ANY, session=mock_session),
-            ]
+        # Check that the DAG is serialized once and 'SerializedDagModel.write_serialized_dags' is
+        # called on each attempt, since the session is roll-backed when 'DAG.bulk_write_to_db' error'd
+        mock_s10n_model.assert_called_once_with(mock_dag)
+        mock_s10n_model.write_serialized_dags.assert_has_calls(
+            [mock.call([mock_s10n_model.return_value], min_update_interval=mock.ANY, session=mock_session)]
+            * 3
         )
 
     @patch("airflow.models.dagbag.settings.MIN_SERIALIZED_DAG_UPDATE_INTERVAL", 5)
@@ -1027,6 +1077,44 @@ class TestDagBag:
         assert set(updated_ser_dag.tags) == {"example", "example2", "new_tag"}
         assert updated_ser_dag_update_time > ser_dag_update_time
 
+    @patch("airflow.models.dagbag.settings.MIN_SERIALIZED_DAG_UPDATE_INTERVAL", 5)
+    @patch("airflow.models.dagbag.settings.MIN_SERIALIZED_DAG_FETCH_INTERVAL", 5)
+    def test_get_dag_checks_all_cached_dags_in_one_query(self):
+        """
+        Test that DagBag.get_dag checks if all the cached DAGs due for a check changed in one query,
+        and only checks unchanged DAGs again after 'min_serialized_dag_fetch_interval' seconds.
+        """
+        example_dags = DagBag(include_examples=True).dags
+        dag_ids = ["example_bash_operator", "example_xcom", "example_python_operator"]
+        with time_machine.travel((tz.datetime(2020, 1, 5, 0, 0, 0)), tick=False):
+            for dag_id in dag_ids:
+                SerializedDagModel.write_dag(dag=example_dags[dag_id])
+            dag_bag = DagBag(read_dags_from_db=True)
+            for dag_id in dag_ids:
+                dag_bag.get_dag(dag_id)
+
+        with time_machine.travel((tz.datetime(2020, 1, 5, 0, 0, 6)), tick=False):
+            example_dags["example_xcom"].tags = ["new_tag"]
+            SerializedDagModel.write_dag(dag=example_dags["example_xcom"])
+            SerializedDagModel.remove_dag("example_python_operator")
+
+        with time_machine.travel((tz.datetime(2020, 1, 5, 0, 0, 8)), tick=False):
+            with assert_queries_count(1):
+                assert dag_bag.get_dag("example_bash_operator").dag_id == "example_bash_operator"
+            # The changed and deleted DAGs were checked along and removed from the bag
+            assert set(dag_bag.dags_last_fetched) == {"example_bash_operator"}
+            assert set(dag_bag.dags_last_checked) == {"example_bash_operator"}
+            # The unchanged DAG was checked already
+            with assert_queries_count(0):
+                dag_bag.get_dag("example_bash_operator")
+            with assert_queries_count(1):
+                assert dag_bag.get_dag("example_xcom").tags == ["new_tag"]
+            assert dag_bag.get_dag("example_python_operator") is None
+
+        with time_machine.travel((tz.datetime(2020, 1, 5, 0, 0, 14)), tick=False):
+            with assert_queries_count(1):
+                dag_bag.get_dag("example_bash_operator")
+
     def test_collect_dags_from_db(self):
         """DAGs are collected from Database"""
         db.clear_db_dags()
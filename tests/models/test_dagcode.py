@@ -158,3 +158,25 @@ class TestDagCode:
                     assert new_result.fileloc == example_dag.fileloc
                     assert new_result.source_code == "# dummy code"
                     assert new_result.last_updated > result.last_updated
+
+    @pytest.mark.parametrize("codec", ["zlib", "zstd", "lz4"])
+    def test_compressed_code(self, codec):
+        """Test that DAG code is compressed with the configured codec, and stays readable with another"""
+        if codec == "zstd":
+            pytest.importorskip("zstandard")
+        elif codec == "lz4":
+            pytest.importorskip("lz4")
+        example_dag = make_example_dags(example_dags_module).get("example_bash_operator")
+        with patch("airflow.models.dagcode.COMPRESS_DAG_CODE", True), patch(
+            "airflow.settings.SERIALIZED_DAG_COMPRESSION_CODEC", codec
+        ):
+            DagCode.bulk_sync_to_db([example_dag.fileloc])
+
+        with create_session() as session:
+            result = session.query(DagCode).filter(DagCode.fileloc == example_dag.fileloc).one()
+            assert result.source_code is None
+            assert result.compression == codec
+            assert result.source_code_compressed
+
+        with open_maybe_zipped(example_dag.fileloc, "r") as source:
+            assert DagCode.code(example_dag.fileloc) == source.read()
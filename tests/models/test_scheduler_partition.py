@@ -0,0 +1,90 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+
+from airflow.jobs.job import Job
+from airflow.models.scheduler_partition import SchedulerPartition
+from airflow.utils import timezone
+from airflow.utils.state import JobState
+from tests.test_utils.db import clear_db_jobs, clear_db_scheduler_partitions
+
+
+class TestSchedulerPartition:
+    @pytest.fixture(autouse=True)
+    def clean_db(self):
+        clear_db_jobs()
+        clear_db_scheduler_partitions()
+        yield
+        clear_db_jobs()
+        clear_db_scheduler_partitions()
+
+    @staticmethod
+    def _scheduler_job(session, heartbeat_age: float = 0) -> Job:
+        job = Job(job_type="SchedulerJob", state=JobState.RUNNING)
+        job.latest_heartbeat = timezone.utcnow() - timedelta(seconds=heartbeat_age)
+        session.add(job)
+        session.flush()
+        return job
+
+    def test_partition_for_dag_is_stable(self):
+        assert SchedulerPartition.partition_for_dag("example_bash_operator", 16) == 6
+        assert all(0 <= SchedulerPartition.partition_for_dag(f"dag_{i}", 4) < 4 for i in range(100))
+
+    def test_single_scheduler_holds_all_partitions(self, session):
+        job = self._scheduler_job(session)
+        owned = SchedulerPartition.rebalance(job.id, 4, health_check_threshold=30, session=session)
+        assert owned == {0, 1, 2, 3}
+
+    def test_rebalance_between_schedulers(self, session):
+        job1 = self._scheduler_job(session)
+        assert SchedulerPartition.rebalance(job1.id, 4, 30, session=session) == {0, 1, 2, 3}
+
+        # A new scheduler only gets partitions once the first one shed its extra partitions
+        job2 = self._scheduler_job(session)
+        assert SchedulerPartition.rebalance(job2.id, 4, 30, session=session) == set()
+        owned1 = SchedulerPartition.rebalance(job1.id, 4, 30, session=session)
+        owned2 = SchedulerPartition.rebalance(job2.id, 4, 30, session=session)
+        assert len(owned1) == len(owned2) == 2
+        assert owned1 | owned2 == {0, 1, 2, 3}
+
+    def test_partitions_of_dead_scheduler_are_taken_over(self, session):
+        dead_job = self._scheduler_job(session, heartbeat_age=60)
+        for partition_id in range(4):
+            partition = SchedulerPartition(partition_id)
+            partition.scheduler_job_id = dead_job.id
+            session.add(partition)
+        session.flush()
+
+        job = self._scheduler_job(session)
+        assert SchedulerPartition.rebalance(job.id, 4, 30, session=session) == {0, 1, 2, 3}
+
+    def test_partition_count_change(self, session):
+        job = self._scheduler_job(session)
+        SchedulerPartition.rebalance(job.id, 4, 30, session=session)
+        assert SchedulerPartition.rebalance(job.id, 2, 30, session=session) == {0, 1}
+        assert session.query(SchedulerPartition).count() == 2
+
+    def test_release(self, session):
+        job = self._scheduler_job(session)
+        SchedulerPartition.rebalance(job.id, 2, 30, session=session)
+        SchedulerPartition.release(job.id, session=session)
+        assert all(p.scheduler_job_id is None for p in session.query(SchedulerPartition))
@@ -23,11 +23,12 @@ from unittest import mock
 import pendulum
 import pytest
 
-from airflow import DAG, Dataset, example_dags as example_dags_module
+from airflow import DAG, Dataset, example_dags as example_dags_module, settings
 from airflow.models import DagBag
 from airflow.models.dagcode import DagCode
-from airflow.models.serialized_dag import SerializedDagModel as SDM
+from airflow.models.serialized_dag import SerializedDagModel as SDM, SerializedDagTaskModel
 from airflow.operators.bash import BashOperator
+from airflow.serialization.json_backend import json_dumps
 from airflow.serialization.serialized_objects import SerializedDAG
 from airflow.settings import json
 from airflow.utils.hashlib_wrapper import md5
@@ -140,6 +141,142 @@ class TestSerializedDagModel:
             assert s_dag.processor_subdir != s_dag_2.processor_subdir
             assert dag_updated is True
 
+    @mock.patch("airflow.models.serialized_dag.SERIALIZED_DAG_CHUNK_MIN_TASKS", 2)
+    def test_write_dag_in_chunks(self):
+        """DAGs with many tasks are stored with one row per task, and read back whole."""
+        example_dags = make_example_dags(example_dags_module)
+        dag = example_dags["example_bash_operator"]
+        assert SDM.write_dag(dag) is True
+
+        with create_session() as session:
+            row = session.get(SDM, dag.dag_id)
+            chunks = session.query(SerializedDagTaskModel).filter_by(dag_id=dag.dag_id).all()
+            assert {chunk.task_id for chunk in chunks} == set(dag.task_ids)
+            assert row.dag_hash == SDM(dag).dag_hash
+            # The hash covers how the DAG is stored, so changing it writes the DAG again
+            with mock.patch("airflow.models.serialized_dag.SERIALIZED_DAG_CHUNK_MIN_TASKS", 0):
+                assert row.dag_hash != SDM(dag).dag_hash
+            assert row.data == json.loads(json.dumps(SerializedDAG.to_dict(dag)))
+            assert set(row.dag.task_dict) == set(dag.task_ids)
+
+        # A DAG with a single task is stored in one row
+        SDM.write_dag(self._make_bash_dag("single_task_dag", ["echo 0"]))
+        assert self._get_task_hashes("single_task_dag") == {}
+        assert set(SDM.get_dag("single_task_dag").task_dict) == {"task_0"}
+
+    @mock.patch("airflow.models.serialized_dag.SERIALIZED_DAG_CHUNK_MIN_TASKS", 2)
+    def test_write_dag_in_chunks_only_writes_changed_tasks(self):
+        """Only the tasks which changed are written again."""
+        SDM.write_dag(self._make_bash_dag("chunked_dag", ["echo 0", "echo 1", "echo 2", "echo 3"]))
+        task_hashes = self._get_task_hashes("chunked_dag")
+
+        dag = self._make_bash_dag("chunked_dag", ["echo 0", "echo changed", "echo 2"])
+        with assert_queries_count(6):
+            # DAG hash check, merge of the DAG, task hashes, delete, task update, DAG update
+            assert SDM.write_dag(dag) is True
+
+        new_task_hashes = self._get_task_hashes("chunked_dag")
+        assert set(new_task_hashes) == {"task_0", "task_1", "task_2"}
+        assert new_task_hashes["task_0"] == task_hashes["task_0"]
+        assert new_task_hashes["task_1"] != task_hashes["task_1"]
+        assert new_task_hashes["task_2"] == task_hashes["task_2"]
+        assert SDM.get_dag("chunked_dag").get_task("task_1").bash_command == "echo changed"
+
+        # Removing the DAG removes its tasks
+        SDM.remove_dag("chunked_dag")
+        assert self._get_task_hashes("chunked_dag") == {}
+
+    @mock.patch("airflow.models.serialized_dag.SERIALIZED_DAG_CHUNK_MIN_TASKS", 2)
+    def test_dag_in_chunks_encodes_tasks_once(self):
+        """The hash of a DAG stored in chunks is derived from the hashes of its tasks."""
+        dag = self._make_bash_dag("chunked_dag", ["echo 0", "echo 1", "echo 2"])
+        with mock.patch("airflow.models.serialized_dag.json_dumps", wraps=json_dumps) as mock_json_dumps:
+            serialized_dag = SDM(dag)
+        # Once for each task and once for the rest of the DAG
+        assert mock_json_dumps.call_count == 4
+        assert all(len(call.args[0]["dag"]["tasks"]) == 3 for call in mock_json_dumps.call_args_list[3:])
+        assert (
+            serialized_dag.dag_hash != SDM(self._make_bash_dag("chunked_dag", ["echo 0", "echo 1"])).dag_hash
+        )
+        changed_dag = self._make_bash_dag("chunked_dag", ["echo 0", "echo changed", "echo 2"])
+        assert serialized_dag.dag_hash != SDM(changed_dag).dag_hash
+
+    @pytest.mark.parametrize("detached", [False, True])
+    @mock.patch("airflow.models.serialized_dag.SERIALIZED_DAG_CHUNK_MIN_TASKS", 2)
+    def test_read_dag_in_chunks_written_again_concurrently(self, detached):
+        """The tasks read always belong to the version of the DAG they are returned with."""
+        SDM.write_dag(self._make_bash_dag("chunked_dag", ["echo 0", "echo 1", "echo 2", "echo 3"]))
+
+        with create_session() as session:
+            row = session.get(SDM, "chunked_dag")
+            if detached:
+                session.expunge(row)
+
+            # The DAG is written again by another session between the read of its row and its tasks
+            other_session = settings.Session.session_factory()
+            dag = self._make_bash_dag("chunked_dag", ["echo 0", "echo changed", "echo 2"])
+            assert SDM.write_dag(dag, session=other_session) is True
+            other_session.commit()
+            other_session.close()
+
+            assert [task["task_id"] for task in row.data["dag"]["tasks"]] == ["task_0", "task_1", "task_2"]
+            assert row.dag.get_task("task_1").bash_command == "echo changed"
+            assert row.dag_hash == SDM(dag).dag_hash
+            if not detached:
+                assert not session.dirty
+
+    @mock.patch("airflow.models.serialized_dag.COMPRESS_SERIALIZED_DAGS", False)
+    @mock.patch("airflow.models.serialized_dag.SERIALIZED_DAG_JSON_BACKEND", "auto")
+    def test_uncompressed_dag_is_encoded_once(self):
+        """Without compression, the DAG is only encoded for its hash, the JSON backend is not used."""
+        dag = self._make_bash_dag("uncompressed_dag", ["echo 0", "echo 1"])
+        with mock.patch(
+            "airflow.models.serialized_dag.json_dumps", wraps=json_dumps
+        ) as mock_json_dumps, mock.patch(
+            "airflow.models.serialized_dag.get_canonical_json_dumps"
+        ) as mock_get_canonical_json_dumps:
+            serialized_dag = SDM(dag)
+        mock_json_dumps.assert_called_once()
+        mock_get_canonical_json_dumps.assert_not_called()
+        assert serialized_dag._data == SerializedDAG.to_dict(dag)
+
+    @staticmethod
+    def _make_bash_dag(dag_id, bash_commands):
+        with DAG(dag_id, start_date=pendulum.datetime(2023, 1, 1)) as dag:
+            for i, bash_command in enumerate(bash_commands):
+                BashOperator(task_id=f"task_{i}", bash_command=bash_command)
+        return dag
+
+    @staticmethod
+    def _get_task_hashes(dag_id):
+        with create_session() as session:
+            return dict(
+                session.query(SerializedDagTaskModel.task_id, SerializedDagTaskModel.task_hash).filter_by(
+                    dag_id=dag_id
+                )
+            )
+
+    @pytest.mark.parametrize("codec, module", [("zstd", "zstandard"), ("lz4", "lz4")])
+    @mock.patch("airflow.models.serialized_dag.COMPRESS_SERIALIZED_DAGS", True)
+    @mock.patch("airflow.models.serialized_dag.SERIALIZED_DAG_CHUNK_MIN_TASKS", 2)
+    def test_compression_codec_is_stored_per_row(self, codec, module):
+        """The codec is stored with each row, so rows written with another codec stay readable."""
+        pytest.importorskip(module)
+        SDM.write_dag(self._make_bash_dag("zlib_dag", ["echo 0", "echo 1"]))
+        with mock.patch("airflow.settings.SERIALIZED_DAG_COMPRESSION_CODEC", codec):
+            SDM.write_dag(self._make_bash_dag("other_codec_dag", ["echo 0", "echo 1"]))
+
+            with create_session() as session:
+                assert session.get(SDM, "zlib_dag").compression == "zlib"
+                assert session.get(SDM, "other_codec_dag").compression == codec
+                chunk_codecs = session.query(
+                    SerializedDagTaskModel.dag_id, SerializedDagTaskModel.compression
+                )
+                assert set(chunk_codecs) == {("zlib_dag", "zlib"), ("other_codec_dag", codec)}
+
+            for dag_id in ("zlib_dag", "other_codec_dag"):
+                assert SDM.get_dag(dag_id).get_task("task_1").bash_command == "echo 1"
+
     def test_read_dags(self):
         """DAGs can be read from database."""
         example_dags = self._write_example_dags()
@@ -176,14 +313,46 @@ class TestSerializedDagModel:
         SDM.remove_deleted_dags(example_dag_files, processor_subdir="/tmp/test")
         assert not SDM.has_dag(dag_removed_by_file.dag_id)
 
+    def test_get_latest_version_hashes_and_updated_datetimes(self):
+        """The versions of several DAGs are read in one query."""
+        example_dags = self._write_example_dags()
+        dag_ids = ["example_bash_operator", "example_xcom", "does_not_exist"]
+        with create_session() as session, assert_queries_count(1):
+            versions = SDM.get_latest_version_hashes_and_updated_datetimes(dag_ids, session=session)
+        assert set(versions) == {"example_bash_operator", "example_xcom"}
+        for dag_id, (dag_hash, last_updated) in versions.items():
+            assert dag_hash == SDM(example_dags[dag_id]).dag_hash
+            assert last_updated == SDM.get_last_updated_datetime(dag_id)
+
     def test_bulk_sync_to_db(self):
         dags = [
             DAG("dag_1"),
             DAG("dag_2"),
             DAG("dag_3"),
         ]
-        with assert_queries_count(10):
+        with assert_queries_count(2):
+            # Select of the stored hashes and upsert
             SDM.bulk_sync_to_db(dags)
+        assert all(SDM.has_dag(dag.dag_id) for dag in dags)
+
+    def test_write_serialized_dags_only_writes_changed_dags(self):
+        """Only the changed DAGs are written, in a single statement, and the others are skipped."""
+        dags = [self._make_bash_dag(f"dag_{i}", ["echo 0"]) for i in range(3)]
+        assert SDM.write_serialized_dags([SDM(dag) for dag in dags]) == ["dag_0", "dag_1", "dag_2"]
+        with assert_queries_count(1):
+            assert SDM.write_serialized_dags([SDM(dag) for dag in dags]) == []
+
+        dags[1] = self._make_bash_dag("dag_1", ["echo changed"])
+        dags.append(self._make_bash_dag("dag_3", ["echo 0"]))
+        with assert_queries_count(2):
+            assert SDM.write_serialized_dags([SDM(dag) for dag in dags]) == ["dag_1", "dag_3"]
+        assert SDM.get_dag("dag_1").get_task("task_0").bash_command == "echo changed"
+        assert SDM.get_latest_version_hash("dag_1") == SDM(dags[1]).dag_hash
+
+        # DAGs updated recently are not written again
+        dags[1] = self._make_bash_dag("dag_1", ["echo changed again"])
+        assert SDM.write_serialized_dags([SDM(dag) for dag in dags], min_update_interval=30) == []
+        assert SDM.get_dag("dag_1").get_task("task_0").bash_command == "echo changed"
 
     @pytest.mark.parametrize("dag_dependencies_fields", [{"dag_dependencies": None}, {}])
     def test_get_dag_dependencies_default_to_empty(self, dag_dependencies_fields):
@@ -20,6 +20,7 @@ import datetime
 
 import pytest
 import pytz
+from sqlalchemy import select
 
 from airflow.jobs.job import Job
 from airflow.jobs.triggerer_job_runner import TriggererJobRunner
@@ -29,6 +30,7 @@ from airflow.triggers.base import TriggerEvent
 from airflow.utils import timezone
 from airflow.utils.session import create_session
 from airflow.utils.state import State
+from tests.test_utils.asserts import assert_queries_count
 
 
 @pytest.fixture
@@ -137,6 +139,76 @@ def test_submit_failure(session, create_task_instance):
     assert updated_task_instance.next_method == "__fail__"
 
 
+def test_submit_events(session, dag_maker):
+    """
+    Tests that events submitted in a batch re-wake the task instances of all
+    their triggers, with the payload of the first event of each trigger.
+    """
+    triggers = [Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={}) for _ in range(3)]
+    session.add_all(triggers)
+    session.flush()
+    with dag_maker(dag_id="test_submit_events", session=session):
+        for i in range(4):
+            EmptyOperator(task_id=f"task_{i}")
+    dr = dag_maker.create_dagrun()
+    # Tasks 0 and 1 wait on the first trigger, task 2 on the second one, task 3 on the third one
+    for task_instance, trigger in zip(
+        sorted(dr.task_instances, key=lambda ti: ti.task_id), [triggers[0], triggers[0], *triggers[1:]]
+    ):
+        task_instance.state = State.DEFERRED
+        task_instance.trigger_id = trigger.id
+    session.commit()
+
+    with assert_queries_count(2):
+        Trigger.submit_events(
+            [
+                (triggers[0].id, TriggerEvent(1)),
+                (triggers[1].id, TriggerEvent(2)),
+                (triggers[0].id, TriggerEvent(3)),
+            ],
+            session=session,
+        )
+    session.flush()
+    session.expunge_all()
+
+    task_instances = {ti.task_id: ti for ti in session.query(TaskInstance)}
+    for task_id, payload in [("task_0", 1), ("task_1", 1), ("task_2", 2)]:
+        assert task_instances[task_id].state == State.SCHEDULED
+        assert task_instances[task_id].next_kwargs == {"event": payload}
+        assert task_instances[task_id].trigger_id is None
+    assert task_instances["task_3"].state == State.DEFERRED
+    assert task_instances["task_3"].trigger_id == triggers[2].id
+
+
+def test_submit_failures(session, dag_maker):
+    """
+    Tests that failures submitted in a batch fail the task instances of all
+    their triggers.
+    """
+    triggers = [Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={}) for _ in range(2)]
+    session.add_all(triggers)
+    session.flush()
+    with dag_maker(dag_id="test_submit_failures", session=session):
+        EmptyOperator(task_id="task_0")
+        EmptyOperator(task_id="task_1")
+    dr = dag_maker.create_dagrun()
+    for task_instance, trigger in zip(sorted(dr.task_instances, key=lambda ti: ti.task_id), triggers):
+        task_instance.state = State.DEFERRED
+        task_instance.trigger_id = trigger.id
+    session.commit()
+
+    Trigger.submit_failures([(triggers[0].id, ValueError("boom")), (triggers[1].id, None)], session=session)
+    session.flush()
+    session.expunge_all()
+
+    task_instances = {ti.task_id: ti for ti in session.query(TaskInstance)}
+    for task_instance in task_instances.values():
+        assert task_instance.state == State.SCHEDULED
+        assert task_instance.next_method == "__fail__"
+    assert task_instances["task_0"].next_kwargs["traceback"][-1] == "ValueError: boom\n"
+    assert task_instances["task_1"].next_kwargs["traceback"] is None
+
+
 def test_assign_unassigned(session, create_task_instance):
     """
     Tests that unassigned triggers of all appropriate states are assigned.
@@ -237,6 +309,122 @@ def test_assign_unassigned(session, create_task_instance):
     )
 
 
+def _create_triggers_with_task_instances(session, dag_maker, triggerer_ids):
+    """Create a trigger and a deferred task instance per triggerer ID, with increasing priority weights."""
+    with dag_maker(dag_id="test_trigger_load", session=session):
+        for i in range(len(triggerer_ids)):
+            EmptyOperator(task_id=f"task_{i}", priority_weight=i + 1)
+    dr = dag_maker.create_dagrun()
+    for i, triggerer_id in enumerate(triggerer_ids):
+        trigger = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={})
+        trigger.triggerer_id = triggerer_id
+        session.add(trigger)
+        session.flush()
+        task_instance = dr.get_task_instance(f"task_{i}", session=session)
+        task_instance.state = State.DEFERRED
+        task_instance.trigger_id = trigger.id
+    session.commit()
+
+
+def _create_triggerer(session, load):
+    triggerer = Job(heartrate=10, state=State.RUNNING)
+    TriggererJobRunner(triggerer)
+    triggerer.load = load
+    session.add(triggerer)
+    session.commit()
+    return triggerer
+
+
+@pytest.mark.parametrize(
+    "idle_load, expected_assigned_to_busy",
+    [
+        pytest.param(0.1, 0, id="idle-triggerer-has-room"),
+        pytest.param(None, 0, id="idle-triggerer-not-measured"),
+        pytest.param(0.95, 4, id="no-triggerer-has-room"),
+    ],
+)
+def test_assign_unassigned_under_load(session, dag_maker, idle_load, expected_assigned_to_busy):
+    """
+    Tests that a triggerer does not take triggers which would put it over the
+    maximum load, unless no other triggerer has room for them.
+    """
+    busy_triggerer = _create_triggerer(session, load=0.75)
+    idle_triggerer = _create_triggerer(session, load=idle_load)
+    _create_triggers_with_task_instances(session, dag_maker, [busy_triggerer.id] * 3 + [None] * 4)
+
+    # Each trigger costs 0.25, so one more would put the busy triggerer over 0.8
+    Trigger.assign_unassigned(busy_triggerer.id, 100, health_check_threshold=30, max_load=0.8)
+    assert len(Trigger.ids_for_triggerer(busy_triggerer.id)) == 3 + expected_assigned_to_busy
+    Trigger.assign_unassigned(idle_triggerer.id, 100, health_check_threshold=30, max_load=0.8)
+    assert len(Trigger.ids_for_triggerer(idle_triggerer.id)) == 4 - expected_assigned_to_busy
+
+
+@pytest.mark.parametrize(
+    "idle_load, expected_released",
+    [
+        pytest.param(None, 2, id="idle-triggerer-not-measured"),
+        pytest.param(0.3, 1, id="idle-triggerer-has-room-for-one"),
+        pytest.param(0.7, 0, id="no-triggerer-has-room"),
+    ],
+)
+def test_release_excess_triggers(session, dag_maker, idle_load, expected_released):
+    """
+    Tests that a triggerer over the maximum load releases the triggers of the
+    lowest priority, as long as other triggerers have room for them.
+    """
+    busy_triggerer = _create_triggerer(session, load=1.0)
+    _create_triggerer(session, load=idle_load)
+    _create_triggers_with_task_instances(session, dag_maker, [busy_triggerer.id] * 4)
+
+    # Each trigger costs 0.25, releasing 2 brings the busy triggerer to 0.5
+    released = Trigger.release_excess_triggers(busy_triggerer.id, health_check_threshold=30, max_load=0.6)
+
+    assert released == expected_released
+    session.expire_all()
+    unassigned = session.scalars(
+        select(TaskInstance.priority_weight)
+        .join(Trigger, Trigger.id == TaskInstance.trigger_id)
+        .where(Trigger.triggerer_id.is_(None))
+    ).all()
+    assert sorted(unassigned) == [1, 2][:expected_released]
+
+
+@pytest.mark.parametrize(
+    "max_load, expected_released",
+    [
+        pytest.param(None, 1, id="default-max-load"),
+        pytest.param(1.0, 1, id="max-load-of-1"),
+    ],
+)
+def test_release_excess_triggers_of_saturated_triggerer(session, dag_maker, max_load, expected_released):
+    """
+    Tests that a saturated triggerer, whose load is 1, releases triggers with the
+    default maximum load, and at least one trigger when the maximum load is 1.
+    """
+    busy_triggerer = _create_triggerer(session, load=1.0)
+    _create_triggerer(session, load=None)
+    _create_triggers_with_task_instances(session, dag_maker, [busy_triggerer.id] * 4)
+    if max_load is None:
+        max_load = TriggererJobRunner(Job()).max_load
+
+    # Each trigger costs 0.25, releasing one brings the busy triggerer under 0.8
+    released = Trigger.release_excess_triggers(
+        busy_triggerer.id, health_check_threshold=30, max_load=max_load
+    )
+
+    assert released == expected_released
+    assert len(Trigger.ids_for_triggerer(busy_triggerer.id)) == 4 - expected_released
+
+
+def test_release_excess_triggers_under_max_load(session, dag_maker):
+    triggerer = _create_triggerer(session, load=0.5)
+    _create_triggerer(session, load=None)
+    _create_triggers_with_task_instances(session, dag_maker, [triggerer.id] * 4)
+
+    assert Trigger.release_excess_triggers(triggerer.id, health_check_threshold=30, max_load=0.6) == 0
+    assert len(Trigger.ids_for_triggerer(triggerer.id)) == 4
+
+
 def test_get_sorted_triggers_same_priority_weight(session, create_task_instance):
     """
     Tests that triggers are sorted by the creation_date if they have the same priority.
@@ -22,6 +22,9 @@ import logging
 import os
 import signal
 import sys
+import time
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta
 from unittest import mock
 
@@ -29,7 +32,7 @@ from unittest import mock
 import celery.contrib.testing.tasks  # noqa: F401
 import pytest
 import time_machine
-from celery import Celery
+from celery import Celery, states as celery_states
 from celery.result import AsyncResult
 from kombu.asynchronous import set_event_loop
 
@@ -274,6 +277,169 @@ class TestCeleryExecutor:
         assert "database_engine_options" in call_args
         assert call_args["database_engine_options"] == {"pool_recycle": 1800}
 
+    @conf_vars({("celery", "sync_state_with_events"): "True"})
+    @mock.patch("airflow.providers.celery.executors.celery_executor.CeleryExecutor.update_all_task_states")
+    def test_sync_updates_task_states_from_events(self, mock_update_all_task_states):
+        executor = celery_executor.CeleryExecutor()
+        executor.task_event_receiver = mock.MagicMock()
+        executor._last_state_reconciliation = time.monotonic()
+        key_1 = TaskInstanceKey("dag", "task_1", "run", 1)
+        key_2 = TaskInstanceKey("dag", "task_2", "run", 1)
+        executor.running = {key_1, key_2}
+        executor.tasks = {key_1: mock.Mock(task_id="231")}
+
+        executor.task_event_receiver.get_events.return_value = [
+            ("231", celery_states.STARTED, None),
+            ("231", celery_states.SUCCESS, None),
+            ("232", celery_states.FAILURE, "error"),
+        ]
+        executor.sync()
+        assert executor.event_buffer == {key_1: (State.SUCCESS, None)}
+        # The task may get its events before it is registered
+        assert executor._unmatched_task_events.keys() == {"232"}
+
+        executor.tasks[key_2] = mock.Mock(task_id="232")
+        executor.task_event_receiver.get_events.return_value = []
+        executor.sync()
+        assert executor.event_buffer[key_2] == (State.FAILED, "error")
+        assert executor.tasks == {}
+        assert not executor._unmatched_task_events
+        mock_update_all_task_states.assert_not_called()
+
+    @pytest.mark.parametrize("interval, reconciled", [(0, True), (3600, False)])
+    @mock.patch("airflow.providers.celery.executors.celery_executor.CeleryExecutor.update_all_task_states")
+    def test_sync_reconciles_task_states_periodically(
+        self, mock_update_all_task_states, interval, reconciled
+    ):
+        with conf_vars(
+            {
+                ("celery", "sync_state_with_events"): "True",
+                ("celery", "state_reconciliation_interval"): str(interval),
+            }
+        ):
+            executor = celery_executor.CeleryExecutor()
+        executor.task_event_receiver = mock.MagicMock(**{"get_events.return_value": []})
+        executor._last_state_reconciliation = time.monotonic()
+        executor.tasks = {TaskInstanceKey("dag", "task_1", "run", 1): mock.Mock(task_id="231")}
+
+        executor.sync()
+        assert mock_update_all_task_states.called == reconciled
+
+    def test_task_event_receiver(self):
+        test_app = Celery("test_task_event_receiver", broker="memory://")
+        with mock.patch.object(celery_executor_utils, "app", test_app):
+            receiver = celery_executor_utils.TaskEventReceiver()
+            receiver.start()
+            try:
+                # The receiver only gets the events sent once it listens
+                while receiver._receiver is None:
+                    time.sleep(0.1)
+                time.sleep(0.5)
+                with test_app.events.default_dispatcher() as dispatcher:
+                    dispatcher.send("task-succeeded", uuid="231", result="None")
+                    dispatcher.send("worker-heartbeat")
+                    dispatcher.send("task-failed", uuid="232", exception="error")
+
+                events: list = []
+                for _ in range(50):
+                    events.extend(receiver.get_events())
+                    if len(events) == 2:
+                        break
+                    time.sleep(0.1)
+            finally:
+                receiver.stop()
+        assert events == [("231", celery_states.SUCCESS, None), ("232", celery_states.FAILURE, "error")]
+        assert not receiver._thread.is_alive()
+
+    @staticmethod
+    def _send_in_future(fn, task_tuples):
+        future: Future = Future()
+        future.set_result(
+            [
+                (key, command, mock.Mock(task_id=key.task_id, state="PENDING"))
+                for key, command, *_ in task_tuples
+            ]
+        )
+        return future
+
+    @conf_vars({("celery", "task_publish_max_in_flight"): "2"})
+    @mock.patch("airflow.providers.celery.executors.celery_executor.CeleryExecutor.update_all_task_states")
+    @mock.patch("airflow.providers.celery.executors.celery_executor_utils.execute_command")
+    def test_send_tasks_in_background(self, mock_execute_command, mock_update_all_task_states):
+        executor = celery_executor.CeleryExecutor()
+        executor._send_pool = mock.MagicMock(**{"submit.side_effect": self._send_in_future})
+        keys = [TaskInstanceKey("dag", f"task_{i}", "run", 1) for i in range(3)]
+        for priority, key in enumerate(keys):
+            executor.queued_tasks[key] = (["airflow", "tasks", "run"], -priority, None, mock.MagicMock())
+
+        executor.trigger_tasks(open_slots=3)
+        # Only two tasks are sent at once, and they stay queued until they are sent
+        assert executor._tasks_being_sent == set(keys[:2])
+        assert executor.queued_tasks.keys() == set(keys)
+        assert executor.slots_available == executor.parallelism - 3
+        num_submissions = executor._send_pool.submit.call_count
+        executor.trigger_tasks(open_slots=3)
+        assert executor._send_pool.submit.call_count == num_submissions
+
+        executor.sync()
+        assert executor.running == set(keys[:2])
+        assert executor.queued_tasks.keys() == {keys[2]}
+        assert executor.event_buffer == {key: (State.QUEUED, key.task_id) for key in keys[:2]}
+
+        executor.trigger_tasks(open_slots=1)
+        assert executor._tasks_being_sent == {keys[2]}
+        executor.end()
+        assert executor.running == set(keys)
+        assert not executor.queued_tasks
+
+    @conf_vars({("celery", "task_publish_max_in_flight"): "2"})
+    @mock.patch("airflow.providers.celery.executors.celery_executor.CeleryExecutor.update_all_task_states")
+    @mock.patch("airflow.providers.celery.executors.celery_executor_utils.execute_command")
+    def test_send_tasks_in_background_with_broken_pool(
+        self, mock_execute_command, mock_update_all_task_states
+    ):
+        executor = celery_executor.CeleryExecutor()
+        broken_future: Future = Future()
+        broken_future.set_exception(BrokenProcessPool())
+        broken_pool = executor._send_pool = mock.MagicMock(**{"submit.return_value": broken_future})
+        key = TaskInstanceKey("dag", "task", "run", 1)
+        executor.queued_tasks[key] = (["airflow", "tasks", "run"], 1, None, mock.MagicMock())
+
+        executor.trigger_tasks(open_slots=1)
+        executor.sync()
+        assert executor.event_buffer == {key: (State.FAILED, None)}
+        assert not executor.queued_tasks
+        broken_pool.shutdown.assert_called_once_with(wait=True)
+        assert executor._send_pool is None
+
+        # The next tasks are sent by a new pool
+        with mock.patch.object(celery_executor, "ProcessPoolExecutor") as mock_pool_executor:
+            mock_pool_executor.return_value.submit.side_effect = self._send_in_future
+            executor.queued_tasks[key] = (["airflow", "tasks", "run"], 1, None, mock.MagicMock())
+            executor.trigger_tasks(open_slots=1)
+            assert executor._send_pool is mock_pool_executor.return_value
+            executor.end()
+        assert executor.running == {key}
+
+    @mock.patch("airflow.providers.celery.executors.celery_executor_utils.ProcessPoolExecutor")
+    def test_bulk_state_fetcher_reuses_processes(self, mock_pool_executor):
+        mock_pool_executor.return_value.map.side_effect = lambda fn, results, chunksize: [
+            (result.task_id, celery_states.SUCCESS, None) for result in results
+        ]
+        fetcher = celery_executor_utils.BulkStateFetcher(2)
+
+        assert fetcher._get_many_using_multiprocessing([mock.Mock(task_id="231")]) == {
+            "231": (celery_states.SUCCESS, None)
+        }
+        assert fetcher._get_many_using_multiprocessing([mock.Mock(task_id="232")]) == {
+            "232": (celery_states.SUCCESS, None)
+        }
+        mock_pool_executor.assert_called_once_with(max_workers=2)
+
+        fetcher.close()
+        mock_pool_executor.return_value.shutdown.assert_called_once()
+        assert fetcher._sync_pool is None
+
 
 def test_operation_timeout_config():
     assert celery_executor_utils.OPERATION_TIMEOUT == 1
@@ -21,6 +21,8 @@ import random
 import re
 import string
 import sys
+import threading
+import time
 from datetime import datetime, timedelta
 from unittest import mock
 
@@ -48,6 +50,7 @@ try:
     from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils import (
         AirflowKubernetesScheduler,
         KubernetesJobWatcher,
+        RateLimiter,
         ResourceVersion,
         create_pod_id,
         get_base_pod_from_template,
@@ -408,6 +411,48 @@ class TestKubernetesExecutor:
             finally:
                 kubernetes_executor.end()
 
+    @pytest.mark.skipif(
+        AirflowKubernetesScheduler is None, reason="kubernetes python package is not installed"
+    )
+    @conf_vars(
+        {
+            ("kubernetes_executor", "worker_pods_creation_batch_size"): "3",
+            ("kubernetes_executor", "worker_pods_creation_parallelism"): "3",
+        }
+    )
+    @mock.patch(
+        "airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils.AirflowKubernetesScheduler.run_next"
+    )
+    @mock.patch("airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils.KubernetesJobWatcher")
+    @mock.patch("airflow.providers.cncf.kubernetes.kube_client.get_kube_client")
+    def test_run_next_concurrently(self, mock_get_kube_client, mock_kubernetes_job_watcher, mock_run_next):
+        # Only passes once the three pods are being created at the same time
+        barrier = threading.Barrier(3, timeout=10)
+
+        def run_next(task):
+            barrier.wait()
+            if task[0].task_id == "task_1":
+                raise ApiException(status=400, reason="BadRequest")
+
+        mock_run_next.side_effect = run_next
+        kubernetes_executor = KubernetesExecutor()
+        kubernetes_executor.job_id = 5
+        kubernetes_executor.start()
+        try:
+            keys = [TaskInstanceKey("dag", f"task_{i}", "run_id", 1) for i in range(3)]
+            for key in keys:
+                kubernetes_executor.execute_async(
+                    key=key, queue=None, command=["airflow", "tasks", "run", "true", "some_parameter"]
+                )
+            kubernetes_executor.sync()
+
+            assert mock_run_next.call_count == 3
+            assert kubernetes_executor.task_queue.empty()
+            assert kubernetes_executor.event_buffer[keys[0]][0] == State.QUEUED
+            assert kubernetes_executor.event_buffer[keys[1]][0] == State.FAILED
+        finally:
+            kubernetes_executor.end()
+
     @mock.patch("airflow.providers.cncf.kubernetes.executors.kubernetes_executor.KubeConfig")
     @mock.patch("airflow.providers.cncf.kubernetes.executors.kubernetes_executor.KubernetesExecutor.sync")
     @mock.patch("airflow.executors.base_executor.BaseExecutor.trigger_tasks")
@@ -1317,6 +1362,18 @@ class TestKubernetesJobWatcher:
         self._run()
         self.assert_watcher_queue_called_once_with_state(State.FAILED)
 
+    def test_process_status_coalesced(self):
+        self.watcher._pending_events_lock = threading.Lock()
+        self.pod.status.phase = "Failed"
+        self.events.append({"type": "MODIFIED", "object": self.pod})
+        self.events.append({"type": "DELETED", "object": self.pod})
+
+        self._run()
+        self.watcher.watcher_queue.put.assert_not_called()
+        # Only the latest event of the pod is forwarded
+        self.watcher._forward_pending_events()
+        self.assert_watcher_queue_called_once_with_state(State.FAILED)
+
     def test_process_status_succeeded(self):
         self.pod.status.phase = "Succeeded"
         self.events.append({"type": "MODIFIED", "object": self.pod})
@@ -1428,3 +1485,12 @@ class TestKubernetesJobWatcher:
                 assert e.args == ("sentinel",)
 
             mock_underscore_run.assert_called_once_with(mock.ANY, "0", mock.ANY, mock.ANY)
+
+
+@pytest.mark.skipif(AirflowKubernetesScheduler is None, reason="kubernetes python package is not installed")
+def test_rate_limiter():
+    rate_limiter = RateLimiter(20)
+    start = time.monotonic()
+    for _ in range(5):
+        rate_limiter.wait()
+    assert time.monotonic() - start >= 0.2
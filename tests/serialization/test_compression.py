@@ -0,0 +1,90 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import zlib
+from unittest import mock
+
+import pytest
+
+from airflow.exceptions import AirflowConfigException, AirflowException
+from airflow.serialization.compression import (
+    ZlibCodec,
+    compress,
+    decompress,
+    get_compression_codec,
+)
+
+DATA = b'{"__version":1,"dag":{"_dag_id":"example","tasks":[]}}' * 20
+
+
+@pytest.fixture(autouse=True)
+def clear_codec_cache():
+    get_compression_codec.cache_clear()
+    yield
+    get_compression_codec.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "codec, module",
+    [("zlib", "zlib"), ("zstd", "zstandard"), ("lz4", "lz4")],
+)
+def test_round_trip(codec, module):
+    pytest.importorskip(module)
+    with mock.patch("airflow.settings.SERIALIZED_DAG_COMPRESSION_CODEC", codec):
+        compressed, name = compress(DATA)
+    assert name == codec
+    assert len(compressed) < len(DATA)
+    assert decompress(compressed, name) == DATA
+
+
+def test_rows_without_codec_are_zlib():
+    assert isinstance(get_compression_codec(None), ZlibCodec)
+    assert decompress(zlib.compress(DATA), None) == DATA
+
+
+def test_custom_codec():
+    assert isinstance(get_compression_codec("airflow.serialization.compression.ZlibCodec"), ZlibCodec)
+    with pytest.raises(AirflowConfigException, match="Cannot import"):
+        get_compression_codec("not_a_module.Codec")
+
+
+def test_missing_package():
+    with mock.patch.dict("sys.modules", {"zstandard": None}):
+        with pytest.raises(AirflowConfigException, match="requires the zstandard package"):
+            get_compression_codec("zstd")
+
+
+def test_zstd_dictionary(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    samples = [
+        b'{"__version":1,"dag":{"_dag_id":"dag_%d","tasks":[{"task_id":"task_%d","pool":"default_pool"}]}}'
+        % (i, i * 7)
+        for i in range(1000)
+    ]
+    dictionary_path = tmp_path / "dictionary"
+    dictionary_path.write_bytes(zstandard.train_dictionary(1024, samples).as_bytes())
+
+    codec = get_compression_codec("zstd", str(dictionary_path))
+    compressed = codec.compress(samples[0])
+    assert len(compressed) < len(get_compression_codec("zstd").compress(samples[0]))
+    assert codec.decompress(compressed) == samples[0]
+
+    # The dictionary is needed to decompress
+    with pytest.raises(AirflowException, match="compressed with the zstd dictionary"):
+        get_compression_codec("zstd").decompress(compressed)
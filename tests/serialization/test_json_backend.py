@@ -0,0 +1,108 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from unittest import mock
+
+import pytest
+
+from airflow.exceptions import AirflowConfigException
+from airflow.models.dag import DAG
+from airflow.models.dagbag import DagBag
+from airflow.models.serialized_dag import SerializedDagModel
+from airflow.serialization.enums import Encoding
+from airflow.serialization.json_backend import get_canonical_json_dumps, json_dumps, orjson_dumps
+from airflow.serialization.serialized_objects import SerializedDAG
+
+
+@pytest.fixture(autouse=True)
+def clear_backend_cache():
+    get_canonical_json_dumps.cache_clear()
+    yield
+    get_canonical_json_dumps.cache_clear()
+
+
+def test_json_dumps_is_canonical():
+    assert json_dumps({"b": [1, 2.5, None], "a": {"é": True}}) == '{"a":{"é":true},"b":[1,2.5,null]}'.encode()
+
+
+def test_orjson_dumps_matches_json_dumps():
+    pytest.importorskip("orjson")
+    dagbag = DagBag("/dev/null", include_examples=True, read_dags_from_db=False)
+    for dag in dagbag.dags.values():
+        serialized_dag = SerializedDAG.to_dict(dag)
+        assert orjson_dumps(serialized_dag) == json_dumps(serialized_dag), dag.dag_id
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        pytest.param({"a": 1e20, "b": 1.5e-7, "c": 1e-5, "d": 0.1}, id="floats"),
+        pytest.param({"a": float("nan"), "b": None}, id="nan"),
+        pytest.param({"a": [float("inf"), float("-inf")]}, id="infinity"),
+        pytest.param({"a": "\ud800"}, id="lone-surrogate"),
+    ],
+)
+def test_orjson_dumps_loads_back_and_dag_hash_ignores_backend(obj):
+    pytest.importorskip("orjson")
+    # The backends may format floats differently, but they read back to the same values
+    assert repr(json.loads(orjson_dumps(obj))) == repr(json.loads(json_dumps(obj))) == repr(obj)
+
+    dag = DAG("test_json_backend", start_date=datetime(2023, 1, 1), params={"value": obj})
+    hashes = set()
+    for backend in ["json", "orjson"]:
+        with mock.patch("airflow.models.serialized_dag.SERIALIZED_DAG_JSON_BACKEND", backend):
+            hashes.add(SerializedDagModel(dag).dag_hash)
+    assert len(hashes) == 1
+
+
+def test_orjson_dumps_keeps_non_finite_floats():
+    pytest.importorskip("orjson")
+    obj = {"a": float("nan"), "b": [float("inf"), None]}
+    assert orjson_dumps(obj) == json_dumps(obj) == b'{"a":NaN,"b":[Infinity,null]}'
+
+
+def test_orjson_dumps_enum_keys_and_big_integers():
+    pytest.importorskip("orjson")
+    obj = {"a": "x", Encoding.VAR: 2**70}
+    assert orjson_dumps(obj) == json_dumps(obj) == b'{"__var":1180591620717411303424,"a":"x"}'
+
+
+def test_auto_backend():
+    try:
+        import orjson  # noqa: F401
+
+        expected = orjson_dumps
+    except ImportError:
+        expected = json_dumps
+    assert get_canonical_json_dumps("auto") is expected
+
+
+def test_auto_backend_without_orjson():
+    with mock.patch.dict("sys.modules", {"orjson": None}):
+        assert get_canonical_json_dumps("auto") is json_dumps
+        with pytest.raises(AirflowConfigException, match="requires the orjson package"):
+            get_canonical_json_dumps("orjson")
+
+
+def test_custom_backend():
+    assert get_canonical_json_dumps("airflow.serialization.json_backend.json_dumps") is json_dumps
+    with pytest.raises(AirflowConfigException, match="Cannot import"):
+        get_canonical_json_dumps("not_a_module.dumps")
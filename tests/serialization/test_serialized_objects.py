@@ -117,3 +117,39 @@ def test_serialized_mapped_operator_unmap(dag_maker):
 
     serialized_unmapped_task = serialized_task2.unmap(None)
     assert serialized_unmapped_task.dag is serialized_dag
+
+
+def test_lazy_deserialization_of_tasks(dag_maker):
+    from airflow.serialization.serialized_objects import LazyDeserializedTaskDict, SerializedDAG
+    from airflow.utils.task_group import TaskGroup
+    from tests.test_utils.mock_operators import MockOperator
+
+    with dag_maker(dag_id="dag") as dag:
+        start = EmptyOperator(task_id="start")
+        with TaskGroup("group"):
+            mapped = MockOperator.partial(task_id="mapped").expand(arg1=["a", "b"])
+            end = EmptyOperator(task_id="end")
+        start >> mapped >> end
+
+    serialized_dag = SerializedDAG.from_dict(SerializedDAG.to_dict(dag), lazy_tasks=True)
+    task_dict = serialized_dag.task_dict
+    assert isinstance(task_dict, LazyDeserializedTaskDict)
+    assert serialized_dag.task_ids == ["start", "group.mapped", "group.end"]
+    assert serialized_dag.has_task("group.end")
+    assert serialized_dag.task_group.get_child_by_label("group").has_task(end)
+    # Nothing is deserialized until needed
+    assert all(isinstance(task, dict) for task in task_dict._data.values())
+
+    serialized_end = serialized_dag.get_task("group.end")
+    assert serialized_end.dag is serialized_dag
+    assert serialized_end.task_group.group_id == "group"
+    assert serialized_end.upstream_task_ids == {"group.mapped"}
+    assert isinstance(task_dict._data["start"], dict)
+
+    serialized_mapped = serialized_end.upstream_list[0]
+    assert serialized_mapped.task_id == "group.mapped"
+    assert serialized_mapped.upstream_task_ids == {"start"}
+    assert serialized_mapped.downstream_task_ids == {"group.end"}
+
+    eager_dag = SerializedDAG.from_dict(SerializedDAG.to_dict(dag))
+    assert SerializedDAG.to_dict(serialized_dag) == SerializedDAG.to_dict(eager_dag)
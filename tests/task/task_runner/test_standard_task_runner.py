@@ -33,6 +33,7 @@ from airflow.jobs.local_task_job_runner import LocalTaskJobRunner
 from airflow.listeners.listener import get_listener_manager
 from airflow.models.dagbag import DagBag
 from airflow.models.taskinstance import TaskInstance
+from airflow.serialization.serialized_objects import SerializedDAG
 from airflow.task.task_runner.standard_task_runner import StandardTaskRunner
 from airflow.utils import timezone
 from airflow.utils.log.file_task_handler import FileTaskHandler
@@ -410,6 +411,38 @@ class TestStandardTaskRunner:
             "_AIRFLOW_PARSING_CONTEXT_TASK_ID=task1\n"
         )
 
+    def test_serialized_dag_is_parsed_by_task(self):
+        context_file = Path("/tmp/airflow_parsing_context")
+        try:
+            context_file.unlink()
+        except FileNotFoundError:
+            pass
+        dagbag = DagBag(
+            dag_folder=TEST_DAG_FOLDER,
+            include_examples=False,
+        )
+        dag = dagbag.dags.get("test_parsing_context")
+        dag.create_dagrun(
+            run_id="test_serialized",
+            data_interval=(DEFAULT_DATE, DEFAULT_DATE),
+            state=State.RUNNING,
+            start_date=DEFAULT_DATE,
+        )
+        serialized_dag = SerializedDAG.from_dict(SerializedDAG.to_dict(dag))
+        ti = TaskInstance(task=serialized_dag.get_task("task1"), run_id="test_serialized")
+        job = Job(dag_id=ti.dag_id)
+        job_runner = LocalTaskJobRunner(job=job, task_instance=ti, ignore_ti_state=True)
+        task_runner = StandardTaskRunner(job_runner)
+        assert task_runner.dag is None
+        task_runner.start()
+        psutil.wait_procs([task_runner.process])
+
+        assert task_runner.return_code() == 0
+        # The task parsed its DAG file with the parsing context set
+        assert context_file.read_text() == (
+            "_AIRFLOW_PARSING_CONTEXT_DAG_ID=test_parsing_context\n_AIRFLOW_PARSING_CONTEXT_TASK_ID=task1\n"
+        )
+
     @staticmethod
     def _procs_in_pgroup(pgid):
         for proc in psutil.process_iter(attrs=["pid", "name"]):
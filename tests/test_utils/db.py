@@ -47,7 +47,8 @@ from airflow.models.dataset import (
     DatasetModel,
     TaskOutletDatasetReference,
 )
-from airflow.models.serialized_dag import SerializedDagModel
+from airflow.models.scheduler_partition import SchedulerPartition
+from airflow.models.serialized_dag import SerializedDagModel, SerializedDagTaskModel
 from airflow.security.permissions import RESOURCE_DAG_PREFIX
 from airflow.utils.db import add_default_pool_if_not_exists, create_default_connections, reflect_tables
 from airflow.utils.session import create_session
@@ -88,6 +89,7 @@ def drop_tables_with_prefix(prefix):
 def clear_db_serialized_dags():
     with create_session() as session:
         session.query(SerializedDagModel).delete()
+        session.query(SerializedDagTaskModel).delete()
 
 
 def clear_db_sla_miss():
@@ -159,6 +161,11 @@ def clear_db_jobs():
         session.query(Job).delete()
 
 
+def clear_db_scheduler_partitions():
+    with create_session() as session:
+        session.query(SchedulerPartition).delete()
+
+
 def clear_db_task_fail():
     with create_session() as session:
         session.query(TaskFail).delete()
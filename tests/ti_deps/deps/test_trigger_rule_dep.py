@@ -1160,6 +1160,45 @@ def test_upstream_in_mapped_group_triggers_only_relevant(dag_maker, session):
     assert sorted(tis) == [("t3", -1)]
 
 
+def test_upstream_in_mapped_group_batch_upstream_counts(dag_maker, session):
+    """Counting upstreams from the batched map indexes gives the same result as querying per ti."""
+    with dag_maker(session=session):
+
+        @task
+        def t(x):
+            return x
+
+        @task_group
+        def tg(x):
+            t1 = t.override(task_id="t1")(x=x)
+            return t.override(task_id="t2")(x=t1)
+
+        t2 = tg.expand(x=[1, 2, 3])
+        t.override(task_id="t3")(x=t2)
+
+    dr: DagRun = dag_maker.create_dagrun()
+    tis = {(ti.task_id, ti.map_index): ti for ti in dr.task_instance_scheduling_decisions(session).tis}
+    tis["tg.t1", 0].run()
+    tis = {(ti.task_id, ti.map_index): ti for ti in dr.task_instance_scheduling_decisions(session).tis}
+
+    batched_context = DepContext(batch_upstream_counts=True)
+    for key in [("tg.t2", 0), ("tg.t2", 1), ("tg.t2", 2), ("t3", -1)]:
+        ti = tis[key]
+        expected = [
+            (s.passed, s.reason)
+            for s in TriggerRuleDep()._evaluate_trigger_rule(ti=ti, dep_context=DepContext(), session=session)
+        ]
+        batched = [
+            (s.passed, s.reason)
+            for s in TriggerRuleDep()._evaluate_trigger_rule(
+                ti=ti, dep_context=batched_context, session=session
+            )
+        ]
+        assert batched == expected, key
+    # The map indexes are only loaded once for the whole dag run
+    assert list(batched_context._ti_map_indexes) == [(dr.dag_id, dr.run_id)]
+
+
 def test_upstream_in_mapped_group_when_mapped_tasks_list_is_empty(dag_maker, session):
     from airflow.decorators import task, task_group
 
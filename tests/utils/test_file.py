@@ -26,7 +26,12 @@ from unittest import mock
 import pytest
 
 from airflow.utils import file as file_utils
-from airflow.utils.file import correct_maybe_zipped, find_path_from_directory, open_maybe_zipped
+from airflow.utils.file import (
+    correct_maybe_zipped,
+    find_path_from_directory,
+    is_path_ignored,
+    open_maybe_zipped,
+)
 from tests.models import TEST_DAGS_FOLDER
 from tests.test_utils.config import conf_vars
 
@@ -139,6 +144,27 @@ class TestListPyFilesPath:
             should_not_ignore
         )
 
+    @pytest.mark.parametrize(
+        "ignore_file_name, ignore_file_syntax",
+        [(".airflowignore", "regexp"), (".airflowignore_glob", "glob")],
+    )
+    def test_is_path_ignored_matches_find_path_from_directory(self, ignore_file_name, ignore_file_syntax):
+        found = set(find_path_from_directory(TEST_DAGS_FOLDER, ignore_file_name, ignore_file_syntax))
+        all_files = {
+            os.path.join(root, file) for root, _, files in os.walk(TEST_DAGS_FOLDER) for file in files
+        }
+        ignored = {
+            file
+            for file in all_files
+            if is_path_ignored(TEST_DAGS_FOLDER, file, ignore_file_name, ignore_file_syntax)
+        }
+
+        assert ignored
+        assert all_files - ignored == found
+
+    def test_is_path_ignored_outside_directory(self, tmp_path):
+        assert is_path_ignored(tmp_path / "dags", tmp_path / "other" / "dag.py", ".airflowignore")
+
     def test_find_path_from_directory_respects_symlinks_regexp_ignore(self, test_dir):
         ignore_list_file = ".airflowignore"
         found = list(find_path_from_directory(test_dir, ignore_list_file))
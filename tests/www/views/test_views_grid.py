@@ -21,6 +21,7 @@ import pendulum
 import pytest
 from dateutil.tz import UTC
 
+from airflow.api.common.mark_tasks import set_state
 from airflow.datasets import Dataset
 from airflow.decorators import task_group
 from airflow.lineage.entities import File
@@ -32,6 +33,7 @@ from airflow.utils import timezone
 from airflow.utils.state import DagRunState, TaskInstanceState
 from airflow.utils.task_group import TaskGroup
 from airflow.utils.types import DagRunType
+from airflow.www.grid_cache import GridDataCache, get_grid_data_cache, get_run_fingerprints, get_ti_summaries
 from airflow.www.views import dag_to_grid
 from tests.test_utils.asserts import assert_queries_count
 from tests.test_utils.db import clear_db_datasets, clear_db_runs
@@ -55,6 +57,13 @@ def clean():
     clear_db_datasets()
 
 
+@pytest.fixture(autouse=True)
+def clear_grid_data_cache():
+    get_grid_data_cache.cache_clear()
+    yield
+    get_grid_data_cache.cache_clear()
+
+
 @pytest.fixture
 def dag_without_runs(dag_maker, session, app, monkeypatch):
     with monkeypatch.context() as m:
@@ -388,6 +397,89 @@ def test_query_count(dag_with_runs, session):
         dag_to_grid(run1.dag, (run1, run2), session)
 
 
+def test_etag(admin_client, dag_with_runs, session):
+    _, run2 = dag_with_runs
+    resp = admin_client.get(f"/object/grid_data?dag_id={DAG_ID}", follow_redirects=True)
+    assert resp.status_code == 200
+    etag = resp.headers["ETag"]
+
+    resp = admin_client.get(f"/object/grid_data?dag_id={DAG_ID}", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.headers["ETag"] == etag
+    assert not resp.data
+
+    ti = run2.get_task_instance("task1", session=session)
+    ti.state = TaskInstanceState.FAILED
+    session.commit()
+
+    resp = admin_client.get(f"/object/grid_data?dag_id={DAG_ID}", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.headers["ETag"] != etag
+    instances = resp.json["groups"]["children"][0]["instances"]
+    assert {instance["run_id"]: instance["state"] for instance in instances}["run_2"] == "failed"
+
+
+def test_etag_of_finished_run_changes_when_marking_task(admin_client, dag_with_runs, session):
+    run1, _ = dag_with_runs
+    resp = admin_client.get(f"/object/grid_data?dag_id={DAG_ID}", follow_redirects=True)
+    etag = resp.headers["ETag"]
+
+    set_state(tasks=[run1.dag.get_task("task1")], run_id=run1.run_id, state="failed", commit=True)
+    session.commit()
+
+    resp = admin_client.get(f"/object/grid_data?dag_id={DAG_ID}", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.headers["ETag"] != etag
+    instances = resp.json["groups"]["children"][0]["instances"]
+    assert {instance["run_id"]: instance["state"] for instance in instances}["run_1"] == "failed"
+
+
+def test_run_fingerprints_do_not_read_task_instances(dag_with_runs):
+    run1, run2 = dag_with_runs
+    with assert_queries_count(0):
+        fingerprints = get_run_fingerprints([run1, run2])
+    assert fingerprints[run1.run_id] is not None
+    assert fingerprints[run2.run_id] is None
+
+
+def test_grid_data_cache_only_queries_changed_runs(dag_with_runs, session):
+    run1, run2 = dag_with_runs
+    run_ids = [run1.run_id, run2.run_id]
+    cache = GridDataCache(size=10)
+
+    fingerprints = get_run_fingerprints([run1])
+    expected = get_ti_summaries(DAG_ID, [run1.run_id], session)
+    with assert_queries_count(1):
+        assert cache.get_ti_summaries(DAG_ID, fingerprints, session) == expected
+    with assert_queries_count(0):
+        assert cache.get_ti_summaries(DAG_ID, fingerprints, session) == expected
+
+    # The runs in progress are always summarized
+    fingerprints = get_run_fingerprints([run1, run2])
+    expected = get_ti_summaries(DAG_ID, run_ids, session)
+    with assert_queries_count(1):
+        assert cache.get_ti_summaries(DAG_ID, fingerprints, session) == expected
+    assert list(cache._runs) == [(DAG_ID, run1.run_id)]
+
+    # The finished runs are summarized again once updated
+    DagRun.touch_finished([(DAG_ID, run1.run_id)], session=session)
+    session.expire(run1)
+    new_fingerprints = get_run_fingerprints([run1])
+    assert new_fingerprints[run1.run_id] != fingerprints[run1.run_id]
+    with assert_queries_count(1):
+        cache.get_ti_summaries(DAG_ID, new_fingerprints, session)
+
+
+def test_grid_data_cache_evicts_least_recently_used_runs(dag_with_runs, session):
+    run1, run2 = dag_with_runs
+    run2.state = DagRunState.FAILED
+    session.flush()
+    cache = GridDataCache(size=1)
+    cache.get_ti_summaries(DAG_ID, get_run_fingerprints([run1]), session)
+    cache.get_ti_summaries(DAG_ID, get_run_fingerprints([run2]), session)
+    assert list(cache._runs) == [(DAG_ID, run2.run_id)]
+
+
 def test_has_outlet_dataset_flag(admin_client, dag_maker, session, app, monkeypatch):
     with monkeypatch.context() as m:
         # Remove global operator links for this test